@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Compare ``sqlitch deploy`` wall time at different logging verbosities.
+
+The benchmark creates a throwaway SQLite project with ``--changes`` trivial
+changes and deploys it from scratch with ``-q``, with no flags, with ``-vvv``,
+and with ``--json -vvv``. Each run gets a fresh database, and the best of
+``--repeat`` runs is reported. Times are process CPU time, which leaves out
+SQLite's fsync waits, so the differences are the cost of building,
+redacting, formatting, and writing log records.
+
+Usage::
+
+    python scripts/benchmarks/deploy_logging.py --changes 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable
+
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main as sqlitch_main
+
+_MODES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("quiet", ("-q",)),
+    ("default", ()),
+    ("-vvv", ("-vvv",)),
+    ("--json -vvv", ("--json", "-vvv")),
+)
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--changes", type=int, default=500, help="Number of changes to deploy.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per verbosity.")
+    return parser.parse_args(list(argv))
+
+
+def build_project(root: Path, changes: int) -> None:
+    """Write a plan, config, and deploy scripts for ``changes`` tiny changes."""
+
+    lines = ["%syntax-version=1.0.0", "%project=bench", ""]
+    (root / "deploy").mkdir()
+    for index in range(changes):
+        name = f"change_{index:05d}"
+        lines.append(f"{name} 2025-01-01T00:00:00Z Alice <alice@example.com> # Bench")
+        (root / "deploy" / f"{name}.sql").write_text(
+            f"CREATE TABLE t_{index:05d} (id INTEGER);\n", encoding="utf-8"
+        )
+    (root / "sqitch.plan").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (root / "sqitch.conf").write_text(
+        "[core]\n\tengine = sqlite\n[user]\n\tname = Alice\n\temail = alice@example.com\n",
+        encoding="utf-8",
+    )
+
+
+def run_once(root: Path, flags: tuple[str, ...]) -> float:
+    """Return the CPU seconds taken by one full deploy with the global ``flags``."""
+
+    for name in ("bench.db", "sqitch.db"):
+        (root / name).unlink(missing_ok=True)
+    started = time.process_time()
+    result = CliRunner().invoke(sqlitch_main, [*flags, "deploy", "db:sqlite:bench.db"])
+    elapsed = time.process_time() - started
+    if result.exit_code != 0:
+        raise SystemExit(f"deploy failed with {' '.join(flags)}:\n{result.output}")
+    return elapsed
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    with tempfile.TemporaryDirectory() as workspace:
+        root = Path(workspace)
+        build_project(root, args.changes)
+        previous = Path.cwd()
+        os.chdir(root)
+        try:
+            print(f"changes: {args.changes}")
+            run_once(root, ("-q",))  # warm up imports and the page cache
+            best: dict[str, float] = {}
+            for _ in range(args.repeat):
+                # Interleave the modes so drift affects all of them alike.
+                for label, flags in _MODES:
+                    elapsed = run_once(root, flags)
+                    best[label] = min(best.get(label, elapsed), elapsed)
+            baseline = best[_MODES[0][0]]
+            for label, _ in _MODES:
+                print(
+                    f"{label:<12} {best[label] * 1000:9.1f} ms cpu  {best[label] / baseline:5.2f}x"
+                )
+        finally:
+            os.chdir(previous)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
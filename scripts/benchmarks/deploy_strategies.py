@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare the SQLite deploy script execution strategies on a large INSERT script.
+
+The benchmark builds a deploy script that creates a table and inserts
+``--rows`` rows, one literal ``INSERT`` per row, and runs it with every
+strategy in :data:`~sqlitch.engine.sqlite_execution.EXECUTION_STRATEGIES`
+inside the same ``BEGIN IMMEDIATE`` / savepoint wrapper that ``sqlitch
+deploy`` uses. Each strategy runs against a fresh database file, and the best
+of ``--repeat`` runs is reported.
+
+Usage::
+
+    python scripts/benchmarks/deploy_strategies.py --rows 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable
+
+from sqlitch.engine.sqlite import prepare_sqlite_script
+from sqlitch.engine.sqlite_execution import EXECUTION_STRATEGIES, execute_sqlite_statements
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="Number of INSERT statements.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per strategy.")
+    return parser.parse_args(list(argv))
+
+
+def build_script(rows: int) -> str:
+    """Return a deploy script with one literal INSERT per row."""
+
+    lines = ["CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL, price REAL);"]
+    lines.extend(
+        f"INSERT INTO items (id, name, price) VALUES ({index}, 'item {index}', {index}.25);"
+        for index in range(rows)
+    )
+    return "\n".join(lines) + "\n"
+
+
+def run_once(database: Path, statements: tuple[str, ...], strategy: str) -> float:
+    """Return the seconds taken to apply ``statements`` to a fresh ``database``."""
+
+    database.unlink(missing_ok=True)
+    connection = sqlite3.connect(database, isolation_level=None)
+    try:
+        cursor = connection.cursor()
+        started = time.perf_counter()
+        execute_sqlite_statements(
+            cursor,
+            statements,
+            strategy=strategy,
+            preamble=("BEGIN IMMEDIATE", "SAVEPOINT sqlitch_change"),
+        )
+        connection.execute("RELEASE SAVEPOINT sqlitch_change")
+        connection.execute("COMMIT")
+        return time.perf_counter() - started
+    finally:
+        connection.close()
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    statements = prepare_sqlite_script(build_script(args.rows)).statements
+
+    print(f"statements: {len(statements)}")
+    with tempfile.TemporaryDirectory() as workspace:
+        database = Path(workspace) / "bench.db"
+        baseline: float | None = None
+        for strategy in EXECUTION_STRATEGIES:
+            best = min(run_once(database, statements, strategy) for _ in range(args.repeat))
+            baseline = baseline or best
+            print(f"{strategy:<10} {best * 1000:9.1f} ms  {baseline / best:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Measure the resident memory cost of parsed plan entries with tracemalloc.
+
+The benchmark writes a synthetic compact-format plan containing ``--changes``
+changes (every ``--tag-every`` change is tagged and every ``--rework-every``
+change is reworked), parses it, and reports the number of bytes retained per
+plan entry while the resulting :class:`~sqlitch.plan.model.Plan` is alive.
+
+Usage::
+
+    python scripts/benchmarks/plan_memory.py --changes 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Iterable
+
+from sqlitch.plan.parser import parse_plan
+
+_PLANNERS = (
+    "Alice Example <alice@example.com>",
+    "Bob Example <bob@example.com>",
+    "Carol Example <carol@example.com>",
+)
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--changes", type=int, default=5000, help="Number of changes to plan.")
+    parser.add_argument("--tag-every", type=int, default=25, help="Tag every Nth change.")
+    parser.add_argument("--rework-every", type=int, default=100, help="Rework every Nth change.")
+    return parser.parse_args(list(argv))
+
+
+def build_plan_text(changes: int, tag_every: int, rework_every: int) -> str:
+    """Return a compact plan body exercising dependencies, tags, and reworks."""
+
+    lines = ["%syntax-version=1.0.0", "%project=bench", "%default_engine=sqlite", ""]
+    tag_index = 0
+    last_tag: str | None = None
+    for index in range(changes):
+        name = f"change_{index:06d}"
+        planner = _PLANNERS[index % len(_PLANNERS)]
+        requires = f" [change_{index - 1:06d}]" if index else ""
+        lines.append(f"{name}{requires} 2025-01-01T00:00:00Z {planner} # Note for {name}")
+        if tag_every and index % tag_every == tag_every - 1:
+            tag_index += 1
+            last_tag = f"v{tag_index}"
+            lines.append(f"@{last_tag} 2025-01-01T00:00:00Z {planner}")
+        if rework_every and last_tag and index % rework_every == rework_every - 1:
+            rework_target = f"change_{index - rework_every + 1:06d}"
+            lines.append(
+                f"{rework_target} [{rework_target}@{last_tag}] 2025-01-02T00:00:00Z {planner}"
+                " # Rework"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def measure(plan_path: Path) -> tuple[int, int]:
+    """Return ``(retained_bytes, entry_count)`` for parsing ``plan_path``."""
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    plan = parse_plan(plan_path)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return retained, len(plan.entries)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    with tempfile.TemporaryDirectory() as workspace:
+        root = Path(workspace)
+        for kind in ("deploy", "revert", "verify"):
+            (root / kind).mkdir()
+        plan_path = root / "sqitch.plan"
+        plan_path.write_text(
+            build_plan_text(args.changes, args.tag_every, args.rework_every), encoding="utf-8"
+        )
+        retained, entries = measure(plan_path)
+
+    print(f"entries:          {entries}")
+    print(f"retained bytes:   {retained}")
+    print(f"bytes per entry:  {retained / max(entries, 1):.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
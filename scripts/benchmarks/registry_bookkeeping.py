@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Measure the SQLite registry bookkeeping cost of deploying and reverting a change.
+
+The benchmark parses a synthetic plan of ``--changes`` changes (each requiring
+its predecessor and every ``--tag-every`` change tagged), then records every
+change in an in-memory registry the way ``sqlitch deploy`` does, followed by
+the registry updates of ``sqlitch revert`` in transactions of ``--batch-size``
+changes. No scripts run, so the reported times are the pure per-change
+registry overhead.
+
+Usage::
+
+    python scripts/benchmarks/registry_bookkeeping.py --changes 2000 --batch-size 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+
+from sqlitch.cli.commands.deploy import (
+    DeployedMetadata,
+    _apply_registry_baseline,
+    _build_dependency_lookup,
+    _plan_change_ids,
+    _record_deployment_entries,
+)
+from sqlitch.cli.commands.revert import _PreparedRevert, _record_reverts
+from sqlitch.engine.sqlite import prepare_sqlite_script
+from sqlitch.plan.parser import parse_plan
+
+_SCHEMA = "sqitch"
+_TIMESTAMP = "2025-01-01 00:00:00"
+_REVERTED_AT = "2025-01-02 00:00:00"
+
+
+def parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--changes", type=int, default=2000, help="Number of changes to plan.")
+    parser.add_argument("--tag-every", type=int, default=10, help="Tag every Nth change.")
+    parser.add_argument(
+        "--batch-size", type=int, default=1, help="Changes reverted per transaction."
+    )
+    return parser.parse_args(list(argv))
+
+
+def build_plan_text(changes: int, tag_every: int) -> str:
+    """Return a compact plan body where every change requires its predecessor."""
+
+    lines = ["%syntax-version=1.0.0", "%project=bench", "%default_engine=sqlite", ""]
+    for index in range(changes):
+        requires = f" [change_{index - 1:06d}]" if index else ""
+        lines.append(
+            f"change_{index:06d}{requires} 2025-01-01T00:00:00Z Alice <alice@example.com> # Note"
+        )
+        if tag_every and index % tag_every == tag_every - 1:
+            lines.append(
+                f"@v{index // tag_every + 1} 2025-01-01T00:00:00Z Alice <alice@example.com>"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def measure(changes: int, tag_every: int, batch_size: int) -> tuple[float, float]:
+    """Return ``(deploy_seconds, revert_seconds)`` spent on registry writes."""
+
+    plan = parse_plan(Path("sqitch.plan"), content=build_plan_text(changes, tag_every))
+    change_ids = _plan_change_ids(plan)
+
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    connection.execute(f"ATTACH DATABASE ':memory:' AS {_SCHEMA}")
+    _apply_registry_baseline(connection, _SCHEMA)
+    connection.execute(
+        f"INSERT INTO {_SCHEMA}.projects (project, uri, creator_name, creator_email) "
+        "VALUES (?, NULL, 'Alice', 'alice@example.com')",  # nosec B608
+        (plan.project_name,),
+    )
+
+    deployed: dict[str, DeployedMetadata] = {}
+    cursor = connection.cursor()
+    started = time.perf_counter()
+    for change, change_id in change_ids:
+        connection.execute("BEGIN")
+        _record_deployment_entries(
+            cursor=cursor,
+            registry_schema=_SCHEMA,
+            project=plan.project_name,
+            change=change,
+            change_id=change_id,
+            script_hash=change_id,
+            note=change.notes or "",
+            committed_at=_TIMESTAMP,
+            committer_name="Alice",
+            committer_email="alice@example.com",
+            planned_at=_TIMESTAMP,
+            planner_name="Alice",
+            planner_email="alice@example.com",
+            dependencies=change.dependencies,
+            dependency_lookup=_build_dependency_lookup(change, deployed),
+            tags=change.tags,
+        )
+        connection.execute("COMMIT")
+        deployed[change.name] = {"change_id": change_id, "script_hash": "", "tags": set()}
+    deploy_seconds = time.perf_counter() - started
+
+    script = prepare_sqlite_script("")
+    reverts = [
+        _PreparedRevert(
+            change=change,
+            change_id=change_id,
+            script=script,
+            event=("revert", change_id, change.name, plan.project_name, "", "", "", "")
+            + (
+                _REVERTED_AT,
+                "Alice",
+                "alice@example.com",
+                _TIMESTAMP,
+                "Alice",
+                "alice@example.com",
+            ),
+        )
+        for change, change_id in reversed(change_ids)
+    ]
+    started = time.perf_counter()
+    for start in range(0, len(reverts), batch_size):
+        connection.execute("BEGIN")
+        _record_reverts(cursor, _SCHEMA, reverts[start : start + batch_size])
+        connection.execute("COMMIT")
+    revert_seconds = time.perf_counter() - started
+
+    connection.close()
+    return deploy_seconds, revert_seconds
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    deploy_seconds, revert_seconds = measure(args.changes, args.tag_every, args.batch_size)
+    count = max(args.changes, 1)
+
+    print(f"changes:              {args.changes}")
+    print(f"deploy us/change:     {deploy_seconds / count * 1e6:.1f}")
+    print(f"revert us/change:     {revert_seconds / count * 1e6:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
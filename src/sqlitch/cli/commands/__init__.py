@@ -175,6 +175,7 @@ COMMAND_MODULES: tuple[str, ...] = (
     "deploy",
     "engine",
     "init",
+    "lock",
     "log",
     "help",
     "plan",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
 from sqlitch.config import resolver as config_resolver
@@ -52,8 +52,13 @@ def resolve_default_engine(
     env: Mapping[str, str],
     engine_override: str | None,
     plan_path: Path | None = None,
+    plan_content: str | None = None,
 ) -> str:
-    """Determine the effective default engine for plan operations."""
+    """Determine the effective default engine for plan operations.
+
+    ``plan_content`` supplies the plan text when the plan is not read from
+    ``plan_path``, for example when it comes from a bundle archive.
+    """
 
     if engine_override:
         return engine_override
@@ -67,7 +72,11 @@ def resolve_default_engine(
     if profile.active_engine:
         return profile.active_engine
 
-    if plan_path is not None:
+    if plan_content is not None:
+        header_engine = _plan_default_engine(plan_content.splitlines())
+        if header_engine:
+            return header_engine
+    elif plan_path is not None:
         header_engine = _read_plan_default_engine(plan_path)
         if header_engine:
             return header_engine
@@ -80,17 +89,21 @@ def resolve_default_engine(
 def _read_plan_default_engine(plan_path: Path) -> str | None:
     try:
         with plan_path.open(encoding="utf-8") as handle:
-            for raw in handle:
-                line = raw.strip()
-                if not line or not line.startswith("%"):
-                    break
-                if "=" not in line:
-                    continue
-                key, value = line[1:].split("=", 1)
-                if key.strip() == "default_engine":
-                    return value.strip()
+            return _plan_default_engine(handle)
     except FileNotFoundError:
         return None
     except OSError:  # pragma: no cover - IO failures ignored
         return None
+
+
+def _plan_default_engine(lines: Iterable[str]) -> str | None:
+    for raw in lines:
+        line = raw.strip()
+        if not line or not line.startswith("%"):
+            break
+        if "=" not in line:
+            continue
+        key, value = line[1:].split("=", 1)
+        if key.strip() == "default_engine":
+            return value.strip()
     return None
@@ -0,0 +1,355 @@
+"""Execution state shared by consecutive command phases against one target.
+
+``rebase`` and ``checkout`` revert and then redeploy changes on the same
+target. Running the two phases as independent commands would resolve the target and committer
+identity twice, open and attach the registry twice, and rebuild every change ID
+of the plan twice. :class:`ExecutionSession` carries that work from the first
+phase to the second.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlitch.config import resolver as config_resolver
+from sqlitch.engine import EngineTarget, create_engine
+from sqlitch.engine.base import EngineError, UnsupportedEngineError
+from sqlitch.engine.lock import (
+    DEFAULT_BUSY_TIMEOUT_MS,
+    DEFAULT_LOCK_TIMEOUT,
+    DeployLock,
+    DeployLockError,
+    lock_path_for_registry,
+)
+from sqlitch.engine.server import DeployedChangeRow, ServerEngine
+from sqlitch.engine.sqlite import REGISTRY_ATTACHMENT_ALIAS, SQLiteEngine
+from sqlitch.plan.model import Change, Plan
+from sqlitch.utils.logging import StructuredLogger
+
+from . import CommandError
+
+if TYPE_CHECKING:
+    from .deploy import DeployedMetadata
+
+__all__ = [
+    "ExecutionSession",
+    "LockSettings",
+    "RegistrySnapshot",
+    "acquire_deploy_lock",
+    "load_registry_snapshot",
+    "open_execution_session",
+    "resolve_lock_settings",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class LockSettings:
+    """Concurrency settings for commands that write to a target.
+
+    Attributes:
+        timeout: Seconds to wait for another deployer's advisory lock.
+        busy_timeout: Milliseconds a SQLite connection waits on a locked database.
+    """
+
+    timeout: float = DEFAULT_LOCK_TIMEOUT
+    busy_timeout: int = DEFAULT_BUSY_TIMEOUT_MS
+
+
+def resolve_lock_settings(
+    *,
+    project_root: Path,
+    config_root: Path,
+    env: Mapping[str, str],
+    lock_timeout: float | None = None,
+) -> LockSettings:
+    """Read ``core.lock_timeout`` and ``core.busy_timeout``; ``lock_timeout`` wins."""
+
+    profile = config_resolver.resolve_config(
+        root_dir=project_root,
+        config_root=config_root,
+        env=env,
+    )
+    core = profile.settings.get("core", {})
+    if lock_timeout is None:
+        lock_timeout = float(_config_number(core, "lock_timeout", DEFAULT_LOCK_TIMEOUT))
+    busy_timeout = int(_config_number(core, "busy_timeout", DEFAULT_BUSY_TIMEOUT_MS))
+    return LockSettings(timeout=max(lock_timeout, 0.0), busy_timeout=max(busy_timeout, 0))
+
+
+def _config_number(section: Mapping[str, str], key: str, default: float) -> float:
+    value = section.get(key)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise CommandError(f"Invalid core.{key} value: {value!r}") from exc
+
+
+def acquire_deploy_lock(
+    engine_target: EngineTarget, *, owner: str, timeout: float
+) -> DeployLock | None:
+    """Take the advisory deploy lock for a SQLite target; other engines need none."""
+
+    if engine_target.engine != "sqlite":
+        return None
+    try:
+        registry_path = SQLiteEngine(engine_target).registry_filesystem_path()
+    except EngineError:
+        # Registries outside the filesystem cannot be shared between processes.
+        return None
+    lock = DeployLock(lock_path_for_registry(registry_path), owner=owner, timeout=timeout)
+    try:
+        lock.acquire()
+    except DeployLockError as exc:
+        raise CommandError(str(exc)) from exc
+    return lock
+
+
+@dataclass(slots=True)
+class RegistrySnapshot:
+    """Deployed changes and tags of one project, read once from the registry.
+
+    Attributes:
+        rows: Deployed changes in deployment order (oldest first).
+        tags: Recorded tag names keyed by change ID.
+    """
+
+    rows: list[DeployedChangeRow]
+    tags: dict[str, set[str]] = field(default_factory=dict)
+    _positions: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._positions = {row.change_id: index for index, row in enumerate(self.rows)}
+
+    @classmethod
+    def load(
+        cls, connection: sqlite3.Connection, registry_schema: str, project: str
+    ) -> RegistrySnapshot:
+        """Read the deployed changes and tags of ``project`` from ``registry_schema``."""
+
+        cursor = connection.execute(
+            f'SELECT "change", change_id, script_hash FROM {registry_schema}.changes '
+            "WHERE project = ? ORDER BY committed_at ASC, change_id ASC",  # nosec B608
+            (project,),
+        )
+        try:
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        tag_cursor = connection.execute(
+            f"SELECT change_id, tag FROM {registry_schema}.tags WHERE project = ?",  # nosec B608
+            (project,),
+        )
+        try:
+            tag_rows = tag_cursor.fetchall()
+        finally:
+            tag_cursor.close()
+
+        tags: dict[str, set[str]] = {}
+        for change_id, tag in tag_rows:
+            tags.setdefault(str(change_id), set()).add(str(tag))
+
+        return cls(
+            rows=[
+                DeployedChangeRow(
+                    change=str(name),
+                    change_id=str(change_id),
+                    script_hash=str(script_hash) if script_hash is not None else None,
+                )
+                for name, change_id, script_hash in rows
+            ],
+            tags=tags,
+        )
+
+    @property
+    def change_ids(self) -> set[str]:
+        """IDs of every deployed change."""
+
+        return set(self._positions)
+
+    def by_name(self) -> dict[str, DeployedMetadata]:
+        """Map change names to the metadata of their most recent deployment."""
+
+        metadata: dict[str, DeployedMetadata] = {}
+        for row in self.rows:
+            # Later rows win so reworked changes resolve to their latest instance.
+            metadata[row.change] = {
+                "change_id": row.change_id,
+                "script_hash": row.script_hash or "",
+                "tags": self.tags.get(row.change_id, set()),
+            }
+        return metadata
+
+    def by_change_id(self) -> dict[str, dict[str, str]]:
+        """Map change IDs to registry metadata, most recently deployed first."""
+
+        return {
+            row.change_id: {
+                "change_name": row.change,
+                "change_id": row.change_id,
+                "script_hash": row.script_hash or "",
+            }
+            for row in reversed(self.rows)
+        }
+
+    def discard(self, change_id: str) -> None:
+        """Forget a change that has been removed from the registry.
+
+        Reverts remove the most recently deployed change first, which is the
+        last row, so discarding each reverted change is constant time.
+        """
+
+        self.tags.pop(change_id, None)
+        position = self._positions.pop(change_id, None)
+        if position is None:
+            return
+        if position == len(self.rows) - 1:
+            self.rows.pop()
+            return
+        del self.rows[position]
+        for index in range(position, len(self.rows)):
+            self._positions[self.rows[index].change_id] = index
+
+
+@dataclass(slots=True)
+class ExecutionSession:
+    """Target, identity, connection, and plan state shared across command phases.
+
+    The session owns :attr:`connection`; phases that receive a session use it
+    without closing it, and the caller releases it with :meth:`close`.
+
+    Attributes:
+        change_ids: Every plan change paired with its change ID, in plan order.
+        connection: Open SQLite workspace connection with the registry
+            attached, or ``None`` for server engines, which borrow pooled
+            connections instead.
+        snapshot: Registry state as last observed by a phase, kept current as
+            changes are reverted. ``None`` until the registry has been read.
+        lock: Advisory deploy lock held until :meth:`close`.
+    """
+
+    engine_target: EngineTarget
+    display_target: str
+    committer_name: str
+    committer_email: str
+    change_ids: list[tuple[Change, str]]
+    connection: sqlite3.Connection | None = None
+    snapshot: RegistrySnapshot | None = None
+    lock: DeployLock | None = None
+
+    def close(self) -> None:
+        """Close the shared connection, if one was opened, and release the lock."""
+
+        try:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+        finally:
+            if self.lock is not None:
+                self.lock.release()
+                self.lock = None
+
+
+def open_execution_session(
+    *,
+    target: str,
+    project_root: Path,
+    config_root: Path,
+    env: Mapping[str, str],
+    plan: Plan,
+    plan_path: Path,
+    logger: StructuredLogger,
+    lock_timeout: float | None = None,
+) -> ExecutionSession:
+    """Resolve ``target`` and the committer once, take the deploy lock, and connect."""
+
+    # Import here to avoid circular dependency
+    from .deploy import (
+        _create_engine_connection,
+        _plan_change_ids,
+        _resolve_committer_identity,
+        _resolve_engine_target,
+    )
+
+    engine_target, display_target = _resolve_engine_target(
+        target=target,
+        project_root=project_root,
+        config_root=config_root,
+        env=env,
+        default_engine=plan.default_engine,
+        plan_path=plan_path,
+        registry_override=None,
+        logger=logger,
+    )
+    committer_name, committer_email = _resolve_committer_identity(env, config_root, project_root)
+    session = ExecutionSession(
+        engine_target=engine_target,
+        display_target=display_target,
+        committer_name=committer_name,
+        committer_email=committer_email,
+        change_ids=_plan_change_ids(plan),
+    )
+    if engine_target.engine == "sqlite":
+        settings = resolve_lock_settings(
+            project_root=project_root, config_root=config_root, env=env, lock_timeout=lock_timeout
+        )
+        session.lock = acquire_deploy_lock(
+            engine_target,
+            owner=f"{committer_name} <{committer_email}>",
+            timeout=settings.timeout,
+        )
+        try:
+            _, session.connection = _create_engine_connection(
+                engine_target, busy_timeout=settings.busy_timeout
+            )
+        except BaseException:
+            session.close()
+            raise
+    return session
+
+
+def load_registry_snapshot(session: ExecutionSession, project: str) -> RegistrySnapshot:
+    """Return the deployed changes of ``project``, empty when no registry exists.
+
+    SQLite snapshots are kept on ``session`` for the phases that follow. Server
+    registries are read over a pooled connection and not cached, because the
+    server command paths read the registry themselves.
+    """
+
+    if session.snapshot is not None:
+        return session.snapshot
+
+    connection = session.connection
+    if connection is not None:
+        # Import here to avoid circular dependency
+        from .deploy import _registry_tables_exist
+
+        if _registry_tables_exist(connection, REGISTRY_ATTACHMENT_ALIAS):
+            snapshot = RegistrySnapshot.load(connection, REGISTRY_ATTACHMENT_ALIAS, project)
+        else:
+            snapshot = RegistrySnapshot(rows=[])
+        session.snapshot = snapshot
+        return snapshot
+
+    try:
+        engine = create_engine(session.engine_target)
+    except (UnsupportedEngineError, EngineError) as exc:
+        raise CommandError(f"Unsupported engine '{session.engine_target.engine}': {exc}") from exc
+    if not isinstance(engine, ServerEngine):  # pragma: no cover - defensive guard
+        raise CommandError(f"Engine '{session.engine_target.engine}' is not supported yet.")
+    try:
+        with engine.session() as server_connection:
+            rows = (
+                list(engine.load_deployed_changes(server_connection, project))
+                if engine.registry_exists(server_connection)
+                else []
+            )
+    except EngineError as exc:
+        raise CommandError(str(exc)) from exc
+    return RegistrySnapshot(rows=rows)
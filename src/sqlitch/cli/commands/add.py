@@ -9,7 +9,6 @@ from pathlib import Path
 
 import click
 
-from sqlitch.config.resolver import resolve_config
 from sqlitch.engine.base import UnsupportedEngineError, canonicalize_engine_name
 from sqlitch.plan.formatter import write_plan
 from sqlitch.plan.model import Change
@@ -171,11 +170,7 @@ def add_command(  # pylint: disable=unused-argument
     quiet = bool(cli_context.quiet)
 
     # Load configuration for planner identity resolution
-    config = resolve_config(
-        root_dir=project_root,
-        config_root=cli_context.config_root,
-        env=environment,
-    )
+    config = cli_context.config_profile()
 
     default_engine = resolve_default_engine(
         project_root=project_root,
@@ -4,15 +4,36 @@ from __future__ import annotations
 
 import os
 import shutil
-from collections.abc import Mapping
-from pathlib import Path
+import tempfile
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 
 import click
 
+from sqlitch.plan.formatter import format_plan
+from sqlitch.plan.model import Change, Plan, PlanEntry
+from sqlitch.plan.parser import PlanParseError, parse_plan
+from sqlitch.plan.symbolic import ReferenceResolver
+from sqlitch.utils.bundle import (
+    ARCHIVE_FORMATS,
+    BundleManifest,
+    ManifestEntry,
+    archive_format,
+    build_manifest,
+    write_archive,
+)
+
 from ..options import global_output_options, global_sqitch_options
 from . import CommandError, register_command
-from ._context import environment_from, plan_override_from, project_root_from, quiet_mode_enabled
-from ._plan_utils import resolve_plan_path
+from ._context import (
+    environment_from,
+    plan_override_from,
+    project_root_from,
+    quiet_mode_enabled,
+    require_cli_context,
+)
+from ._plan_utils import resolve_default_engine, resolve_plan_path
 
 __all__ = ["bundle_command"]
 
@@ -28,6 +49,23 @@ _SCRIPT_DIRECTORIES: tuple[str, ...] = ("deploy", "revert", "verify")
     type=click.Path(file_okay=False, path_type=Path),
     help="Destination directory for the bundle output.",
 )
+@click.option(
+    "--archive",
+    "archive_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the bundle as a single .tar.gz or .zip archive instead of a directory.",
+)
+@click.option(
+    "--from",
+    "from_ref",
+    help="Bundle only the scripts of changes from this change or tag onward; accepts "
+    "symbolic references.",
+)
+@click.option(
+    "--to",
+    "to_ref",
+    help="Bundle only changes up to this change or tag; accepts symbolic references.",
+)
 @click.option("--no-plan", is_flag=True, help="Skip copying the plan file into the bundle.")
 @global_sqitch_options
 @global_output_options
@@ -38,43 +76,114 @@ def bundle_command(  # pylint: disable=unused-argument
     directory: Path | None,
     *,
     dest_option: Path | None,
+    archive_path: Path | None,
+    from_ref: str | None,
+    to_ref: str | None,
     no_plan: bool,
     json_mode: bool,
     verbose: int,
     quiet: bool,
 ) -> None:
-    """Bundle the current project for distribution."""
+    """Bundle the current project for distribution.
+
+    The bundle records the path, SHA-1, and size of every file in its
+    manifest. Bundling into an existing bundle copies only the files that
+    changed since it was written and removes the ones that left the project.
+    With ``--archive`` the plan, scripts, and manifest are written into one
+    archive that ``deploy --bundle`` reads without extracting it.
+
+    ``--from`` and ``--to`` slice the bundle to a range of the plan: only
+    the scripts of the changes in the range are bundled, including the
+    ``@tag`` scripts of reworked changes. The bundled plan ends at ``--to``
+    but keeps every earlier change, so change IDs and dependencies match the
+    full plan and consecutive slices deploy onto each other.
+    """
 
     project_root = project_root_from(ctx)
     env = environment_from(ctx)
     plan_override = plan_override_from(ctx)
     quiet = quiet_mode_enabled(ctx)
 
+    if archive_path is not None:
+        if directory is not None or dest_option is not None:
+            raise CommandError("--archive cannot be combined with a destination directory.")
+        if archive_format(archive_path) is None:
+            raise CommandError(
+                f"Unsupported archive type {archive_path.name}; use one of "
+                f"{', '.join(ARCHIVE_FORMATS)}."
+            )
+
+    sources: dict[str, Path] = {}
+    if from_ref is not None or to_ref is not None:
+        plan_path = _resolve_plan_path(
+            project_root=project_root,
+            override=plan_override,
+            env=env,
+        )
+        cli_context = require_cli_context(ctx)
+        default_engine = resolve_default_engine(
+            project_root=project_root,
+            config_root=cli_context.config_root,
+            env=env,
+            engine_override=cli_context.engine,
+            plan_path=plan_path,
+        )
+        # The truncated plan is written here and bundled like any other file.
+        workspace = Path(ctx.with_resource(tempfile.TemporaryDirectory(prefix="sqlitch-bundle-")))
+        sources.update(
+            _sliced_sources(
+                project_root=project_root,
+                plan_path=plan_path,
+                default_engine=default_engine,
+                from_ref=from_ref,
+                to_ref=to_ref,
+                plan_destination=None if no_plan else workspace / plan_path.name,
+            )
+        )
+    else:
+        if not no_plan:
+            plan_path = _resolve_plan_path(
+                project_root=project_root,
+                override=plan_override,
+                env=env,
+            )
+            sources[plan_path.name] = plan_path
+        for name in _SCRIPT_DIRECTORIES:
+            sources.update(_script_files(project_root, name))
+
+    if archive_path is not None:
+        archive = archive_path if archive_path.is_absolute() else project_root / archive_path
+        _write_archive(archive, sources)
+        if not quiet:
+            click.echo(f"Bundled project to {_format_display_path(archive, project_root)}")
+        return
+
     destination = _determine_destination(
         project_root=project_root,
         directory_argument=directory,
         dest_option=dest_option,
         env=env,
     )
-
     _create_destination(destination)
 
-    if not no_plan:
-        plan_path = _resolve_plan_path(
-            project_root=project_root,
-            override=plan_override,
-            env=env,
-        )
-        _copy_file(plan_path, destination / plan_path.name)
-
-    for name in _SCRIPT_DIRECTORIES:
-        source_directory = project_root / name
-        if not source_directory.exists():
-            continue
-        _copy_directory(source_directory, destination / name)
+    with ThreadPoolExecutor() as executor:
+        try:
+            manifest = build_manifest(sources, executor)
+        except OSError as exc:  # pragma: no cover - surfaced to the CLI user
+            raise CommandError(f"Failed to read project files: {exc}") from exc
+        changed, stale = manifest.changed_since(BundleManifest.load(destination), destination)
+        _copy_files(executor, sources, changed, destination)
+    _remove_stale(stale, destination)
+    try:
+        manifest.write(destination)
+    except OSError as exc:  # pragma: no cover - surfaced to the CLI user
+        raise CommandError(f"Failed to write bundle manifest in {destination}: {exc}") from exc
 
     if not quiet:
         click.echo(f"Bundled project to {_format_display_path(destination, project_root)}")
+        if verbose:
+            unchanged = len(manifest.entries) - len(changed)
+            click.echo(f"{len(changed)} copied, {unchanged} unchanged, {len(stale)} removed")
 
 
 def _determine_destination(
@@ -122,19 +231,172 @@ def _resolve_plan_path(
     )
 
 
+def _sliced_sources(
+    *,
+    project_root: Path,
+    plan_path: Path,
+    default_engine: str,
+    from_ref: str | None,
+    to_ref: str | None,
+    plan_destination: Path | None,
+) -> dict[str, Path]:
+    """Return the scripts of the plan range, writing the plan through its end if requested."""
+
+    try:
+        plan_text = plan_path.read_text(encoding="utf-8")
+        plan = parse_plan(plan_path, default_engine=default_engine, content=plan_text)
+    except OSError as exc:  # pragma: no cover - surfaced to the CLI user
+        raise CommandError(f"Unable to read plan file {plan_path}: {exc}") from exc
+    except PlanParseError as exc:
+        raise CommandError(str(exc)) from exc
+
+    entries, changes = _slice_entries(plan, from_ref, to_ref)
+    sources: dict[str, Path] = {}
+    for change in changes:
+        # Script paths come resolved from the full plan, so reworked changes
+        # already point at their @tag scripts.
+        for script in change.script_paths.values():
+            if script is None:
+                continue
+            path = Path(script)
+            if not path.is_absolute():
+                path = plan_path.parent / path
+            if not path.is_file():
+                continue
+            try:
+                name = path.relative_to(project_root).as_posix()
+            except ValueError as exc:
+                raise CommandError(
+                    f"Script {path} of change '{change.name}' is outside the project."
+                ) from exc
+            sources[name] = path
+
+    if plan_destination is not None:
+        content = format_plan(
+            project_name=plan.project_name,
+            default_engine=plan.default_engine,
+            entries=entries,
+            base_path=plan_path.parent,
+            syntax_version=plan.syntax_version,
+            uri=plan.uri,
+            include_default_engine="%default_engine=" in plan_text,
+        )
+        plan_destination.write_text(content, encoding="utf-8")
+        sources[plan_path.name] = plan_destination
+    return sources
+
+
+def _slice_entries(
+    plan: Plan, from_ref: str | None, to_ref: str | None
+) -> tuple[tuple[PlanEntry, ...], tuple[Change, ...]]:
+    """Return the plan entries through ``to_ref`` and its tags, and the changes from ``from_ref``.
+
+    Entries before ``from_ref`` stay in the plan: each change ID chains through
+    its parent's, and dependencies may name earlier changes.
+    """
+
+    resolver = ReferenceResolver.from_plan(plan)
+    if not len(resolver):
+        raise CommandError(f"Plan {plan.file_path.name} has no changes to bundle.")
+    start = _resolve_reference_index(resolver, from_ref) if from_ref is not None else 0
+    end = _resolve_reference_index(resolver, to_ref) if to_ref is not None else len(resolver) - 1
+    if start > end:
+        raise CommandError(f"Change '{from_ref}' comes after '{to_ref}' in the plan.")
+
+    selected: list[PlanEntry] = []
+    changes: list[Change] = []
+    index = -1
+    for entry in plan.entries:
+        if isinstance(entry, Change):
+            index += 1
+            if start <= index <= end:
+                changes.append(entry)
+        # Tags follow the change they are applied to.
+        if index <= end:
+            selected.append(entry)
+    return tuple(selected), tuple(changes)
+
+
+def _resolve_reference_index(resolver: ReferenceResolver, reference: str) -> int:
+    try:
+        return resolver.resolve_index(reference)
+    except ValueError as exc:
+        raise CommandError(f"Plan does not contain change '{reference}'.") from exc
+
+
+def _write_archive(archive: Path, sources: Mapping[str, Path]) -> None:
+    _create_destination(archive.parent)
+    try:
+        with ThreadPoolExecutor() as executor:
+            manifest = build_manifest(sources, executor)
+        write_archive(archive, sources, manifest)
+    except OSError as exc:  # pragma: no cover - surfaced to the CLI user
+        raise CommandError(f"Failed to write bundle archive {archive}: {exc}") from exc
+
+
+def _script_files(project_root: Path, name: str) -> dict[str, Path]:
+    """Return the files below ``project_root / name`` keyed by project-relative path."""
+
+    source_directory = project_root / name
+    if not source_directory.is_dir():
+        return {}
+    return {
+        path.relative_to(project_root).as_posix(): path
+        for path in source_directory.rglob("*")
+        if path.is_file()
+    }
+
+
+def _copy_files(
+    executor: Executor,
+    sources: Mapping[str, Path],
+    entries: Sequence[ManifestEntry],
+    destination: Path,
+) -> None:
+    for directory in {(destination / entry.path).parent for entry in entries}:
+        _create_destination(directory)
+    # list() re-raises the first copy failure.
+    list(
+        executor.map(
+            lambda entry: _copy_file(sources[entry.path], destination / entry.path), entries
+        )
+    )
+
+
 def _copy_file(source: Path, destination: Path) -> None:
     try:
-        destination.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source, destination)
     except OSError as exc:  # pragma: no cover - surfaced to the CLI user
         raise CommandError(f"Failed to copy {source} to {destination}: {exc}") from exc
 
 
-def _copy_directory(source: Path, destination: Path) -> None:
-    try:
-        shutil.copytree(source, destination, dirs_exist_ok=True)
-    except OSError as exc:  # pragma: no cover - surfaced to the CLI user
-        raise CommandError(f"Failed to copy directory {source} to {destination}: {exc}") from exc
+def _remove_stale(entries: Sequence[ManifestEntry], destination: Path) -> None:
+    """Delete files the previous bundle listed but this one does not, and emptied folders.
+
+    Paths are resolved before anything is removed; an entry that resolves
+    outside ``destination``, for example through a symlinked folder, is refused.
+    """
+
+    root = destination.resolve()
+    directories: set[Path] = set()
+    for entry in entries:
+        # Resolve the parent only: a stale file that is itself a symlink is unlinked, not followed.
+        path = (root / entry.path).parent.resolve() / PurePosixPath(entry.path).name
+        if root not in path.parents:
+            raise CommandError(
+                f"Refusing to remove stale bundle file {entry.path}: it resolves outside "
+                f"{destination}"
+            )
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as exc:  # pragma: no cover - surfaced to the CLI user
+            raise CommandError(f"Failed to remove stale bundle file {path}: {exc}") from exc
+        directories.update(parent for parent in path.parents if root in parent.parents)
+    for directory in sorted(directories, key=lambda item: len(item.parts), reverse=True):
+        try:
+            directory.rmdir()
+        except OSError:
+            continue  # Not empty, or already gone.
 
 
 def _format_display_path(path: Path, project_root: Path) -> str:
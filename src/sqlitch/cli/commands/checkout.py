@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import subprocess  # nosec B404 - runs the local git client with argument lists
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
 import click
 
+from sqlitch.plan.diff import diff_change_sequences
+from sqlitch.plan.model import Plan
+from sqlitch.plan.parser import PlanParseError, parse_plan
+from sqlitch.plan.symbolic import ReferenceResolver
+from sqlitch.utils.logging import StructuredLogger
+
 from ..options import global_output_options, global_sqitch_options
 from . import CommandError, register_command
 from ._context import (
@@ -18,7 +25,8 @@ from ._context import (
     quiet_mode_enabled,
     require_cli_context,
 )
-from ._plan_utils import resolve_plan_path
+from ._plan_utils import resolve_default_engine, resolve_plan_path
+from ._session import load_registry_snapshot, open_execution_session
 
 __all__ = ["checkout_command"]
 
@@ -34,9 +42,15 @@ class _CheckoutRequest:
     log_only: bool
     vcs_command: str
     quiet: bool
+    config_root: Path | None = None
+    branch: str | None = None
+    default_engine: str | None = None
+    logger: StructuredLogger | None = None
+    lock_timeout: float | None = None
 
 
 @click.command("checkout")
+@click.argument("branch", required=False)
 @click.option("--target", "target_option", help="Deployment target alias or URI.")
 @click.option(
     "--mode",
@@ -49,6 +63,13 @@ class _CheckoutRequest:
 @click.option(
     "--log-only", is_flag=True, help="Describe the checkout pipeline without executing it."
 )
+@click.option(
+    "--lock-timeout",
+    "lock_timeout",
+    type=click.FloatRange(min=0),
+    help="Seconds to wait for another deployer's lock on the target (default: "
+    "core.lock_timeout or 60).",
+)
 @global_sqitch_options
 @global_output_options
 @click.pass_context
@@ -56,15 +77,22 @@ def checkout_command(  # pylint: disable=unused-argument
     # json_mode/verbose/quiet injected by @global_output_options
     ctx: click.Context,
     *,
+    branch: str | None,
     target_option: str | None,
     mode: str,
     to_change: str | None,
     log_only: bool,
+    lock_timeout: float | None,
     json_mode: bool,
     verbose: int,
     quiet: bool,
 ) -> None:
-    """Coordinate revert, VCS checkout, and redeploy operations."""
+    """Coordinate revert, VCS checkout, and redeploy operations.
+
+    With BRANCH, only the changes after the last change the deployed history
+    shares with BRANCH's plan are reverted, BRANCH is checked out with git, and
+    its plan is deployed.
+    """
 
     cli_context = require_cli_context(ctx)
     project_root = project_root_from(ctx)
@@ -72,10 +100,17 @@ def checkout_command(  # pylint: disable=unused-argument
     plan_override = plan_override_from(ctx)
 
     target = _resolve_target(target_option, cli_context.target)
-    vcs_command = _resolve_vcs_command(env)
+    if branch is not None:
+        if branch.startswith("-"):
+            raise CommandError(f"Invalid branch name: {branch}")
+        vcs_command = f"git checkout {branch}"
+    else:
+        vcs_command = _resolve_vcs_command(env)
 
     request = _build_request(
         project_root=project_root,
+        config_root=cli_context.config_root,
+        engine_override=cli_context.engine,
         env=env,
         plan_override=plan_override,
         target=target,
@@ -84,6 +119,9 @@ def checkout_command(  # pylint: disable=unused-argument
         log_only=log_only,
         vcs_command=vcs_command,
         quiet=quiet_mode_enabled(ctx),
+        branch=branch,
+        logger=cli_context.logger,
+        lock_timeout=lock_timeout,
     )
 
     _execute_checkout(request)
@@ -92,6 +130,8 @@ def checkout_command(  # pylint: disable=unused-argument
 def _build_request(
     *,
     project_root: Path,
+    config_root: Path,
+    engine_override: str | None,
     env: Mapping[str, str],
     plan_override: Path | None,
     target: str,
@@ -100,9 +140,44 @@ def _build_request(
     log_only: bool,
     vcs_command: str,
     quiet: bool,
+    branch: str | None = None,
+    logger: StructuredLogger | None = None,
+    lock_timeout: float | None = None,
 ) -> _CheckoutRequest:
     plan_path = _resolve_plan_path(project_root=project_root, override=plan_override, env=env)
 
+    default_engine: str | None = None
+    if branch is not None:
+        if mode != "latest":
+            raise CommandError(
+                "--mode cannot be combined with BRANCH; the target is reverted to the "
+                "last change shared with the branch's plan."
+            )
+        # The reference is resolved against the branch's plan before checkout.
+        default_engine = resolve_default_engine(
+            project_root=project_root,
+            config_root=config_root,
+            env=env,
+            engine_override=engine_override,
+            plan_path=plan_path,
+        )
+    elif to_change:
+        default_engine = resolve_default_engine(
+            project_root=project_root,
+            config_root=config_root,
+            env=env,
+            engine_override=engine_override,
+            plan_path=plan_path,
+        )
+        plan = _load_plan(plan_path, default_engine)
+        resolver = ReferenceResolver.from_plan(plan)
+        try:
+            to_change = resolver.target_reference(
+                resolver.resolve_target_index(to_change), to_change
+            )
+        except ValueError as exc:
+            raise CommandError(f"Plan does not contain change '{to_change}'.") from exc
+
     return _CheckoutRequest(
         project_root=project_root,
         env=env,
@@ -113,10 +188,19 @@ def _build_request(
         log_only=log_only,
         vcs_command=vcs_command,
         quiet=quiet,
+        config_root=config_root,
+        branch=branch,
+        default_engine=default_engine,
+        logger=logger,
+        lock_timeout=lock_timeout,
     )
 
 
 def _execute_checkout(request: _CheckoutRequest) -> None:
+    if request.branch is not None:
+        _execute_branch_checkout(request)
+        return
+
     emitter = _build_emitter(request.quiet)
 
     emitter(
@@ -130,7 +214,156 @@ def _execute_checkout(request: _CheckoutRequest) -> None:
         emitter("Log-only run; no database changes were applied.")
         return
 
-    raise CommandError("Checkout execution is not yet implemented; rerun with --log-only for now.")
+    raise CommandError("A branch to check out is required; rerun with --log-only to preview.")
+
+
+def _execute_branch_checkout(request: _CheckoutRequest) -> None:
+    """Move the target from the deployed history to the plan of ``request.branch``."""
+
+    # Import the command implementations
+    from .deploy import _DeployRequest, _execute_deploy, _plan_change_ids
+    from .revert import _execute_revert, _RevertRequest
+
+    assert request.branch is not None  # nosec B101 - guaranteed by caller
+    assert request.config_root is not None  # nosec B101 - set with branch
+    assert request.logger is not None  # nosec B101 - set with branch
+
+    emitter = _build_emitter(request.quiet)
+    plan = _load_plan(request.plan_path, request.default_engine)
+    branch_plan = _load_branch_plan(request)
+    branch_change_ids = _plan_change_ids(branch_plan)
+    to_change = request.to_change
+    deploy_count = len(branch_change_ids)
+    if to_change:
+        resolver = ReferenceResolver.from_plan(branch_plan)
+        try:
+            to_index = resolver.resolve_target_index(to_change)
+        except ValueError as exc:
+            raise CommandError(
+                f"Plan on branch '{request.branch}' does not contain change '{to_change}'."
+            ) from exc
+        to_change = resolver.target_reference(to_index, to_change)
+        deploy_count = to_index + 1
+
+    session = open_execution_session(
+        target=request.target,
+        project_root=request.project_root,
+        config_root=request.config_root,
+        env=request.env,
+        plan=plan,
+        plan_path=request.plan_path,
+        logger=request.logger,
+        lock_timeout=request.lock_timeout,
+    )
+    try:
+        deployed = load_registry_snapshot(session, plan.project_name).rows
+        diff = diff_change_sequences(
+            [row.change_id for row in deployed],
+            [change_id for _, change_id in branch_change_ids],
+        )
+
+        if diff.common:
+            last_shared = deployed[diff.common - 1].change
+            emitter(f"Last change before the branches diverged: {last_shared}")
+
+        # Reverts use the current checkout's scripts, so every reverted change
+        # must be part of the current plan.
+        plan_positions = {
+            change_id: index for index, (_, change_id) in enumerate(session.change_ids)
+        }
+        for index in diff.revert:
+            if deployed[index].change_id not in plan_positions:
+                raise CommandError(
+                    f"Deployed change '{deployed[index].change}' is not in the current plan; "
+                    "cannot revert it before checkout."
+                )
+
+        if request.log_only:
+            for index in diff.revert:
+                emitter(f"Would revert change {deployed[index].change}")
+            emitter(f"Would run VCS command: {request.vcs_command}")
+            for index in diff.deploy:
+                if index < deploy_count:
+                    emitter(f"Would deploy change {branch_change_ids[index][0].name}")
+            emitter("Log-only run; no database changes were applied.")
+            return
+
+        if diff.revert:
+            keep_count = (
+                plan_positions[deployed[diff.common - 1].change_id] + 1 if diff.common else 0
+            )
+            _execute_revert(
+                _RevertRequest(
+                    project_root=request.project_root,
+                    env=request.env,
+                    plan_path=request.plan_path,
+                    plan=plan,
+                    target=request.target,
+                    to_change=None,
+                    to_tag=None,
+                    log_only=False,
+                    skip_prompt=True,
+                    quiet=request.quiet,
+                    config_root=request.config_root,
+                    logger=request.logger,
+                    keep_count=keep_count,
+                ),
+                session,
+            )
+
+        _run_git(["checkout", request.branch, "--"], cwd=request.project_root)
+
+        checked_out = _load_plan(request.plan_path, request.default_engine)
+        session.change_ids = _plan_change_ids(checked_out)
+        _execute_deploy(
+            _DeployRequest(
+                project_root=request.project_root,
+                config_root=request.config_root,
+                env=request.env,
+                plan_path=request.plan_path,
+                plan=checked_out,
+                target=request.target,
+                to_change=to_change,
+                to_tag=None,
+                log_only=False,
+                quiet=request.quiet,
+                logger=request.logger,
+                registry_override=None,
+            ),
+            session,
+        )
+    finally:
+        session.close()
+
+
+def _load_branch_plan(request: _CheckoutRequest) -> Plan:
+    """Parse the plan file as committed on ``request.branch`` without checking it out."""
+
+    plan_dir = request.plan_path.parent
+    content = _run_git(["show", f"{request.branch}:./{request.plan_path.name}"], cwd=plan_dir)
+    try:
+        return parse_plan(request.plan_path, default_engine=request.default_engine, content=content)
+    except (PlanParseError, ValueError) as exc:
+        raise CommandError(f"Unable to parse plan on branch '{request.branch}': {exc}") from exc
+
+
+def _run_git(args: Sequence[str], *, cwd: Path) -> str:
+    """Run the local git client and return its standard output."""
+
+    try:
+        completed = subprocess.run(  # nosec B603 B607 - fixed executable, no shell
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as exc:
+        raise CommandError(f"Unable to run git: {exc}") from exc
+    if completed.returncode != 0:
+        detail = completed.stderr.strip() or f"exit status {completed.returncode}"
+        raise CommandError(f"git {' '.join(args)} failed: {detail}")
+    return completed.stdout
 
 
 def _resolve_target(target_option: str | None, configured_target: str | None) -> str:
@@ -166,6 +399,15 @@ def _resolve_plan_path(
     )
 
 
+def _load_plan(plan_path: Path, default_engine: str | None) -> Plan:
+    try:
+        return parse_plan(plan_path, default_engine=default_engine)
+    except (PlanParseError, ValueError) as exc:  # pragma: no cover - delegated to parser tests
+        raise CommandError(str(exc)) from exc
+    except OSError as exc:  # pragma: no cover - IO failures surfaced to the CLI user
+        raise CommandError(f"Unable to read plan file {plan_path}: {exc}") from exc
+
+
 def _build_emitter(quiet: bool) -> Callable[[str], None]:
     def _emit(message: str) -> None:
         if not quiet:
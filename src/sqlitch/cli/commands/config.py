@@ -18,12 +18,7 @@ from sqlitch.utils.fs import ArtifactConflictError, resolve_config_file
 
 from ..options import global_sqitch_options
 from . import CommandError, register_command
-from ._context import (
-    environment_from,
-    project_root_from,
-    quiet_mode_enabled,
-    require_cli_context,
-)
+from ._context import environment_from, project_root_from, quiet_mode_enabled, require_cli_context
 
 __all__ = ["config_command"]
 
@@ -6,6 +6,8 @@ import hashlib
 import logging
 import sqlite3
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,25 +16,31 @@ from typing import Callable, TypedDict
 import click
 
 from sqlitch.config import resolver as config_resolver
-from sqlitch.engine import (
-    MYSQL_STUB_MESSAGE,
-    POSTGRES_STUB_MESSAGE,
-    EngineTarget,
-    canonicalize_engine_name,
-    create_engine,
-)
-from sqlitch.engine.base import UnsupportedEngineError
+from sqlitch.engine import EngineTarget, canonicalize_engine_name, create_engine
+from sqlitch.engine.base import EngineError, UnsupportedEngineError
+from sqlitch.engine.lock import DeployLock
+from sqlitch.engine.script_cache import ScriptCache
+from sqlitch.engine.server import RegistryChangeRecord, RegistryTagRecord, ServerEngine
 from sqlitch.engine.sqlite import (
     REGISTRY_ATTACHMENT_ALIAS,
+    PreparedSQLiteScript,
     SQLiteEngine,
-    extract_sqlite_statements,
+    SQLiteEngineError,
+    compute_script_hash,
     resolve_sqlite_filesystem_path,
-    script_manages_transactions,
-    validate_sqlite_script,
 )
+from sqlitch.engine.sqlite_execution import (
+    DEFAULT_EXECUTION_STRATEGY,
+    EXECUTION_STRATEGIES,
+    execute_sqlite_statements,
+)
+from sqlitch.plan.graph import DependencyCycleError, build_dependency_graph
 from sqlitch.plan.model import Change, Plan
 from sqlitch.plan.parser import PlanParseError, parse_plan
+from sqlitch.plan.symbolic import ReferenceResolver
 from sqlitch.registry import LATEST_REGISTRY_VERSION, get_registry_migrations
+from sqlitch.registry.statements import registry_statements
+from sqlitch.utils.bundle import BundleArchive, BundleArchiveError
 from sqlitch.utils.identity import (
     generate_change_id,
     resolve_email,
@@ -52,9 +60,17 @@ from ._context import (
     require_cli_context,
 )
 from ._plan_utils import resolve_default_engine, resolve_plan_path
+from ._session import ExecutionSession, RegistrySnapshot, acquire_deploy_lock, resolve_lock_settings
 
 __all__ = ["deploy_command"]
 
+_PREFLIGHT_SCRIPT_KINDS: dict[str, tuple[str, ...]] = {
+    "deploy": ("deploy",),
+    "all": ("deploy", "revert", "verify"),
+}
+_PREFLIGHT_MODES = tuple(_PREFLIGHT_SCRIPT_KINDS)
+_PREFLIGHT_MAX_WORKERS = 8
+
 # Module-level logger for low-level warnings (e.g., cleanup failures)
 _module_logger = logging.getLogger(__name__)
 
@@ -81,6 +97,11 @@ class _DeployRequest:
     quiet: bool
     logger: StructuredLogger
     registry_override: str | None
+    preflight: str = "deploy"
+    lock_timeout: float | None = None
+    execution_strategy: str | None = None
+    # Archive the plan and scripts are read from instead of the project directory.
+    bundle: BundleArchive | None = None
 
 
 @click.command("deploy")
@@ -93,6 +114,38 @@ class _DeployRequest:
     is_flag=True,
     help="Show the deployment actions without executing any scripts.",
 )
+@click.option(
+    "--preflight",
+    "preflight",
+    type=click.Choice(_PREFLIGHT_MODES),
+    default="deploy",
+    show_default=True,
+    help="Scripts to load and validate before the first change is applied "
+    "(deploy scripts only, or deploy, revert, and verify scripts).",
+)
+@click.option(
+    "--lock-timeout",
+    "lock_timeout",
+    type=click.FloatRange(min=0),
+    help="Seconds to wait for another deployer's lock on the target (default: "
+    "core.lock_timeout or 60).",
+)
+@click.option(
+    "--execution-strategy",
+    "execution_strategy",
+    type=click.Choice(EXECUTION_STRATEGIES),
+    help="How SQLite deploy scripts are executed: one call per statement, one "
+    "executescript call, or batched literal INSERTs, which is slower than "
+    "statement in benchmarks (default: the target's or engine's "
+    "execution_strategy setting, else statement).",
+)
+@click.option(
+    "--bundle",
+    "bundle_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Deploy the plan and scripts of a bundle archive written by "
+    "'bundle --archive', without extracting it.",
+)
 @global_sqitch_options
 @global_output_options
 @click.pass_context
@@ -105,38 +158,64 @@ def deploy_command(  # pylint: disable=unused-argument
     to_change: str | None,
     to_tag: str | None,
     log_only: bool,
+    preflight: str,
+    lock_timeout: float | None,
+    execution_strategy: str | None,
+    bundle_path: Path | None,
     json_mode: bool,
     verbose: int,
     quiet: bool,
 ) -> None:
-    """Deploy pending plan changes to the requested target."""
+    """Deploy pending plan changes to the requested target.
+
+    With ``--bundle`` the plan and scripts come from a bundle archive, which
+    is checked against its manifest as it is read; the project directory only
+    supplies configuration.
+    """
 
     cli_context = require_cli_context(ctx)
     project_root = project_root_from(ctx)
     env = environment_from(ctx)
     plan_override = plan_override_from(ctx)
+    logger = cli_context.logger
 
-    plan_path_for_engine = _resolve_plan_path(
-        project_root=project_root, override=plan_override, env=env
-    )
+    bundle: BundleArchive | None = None
+    if bundle_path is not None:
+        if plan_override is not None:
+            raise CommandError("--bundle cannot be combined with --plan-file.")
+        bundle = ctx.with_resource(_open_bundle(bundle_path, project_root))
 
-    default_engine = resolve_default_engine(
-        project_root=project_root,
-        config_root=cli_context.config_root,
-        env=env,
-        engine_override=cli_context.engine,
-        plan_path=plan_path_for_engine,
-    )
+    with logger.span("deploy.config"):
+        if bundle is not None:
+            try:
+                plan_path_for_engine = bundle.plan_path
+            except BundleArchiveError as exc:
+                raise CommandError(str(exc)) from exc
+            plan_content = _read_script_text(plan_path_for_engine, bundle)
+        else:
+            plan_path_for_engine = _resolve_plan_path(
+                project_root=project_root, override=plan_override, env=env
+            )
+            plan_content = None
 
-    target = _resolve_target(
-        option_value=target_option,
-        configured_target=cli_context.target,
-        positional_targets=target_args,
-        project_root=project_root,
-        config_root=cli_context.config_root,
-        env=env,
-        default_engine=default_engine,
-    )
+        default_engine = resolve_default_engine(
+            project_root=project_root,
+            config_root=cli_context.config_root,
+            env=env,
+            engine_override=cli_context.engine,
+            plan_path=plan_path_for_engine,
+            plan_content=plan_content,
+        )
+
+        target = _resolve_target(
+            option_value=target_option,
+            configured_target=cli_context.target,
+            positional_targets=target_args,
+            project_root=project_root,
+            config_root=cli_context.config_root,
+            env=env,
+            default_engine=default_engine,
+        )
 
     request = _build_request(
         project_root=project_root,
@@ -151,6 +230,11 @@ def deploy_command(  # pylint: disable=unused-argument
         default_engine=default_engine,
         logger=cli_context.logger,
         registry_override=cli_context.registry,
+        preflight=preflight,
+        lock_timeout=lock_timeout,
+        execution_strategy=execution_strategy,
+        bundle=bundle,
+        plan_content=plan_content,
     )
 
     _execute_deploy(request)
@@ -170,13 +254,22 @@ def _build_request(
     default_engine: str,
     logger: StructuredLogger,
     registry_override: str | None,
+    preflight: str = "deploy",
+    lock_timeout: float | None = None,
+    execution_strategy: str | None = None,
+    bundle: BundleArchive | None = None,
+    plan_content: str | None = None,
 ) -> _DeployRequest:
     if to_change and to_tag:
         raise CommandError("Cannot combine --to-change and --to-tag filters.")
 
-    plan_path = _resolve_plan_path(project_root=project_root, override=plan_override, env=env)
-    plan = _load_plan(plan_path, default_engine)
-    _assert_plan_dependencies_present(plan=plan, plan_path=plan_path)
+    if bundle is not None:
+        plan_path = bundle.plan_path
+    else:
+        plan_path = _resolve_plan_path(project_root=project_root, override=plan_override, env=env)
+    with logger.span("deploy.plan.parse", plan_path=plan_path.as_posix()):
+        plan = _load_plan(plan_path, default_engine, bundle=bundle, content=plan_content)
+        _assert_plan_dependencies_present(plan=plan, plan_path=plan_path)
 
     return _DeployRequest(
         project_root=project_root,
@@ -191,23 +284,34 @@ def _build_request(
         quiet=quiet,
         logger=logger,
         registry_override=registry_override,
+        preflight=preflight,
+        lock_timeout=lock_timeout,
+        execution_strategy=execution_strategy,
+        bundle=bundle,
     )
 
 
-def _execute_deploy(request: _DeployRequest) -> None:
+def _execute_deploy(request: _DeployRequest, session: ExecutionSession | None = None) -> None:
+    """Deploy pending plan changes to the request target.
+
+    When ``session`` is provided its target, committer identity, connection,
+    registry snapshot, and change IDs are used instead of being resolved again,
+    and the connection is left open for the session owner to close. Otherwise
+    the target's advisory deploy lock is held while changes are applied.
+    """
+
     logger = request.logger
     changes = _select_changes(
         plan=request.plan,
         to_change=request.to_change,
         to_tag=request.to_tag,
     )
-    change_names = [change.name for change in changes]
     logger.debug(
         "deploy.changes.selected",
-        payload={
+        payload=lambda: {
             "plan": request.plan.project_name,
             "plan_path": request.plan_path.as_posix(),
-            "changes": change_names,
+            "changes": [change.name for change in changes],
             "to_change": request.to_change,
             "to_tag": request.to_tag,
         },
@@ -216,11 +320,11 @@ def _execute_deploy(request: _DeployRequest) -> None:
     if request.log_only:
         logger.info(
             "deploy.log_only",
-            payload={
+            payload=lambda: {
                 "plan": request.plan.project_name,
                 "plan_path": request.plan_path.as_posix(),
                 "target": request.target,
-                "changes": change_names,
+                "changes": [change.name for change in changes],
             },
         )
         _render_log_only_deploy(request, changes)
@@ -228,27 +332,31 @@ def _execute_deploy(request: _DeployRequest) -> None:
 
     emitter = _build_emitter(request.quiet)
 
-    engine_target, display_target = _resolve_engine_target(
-        target=request.target,
-        project_root=request.project_root,
-        config_root=request.config_root,
-        env=request.env,
-        default_engine=request.plan.default_engine,
-        plan_path=request.plan_path,
-        registry_override=request.registry_override,
-        logger=logger,
-    )
+    if session is not None:
+        engine_target, display_target = session.engine_target, session.display_target
+    else:
+        with logger.span("deploy.target.resolve"):
+            engine_target, display_target = _resolve_engine_target(
+                target=request.target,
+                project_root=request.project_root,
+                config_root=request.config_root,
+                env=request.env,
+                default_engine=request.plan.default_engine,
+                plan_path=request.plan_path,
+                registry_override=request.registry_override,
+                logger=logger,
+            )
 
     emitter(f"Deploying plan '{request.plan.project_name}' to target '{display_target}'.")
     logger.info(
         "deploy.start",
-        payload={
+        payload=lambda: {
             "plan": request.plan.project_name,
             "plan_path": request.plan_path.as_posix(),
             "target": engine_target.uri,
             "display_target": display_target,
             "registry": engine_target.registry_uri,
-            "changes": change_names,
+            "changes": [change.name for change in changes],
         },
     )
 
@@ -264,68 +372,105 @@ def _execute_deploy(request: _DeployRequest) -> None:
         )
         return
 
-    committer_name, committer_email = _resolve_committer_identity(
-        request.env,
-        request.config_root,
-        request.project_root,
-    )
-
-    engine, connection = _create_engine_connection(engine_target)
-
-    if not isinstance(engine, SQLiteEngine):  # pragma: no cover - defensive guard
-        raise CommandError("Only the SQLite engine is supported for deploy in this milestone")
-
-    # EngineTarget.__post_init__ guarantees registry_uri is never None
-    assert engine_target.registry_uri is not None  # nosec B101 - type guard for invariant
-    registry_schema = REGISTRY_ATTACHMENT_ALIAS
+    if session is not None:
+        committer_name, committer_email = session.committer_name, session.committer_email
+    else:
+        committer_name, committer_email = _resolve_committer_identity(
+            request.env,
+            request.config_root,
+            request.project_root,
+        )
 
-    try:
-        _initialise_registry_state(
-            connection=connection,
-            registry_schema=registry_schema,
-            project=request.plan.project_name,
-            plan=request.plan,
+    if engine_target.engine != "sqlite":
+        _execute_server_deploy(
+            request=request,
+            engine_target=engine_target,
+            display_target=display_target,
+            changes=changes,
             committer_name=committer_name,
             committer_email=committer_email,
             emitter=emitter,
-            registry_uri=engine_target.registry_uri,
         )
+        return
 
-        deployed_ids, deployed_metadata = _load_deployed_state(
-            connection=connection,
-            registry_schema=registry_schema,
-            project=request.plan.project_name,
+    owns_connection = session is None or session.connection is None
+    lock: DeployLock | None = None
+    if session is not None and session.connection is not None:
+        connection = session.connection
+    else:
+        settings = resolve_lock_settings(
+            project_root=request.project_root,
+            config_root=request.config_root,
+            env=request.env,
+            lock_timeout=request.lock_timeout,
         )
-
-        # Build a cache of change IDs as we process the plan sequentially
-        # This allows us to resolve parent IDs (previous change chronologically)
-        change_id_cache: dict[int, str] = {}
-
-        # Compute change_id for each change in the plan and filter out deployed ones
-        pending: list[tuple[Change, str]] = []
-        for idx, change in enumerate(request.plan.changes):
-            # Resolve parent ID (the previous change chronologically)
-            parent_id = _resolve_parent_id_for_change(request.plan, idx, change_id_cache)
-
-            # Compute the change ID with the resolved parent
-            change_id = _compute_change_id_for_change(
-                request.plan.project_name,
-                change,
-                request.plan.uri,
-                parent_id,
+        with logger.span("deploy.lock.wait"):
+            lock = acquire_deploy_lock(
+                engine_target,
+                owner=f"{committer_name} <{committer_email}>",
+                timeout=settings.timeout,
+            )
+        try:
+            engine, connection = _create_engine_connection(
+                engine_target, busy_timeout=settings.busy_timeout
             )
+        except BaseException:
+            if lock is not None:
+                lock.release()
+            raise
 
-            # Cache the ID by index for parent resolution
-            change_id_cache[idx] = change_id
+        if not isinstance(engine, SQLiteEngine):  # pragma: no cover - defensive guard
+            raise CommandError("Only the SQLite engine is supported for deploy in this milestone")
 
-            if change_id not in deployed_ids:
-                pending.append((change, change_id))
+    # EngineTarget.__post_init__ guarantees registry_uri is never None
+    assert engine_target.registry_uri is not None  # nosec B101 - type guard for invariant
+    registry_schema = REGISTRY_ATTACHMENT_ALIAS
+
+    try:
+        with logger.span("deploy.registry.load"):
+            _initialise_registry_state(
+                connection=connection,
+                registry_schema=registry_schema,
+                project=request.plan.project_name,
+                plan=request.plan,
+                committer_name=committer_name,
+                committer_email=committer_email,
+                emitter=emitter,
+                registry_uri=engine_target.registry_uri,
+            )
+
+            snapshot = session.snapshot if session is not None else None
+            if snapshot is None:
+                snapshot = RegistrySnapshot.load(
+                    connection, registry_schema, request.plan.project_name
+                )
+            deployed_ids = snapshot.change_ids
+            deployed_metadata = snapshot.by_name()
+        if session is not None:
+            change_ids = session.change_ids
+        else:
+            with logger.span("deploy.change_ids"):
+                change_ids = _plan_change_ids(request.plan)
+
+        pending: list[tuple[Change, str]] = [
+            (change, change_id) for change, change_id in change_ids if change_id not in deployed_ids
+        ]
+
+        with logger.span("deploy.preflight", changes=len(pending)):
+            prepared_scripts = _preflight_scripts(
+                plan_root=request.plan_path.parent,
+                changes=[change for change, _ in pending],
+                env=request.env,
+                kinds=_PREFLIGHT_SCRIPT_KINDS[request.preflight],
+                logger=logger,
+                bundle=request.bundle,
+            )
 
         _synchronise_registry_tags(
             connection=connection,
             registry_schema=registry_schema,
             project=request.plan.project_name,
-            plan=request.plan,
+            change_ids=change_ids,
             deployed=deployed_metadata,
             env=request.env,
             committer_name=committer_name,
@@ -344,28 +489,43 @@ def _execute_deploy(request: _DeployRequest) -> None:
             )
             return
 
+        if session is not None:
+            # Registry rows written below are not tracked by the snapshot.
+            session.snapshot = None
+
+        strategy = _resolve_execution_strategy(request)
+
         applied = 0
-        for change, change_id in pending:
+        log_starts = logger.enabled("INFO")
+        log_successes = logger.enabled("INFO", "deploy.change.success")
+        for (change, change_id), script in zip(pending, prepared_scripts, strict=True):
+            assert script.prepared is not None  # nosec B101 - SQLite pre-flight prepares
             change_payload = {
                 "change": change.name,
                 "plan": request.plan.project_name,
                 "target": engine_target.uri,
                 "registry": engine_target.registry_uri,
             }
-            logger.info("deploy.change.start", payload=change_payload)
+            if log_starts:
+                logger.info("deploy.change.start", payload=change_payload)
             try:
-                transaction_scope = _apply_change(
-                    connection=connection,
-                    project=request.plan.project_name,
-                    plan_root=request.plan_path.parent,
-                    change=change,
-                    change_id=change_id,
-                    env=request.env,
-                    committer_name=committer_name,
-                    committer_email=committer_email,
-                    deployed=deployed_metadata,
-                    registry_schema=registry_schema,
-                )
+                with logger.span("deploy.apply", change=change.name):
+                    transaction_scope = _apply_change(
+                        connection=connection,
+                        project=request.plan.project_name,
+                        plan_root=request.plan_path.parent,
+                        change=change,
+                        change_id=change_id,
+                        env=request.env,
+                        committer_name=committer_name,
+                        committer_email=committer_email,
+                        deployed=deployed_metadata,
+                        registry_schema=registry_schema,
+                        prepared=script.prepared,
+                        strategy=strategy,
+                        logger=logger,
+                        bundle=request.bundle,
+                    )
             except Exception as exc:
                 logger.error(
                     "deploy.change.error",
@@ -376,13 +536,14 @@ def _execute_deploy(request: _DeployRequest) -> None:
             else:
                 emitter(f"  + {change.name}")
                 applied += 1
-                logger.info(
-                    "deploy.change.success",
-                    payload={
-                        **change_payload,
-                        "transaction_scope": transaction_scope,
-                    },
-                )
+                if log_successes:
+                    logger.info(
+                        "deploy.change.success",
+                        payload={
+                            **change_payload,
+                            "transaction_scope": transaction_scope,
+                        },
+                    )
 
         emitter(f"Deployment complete. Applied {applied} change(s).")
         logger.info(
@@ -392,6 +553,7 @@ def _execute_deploy(request: _DeployRequest) -> None:
                 "target": engine_target.uri,
                 "registry": engine_target.registry_uri,
                 "applied": applied,
+                "execution_strategy": strategy,
             },
         )
     except Exception as exc:
@@ -407,7 +569,8 @@ def _execute_deploy(request: _DeployRequest) -> None:
         raise
     finally:
         try:
-            connection.close()
+            if owns_connection:
+                connection.close()
         except Exception as exc:  # pylint: disable=broad-exception-caught # pragma: no cover
             # Cleanup must never fail the operation; log but don't mask original exception
             _module_logger.warning(
@@ -415,6 +578,205 @@ def _execute_deploy(request: _DeployRequest) -> None:
                 exc,
                 extra={"exception_type": type(exc).__name__},
             )
+        if lock is not None:
+            lock.release()
+
+
+def _execute_server_deploy(
+    *,
+    request: _DeployRequest,
+    engine_target: EngineTarget,
+    display_target: str,
+    changes: Sequence[Change],
+    committer_name: str,
+    committer_email: str,
+    emitter: Callable[[str], None],
+) -> None:
+    """Deploy ``changes`` to a target whose registry lives on a database server.
+
+    All registry reads and writes share one pooled connection; each change's
+    script and registry rows are committed together unless the script manages
+    its own transactions.
+    """
+
+    logger = request.logger
+    plan = request.plan
+    try:
+        engine = create_engine(engine_target)
+    except (UnsupportedEngineError, EngineError) as exc:
+        raise CommandError(f"Unsupported engine '{engine_target.engine}': {exc}") from exc
+    if not isinstance(engine, ServerEngine):  # pragma: no cover - defensive guard
+        raise CommandError(f"Engine '{engine_target.engine}' deployment is not supported yet.")
+
+    selected = {id(change) for change in changes}
+    plan_root = request.plan_path.parent
+    try:
+        with engine.session() as connection:
+            if not engine.registry_exists(connection):
+                emitter(f"Adding registry tables to {display_target}")
+                engine.initialise_registry(
+                    connection, installer_name=committer_name, installer_email=committer_email
+                )
+            engine.ensure_project(
+                connection,
+                project=plan.project_name,
+                uri=plan.uri,
+                creator_name=committer_name,
+                creator_email=committer_email,
+            )
+
+            with logger.span("deploy.registry.load"):
+                deployed_rows = engine.load_deployed_changes(connection, plan.project_name)
+            deployed_ids = {row.change_id for row in deployed_rows}
+            deployed: dict[str, DeployedMetadata] = {
+                row.change: {
+                    "change_id": row.change_id,
+                    "script_hash": row.script_hash or "",
+                    "tags": set(),
+                }
+                for row in deployed_rows
+            }
+            pending = [
+                (change, change_id)
+                for change, change_id in _plan_change_ids(plan)
+                if change_id not in deployed_ids and id(change) in selected
+            ]
+            if not pending:
+                emitter("Nothing to deploy (up-to-date).")
+                logger.info(
+                    "deploy.noop",
+                    payload={
+                        "reason": "already-deployed",
+                        "plan": plan.project_name,
+                        "target": engine_target.uri,
+                    },
+                )
+                return
+
+            prepared_scripts = _preflight_scripts(
+                plan_root=plan_root,
+                changes=[change for change, _ in pending],
+                env=request.env,
+                kinds=_PREFLIGHT_SCRIPT_KINDS[request.preflight],
+                logger=logger,
+                bundle=request.bundle,
+                prepare_sqlite=False,
+            )
+
+            applied = 0
+            log_starts = logger.enabled("INFO")
+            log_successes = logger.enabled("INFO", "deploy.change.success")
+            for (change, change_id), script in zip(pending, prepared_scripts, strict=True):
+                manages_transactions = engine.script_manages_transactions(script.body)
+                change_payload = {
+                    "change": change.name,
+                    "plan": plan.project_name,
+                    "target": engine_target.uri,
+                    "registry": engine_target.registry_uri,
+                }
+                if log_starts:
+                    logger.info("deploy.change.start", payload=change_payload)
+                record = _build_registry_record(
+                    project=plan.project_name,
+                    change=change,
+                    change_id=change_id,
+                    script_hash=script.script_hash,
+                    deployed=deployed,
+                    env=request.env,
+                    committer_name=committer_name,
+                    committer_email=committer_email,
+                )
+                try:
+                    with logger.span("deploy.apply", change=change.name):
+                        # Run the body pre-flight hashed, not a fresh read.
+                        engine.deploy_change(
+                            connection,
+                            script.body,
+                            record,
+                            manages_transactions=manages_transactions,
+                        )
+                except EngineError as exc:
+                    logger.error("deploy.change.error", message=str(exc), payload=change_payload)
+                    try:
+                        engine.record_failure(connection, record)
+                    except EngineError as record_exc:
+                        raise CommandError(f"{exc}; additionally, {record_exc}") from exc
+                    raise CommandError(str(exc)) from exc
+
+                deployed[change.name] = {
+                    "change_id": record.change_id,
+                    "script_hash": script.script_hash,
+                    "tags": set(change.tags),
+                }
+                emitter(f"  + {change.name}")
+                applied += 1
+                if log_successes:
+                    logger.info(
+                        "deploy.change.success",
+                        payload={
+                            **change_payload,
+                            "transaction_scope": (
+                                "script-managed" if manages_transactions else "engine-managed"
+                            ),
+                        },
+                    )
+    except EngineError as exc:
+        raise CommandError(str(exc)) from exc
+
+    emitter(f"Deployment complete. Applied {applied} change(s).")
+    logger.info(
+        "deploy.complete",
+        payload={
+            "plan": plan.project_name,
+            "target": engine_target.uri,
+            "registry": engine_target.registry_uri,
+            "applied": applied,
+        },
+    )
+
+
+def _build_registry_record(
+    *,
+    project: str,
+    change: Change,
+    change_id: str,
+    script_hash: str,
+    deployed: Mapping[str, DeployedMetadata],
+    env: Mapping[str, str],
+    committer_name: str,
+    committer_email: str,
+) -> RegistryChangeRecord:
+    """Describe the registry rows written when ``change`` is deployed."""
+
+    dependency_lookup = _build_dependency_lookup(change, deployed)
+    _validate_dependencies(change, dependency_lookup)
+    planner_name, planner_email = _resolve_planner_identity(change.planner, env, committer_email)
+    if change.change_id is not None:
+        change_id = str(change.change_id)
+
+    return RegistryChangeRecord(
+        project=project,
+        change_id=change_id,
+        change=change.name,
+        script_hash=script_hash,
+        note=change.notes or "",
+        committed_at=datetime.now(timezone.utc),
+        committer_name=committer_name,
+        committer_email=committer_email,
+        planned_at=change.planned_at,
+        planner_name=planner_name,
+        planner_email=planner_email,
+        requires=tuple(change.dependencies),
+        conflicts=tuple(change.conflicts),
+        tags=tuple(
+            RegistryTagRecord(tag_id=_registry_tag_id(change_id, tag), tag=tag)
+            for tag in change.tags
+        ),
+        dependency_ids={
+            dependency: dependency_lookup[dependency.partition("@")[0]]
+            for dependency in change.dependencies
+        },
+    )
 
 
 def _resolve_target(
@@ -476,9 +838,24 @@ def _resolve_plan_path(
     )
 
 
-def _load_plan(plan_path: Path, default_engine: str | None) -> Plan:
+def _load_plan(
+    plan_path: Path,
+    default_engine: str | None,
+    *,
+    bundle: BundleArchive | None = None,
+    content: str | None = None,
+) -> Plan:
+    """Parse the plan at ``plan_path``, or ``content`` when its text was already read."""
+
     try:
-        return parse_plan(plan_path, default_engine=default_engine)
+        if bundle is not None:
+            return parse_plan(
+                plan_path,
+                default_engine=default_engine,
+                content=content if content is not None else _read_script_text(plan_path, bundle),
+                list_directory=bundle.list_directory,
+            )
+        return parse_plan(plan_path, default_engine=default_engine, content=content)
     except (PlanParseError, ValueError) as exc:  # pragma: no cover - delegated to parser tests
         raise CommandError(str(exc)) from exc
     except OSError as exc:  # pragma: no cover - IO failures surfaced to the CLI user
@@ -486,21 +863,19 @@ def _load_plan(plan_path: Path, default_engine: str | None) -> Plan:
 
 
 def _assert_plan_dependencies_present(*, plan: Plan, plan_path: Path) -> None:
-    """Verify all dependencies exist in the plan.
+    """Verify all dependencies exist in the plan and do not form a cycle.
 
     Dependencies can include tag references (e.g., "userflips@v1.0.0-dev2" for reworked changes).
-    We normalize these to bare change names when checking plan presence.
+    The dependency graph resolves these to the matching change instance.
     """
-    known_changes = {change.name for change in plan.changes}
-    missing: list[str] = []
-    for change in plan.changes:
-        for dependency in change.dependencies:
-            # Strip tag suffix if present (e.g., "userflips@v1.0.0-dev2" -> "userflips")
-            dependency_name = dependency.split("@", 1)[0] if "@" in dependency else dependency
-            if dependency_name not in known_changes and dependency not in missing:
-                missing.append(dependency)
+    graph = build_dependency_graph(plan)
+    missing = graph.missing_dependencies
 
     if not missing:
+        try:
+            graph.assert_acyclic()
+        except DependencyCycleError as exc:
+            raise CommandError(str(exc)) from exc
         return
 
     plan_name = plan_path.name
@@ -521,21 +896,24 @@ def _select_changes(
     if not changes:
         return ()
 
+    if not to_change and not to_tag:
+        return changes
+
+    resolver = ReferenceResolver.from_plan(plan)
     if to_change:
         try:
-            index = next(i for i, change in enumerate(changes) if change.name == to_change)
-        except StopIteration as exc:
+            index = resolver.resolve_target_index(to_change)
+        except ValueError as exc:
             raise CommandError(f'Unknown change: "{to_change}"') from exc
         return changes[: index + 1]
 
-    if to_tag:
-        try:
-            tag_entry = next(tag for tag in plan.tags if tag.name == to_tag)
-        except StopIteration as exc:
-            raise CommandError(f"Plan does not contain tag '{to_tag}'.") from exc
-        return _select_changes(plan=plan, to_change=tag_entry.change_ref, to_tag=None)
-
-    return changes
+    assert to_tag is not None  # nosec B101 - guaranteed by the early return above
+    tag_ref = to_tag if to_tag.startswith("@") else f"@{to_tag}"
+    try:
+        index = resolver.resolve_index(tag_ref)
+    except ValueError as exc:
+        raise CommandError(f"Plan does not contain tag '{to_tag}'.") from exc
+    return changes[: index + 1]
 
 
 def _resolve_engine_target(
@@ -618,25 +996,49 @@ def _resolve_engine_target(
         )
         return engine_target, display_name
 
-    if engine_name == "mysql":
-        logger.warning(
-            "deploy.stub_engine",
-            message=MYSQL_STUB_MESSAGE,
-            payload={"engine": engine_name, "target": target},
+    if engine_name in {"pg", "mysql"}:
+        workspace_uri = (
+            candidate if candidate.startswith("db:") else f"db:{engine_name}:{workspace_payload}"
         )
-        raise CommandError(MYSQL_STUB_MESSAGE)
-
-    if engine_name == "pg":
-        logger.warning(
-            "deploy.stub_engine",
-            message=POSTGRES_STUB_MESSAGE,
-            payload={"engine": engine_name, "target": target},
+        engine_target = EngineTarget(
+            name=original_display,
+            engine=engine_name,
+            uri=workspace_uri,
+            registry_uri=registry_override or workspace_uri,
         )
-        raise CommandError(POSTGRES_STUB_MESSAGE)
+        return engine_target, original_display
 
     raise CommandError(f"Engine '{engine_name}' deployment is not supported yet.")
 
 
+def _resolve_execution_strategy(request: _DeployRequest) -> str:
+    """Return the SQLite script execution strategy for the request target.
+
+    ``--execution-strategy`` wins, then ``target.<name>.execution_strategy``,
+    then ``engine.sqlite.execution_strategy``, then the default.
+    """
+
+    if request.execution_strategy is not None:
+        return request.execution_strategy
+
+    config_profile = config_resolver.resolve_config(
+        root_dir=request.project_root,
+        config_root=request.config_root,
+        env=request.env,
+    )
+    for section in (f'target "{request.target.strip()}"', 'engine "sqlite"'):
+        value = config_profile.settings.get(section, {}).get("execution_strategy")
+        if value:
+            strategy = value.strip().lower()
+            if strategy not in EXECUTION_STRATEGIES:
+                raise CommandError(
+                    f"Invalid execution_strategy '{value}' in [{section}]; expected one of "
+                    f"{', '.join(EXECUTION_STRATEGIES)}."
+                )
+            return strategy
+    return DEFAULT_EXECUTION_STRATEGY
+
+
 def _resolve_sqlite_workspace_uri(
     *,
     payload: str,
@@ -666,17 +1068,19 @@ def _resolve_sqlite_workspace_uri(
 
 def _create_engine_connection(
     engine_target: EngineTarget,
+    *,
+    busy_timeout: int | None = None,
 ) -> tuple[SQLiteEngine, sqlite3.Connection]:
     """Instantiate the engine and open a workspace connection."""
 
+    if engine_target.engine != "sqlite":
+        raise CommandError(f"Engine '{engine_target.engine}' deployment is not supported yet.")
+
     try:
-        engine = create_engine(engine_target)
+        engine = create_engine(engine_target, busy_timeout=busy_timeout)
     except UnsupportedEngineError as exc:  # pragma: no cover - defensive
         raise CommandError(f"Unsupported engine '{engine_target.engine}': {exc}") from exc
 
-    if engine_target.engine != "sqlite":
-        raise CommandError(f"Engine '{engine_target.engine}' deployment is not supported yet.")
-
     assert isinstance(engine, SQLiteEngine)  # nosec B101 - type guard after engine check
 
     _ensure_sqlite_parent_directory(engine_target.uri)
@@ -952,58 +1356,17 @@ def _compute_change_id_for_change(
     )
 
 
-def _load_deployed_state(
-    connection: sqlite3.Connection,
-    registry_schema: str,
-    project: str,
-) -> tuple[set[str], dict[str, DeployedMetadata]]:
-    """Return deployed change IDs and a mapping of names to registry metadata.
-
-    Returns:
-        A tuple of (deployed_change_ids, name_to_metadata) where:
-        - deployed_change_ids: Set of change_id strings for all deployed changes
-        - name_to_metadata: Dict mapping change names to their latest deployment metadata
-                           (useful for script_hash validation and tag lookups)
-    """
+def _plan_change_ids(plan: Plan) -> list[tuple[Change, str]]:
+    """Return every plan change paired with its Sqitch change ID, in plan order."""
 
-    cursor = connection.execute(
-        f'SELECT "change", change_id, script_hash FROM {registry_schema}.changes WHERE project = ? '
-        "ORDER BY committed_at ASC, change_id ASC",  # nosec B608
-        (project,),
-    )
-    try:
-        rows = cursor.fetchall()
-    finally:
-        cursor.close()
-
-    tag_cursor = connection.execute(
-        f"SELECT change_id, tag FROM {registry_schema}.tags WHERE project = ?",  # nosec B608
-        (project,),
-    )
-    try:
-        tag_rows = tag_cursor.fetchall()
-    finally:
-        tag_cursor.close()
-
-    tag_lookup: dict[str, set[str]] = {}
-    for change_id, tag in tag_rows:
-        tag_lookup.setdefault(str(change_id), set()).add(str(tag))
-
-    deployed_ids: set[str] = set()
-    name_to_metadata: dict[str, DeployedMetadata] = {}
-
-    for change_name, change_id, script_hash in rows:
-        change_id_str = str(change_id)
-        deployed_ids.add(change_id_str)
-        # Keep updating the dict so the last (most recent) version wins
-        # This is used for script_hash checking and tag lookups
-        name_to_metadata[str(change_name)] = {
-            "change_id": change_id_str,
-            "script_hash": str(script_hash) if script_hash is not None else "",
-            "tags": tag_lookup.get(change_id_str, set()),
-        }
-
-    return deployed_ids, name_to_metadata
+    change_id_cache: dict[int, str] = {}
+    result: list[tuple[Change, str]] = []
+    for index, change in enumerate(plan.changes):
+        parent_id = _resolve_parent_id_for_change(plan, index, change_id_cache)
+        change_id = _compute_change_id_for_change(plan.project_name, change, plan.uri, parent_id)
+        change_id_cache[index] = change_id
+        result.append((change, change_id))
+    return result
 
 
 def _apply_change(
@@ -1018,22 +1381,36 @@ def _apply_change(
     committer_email: str,
     deployed: dict[str, DeployedMetadata],
     registry_schema: str,
+    prepared: PreparedSQLiteScript | None = None,
+    strategy: str = DEFAULT_EXECUTION_STRATEGY,
+    logger: StructuredLogger | None = None,
+    bundle: BundleArchive | None = None,
 ) -> str:
     """Execute a deploy script and record registry state for ``change``.
 
+    ``prepared`` carries the script loaded during pre-flight; when omitted the
+    deploy script is read, from ``bundle`` if given, and validated here. ``strategy`` names one of
+    :data:`~sqlitch.engine.sqlite_execution.EXECUTION_STRATEGIES`. With a
+    ``logger``, the registry bookkeeping is timed as a ``deploy.registry.record``
+    span.
+
     Returns the transaction scope applied for structured logging.
     """
 
-    script_path = _resolve_script_path(plan_root, change, "deploy")
-    if not script_path.exists():
-        raise CommandError(f"Deploy script {script_path} is missing for change '{change.name}'.")
-
-    script_body = script_path.read_text(encoding="utf-8")
-    validate_sqlite_script(script_body)
-    script_hash = _compute_script_hash(script_body)
-    manages_transactions = script_manages_transactions(script_body)
+    if prepared is None:
+        script_path = _resolve_script_path(plan_root, change, "deploy")
+        try:
+            script_body = _read_script_text(script_path, bundle)
+        except FileNotFoundError as exc:
+            raise CommandError(
+                f"Deploy script {script_path} is missing for change '{change.name}'."
+            ) from exc
+        prepared = ScriptCache.from_env(env).prepare(script_body)
+        prepared.validate()
+    script_hash = prepared.script_hash
+    manages_transactions = prepared.manages_transactions
 
-    dependency_lookup = {name: data["change_id"] for name, data in deployed.items()}
+    dependency_lookup = _build_dependency_lookup(change, deployed)
     _validate_dependencies(change, dependency_lookup)
 
     planner_name, planner_email = _resolve_planner_identity(
@@ -1052,6 +1429,10 @@ def _apply_change(
     note = change.notes or ""
 
     def _record(cursor: sqlite3.Cursor) -> None:
+        with logger.span("deploy.registry.record") if logger is not None else nullcontext():
+            _record_entries(cursor)
+
+    def _record_entries(cursor: sqlite3.Cursor) -> None:
         _record_deployment_entries(
             cursor=cursor,
             registry_schema=registry_schema,
@@ -1074,9 +1455,10 @@ def _apply_change(
     try:
         _execute_change_transaction(
             connection,
-            script_body,
+            prepared.statements,
             _record,
             manages_transactions=manages_transactions,
+            strategy=strategy,
         )
     except sqlite3.Error as exc:  # pragma: no cover - execution error propagated
         try:
@@ -1134,6 +1516,134 @@ def _apply_change(
     return "script-managed" if manages_transactions else "engine-managed"
 
 
+@dataclass(frozen=True, slots=True)
+class _PreflightScript:
+    """A script read and hashed during pre-flight.
+
+    ``prepared`` holds the validated SQLite statements and is ``None`` for
+    server engines, whose scripts are left for the server to interpret.
+    """
+
+    body: str
+    script_hash: str
+    prepared: PreparedSQLiteScript | None
+
+
+def _preflight_scripts(
+    *,
+    plan_root: Path,
+    changes: Sequence[Change],
+    env: Mapping[str, str],
+    kinds: tuple[str, ...],
+    logger: StructuredLogger,
+    bundle: BundleArchive | None = None,
+    prepare_sqlite: bool = True,
+) -> list[_PreflightScript]:
+    """Load, hash, and validate the scripts of ``changes`` before deploying any.
+
+    Scripts are read and preprocessed concurrently. The first failure in plan
+    order is raised as a :class:`CommandError` so a broken script late in the
+    plan aborts the deploy before the first transaction is opened. With
+    ``prepare_sqlite`` false the scripts are only read and hashed, since the
+    SQLite lexer cannot judge PostgreSQL or MySQL syntax.
+
+    Returns the deploy script for each change, in order.
+    """
+
+    jobs = [(change, kind) for change in changes for kind in kinds]
+    if not jobs:
+        return []
+
+    cache = ScriptCache.from_env(env) if prepare_sqlite else None
+    with ThreadPoolExecutor(max_workers=min(len(jobs), _PREFLIGHT_MAX_WORKERS)) as executor:
+        futures = [
+            executor.submit(_preflight_script, plan_root, change, kind, cache, bundle)
+            for change, kind in jobs
+        ]
+        try:
+            results = [future.result() for future in futures]
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    logger.debug(
+        "deploy.preflight",
+        payload={
+            "changes": len(changes),
+            "scripts": sum(1 for result in results if result is not None),
+        },
+    )
+
+    deploy_scripts: list[_PreflightScript] = []
+    for script in results[:: len(kinds)]:
+        assert script is not None  # nosec B101 - deploy scripts are mandatory
+        deploy_scripts.append(script)
+    return deploy_scripts
+
+
+def _preflight_script(
+    plan_root: Path,
+    change: Change,
+    kind: str,
+    cache: ScriptCache | None,
+    bundle: BundleArchive | None = None,
+) -> _PreflightScript | None:
+    """Load and preprocess one script; optional verify scripts may be absent."""
+
+    script_path = _resolve_script_path(plan_root, change, kind)
+    try:
+        script_body = _read_script_text(script_path, bundle)
+    except FileNotFoundError:
+        if kind == "verify":
+            return None
+        raise CommandError(
+            f"{kind.capitalize()} script {script_path} is missing for change '{change.name}'."
+        ) from None
+    except (OSError, UnicodeDecodeError) as exc:
+        raise CommandError(
+            f"Unable to read {kind} script {script_path} for change '{change.name}': {exc}"
+        ) from exc
+
+    if cache is None:
+        return _PreflightScript(
+            body=script_body, script_hash=compute_script_hash(script_body), prepared=None
+        )
+
+    prepared = cache.prepare(script_body)
+    if kind != "verify":
+        try:
+            prepared.validate()
+        except SQLiteEngineError as exc:
+            raise CommandError(
+                f"Invalid {kind} script {script_path} for change '{change.name}': {exc}"
+            ) from exc
+    return _PreflightScript(body=script_body, script_hash=prepared.script_hash, prepared=prepared)
+
+
+def _open_bundle(bundle_path: Path, project_root: Path) -> BundleArchive:
+    """Open the bundle archive at ``bundle_path``, mounted at ``project_root``."""
+
+    try:
+        return BundleArchive(bundle_path.resolve(), project_root)
+    except BundleArchiveError as exc:
+        raise CommandError(str(exc)) from exc
+
+
+def _read_script_text(script_path: Path, bundle: BundleArchive | None) -> str:
+    """Return the text of ``script_path``, from ``bundle`` when deploying one.
+
+    Raises:
+        FileNotFoundError: If the script does not exist.
+    """
+
+    if bundle is None:
+        return script_path.read_text(encoding="utf-8")
+    try:
+        return bundle.read_text(script_path)
+    except BundleArchiveError as exc:
+        raise CommandError(str(exc)) from exc
+
+
 def _resolve_script_path(plan_root: Path, change: Change, kind: str) -> Path:
     """Resolve a script path relative to the plan directory."""
 
@@ -1148,12 +1658,6 @@ def _resolve_script_path(plan_root: Path, change: Change, kind: str) -> Path:
     return path
 
 
-def _compute_script_hash(script_body: str) -> str:
-    """Return the SHA-1 hash of the deploy script body."""
-
-    return hashlib.sha1(script_body.encode("utf-8"), usedforsecurity=False).hexdigest()
-
-
 def _resolve_committer_identity(
     env: Mapping[str, str],
     config_root: Path,
@@ -1227,6 +1731,24 @@ def _parse_identity(identity: str) -> tuple[str, str | None]:
     return text, None
 
 
+def _build_dependency_lookup(
+    change: Change, deployed: Mapping[str, DeployedMetadata]
+) -> dict[str, str]:
+    """Map the bare names of ``change``'s dependencies to their deployed change IDs.
+
+    Only the change's own dependencies are looked up so that the cost is
+    proportional to its fan-in rather than to the number of deployed changes.
+    """
+
+    lookup: dict[str, str] = {}
+    for dependency in change.dependencies:
+        dependency_name = dependency.partition("@")[0]
+        metadata = deployed.get(dependency_name)
+        if metadata is not None:
+            lookup[dependency_name] = metadata["change_id"]
+    return lookup
+
+
 def _validate_dependencies(change: Change, deployed_lookup: Mapping[str, str]) -> None:
     """Ensure all required dependencies have been deployed.
 
@@ -1263,26 +1785,28 @@ def _validate_dependencies(change: Change, deployed_lookup: Mapping[str, str]) -
 
 def _execute_change_transaction(
     connection: sqlite3.Connection,
-    script_sql: str,
+    statements: Sequence[str],
     recorder: Callable[[sqlite3.Cursor], None],
     *,
     manages_transactions: bool,
+    strategy: str = DEFAULT_EXECUTION_STRATEGY,
 ) -> None:
-    """Execute ``script_sql`` while preserving atomic registry recording."""
+    """Execute ``statements`` while preserving atomic registry recording."""
 
     script_cursor = connection.cursor()
     registry_cursor = connection.cursor()
     try:
         if manages_transactions:
-            _execute_sqlite_script(script_cursor, script_sql)
+            execute_sqlite_statements(script_cursor, statements, strategy=strategy)
             _record_registry_entries(connection, registry_cursor, recorder)
         else:
             _execute_engine_managed_change(
                 connection,
                 script_cursor,
                 registry_cursor,
-                script_sql,
+                statements,
                 recorder,
+                strategy=strategy,
             )
     finally:
         script_cursor.close()
@@ -1293,15 +1817,22 @@ def _execute_engine_managed_change(
     connection: sqlite3.Connection,
     script_cursor: sqlite3.Cursor,
     registry_cursor: sqlite3.Cursor,
-    script_sql: str,
+    statements: Sequence[str],
     recorder: Callable[[sqlite3.Cursor], None],
+    *,
+    strategy: str = DEFAULT_EXECUTION_STRATEGY,
 ) -> None:
     savepoint = "sqlitch_change"
-    connection.execute("BEGIN IMMEDIATE")
     try:
-        connection.execute(f"SAVEPOINT {savepoint}")
         try:
-            _execute_sqlite_script(script_cursor, script_sql)
+            # The transaction is opened by the script call itself so that the
+            # executescript strategy cannot commit it before the script runs.
+            execute_sqlite_statements(
+                script_cursor,
+                statements,
+                strategy=strategy,
+                preamble=("BEGIN IMMEDIATE", f"SAVEPOINT {savepoint}"),
+            )
             recorder(registry_cursor)
         except Exception:
             _rollback_savepoint(connection, savepoint)
@@ -1356,12 +1887,6 @@ def _release_savepoint(
         raise
 
 
-def _execute_sqlite_script(cursor: sqlite3.Cursor, script_sql: str) -> None:
-    """Execute ``script_sql`` statement-by-statement against ``cursor``."""
-    for statement in extract_sqlite_statements(script_sql):
-        cursor.execute(statement)
-
-
 def _record_deployment_entries(
     *,
     cursor: sqlite3.Cursor,
@@ -1381,26 +1906,29 @@ def _record_deployment_entries(
     dependency_lookup: Mapping[str, str],
     tags: Sequence[str],
 ) -> None:
-    """Persist registry entries for a deployed change."""
+    """Persist registry entries for a deployed change.
 
-    # nosec B608: registry_schema is always the constant REGISTRY_ATTACHMENT_ALIAS ("sqitch")
-    # It's never user input, so SQL injection is not possible.
+    Dependencies and tags are written with one ``executemany`` call each.
+    """
+
+    dependency_rows: list[tuple[str, str, str]] = []
+    for dependency in dependencies:
+        # Normalize dependency name by stripping tag suffix if present
+        # (e.g., "userflips@v1.0.0-dev2" -> "userflips")
+        # This handles reworked changes where dependencies reference
+        # previous versions
+        dependency_name = dependency.split("@", 1)[0] if "@" in dependency else dependency
+        dependency_id = dependency_lookup.get(dependency_name)
+        if dependency_id is None:
+            raise CommandError(
+                f"Dependency '{dependency}' is not recorded in the registry "
+                f"for change '{change.name}'."
+            )
+        dependency_rows.append((change_id, dependency, dependency_id))
+
+    statements = registry_statements(registry_schema)
     cursor.execute(
-        f"""
-        INSERT INTO {registry_schema}.changes (
-            change_id,
-            script_hash,
-            "change",
-            project,
-            note,
-            committed_at,
-            committer_name,
-            committer_email,
-            planned_at,
-            planner_name,
-            planner_email
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,  # nosec B608
+        statements.insert_change,
         (
             change_id,
             script_hash,
@@ -1415,26 +1943,8 @@ def _record_deployment_entries(
             planner_email,
         ),
     )
-
     cursor.execute(
-        f"""
-        INSERT INTO {registry_schema}.events (
-            event,
-            change_id,
-            change,
-            project,
-            note,
-            requires,
-            conflicts,
-            tags,
-            committed_at,
-            committer_name,
-            committer_email,
-            planned_at,
-            planner_name,
-            planner_email
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,  # nosec B608
+        statements.insert_event,
         (
             "deploy",
             change_id,
@@ -1452,26 +1962,8 @@ def _record_deployment_entries(
             planner_email,
         ),
     )
-
-    for dependency in dependencies:
-        # Normalize dependency name by stripping tag suffix if present
-        # (e.g., "userflips@v1.0.0-dev2" -> "userflips")
-        # This handles reworked changes where dependencies reference
-        # previous versions
-        dependency_name = dependency.split("@", 1)[0] if "@" in dependency else dependency
-        dependency_id = dependency_lookup.get(dependency_name)
-        if dependency_id is None:
-            raise CommandError(
-                f"Dependency '{dependency}' is not recorded in the registry "
-                f"for change '{change.name}'."
-            )
-        cursor.execute(
-            f"""
-            INSERT INTO {registry_schema}.dependencies (change_id, type, dependency, dependency_id)
-            VALUES (?, 'require', ?, ?)
-            """,  # nosec B608
-            (change_id, dependency, dependency_id),
-        )
+    if dependency_rows:
+        cursor.executemany(statements.insert_dependency, dependency_rows)
 
     _insert_registry_tags(
         cursor=cursor,
@@ -1528,24 +2020,7 @@ def _record_failure_event(
     try:
         connection.execute(f"SAVEPOINT {savepoint}")
         cursor.execute(
-            f"""
-            INSERT INTO {registry_schema}.events (
-                event,
-                change_id,
-                change,
-                project,
-                note,
-                requires,
-                conflicts,
-                tags,
-                committed_at,
-                committer_name,
-                committer_email,
-                planned_at,
-                planner_name,
-                planner_email
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,  # nosec B608
+            registry_statements(registry_schema).insert_event,
             (
                 "deploy_fail",
                 change_id,
@@ -1616,28 +2091,13 @@ def _insert_registry_tags(
 ) -> None:
     """Insert tag rows for ``tags`` referencing ``change_id`` into the registry."""
 
-    for tag in tags:
-        tag_id = hashlib.sha1(
-            f"{change_id}:{tag}".encode("utf-8"), usedforsecurity=False
-        ).hexdigest()
-        cursor.execute(
-            f"""
-            INSERT INTO {registry_schema}.tags (
-                tag_id,
-                tag,
-                project,
-                change_id,
-                note,
-                committed_at,
-                committer_name,
-                committer_email,
-                planned_at,
-                planner_name,
-                planner_email
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,  # nosec B608
+    if not tags:
+        return
+    cursor.executemany(
+        registry_statements(registry_schema).insert_tag,
+        [
             (
-                tag_id,
+                _registry_tag_id(change_id, tag),
                 tag,
                 project,
                 change_id,
@@ -1648,8 +2108,16 @@ def _insert_registry_tags(
                 planned_at,
                 planner_name,
                 planner_email,
-            ),
-        )
+            )
+            for tag in tags
+        ],
+    )
+
+
+def _registry_tag_id(change_id: str, tag: str) -> str:
+    """Return the registry ``tag_id`` for ``tag`` applied to ``change_id``."""
+
+    return hashlib.sha1(f"{change_id}:{tag}".encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 def _synchronise_registry_tags(
@@ -1657,7 +2125,7 @@ def _synchronise_registry_tags(
     connection: sqlite3.Connection,
     registry_schema: str,
     project: str,
-    plan: Plan,
+    change_ids: Sequence[tuple[Change, str]],
     deployed: dict[str, DeployedMetadata],
     env: Mapping[str, str],
     committer_name: str,
@@ -1665,28 +2133,18 @@ def _synchronise_registry_tags(
 ) -> None:
     """Ensure registry tag entries mirror plan metadata for deployed changes.
 
+    ``change_ids`` pairs every plan change with its change ID, as returned by
+    :func:`_plan_change_ids`.
+
     Note: The 'deployed' dict maps change names to their LATEST deployment metadata.
     For reworked changes with duplicate names, we need to match by change_id to avoid
     trying to insert the same tags multiple times.
     """
 
-    # Build a cache of change IDs as we process the plan sequentially
-    # This allows us to resolve parent IDs (previous change chronologically)
-    change_id_cache: dict[int, str] = {}
-
     # Build a set of already-processed change_ids to avoid duplicate tag insertions
     processed_change_ids: set[str] = set()
 
-    for idx, change in enumerate(plan.changes):
-        # Resolve parent ID (the previous change chronologically)
-        parent_id = _resolve_parent_id_for_change(plan, idx, change_id_cache)
-
-        # Compute this change's ID to match against deployed changes
-        change_id = _compute_change_id_for_change(project, change, plan.uri, parent_id)
-
-        # Cache the ID by index for parent resolution
-        change_id_cache[idx] = change_id
-
+    for change, change_id in change_ids:
         # Skip if we've already processed this specific change_id
         if change_id in processed_change_ids:
             continue
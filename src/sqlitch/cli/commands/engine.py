@@ -11,7 +11,6 @@ from pathlib import Path
 import click
 
 from sqlitch.cli.main import CLIContext
-from sqlitch.config.resolver import resolve_config
 from sqlitch.utils.fs import ArtifactConflictError, resolve_config_file
 
 from ..options import global_output_options, global_sqitch_options
@@ -339,11 +338,7 @@ def _resolve_engine_uri(*, cli_context: CLIContext, candidate: str) -> str:
     if _is_supported_engine_uri(candidate):
         return candidate
 
-    profile = resolve_config(
-        root_dir=cli_context.project_root,
-        config_root=cli_context.config_root,
-        env=cli_context.env,
-    )
+    profile = cli_context.config_profile()
 
     section = f'target "{candidate}"'
     data = profile.settings.get(section)
@@ -0,0 +1,147 @@
+"""Implementation of the ``sqlitch lock`` command."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import click
+
+from sqlitch.engine.base import EngineError
+from sqlitch.engine.lock import DEFAULT_STALE_AFTER, lock_path_for_registry, read_lock_info
+from sqlitch.engine.sqlite import SQLiteEngine
+
+from ..options import global_output_options, global_sqitch_options
+from . import CommandError, register_command
+from ._context import (
+    environment_from,
+    plan_override_from,
+    project_root_from,
+    quiet_mode_enabled,
+    require_cli_context,
+)
+from ._plan_utils import resolve_default_engine, resolve_plan_path
+
+__all__ = ["lock_command"]
+
+
+@click.command("lock")
+@click.argument("target_args", nargs=-1)
+@click.option("--target", "target_option", help="Deployment target alias or URI.")
+@click.option("--status", is_flag=True, help="Show who holds the deploy lock (the default).")
+@click.option("--release", is_flag=True, help="Remove a stale deploy lock.")
+@click.option(
+    "--force",
+    is_flag=True,
+    help="With --release, remove the lock even though its holder is still active.",
+)
+@global_sqitch_options
+@global_output_options
+@click.pass_context
+def lock_command(  # pylint: disable=unused-argument
+    # json_mode/verbose/quiet injected by @global_output_options
+    ctx: click.Context,
+    *,
+    target_args: tuple[str, ...],
+    target_option: str | None,
+    status: bool,
+    release: bool,
+    force: bool,
+    json_mode: bool,
+    verbose: int,
+    quiet: bool,
+) -> None:
+    """Inspect or clear the advisory deploy lock of a target."""
+
+    # Import here to avoid circular dependency
+    from .deploy import _resolve_engine_target
+    from .rebase import _resolve_target
+
+    if status and release:
+        raise CommandError("--status and --release are mutually exclusive.")
+    if force and not release:
+        raise CommandError("--force requires --release.")
+
+    cli_context = require_cli_context(ctx)
+    project_root = project_root_from(ctx)
+    env = environment_from(ctx)
+    plan_path = resolve_plan_path(
+        project_root=project_root,
+        override=plan_override_from(ctx),
+        env=env,
+        missing_plan_message="Cannot read plan file sqitch.plan",
+    )
+    default_engine = resolve_default_engine(
+        project_root=project_root,
+        config_root=cli_context.config_root,
+        env=env,
+        engine_override=cli_context.engine,
+        plan_path=plan_path,
+    )
+    target = _resolve_target(
+        target_option=target_option or (target_args[0] if target_args else None),
+        configured_target=cli_context.target,
+        project_root=project_root,
+        config_root=cli_context.config_root,
+        env=env,
+        default_engine=default_engine,
+    )
+    engine_target, display_target = _resolve_engine_target(
+        target=target,
+        project_root=project_root,
+        config_root=cli_context.config_root,
+        env=env,
+        default_engine=default_engine,
+        plan_path=plan_path,
+        registry_override=None,
+        logger=cli_context.logger,
+    )
+    if engine_target.engine != "sqlite":
+        raise CommandError(
+            f"Deploy locks are only used by SQLite targets; '{display_target}' uses "
+            f"{engine_target.engine}."
+        )
+    try:
+        registry_path = SQLiteEngine(engine_target).registry_filesystem_path()
+    except EngineError as exc:
+        raise CommandError(str(exc)) from exc
+
+    lock_path = lock_path_for_registry(registry_path)
+    info = read_lock_info(lock_path)
+    emit = _build_emitter(quiet_mode_enabled(ctx))
+    if info is None:
+        emit(f"No deploy lock held on {display_target}.")
+        return
+
+    age = info.age()
+    stale = age > DEFAULT_STALE_AFTER
+    if not release:
+        acquired = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(info.acquired_at))
+        emit(
+            f"Deploy lock on {display_target} held by {info.describe()} since {acquired}, "
+            f"heartbeat {age:.0f}s ago" + (" (stale)" if stale else "")
+        )
+        return
+
+    if not stale and not force:
+        raise CommandError(
+            f"Deploy lock on {display_target} is held by {info.describe()}, "
+            f"heartbeat {age:.0f}s ago; use --force to remove it anyway."
+        )
+    lock_path.unlink(missing_ok=True)
+    emit(f"Released deploy lock on {display_target} held by {info.describe()}.")
+
+
+def _build_emitter(quiet: bool) -> Callable[[str], None]:
+    def _emit(message: str) -> None:
+        if not quiet:
+            click.echo(message)
+
+    return _emit
+
+
+@register_command("lock")
+def _register_lock(group: click.Group) -> None:
+    """Register the lock command with the root CLI group."""
+
+    group.add_command(lock_command)
@@ -21,6 +21,11 @@ __all__ = ["log_command"]
 
 logger = logging.getLogger(__name__)
 
+_UNBOUNDED_OFFSET_SQL = {
+    "sqlite": " LIMIT -1 OFFSET ?",
+    "mysql": " LIMIT 18446744073709551615 OFFSET ?",
+}
+
 
 @dataclass(frozen=True)
 class LogEvent:
@@ -194,8 +199,9 @@ def _load_log_events(
             project_filter=project_filter,
             change_filter=change_filter,
             event_filter=event_filter,
+            engine=engine_target.engine,
         )
-        cursor.execute(query, params)
+        cursor.execute(engine.format_query(query), params)
         rows = cursor.fetchall()
         columns = [column[0] for column in (cursor.description or [])]
     except Exception as exc:  # pragma: no cover - query failures propagated to the user
@@ -267,6 +273,7 @@ def _build_query(
     project_filter: str | None,
     change_filter: str | None,
     event_filter: str | None,
+    engine: str = "sqlite",
 ) -> tuple[str, tuple[object, ...]]:
     clauses: list[str] = []
     params: list[object] = []
@@ -275,7 +282,7 @@ def _build_query(
         clauses.append("project = ?")
         params.append(project_filter)
     if change_filter:
-        clauses.append("change = ?")
+        clauses.append('"change" = ?')
         params.append(change_filter)
     if event_filter:
         clauses.append("lower(event) = ?")
@@ -285,7 +292,7 @@ def _build_query(
     order_sql = "ASC" if reverse else "DESC"
 
     base_query = (
-        "SELECT event, change_id, change, project, note, tags, committed_at, "
+        'SELECT event, change_id, "change", project, note, tags, committed_at, '
         "committer_name, committer_email FROM events"
     )
     sql = f"{base_query}{where_sql} ORDER BY committed_at {order_sql}, change_id {order_sql}"
@@ -297,7 +304,8 @@ def _build_query(
             sql += " OFFSET ?"
             params.append(skip)
     elif skip:
-        sql += " LIMIT -1 OFFSET ?"
+        # SQLite and MySQL need a LIMIT before OFFSET; use each engine's "unbounded" value.
+        sql += _UNBOUNDED_OFFSET_SQL.get(engine, " OFFSET ?")
         params.append(skip)
 
     return sql, tuple(params)
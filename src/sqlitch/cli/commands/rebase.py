@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
 import click
 
-from sqlitch.plan.model import Change, Plan
+from sqlitch.engine.sqlite import compute_script_hash
+from sqlitch.plan.diff import PlanDiff, diff_change_sequences
+from sqlitch.plan.model import Plan
 from sqlitch.plan.parser import PlanParseError, parse_plan
+from sqlitch.plan.symbolic import ReferenceResolver
 from sqlitch.utils.logging import StructuredLogger
 
 from ..options import global_output_options, global_sqitch_options
@@ -23,6 +26,7 @@ from ._context import (
     require_cli_context,
 )
 from ._plan_utils import resolve_default_engine, resolve_plan_path
+from ._session import ExecutionSession, load_registry_snapshot, open_execution_session
 
 __all__ = ["rebase_command"]
 
@@ -41,13 +45,18 @@ class _RebaseRequest:
     log_only: bool
     quiet: bool
     logger: StructuredLogger
+    lock_timeout: float | None = None
 
 
 @click.command("rebase")
 @click.argument("target_args", nargs=-1)
 @click.option("--target", "target_option", help="Deployment target alias or URI.")
 @click.option("--onto", "onto_ref", help="Rebase onto the specified change or tag.")
-@click.option("--from", "from_ref", help="Redeploy starting from the specified change or tag.")
+@click.option(
+    "--from",
+    "from_ref",
+    help="Revert and redeploy from the specified change or tag onward.",
+)
 @click.option(
     "--mode",
     type=click.Choice(("latest", "all"), case_sensitive=False),
@@ -65,6 +74,13 @@ class _RebaseRequest:
     is_flag=True,
     help="Disable the prompt that normally asks whether to execute the revert.",
 )
+@click.option(
+    "--lock-timeout",
+    "lock_timeout",
+    type=click.FloatRange(min=0),
+    help="Seconds to wait for another deployer's lock on the target (default: "
+    "core.lock_timeout or 60).",
+)
 @global_sqitch_options
 @global_output_options
 @click.pass_context
@@ -79,6 +95,7 @@ def rebase_command(  # pylint: disable=unused-argument
     mode: str,
     log_only: bool,
     y: bool,
+    lock_timeout: float | None,
     json_mode: bool,
     verbose: int,
     quiet: bool,
@@ -124,6 +141,7 @@ def rebase_command(  # pylint: disable=unused-argument
         quiet=quiet_mode_enabled(ctx),
         default_engine=default_engine,
         logger=cli_context.logger,
+        lock_timeout=lock_timeout,
     )
 
     _execute_rebase(request)
@@ -143,6 +161,7 @@ def _build_request(
     quiet: bool,
     default_engine: str,
     logger: StructuredLogger,
+    lock_timeout: float | None = None,
 ) -> _RebaseRequest:
     plan_path = _resolve_plan_path(project_root=project_root, override=plan_override, env=env)
     plan = _load_plan(plan_path, default_engine)
@@ -160,67 +179,131 @@ def _build_request(
         log_only=log_only,
         quiet=quiet,
         logger=logger,
+        lock_timeout=lock_timeout,
     )
 
 
 def _execute_rebase(request: _RebaseRequest) -> None:
-    reverts, redeploys = _plan_rebase_actions(
-        plan=request.plan,
-        onto_ref=request.onto,
-        from_ref=request.from_ref,
-    )
-
-    if request.log_only:
-        _render_log_only_rebase(request, reverts, redeploys)
-        return
-
-    # Rebase = revert all + deploy all
+    # Rebase = revert the divergent tail + deploy the plan from there.
     # Import the command implementations
     from .deploy import _DeployRequest, _execute_deploy
     from .revert import _execute_revert, _RevertRequest
 
-    # Build revert request (revert all changes)
-    revert_request = _RevertRequest(
-        project_root=request.project_root,
-        env=request.env,
-        plan_path=request.plan_path,
-        plan=request.plan,
+    # Both phases share one target resolution, connection, and change-ID chain
+    session = open_execution_session(
         target=request.target,
-        to_change=None,  # Revert all
-        to_tag=None,
-        log_only=False,
-        skip_prompt=True,  # Rebase always auto-confirms like -y flag
-        quiet=request.quiet,
-        config_root=request.config_root,
-    )
-
-    # Build deploy request (deploy all changes)
-    deploy_request = _DeployRequest(
         project_root=request.project_root,
         config_root=request.config_root,
         env=request.env,
-        plan_path=request.plan_path,
         plan=request.plan,
-        target=request.target,
-        to_change=None,  # Deploy all
-        to_tag=None,
-        log_only=False,
-        quiet=request.quiet,
+        plan_path=request.plan_path,
         logger=request.logger,
-        registry_override=None,
+        lock_timeout=request.lock_timeout,
     )
-
-    # Execute revert phase
     try:
-        _execute_revert(revert_request)
-    except Exception as exc:
-        raise CommandError(f"Rebase revert phase failed: {exc}") from exc
+        diff = _diff_against_registry(request, session)
+        if request.log_only:
+            _render_log_only_rebase(request, session, diff)
+            return
+        if diff.is_noop:
+            _build_emitter(request.quiet)(
+                "Nothing to rebase: deployed changes match the plan and their "
+                "deploy scripts are unchanged."
+            )
+            request.logger.info(
+                "rebase.noop",
+                payload={
+                    "plan": request.plan.project_name,
+                    "target": session.engine_target.uri,
+                    "changes": [change.name for change, _ in session.change_ids],
+                },
+            )
+            return
+
+        # Revert only the changes after the last one both histories share
+        revert_request = _RevertRequest(
+            project_root=request.project_root,
+            env=request.env,
+            plan_path=request.plan_path,
+            plan=request.plan,
+            target=request.target,
+            to_change=None,
+            to_tag=None,
+            log_only=False,
+            skip_prompt=True,  # Rebase always auto-confirms like -y flag
+            quiet=request.quiet,
+            config_root=request.config_root,
+            logger=request.logger,
+            keep_count=diff.common,
+        )
 
-    # Execute deploy phase
-    try:
-        _execute_deploy(deploy_request)
-    except Exception as exc:
-        raise CommandError(f"Rebase deploy phase failed: {exc}") from exc
+        # Build deploy request (deploy all pending changes)
+        deploy_request = _DeployRequest(
+            project_root=request.project_root,
+            config_root=request.config_root,
+            env=request.env,
+            plan_path=request.plan_path,
+            plan=request.plan,
+            target=request.target,
+            to_change=None,  # Deploy all
+            to_tag=None,
+            log_only=False,
+            quiet=request.quiet,
+            logger=request.logger,
+            registry_override=None,
+        )
+
+        # Execute revert phase
+        if diff.revert:
+            try:
+                _execute_revert(revert_request, session)
+            except Exception as exc:
+                raise CommandError(f"Rebase revert phase failed: {exc}") from exc
+
+        # Execute deploy phase
+        try:
+            _execute_deploy(deploy_request, session)
+        except Exception as exc:
+            raise CommandError(f"Rebase deploy phase failed: {exc}") from exc
+    finally:
+        session.close()
+
+
+def _diff_against_registry(request: _RebaseRequest, session: ExecutionSession) -> PlanDiff:
+    """Compare deployed changes with the plan by change ID and deploy script hash.
+
+    An edited deploy script makes its change divergent even though its ID is
+    unchanged. ``--onto`` and ``--from`` force the revert to start no later
+    than the change they name.
+    """
+
+    # Import here to avoid circular dependency
+    from .deploy import _resolve_script_path
+
+    snapshot = load_registry_snapshot(session, request.plan.project_name)
+    deployed = [(row.change_id, row.script_hash) for row in snapshot.rows]
+
+    plan_root = request.plan_path.parent
+    target: list[tuple[str, str | None]] = []
+    for index, (change, change_id) in enumerate(session.change_ids):
+        script_hash: str | None = None
+        if index < len(deployed):
+            try:
+                script_body = _resolve_script_path(plan_root, change, "deploy").read_text(
+                    encoding="utf-8"
+                )
+            except (CommandError, OSError, UnicodeDecodeError):
+                pass  # Let the deploy phase report unreadable scripts.
+            else:
+                script_hash = compute_script_hash(script_body)
+        target.append((change_id, script_hash))
+
+    references = [ref for ref in (request.onto, request.from_ref) if ref]
+    keep = None
+    if references:
+        resolver = ReferenceResolver.from_plan(request.plan)
+        keep = min(_resolve_reference_index(resolver, ref) for ref in references)
+    return diff_change_sequences(deployed, target, keep=keep)
 
 
 def _resolve_target(
@@ -278,66 +361,33 @@ def _load_plan(plan_path: Path, default_engine: str | None) -> Plan:
         raise CommandError(f"Unable to read plan file {plan_path}: {exc}") from exc
 
 
-def _plan_rebase_actions(
-    *,
-    plan: Plan,
-    onto_ref: str | None,
-    from_ref: str | None,
-) -> tuple[tuple[Change, ...], tuple[Change, ...]]:
-    changes = plan.changes
-    if not changes:
-        return (), ()
-
-    start_revert_index = _resolve_reference_index(plan, onto_ref) if onto_ref else 0
-    revert_changes = changes[start_revert_index:]
-
-    if from_ref:
-        from_index = _resolve_reference_index(plan, from_ref)
-    else:
-        from_index = start_revert_index
-
-    start_index = max(from_index, start_revert_index, 0)
-    redeploy_changes = changes[start_index:]
-
-    return tuple(revert_changes), tuple(redeploy_changes)
-
-
-def _resolve_reference_index(plan: Plan, reference: str) -> int:
-    change_indexes = {change.name: index for index, change in enumerate(plan.changes)}
-    if reference in change_indexes:
-        return change_indexes[reference]
-
-    for tag in plan.tags:
-        if tag.name == reference:
-            try:
-                return change_indexes[tag.change_ref]
-            except KeyError as exc:
-                raise CommandError(
-                    f"Tag '{tag.name}' references unknown change '{tag.change_ref}'."
-                ) from exc
-
-    raise CommandError(f"Plan does not contain change '{reference}'.")
+def _resolve_reference_index(resolver: ReferenceResolver, reference: str) -> int:
+    try:
+        return resolver.resolve_index(reference)
+    except ValueError as exc:
+        raise CommandError(f"Plan does not contain change '{reference}'.") from exc
 
 
 def _render_log_only_rebase(
-    request: _RebaseRequest,
-    reverts: Sequence[Change],
-    redeploys: Sequence[Change],
+    request: _RebaseRequest, session: ExecutionSession, diff: PlanDiff
 ) -> None:
+    """Show the reverts and deploys a real run would perform for ``diff``."""
+
     emitter = _build_emitter(request.quiet)
 
     emitter(f"Rebasing plan '{request.plan.project_name}' on target '{request.target}' (log-only).")
 
-    if not reverts and not redeploys:
+    if diff.is_noop:
         emitter("No changes require rebase.")
         emitter("Log-only run; no database changes were applied.")
         return
 
-    for change in reversed(reverts):
-        emitter(f"Would revert change {change.name}")
+    deployed = load_registry_snapshot(session, request.plan.project_name).rows
+    for index in diff.revert:
+        emitter(f"Would revert change {deployed[index].change}")
 
-    for change in redeploys:
-        emitter(f"Would deploy change {change.name}")
+    for index in diff.deploy:
+        emitter(f"Would deploy change {session.change_ids[index][0].name}")
 
     emitter("Log-only run; no database changes were applied.")
 
@@ -13,15 +13,22 @@ from typing import Callable
 import click
 
 from sqlitch.config import resolver as config_resolver
-from sqlitch.engine import EngineTarget, canonicalize_engine_name
-from sqlitch.engine.sqlite import (
-    extract_sqlite_statements,
-    script_manages_transactions,
-    validate_sqlite_script,
-)
+from sqlitch.engine import EngineTarget, canonicalize_engine_name, create_engine
+from sqlitch.engine.base import EngineError, UnsupportedEngineError
+from sqlitch.engine.lock import DeployLock
+from sqlitch.engine.script_cache import ScriptCache
+from sqlitch.engine.server import RegistryChangeRecord, RegistryTagRecord, ServerEngine
+from sqlitch.engine.sqlite import PreparedSQLiteScript, SQLiteEngine, compute_script_hash
+from sqlitch.plan.graph import build_dependency_graph
 from sqlitch.plan.model import Change, Plan
 from sqlitch.plan.parser import PlanParseError, parse_plan
-from sqlitch.plan.symbolic import resolve_symbolic_reference
+from sqlitch.plan.symbolic import ReferenceResolver
+from sqlitch.registry.statements import (
+    CLEANUP_CHUNK_SIZE,
+    registry_cleanup_statements,
+    registry_statements,
+)
+from sqlitch.utils.logging import StructuredLogger
 from sqlitch.utils.time import format_registry_timestamp
 
 from ..options import global_output_options, global_sqitch_options
@@ -34,6 +41,7 @@ from ._context import (
     require_cli_context,
 )
 from ._plan_utils import resolve_default_engine, resolve_plan_path
+from ._session import ExecutionSession, RegistrySnapshot, acquire_deploy_lock, resolve_lock_settings
 
 __all__ = ["revert_command"]
 
@@ -53,6 +61,29 @@ class _RevertRequest:
     skip_prompt: bool
     quiet: bool
     config_root: Path
+    logger: StructuredLogger
+    resolver: ReferenceResolver | None = None
+    # Plan index of the --to reference, so reworked instances stay distinct.
+    to_index: int | None = None
+    # Number of leading plan changes to leave deployed; overrides to_change/to_tag.
+    keep_count: int | None = None
+    lock_timeout: float | None = None
+    # Most changes reverted per SQLite transaction; ``None`` means no limit.
+    batch_size: int | None = 1
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedRevert:
+    """A change whose revert script is loaded and whose revert event is built."""
+
+    change: Change
+    change_id: str
+    script: PreparedSQLiteScript
+    event: tuple[str, ...]
+
+
+class _RegistryRecordError(Exception):
+    """Wraps a registry bookkeeping failure so it is not blamed on a revert script."""
 
 
 @click.command("revert")
@@ -71,6 +102,26 @@ class _RevertRequest:
     is_flag=True,
     help="Disable the prompt before reverting.",
 )
+@click.option(
+    "--lock-timeout",
+    "lock_timeout",
+    type=click.FloatRange(min=0),
+    help="Seconds to wait for another deployer's lock on the target (default: "
+    "core.lock_timeout or 60).",
+)
+@click.option(
+    "--mode",
+    type=click.Choice(("change", "all"), case_sensitive=False),
+    default="change",
+    show_default=True,
+    help="Revert each change in its own transaction, or group them into shared transactions.",
+)
+@click.option(
+    "--batch-size",
+    "batch_size",
+    type=click.IntRange(min=1),
+    help="Revert at most N changes per transaction (unlimited with --mode=all).",
+)
 @global_sqitch_options
 @global_output_options
 @click.pass_context
@@ -85,11 +136,19 @@ def revert_command(  # pylint: disable=unused-argument
     to_tag: str | None,
     log_only: bool,
     y: bool,
+    lock_timeout: float | None,
+    mode: str,
+    batch_size: int | None,
     json_mode: bool,
     verbose: int,
     quiet: bool,
 ) -> None:
-    """Revert deployed plan changes on the requested target."""
+    """Revert deployed plan changes on the requested target.
+
+    With ``--mode=all`` or ``--batch-size``, consecutive revert scripts that do
+    not manage their own transactions share one SQLite transaction, so
+    reverting many changes costs one commit per batch instead of one per change.
+    """
 
     cli_context = require_cli_context(ctx)
     project_root = project_root_from(ctx)
@@ -148,6 +207,9 @@ def revert_command(  # pylint: disable=unused-argument
         quiet=quiet_mode_enabled(ctx),
         default_engine=default_engine,
         config_root=cli_context.config_root,
+        structured_logger=cli_context.logger,
+        lock_timeout=lock_timeout,
+        batch_size=batch_size if batch_size is not None or mode.lower() == "all" else 1,
     )
 
     _execute_revert(request)
@@ -166,36 +228,38 @@ def _build_request(
     quiet: bool,
     default_engine: str,
     config_root: Path,
+    structured_logger: StructuredLogger,
+    lock_timeout: float | None = None,
+    batch_size: int | None = 1,
 ) -> _RevertRequest:
     if to_change and to_tag:
         raise CommandError("Cannot combine --to-change and --to-tag filters.")
 
     plan_path = _resolve_plan_path(project_root=project_root, override=plan_override, env=env)
-    plan = _load_plan(plan_path, default_engine)
+    with structured_logger.span("revert.plan.parse", plan_path=plan_path.as_posix()):
+        plan = _load_plan(plan_path, default_engine)
+    resolver = ReferenceResolver.from_plan(plan)
 
     # Resolve symbolic references (e.g., @HEAD^, @ROOT, HEAD^2)
     resolved_to_change = to_change
     resolved_to_tag = to_tag
+    to_index: int | None = None
 
-    if to_tag or to_change:
-        # Get list of change names from plan for symbolic resolution
-        change_names = [c.name for c in plan.changes]
-
+    # Plain tags keep their classification so messages refer to the tag name
+    if to_change or (to_tag and not resolver.has_tag(to_tag)):
         # Reconstruct the original reference
         original_ref = f"@{to_tag}" if to_tag else to_change
         # The if condition guarantees at least one is not None
         assert original_ref is not None  # nosec B101 - guaranteed by conditional logic
 
         try:
-            # Try to resolve as symbolic reference
-            resolved_name = resolve_symbolic_reference(original_ref, change_names)
-            # If successful, it's a change reference (not a tag)
-            resolved_to_change = resolved_name
-            resolved_to_tag = None
+            to_index = resolver.resolve_target_index(original_ref)
         except ValueError:
-            # Not a symbolic reference - could be a plain tag or change name
-            # Keep the original classification
+            # Unresolvable references are reported by _select_changes
             pass
+        else:
+            resolved_to_change = resolver.target_reference(to_index, original_ref)
+            resolved_to_tag = None
 
     return _RevertRequest(
         project_root=project_root,
@@ -209,14 +273,29 @@ def _build_request(
         skip_prompt=skip_prompt,
         quiet=quiet,
         config_root=config_root,
+        logger=structured_logger,
+        resolver=resolver,
+        to_index=to_index,
+        lock_timeout=lock_timeout,
+        batch_size=batch_size,
     )
 
 
-def _execute_revert(request: _RevertRequest) -> None:
+def _execute_revert(request: _RevertRequest, session: ExecutionSession | None = None) -> None:
+    """Revert deployed changes from the request target.
+
+    When ``session`` is provided its target, committer identity, connection,
+    and change IDs are reused, its registry snapshot is read or updated in
+    place, and the connection is left open for the session owner to close.
+    Otherwise the target's advisory deploy lock is held while reverting.
+    """
+
     changes = _select_changes(
         plan=request.plan,
         to_change=request.to_change,
         to_tag=request.to_tag,
+        resolver=request.resolver,
+        to_index=request.to_index,
     )
 
     if request.log_only:
@@ -234,174 +313,375 @@ def _execute_revert(request: _RevertRequest) -> None:
         ):
             raise CommandError("Revert aborted by user.")
 
-    # Resolve engine target
-    from sqlitch.engine.sqlite import SQLiteEngine
+    if session is not None:
+        engine_target = session.engine_target
+        committer_name, committer_email = session.committer_name, session.committer_email
+    else:
+        engine_target, _ = _resolve_engine_target(
+            target=request.target,
+            project_root=request.project_root,
+            config_root=request.config_root,
+            env=request.env,
+            default_engine=request.plan.default_engine,
+            # pylint: disable=fixme  # Tracked in TODO.md - Registry Override Support
+            registry_override=None,  # TODO: support registry override (see TODO.md)
+        )
 
-    engine_target, _ = _resolve_engine_target(
-        target=request.target,
-        project_root=request.project_root,
-        config_root=request.config_root,
-        env=request.env,
-        default_engine=request.plan.default_engine,
-        # pylint: disable=fixme  # Tracked in TODO.md - Registry Override Support (post-lockdown)
-        registry_override=None,  # TODO: support registry override (see TODO.md)
-    )
-    engine = SQLiteEngine(engine_target)
+        # Get committer identity
+        committer_name, committer_email = _resolve_committer_identity(
+            request.env, request.config_root, request.project_root
+        )
 
-    # Get committer identity
-    committer_name, committer_email = _resolve_committer_identity(
-        request.env, request.config_root, request.project_root
-    )
+    if engine_target.engine != "sqlite":
+        _execute_server_revert(
+            request=request,
+            engine_target=engine_target,
+            changes=changes,
+            committer_name=committer_name,
+            committer_email=committer_email,
+            emitter=emitter,
+        )
+        return
 
-    # Connect to workspace (automatically attaches registry)
-    try:
-        connection = engine.connect_workspace()
-    except Exception as exc:
-        raise CommandError(
-            f"Failed to connect to deployment target {engine_target.uri}: {exc}"
-        ) from exc
+    owns_connection = session is None or session.connection is None
+    lock: DeployLock | None = None
+    if session is not None and session.connection is not None:
+        connection = session.connection
+    else:
+        settings = resolve_lock_settings(
+            project_root=request.project_root,
+            config_root=request.config_root,
+            env=request.env,
+            lock_timeout=request.lock_timeout,
+        )
+        engine = SQLiteEngine(engine_target, busy_timeout=settings.busy_timeout)
+        with request.logger.span("revert.lock.wait"):
+            lock = acquire_deploy_lock(
+                engine_target,
+                owner=f"{committer_name} <{committer_email}>",
+                timeout=settings.timeout,
+            )
 
-    # Set manual transaction control
-    connection.isolation_level = None
+        # Connect to workspace (automatically attaches registry)
+        try:
+            connection = engine.connect_workspace()
+        except Exception as exc:
+            if lock is not None:
+                lock.release()
+            raise CommandError(
+                f"Failed to connect to deployment target {engine_target.uri}: {exc}"
+            ) from exc
+
+        # Set manual transaction control
+        connection.isolation_level = None
     registry_schema = "sqitch"
 
     try:
-        # Load currently deployed changes (keyed by change_id for rework support)
-        deployed = _load_deployed_changes(connection, registry_schema, request.plan.project_name)
+        snapshot = session.snapshot if session is not None else None
+        if snapshot is None:
+            with request.logger.span("revert.registry.load"):
+                snapshot = RegistrySnapshot.load(
+                    connection, registry_schema, request.plan.project_name
+                )
+            if session is not None:
+                session.snapshot = snapshot
 
-        # Import here to avoid circular dependency
-        from sqlitch.cli.commands.deploy import (
-            _compute_change_id_for_change,
-            _resolve_parent_id_for_change,
-        )
-
-        # Build a cache of change IDs as we process the plan sequentially
-        # This allows us to resolve parent IDs (previous change chronologically)
-        change_id_cache: dict[int, str] = {}
-
-        # Pre-compute all change IDs with correct parent resolution
-        change_ids_by_index: dict[int, str] = {}
-        for i, change in enumerate(request.plan.changes):
-            parent_id = _resolve_parent_id_for_change(request.plan, i, change_id_cache)
-            change_id = _compute_change_id_for_change(
-                request.plan.project_name,
-                change,
-                request.plan.uri,
-                parent_id,
-            )
-            change_id_cache[i] = change_id
-            change_ids_by_index[i] = change_id
-
-        # Filter to only revert deployed changes in reverse order
-        # If --to-change or --to-tag specified, `changes` contains the target point
-        # We revert everything AFTER the target (in deployment order)
-        #
-        # Important: For reworked changes, we match by change_id, not name.
-        changes_to_keep_indices = set()
-        if request.to_change or request.to_tag:
-            # Build a set of indices of changes to keep
-            for i, change in enumerate(changes):
-                changes_to_keep_indices.add(i)
-
-        changes_to_revert = []
-        for i in range(len(request.plan.changes) - 1, -1, -1):
-            change = request.plan.changes[i]
-            # Get the pre-computed change_id for this plan entry
-            change_id = change_ids_by_index[i]
-
-            # Check if this specific instance is deployed
-            if change_id in deployed:
-                # If we have a target and this change (by position) should be kept, stop
-                if changes_to_keep_indices and i in changes_to_keep_indices:
-                    break
-                # Store both the change and its computed ID for the revert step
-                changes_to_revert.append((change, change_id))
-
-        target_change = changes[-1] if (request.to_change or request.to_tag) and changes else None
+        # Currently deployed changes, keyed by change_id for rework support
+        deployed = snapshot.by_change_id()
 
+        changes_to_revert, target_change = _collect_changes_to_revert(
+            request,
+            changes,
+            set(deployed),
+            change_ids=session.change_ids if session is not None else None,
+        )
         if not changes_to_revert:
-            if request.to_change or request.to_tag:
-                label = (
-                    request.to_change
-                    or request.to_tag
-                    or (target_change.name if target_change else "target")
-                )
-                emitter(f'No changes deployed since: "{label}"')
-            else:
-                emitter("Nothing to revert (nothing deployed)")
+            _report_nothing_to_revert(request, target_change, emitter)
             return
 
-        intro_message = _introductory_message(
-            target=request.target,
-            target_change=target_change,
-            to_change=request.to_change,
-            to_tag=request.to_tag,
+        emitter(
+            _introductory_message(
+                target=request.target,
+                target_change=target_change,
+                to_change=request.to_change or (target_change.name if target_change else None),
+                to_tag=request.to_tag,
+            )
         )
-        emitter(intro_message)
 
-        # Revert each change
-        for change, change_id in changes_to_revert:
-            try:
-                _revert_change(
-                    connection=connection,
-                    project=request.plan.project_name,
-                    plan_root=request.plan_path.parent,
-                    change=change,
+        _revert_in_batches(
+            connection=connection,
+            request=request,
+            changes_to_revert=changes_to_revert,
+            deployed=deployed,
+            snapshot=snapshot,
+            committer_name=committer_name,
+            committer_email=committer_email,
+            registry_schema=registry_schema,
+            emitter=emitter,
+        )
+
+    finally:
+        if owns_connection:
+            connection.close()
+        if lock is not None:
+            lock.release()
+
+
+def _execute_server_revert(
+    *,
+    request: _RevertRequest,
+    engine_target: EngineTarget,
+    changes: Sequence[Change],
+    committer_name: str,
+    committer_email: str,
+    emitter: Callable[[str], None],
+) -> None:
+    """Revert deployed changes from a target whose registry lives on a database server."""
+
+    try:
+        engine = create_engine(engine_target)
+    except (UnsupportedEngineError, EngineError) as exc:
+        raise CommandError(f"Unsupported engine '{engine_target.engine}': {exc}") from exc
+    if not isinstance(engine, ServerEngine):  # pragma: no cover - defensive guard
+        raise CommandError(f"Engine '{engine_target.engine}' revert is not supported yet.")
+
+    # Import here to avoid circular dependency
+    from sqlitch.cli.commands.deploy import _registry_tag_id
+
+    plan = request.plan
+    structured_logger = request.logger
+    try:
+        with engine.session() as connection:
+            deployed_ids: set[str] = set()
+            with structured_logger.span("revert.registry.load"):
+                if engine.registry_exists(connection):
+                    deployed_ids = {
+                        row.change_id
+                        for row in engine.load_deployed_changes(connection, plan.project_name)
+                    }
+
+            changes_to_revert, target_change = _collect_changes_to_revert(
+                request, changes, deployed_ids
+            )
+            if not changes_to_revert:
+                _report_nothing_to_revert(request, target_change, emitter)
+                return
+
+            emitter(
+                _introductory_message(
+                    target=request.target,
+                    target_change=target_change,
+                    to_change=request.to_change or (target_change.name if target_change else None),
+                    to_tag=request.to_tag,
+                )
+            )
+
+            for change, change_id in changes_to_revert:
+                script_path = _resolve_revert_script_path(request.plan_path.parent, change)
+                script_body = script_path.read_text(encoding="utf-8")
+                planner_name, planner_email = _resolve_planner_identity(
+                    change.planner, request.env, committer_email
+                )
+                record = RegistryChangeRecord(
+                    project=plan.project_name,
                     change_id=change_id,
-                    env=request.env,
+                    change=change.name,
+                    script_hash=compute_script_hash(script_body),
+                    note=change.notes or "",
+                    committed_at=datetime.now(timezone.utc),
                     committer_name=committer_name,
                     committer_email=committer_email,
-                    deployed=deployed,
-                    registry_schema=registry_schema,
-                    _emitter=emitter,
-                    _uri=request.plan.uri,
+                    planned_at=change.planned_at,
+                    planner_name=planner_name,
+                    planner_email=planner_email,
+                    requires=tuple(change.dependencies),
+                    conflicts=tuple(change.conflicts),
+                    tags=tuple(
+                        RegistryTagRecord(tag_id=_registry_tag_id(change_id, tag), tag=tag)
+                        for tag in change.tags
+                    ),
                 )
-            except CommandError:
-                emitter(f"  - {change.name} .. not ok")
-                raise
-            except Exception as exc:  # pragma: no cover - defensive guard
-                emitter(f"  - {change.name} .. not ok")
-                raise CommandError(f"Revert failed for change '{change.name}': {exc}") from exc
-            else:
+                try:
+                    with structured_logger.span("revert.apply", change=change.name):
+                        engine.revert_change(
+                            connection,
+                            script_body,
+                            record,
+                            manages_transactions=engine.script_manages_transactions(script_body),
+                        )
+                except EngineError as exc:
+                    emitter(f"  - {change.name} .. not ok")
+                    _log_revert_result(request, change, exc)
+                    raise CommandError(str(exc)) from exc
                 emitter(f"  - {change.name} .. ok")
+                _log_revert_result(request, change)
+    except EngineError as exc:
+        raise CommandError(str(exc)) from exc
 
-    finally:
-        connection.close()
 
+def _collect_changes_to_revert(
+    request: _RevertRequest,
+    changes: Sequence[Change],
+    deployed_ids: set[str],
+    *,
+    change_ids: Sequence[tuple[Change, str]] | None = None,
+) -> tuple[list[tuple[Change, str]], Change | None]:
+    """Return the deployed changes to revert, newest first, and the revert target.
 
-def _load_deployed_changes(
-    connection: sqlite3.Connection, registry_schema: str, project: str
-) -> dict[str, dict[str, str]]:
-    """Load deployed changes from registry for the given project.
+    For reworked changes, deployment is matched by change ID rather than name.
+    ``change_ids`` may supply the plan's precomputed change IDs.
 
-    Returns a dict mapping change_id to metadata. For reworked changes
-    (same name, different instances), each instance has a unique change_id.
+    Raises:
+        CommandError: If a reverted change is still required by a change that
+            stays deployed.
     """
-    cursor = connection.execute(
-        f'SELECT "change", change_id, script_hash FROM {registry_schema}.changes '  # nosec B608
-        f"WHERE project = ? ORDER BY committed_at DESC",
-        (project,),
-    )
-    try:
-        rows = cursor.fetchall()
-    finally:
-        cursor.close()
 
-    deployed: dict[str, dict[str, str]] = {}
-    for change_name, change_id, script_hash in rows:
-        change_id_str = str(change_id)
-        # Map by change_id, not name, to support reworked changes
-        deployed[change_id_str] = {
-            "change_name": str(change_name),
-            "change_id": change_id_str,
-            "script_hash": str(script_hash) if script_hash is not None else "",
-        }
-    return deployed
+    if change_ids is None:
+        # Import here to avoid circular dependency
+        from sqlitch.cli.commands.deploy import _plan_change_ids
+
+        change_ids = _plan_change_ids(request.plan)
+    plan_ids = [change_id for _, change_id in change_ids]
+
+    # If --to-change or --to-tag specified, `changes` contains the target point
+    # We revert everything AFTER the target (in deployment order)
+    if request.keep_count is not None:
+        keep_count = request.keep_count
+        changes = request.plan.changes[:keep_count]
+        bounded = keep_count > 0
+    else:
+        bounded = bool(request.to_change or request.to_tag)
+        keep_count = len(changes) if bounded else 0
+
+    changes_to_revert: list[tuple[Change, str]] = []
+    reverted_indices: list[int] = []
+    for i in range(len(request.plan.changes) - 1, -1, -1):
+        change_id = plan_ids[i]
+        if change_id in deployed_ids:
+            # If we have a target and this change (by position) should be kept, stop
+            if i < keep_count:
+                break
+            changes_to_revert.append((request.plan.changes[i], change_id))
+            reverted_indices.append(i)
+
+    target_change = changes[-1] if bounded and changes else None
+
+    if changes_to_revert:
+        _assert_no_deployed_dependents(
+            plan=request.plan,
+            reverted_indices=reverted_indices,
+            deployed_indices=[
+                i for i, change_id in enumerate(plan_ids) if change_id in deployed_ids
+            ],
+        )
+    return changes_to_revert, target_change
 
 
-def _revert_change(
+def _report_nothing_to_revert(
+    request: _RevertRequest,
+    target_change: Change | None,
+    emitter: Callable[[str], None],
+) -> None:
+    if request.to_change or request.to_tag or target_change is not None:
+        label = (
+            request.to_change
+            or request.to_tag
+            or (target_change.name if target_change else "target")
+        )
+        emitter(f'No changes deployed since: "{label}"')
+    else:
+        emitter("Nothing to revert (nothing deployed)")
+
+
+def _assert_no_deployed_dependents(
+    *,
+    plan: Plan,
+    reverted_indices: Sequence[int],
+    deployed_indices: Sequence[int],
+) -> None:
+    """Refuse to revert changes still required by changes that stay deployed."""
+
+    graph = build_dependency_graph(plan)
+    reverting = set(reverted_indices)
+    remaining = set(deployed_indices) - reverting
+    if not remaining:
+        return
+
+    for index in reverted_indices:
+        blockers = [dependent for dependent in graph.dependents_of(index) if dependent in remaining]
+        if not blockers:
+            continue
+        names = ", ".join(f'"{graph.changes[dependent].name}"' for dependent in blockers)
+        noun = "change" if len(blockers) == 1 else "changes"
+        raise CommandError(
+            f'Change "{graph.changes[index].name}" required by currently deployed {noun}: {names}'
+        )
+
+
+def _revert_in_batches(
     *,
     connection: sqlite3.Connection,
+    request: _RevertRequest,
+    changes_to_revert: Sequence[tuple[Change, str]],
+    deployed: dict[str, dict[str, str]],
+    snapshot: RegistrySnapshot,
+    committer_name: str,
+    committer_email: str,
+    registry_schema: str,
+    emitter: Callable[[str], None],
+) -> None:
+    """Revert ``changes_to_revert`` in order, up to ``request.batch_size`` per transaction.
+
+    Scripts that manage their own transactions always run alone. Batches are
+    committed before a later change fails to load, so every change reported as
+    reverted is also reverted in the database.
+    """
+
+    batch: list[_PreparedRevert] = []
+
+    def _flush() -> None:
+        if batch:
+            _execute_revert_batch(connection, request, batch, registry_schema, emitter)
+            for item in batch:
+                snapshot.discard(item.change_id)
+            batch.clear()
+
+    for change, change_id in changes_to_revert:
+        try:
+            item = _prepare_revert(
+                project=request.plan.project_name,
+                plan_root=request.plan_path.parent,
+                change=change,
+                change_id=change_id,
+                env=request.env,
+                committer_name=committer_name,
+                committer_email=committer_email,
+                deployed=deployed,
+            )
+        except CommandError as exc:
+            _flush()
+            emitter(f"  - {change.name} .. not ok")
+            _log_revert_result(request, change, exc)
+            raise
+        except Exception as exc:  # pragma: no cover - defensive guard
+            _flush()
+            emitter(f"  - {change.name} .. not ok")
+            _log_revert_result(request, change, exc)
+            raise CommandError(f"Revert failed for change '{change.name}': {exc}") from exc
+
+        if item.script.manages_transactions:
+            _flush()
+            batch.append(item)
+            _flush()
+            continue
+        batch.append(item)
+        if request.batch_size is not None and len(batch) >= request.batch_size:
+            _flush()
+    _flush()
+
+
+def _prepare_revert(
+    *,
     project: str,
     plan_root: Path,
     change: Change,
@@ -410,26 +690,13 @@ def _revert_change(
     committer_name: str,
     committer_email: str,
     deployed: dict[str, dict[str, str]],
-    registry_schema: str,
-    _emitter: Callable[[str], None],  # Reserved for progress reporting
-    _uri: str | None = None,  # Reserved for future registry override support
-) -> None:
-    """Execute a revert script and update registry state for a change."""
-    # Load revert script using the script_paths from the parser
-    script_ref = change.script_paths.get("revert")
-    if script_ref is None:
-        raise CommandError(f"Change '{change.name}' is missing a revert script path.")
-
-    script_path = Path(script_ref)
-    if not script_path.is_absolute():
-        script_path = plan_root / script_path
-
-    if not script_path.exists():
-        raise CommandError(f"Revert script {script_path} is missing for change '{change.name}'.")
+) -> _PreparedRevert:
+    """Load and validate the revert script of ``change`` and build its revert event."""
 
+    script_path = _resolve_revert_script_path(plan_root, change)
     script_body = script_path.read_text(encoding="utf-8")
-    validate_sqlite_script(script_body)
-    manages_transactions = script_manages_transactions(script_body)
+    prepared = ScriptCache.from_env(env).prepare(script_body)
+    prepared.validate()
 
     # Get change metadata from deployed state (keyed by change_id for rework support)
     change_metadata = deployed.get(change_id)
@@ -439,91 +706,154 @@ def _revert_change(
     # Use the change_id from metadata (should match computed one)
     registry_change_id = change_metadata["change_id"]
 
-    # Parse planner identity
     planner_name, planner_email = _resolve_planner_identity(change.planner, env, committer_email)
 
-    committed_at = format_registry_timestamp(datetime.now(timezone.utc))
-    planned_at = format_registry_timestamp(change.planned_at)
-    note = change.notes or ""
+    return _PreparedRevert(
+        change=change,
+        change_id=registry_change_id,
+        script=prepared,
+        event=(
+            "revert",
+            registry_change_id,
+            change.name,
+            project,
+            change.notes or "",
+            " ".join(change.dependencies),
+            "",
+            " ".join(change.tags),
+            format_registry_timestamp(datetime.now(timezone.utc)),
+            committer_name,
+            committer_email,
+            format_registry_timestamp(change.planned_at),
+            planner_name,
+            planner_email,
+        ),
+    )
 
-    def _record(cursor: sqlite3.Cursor) -> None:
-        # Delete tags first (if this change has any tags pointing to it)
-        cursor.execute(
-            f"DELETE FROM {registry_schema}.tags WHERE change_id = ?",  # nosec B608
-            (registry_change_id,),
-        )
 
-        # Delete dependencies FROM this change (where this is the source)
-        cursor.execute(
-            f"DELETE FROM {registry_schema}.dependencies WHERE change_id = ?",  # nosec B608
-            (registry_change_id,),
-        )
+def _execute_revert_batch(
+    connection: sqlite3.Connection,
+    request: _RevertRequest,
+    batch: Sequence[_PreparedRevert],
+    registry_schema: str,
+    emitter: Callable[[str], None],
+) -> None:
+    """Run the revert scripts of ``batch`` and update the registry in one transaction.
 
-        # Delete dependencies TO this change (where this is the target)
-        # This is necessary because dependency_id FK doesn't have ON DELETE CASCADE
-        cursor.execute(
-            f"DELETE FROM {registry_schema}.dependencies WHERE dependency_id = ?",  # nosec B608
-            (registry_change_id,),
-        )
+    A failure rolls back the whole batch and leaves every change in it
+    deployed. A failing script is reported against its change; a failure to
+    record the batch in the registry is reported against the registry.
+    """
 
-        # Delete from changes table
-        cursor.execute(
-            f"DELETE FROM {registry_schema}.changes WHERE change_id = ?",  # nosec B608
-            (registry_change_id,),
-        )
+    structured_logger = request.logger
 
-        # Insert revert event
-        cursor.execute(
-            f"""
-            INSERT INTO {registry_schema}.events (
-                event,
-                change_id,
-                change,
-                project,
-                note,
-                requires,
-                conflicts,
-                tags,
-                committed_at,
-                committer_name,
-                committer_email,
-                planned_at,
-                planner_name,
-                planner_email
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,  # nosec B608
-            (
-                "revert",
-                registry_change_id,
-                change.name,
-                project,
-                note,
-                " ".join(change.dependencies),
-                "",
-                " ".join(change.tags),
-                committed_at,
-                committer_name,
-                committer_email,
-                planned_at,
-                planner_name,
-                planner_email,
-            ),
-        )
+    def _record(cursor: sqlite3.Cursor) -> None:
+        with structured_logger.span("revert.registry.record", changes=len(batch)):
+            try:
+                _record_reverts(cursor, registry_schema, batch)
+            except sqlite3.Error as exc:
+                raise _RegistryRecordError(exc) from exc
 
+    current = batch[0]
     try:
-        _execute_change_transaction(
-            connection, script_body, _record, manages_transactions=manages_transactions
+        if current.script.manages_transactions:
+            with structured_logger.span("revert.apply", change=current.change.name):
+                _execute_change_transaction(
+                    connection, current.script.statements, _record, manages_transactions=True
+                )
+        else:
+            connection.execute("BEGIN IMMEDIATE")
+            cursor = connection.cursor()
+            try:
+                for current in batch:
+                    with structured_logger.span("revert.apply", change=current.change.name):
+                        _execute_sqlite_script(cursor, current.script.statements)
+                _record(cursor)
+                connection.execute("COMMIT")
+            except Exception:
+                try:
+                    connection.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+                raise
+            finally:
+                cursor.close()
+    except _RegistryRecordError as exc:
+        names = ", ".join(item.change.name for item in batch)
+        message = (
+            f"Failed to record reverts of {names} in the registry: {exc.__cause__}; "
+            "the changes remain recorded as deployed"
         )
+        for item in batch:
+            emitter(f"  - {item.change.name} .. not ok")
+            _log_revert_result(request, item.change, exc.__cause__ or exc)
+        raise CommandError(message) from exc.__cause__
     except sqlite3.Error as exc:
-        raise CommandError(f"Revert failed for change '{change.name}': {exc}") from exc
+        emitter(f"  - {current.change.name} .. not ok")
+        message = f"Revert failed for change '{current.change.name}': {exc}"
+        rolled_back = batch.index(current)
+        if rolled_back:
+            message += f" ({rolled_back} earlier change(s) in the transaction were rolled back)"
+        _log_revert_result(request, current.change, exc)
+        raise CommandError(message) from exc
+
+    for item in batch:
+        emitter(f"  - {item.change.name} .. ok")
+        _log_revert_result(request, item.change)
+
+
+def _log_revert_result(
+    request: _RevertRequest, change: Change, error: BaseException | None = None
+) -> None:
+    """Emit ``revert.change.success`` or ``revert.change.error`` for ``change``."""
+
+    structured_logger = request.logger
+    payload = {"change": change.name, "plan": request.plan.project_name, "target": request.target}
+    if error is not None:
+        structured_logger.error("revert.change.error", message=str(error), payload=payload)
+    elif structured_logger.enabled("INFO", "revert.change.success"):
+        structured_logger.info("revert.change.success", payload=payload)
+
+
+def _record_reverts(
+    cursor: sqlite3.Cursor, registry_schema: str, reverts: Sequence[_PreparedRevert]
+) -> None:
+    """Remove reverted changes from the registry and record their revert events."""
+
+    change_ids = [item.change_id for item in reverts]
+    for start in range(0, len(change_ids), CLEANUP_CHUNK_SIZE):
+        chunk = change_ids[start : start + CLEANUP_CHUNK_SIZE]
+        delete_tags, delete_dependencies, delete_changes = registry_cleanup_statements(
+            registry_schema, len(chunk)
+        )
+        cursor.execute(delete_tags, chunk)
+        cursor.execute(delete_dependencies, chunk + chunk)
+        cursor.execute(delete_changes, chunk)
+    cursor.executemany(
+        registry_statements(registry_schema).insert_event, [item.event for item in reverts]
+    )
 
-    # Remove from deployed dict
-    deployed.pop(change.name, None)
+
+def _resolve_revert_script_path(plan_root: Path, change: Change) -> Path:
+    """Return the revert script for ``change``, which must exist on disk."""
+
+    # Load revert script using the script_paths from the parser
+    script_ref = change.script_paths.get("revert")
+    if script_ref is None:
+        raise CommandError(f"Change '{change.name}' is missing a revert script path.")
+
+    script_path = Path(script_ref)
+    if not script_path.is_absolute():
+        script_path = plan_root / script_path
+
+    if not script_path.exists():
+        raise CommandError(f"Revert script {script_path} is missing for change '{change.name}'.")
+    return script_path
 
 
 def _execute_change_transaction(
     connection: sqlite3.Connection,
-    script_body: str,
+    statements: Sequence[str],
     record_callback: Callable[[sqlite3.Cursor], None],
     *,
     manages_transactions: bool,
@@ -533,7 +863,7 @@ def _execute_change_transaction(
         # Script manages its own transactions
         cursor = connection.cursor()
         try:
-            _execute_sqlite_script(cursor, script_body)
+            _execute_sqlite_script(cursor, statements)
             cursor.close()
 
             # Record registry changes in separate transaction
@@ -557,7 +887,7 @@ def _execute_change_transaction(
         connection.execute("BEGIN IMMEDIATE")
         try:
             cursor = connection.cursor()
-            _execute_sqlite_script(cursor, script_body)
+            _execute_sqlite_script(cursor, statements)
             record_callback(cursor)
             cursor.close()
             connection.execute("COMMIT")
@@ -569,9 +899,9 @@ def _execute_change_transaction(
             raise
 
 
-def _execute_sqlite_script(cursor: sqlite3.Cursor, script_sql: str) -> None:
-    """Execute script SQL statement-by-statement against cursor."""
-    for statement in extract_sqlite_statements(script_sql):
+def _execute_sqlite_script(cursor: sqlite3.Cursor, statements: Sequence[str]) -> None:
+    """Execute pre-split statements one by one against cursor."""
+    for statement in statements:
         cursor.execute(statement)
 
 
@@ -742,6 +1072,18 @@ def _resolve_engine_target(
         )
         return engine_target, display_name
 
+    if engine_name in {"pg", "mysql"}:
+        workspace_uri = (
+            candidate if candidate.startswith("db:") else f"db:{engine_name}:{workspace_payload}"
+        )
+        engine_target = EngineTarget(
+            name=original_display,
+            engine=engine_name,
+            uri=workspace_uri,
+            registry_uri=registry_override or workspace_uri,
+        )
+        return engine_target, original_display
+
     raise CommandError(f"Engine '{engine_name}' revert is not supported yet.")
 
 
@@ -819,26 +1161,32 @@ def _select_changes(
     plan: Plan,
     to_change: str | None,
     to_tag: str | None,
+    resolver: ReferenceResolver | None = None,
+    to_index: int | None = None,
 ) -> tuple[Change, ...]:
     changes = plan.changes
     if not changes:
         return ()
 
+    if to_index is not None:
+        return changes[: to_index + 1]
+    if not to_change and not to_tag:
+        return changes
+
+    resolver = resolver or ReferenceResolver.from_plan(plan)
     if to_change:
         try:
-            index = next(i for i, change in enumerate(changes) if change.name == to_change)
-        except StopIteration as exc:
+            index = resolver.resolve_target_index(to_change)
+        except ValueError as exc:
             raise CommandError(f"Plan does not contain change '{to_change}'.") from exc
         return changes[: index + 1]
 
-    if to_tag:
-        try:
-            tag_entry = next(tag for tag in plan.tags if tag.name == to_tag)
-        except StopIteration as exc:
-            raise CommandError(f"Plan does not contain tag '{to_tag}'.") from exc
-        return _select_changes(plan=plan, to_change=tag_entry.change_ref, to_tag=None)
-
-    return changes
+    assert to_tag is not None  # nosec B101 - guaranteed by the early return above
+    try:
+        index = resolver.resolve_index(f"@{to_tag.removeprefix('@')}")
+    except ValueError as exc:
+        raise CommandError(f"Plan does not contain tag '{to_tag}'.") from exc
+    return changes[: index + 1]
 
 
 def _render_log_only_revert(request: _RevertRequest, changes: Sequence[Change]) -> None:
@@ -8,7 +8,6 @@ from pathlib import Path
 
 import click
 
-from sqlitch.config.resolver import resolve_config
 from sqlitch.plan.formatter import write_plan
 from sqlitch.plan.model import Change, Plan, PlanEntry, Tag
 from sqlitch.plan.parser import PlanParseError, parse_plan
@@ -144,11 +143,7 @@ def rework_command(  # pylint: disable=unused-argument
     env = cli_context.env
 
     # Load configuration for planner identity resolution
-    config = resolve_config(
-        root_dir=project_root,
-        config_root=cli_context.config_root,
-        env=env,
-    )
+    config = cli_context.config_profile()
 
     plan_path = resolve_plan_path(
         project_root=project_root,
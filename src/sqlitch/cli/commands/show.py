@@ -8,18 +8,15 @@ from pathlib import Path
 
 import click
 
+from sqlitch.plan.graph import build_dependency_graph
 from sqlitch.plan.model import Change, Plan
 from sqlitch.plan.parser import PlanParseError, parse_plan
+from sqlitch.plan.symbolic import ReferenceResolver
 from sqlitch.utils.time import isoformat_utc
 
 from ..options import global_output_options, global_sqitch_options
 from . import CommandError, register_command
-from ._context import (
-    environment_from,
-    plan_override_from,
-    project_root_from,
-    require_cli_context,
-)
+from ._context import environment_from, plan_override_from, project_root_from, require_cli_context
 from ._plan_utils import resolve_default_engine, resolve_plan_path
 from .add import _format_display_path
 
@@ -103,12 +100,17 @@ def show_command(  # pylint: disable=unused-argument
         return
 
     tags = _collect_tags(plan, change)
+    required_by = _collect_dependents(plan, change)
     if output_format.lower() == "json":
-        payload = _build_json_payload(change=change, tags=tags, project_root=project_root)
+        payload = _build_json_payload(
+            change=change, tags=tags, required_by=required_by, project_root=project_root
+        )
         click.echo(json.dumps(payload, indent=2))
         return
 
-    lines = _build_human_output(change=change, tags=tags, project_root=project_root)
+    lines = _build_human_output(
+        change=change, tags=tags, required_by=required_by, project_root=project_root
+    )
     click.echo("\n".join(lines))
 
 
@@ -124,19 +126,10 @@ def _load_plan(plan_path: Path, default_engine: str | None) -> Plan:
 
 
 def _resolve_change(plan: Plan, reference: str) -> Change:
-    if plan.has_change(reference):
-        return plan.get_change(reference)
-
-    for tag in plan.tags:
-        if tag.name == reference:
-            try:
-                return plan.get_change(tag.change_ref)
-            except KeyError as exc:  # pragma: no cover - defensive guard
-                raise CommandError(
-                    f"Tag '{tag.name}' references unknown change '{tag.change_ref}'."
-                ) from exc
-
-    raise CommandError(f'Unknown change "{reference}"')
+    try:
+        return ReferenceResolver.from_plan(plan).resolve(reference)
+    except ValueError as exc:
+        raise CommandError(f'Unknown change "{reference}"') from exc
 
 
 def _collect_tags(plan: Plan, change: Change) -> tuple[str, ...]:
@@ -159,10 +152,17 @@ def _collect_tags(plan: Plan, change: Change) -> tuple[str, ...]:
     return tuple(ordered)
 
 
+def _collect_dependents(plan: Plan, change: Change) -> tuple[str, ...]:
+    graph = build_dependency_graph(plan)
+    dependents = graph.dependents_of(graph.index_of(change))
+    return tuple(dict.fromkeys(graph.changes[index].name for index in dependents))
+
+
 def _build_json_payload(
     *,
     change: Change,
     tags: tuple[str, ...],
+    required_by: tuple[str, ...],
     project_root: Path,
 ) -> dict[str, object]:
     scripts: dict[str, str] = {}
@@ -181,6 +181,7 @@ def _build_json_payload(
             use_z_suffix=True,
         ),
         "dependencies": list(change.dependencies),
+        "required_by": list(required_by),
         "tags": list(tags),
         "notes": change.notes,
         "scripts": scripts,
@@ -191,6 +192,7 @@ def _build_human_output(
     *,
     change: Change,
     tags: tuple[str, ...],
+    required_by: tuple[str, ...],
     project_root: Path,
 ) -> list[str]:
     lines = [
@@ -198,6 +200,7 @@ def _build_human_output(
         f"Planner: {change.planner}",
         f"Planned At: {isoformat_utc(change.planned_at, drop_microseconds=True, use_z_suffix=True)}",  # noqa: E501 pylint: disable=line-too-long
         f"Dependencies: {_format_list(change.dependencies)}",
+        f"Required By: {_format_list(required_by)}",
         f"Tags: {_format_list(tags)}",
     ]
 
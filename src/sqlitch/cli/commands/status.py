@@ -12,7 +12,7 @@ from pathlib import Path
 import click
 
 from sqlitch.config import resolver as config_resolver
-from sqlitch.engine import EngineTarget, canonicalize_engine_name, create_engine
+from sqlitch.engine import Engine, EngineTarget, canonicalize_engine_name, create_engine
 from sqlitch.engine.base import UnsupportedEngineError
 from sqlitch.engine.sqlite import resolve_sqlite_filesystem_path
 from sqlitch.plan.model import Plan
@@ -109,11 +109,7 @@ def status_command(  # pylint: disable=unused-argument
 
     # If no target from CLI/env, check if the default engine has a target configured
     if not target_value and default_engine:
-        config_profile = config_resolver.resolve_config(
-            root_dir=project_root,
-            config_root=cli_context.config_root,
-            env=environment,
-        )
+        config_profile = cli_context.config_profile()
         engine_section = f'engine "{default_engine}"'
         engine_target_value = config_profile.settings.get(engine_section, {}).get("target")
         if engine_target_value and isinstance(engine_target_value, str):
@@ -121,7 +117,9 @@ def status_command(  # pylint: disable=unused-argument
 
     if not target_value:
         raise CommandError("A target must be provided via --target or configuration.")
-    plan = _load_plan(plan_path, default_engine)
+    structured_logger = cli_context.logger
+    with structured_logger.span("status.plan.parse", plan_path=plan_path.as_posix()):
+        plan = _load_plan(plan_path, default_engine)
 
     resolved_project = plan.project_name
     if project_filter and project_filter != resolved_project:
@@ -135,7 +133,8 @@ def status_command(  # pylint: disable=unused-argument
         plan.default_engine,
         registry_override=cli_context.registry,
     )
-    registry_rows, last_failure = _load_registry_state(engine_target, resolved_project)
+    with structured_logger.span("status.registry.load"):
+        registry_rows, last_failure = _load_registry_state(engine_target, resolved_project)
 
     if registry_rows:
         registry_project = registry_rows[-1].project
@@ -150,6 +149,16 @@ def status_command(  # pylint: disable=unused-argument
 
     status = _determine_status(plan_changes, deployed_changes)
     pending = _calculate_pending(plan_changes, deployed_changes)
+    structured_logger.info(
+        "status.complete",
+        payload={
+            "project": resolved_project,
+            "target": display_target,
+            "status": status,
+            "deployed": len(deployed_changes),
+            "pending": len(pending),
+        },
+    )
 
     normalized_format = output_format.lower()
     if normalized_format == "json":
@@ -323,7 +332,8 @@ def _load_registry_state(
             )
 
         cursor.execute(
-            """
+            engine.format_query(
+                """
             SELECT
                 c.project,
                 c.change_id,
@@ -342,14 +352,15 @@ def _load_registry_state(
             FROM changes AS c
             WHERE c.project = ?
             ORDER BY c.committed_at ASC, c.change_id ASC
-            """,
+            """
+            ),
             (expected_project,),
         )
         rows = cursor.fetchall()
         description = getattr(cursor, "description", None)
         columns = [column[0] for column in description] if description else []
 
-        failure_row = _load_last_failure_event(connection, expected_project)
+        failure_row = _load_last_failure_event(connection, expected_project, engine)
     except Exception as exc:  # pylint: disable=broad-exception-caught # pragma: no cover
         # Catch all DB errors to check for missing registry schema
         if _registry_schema_missing(exc):
@@ -427,29 +438,32 @@ def _load_registry_rows(
 
 
 def _load_last_failure_event(
-    connection: sqlite3.Connection, expected_project: str
+    connection: sqlite3.Connection, expected_project: str, engine: Engine
 ) -> FailureMetadata | None:
     failure_cursor: sqlite3.Cursor | None = None
     try:
         failure_cursor = connection.cursor()
         try:
             failure_cursor.execute(
-                """
-                SELECT change, note, committed_at, committer_name, committer_email
+                engine.format_query(
+                    """
+                SELECT "change", note, committed_at, committer_name, committer_email
                 FROM events
-                WHERE project = ? AND lower(event) = 'deploy_fail'
+                WHERE project = ? AND lower(event) IN ('deploy_fail', 'fail')
                 ORDER BY committed_at DESC, change_id DESC
                 LIMIT 1
-                """,
+                """
+                ),
                 (expected_project,),
             )
-        except sqlite3.Error as exc:
+        except Exception as exc:  # pylint: disable=broad-exception-caught
             message = str(exc).lower()
             missing_indicators = (
                 "no such table: events",
                 'relation "events" does not exist',
                 'table "events" does not exist',
                 'missing from-clause entry for table "events"',
+                ".events' doesn't exist",
             )
             if any(indicator in message for indicator in missing_indicators):
                 return None
@@ -488,6 +502,9 @@ def _registry_schema_missing(error: Exception) -> bool:
         "no such table: tags",
         'relation "tags" does not exist',
         'table "tags" does not exist',
+        ".changes' doesn't exist",
+        ".tags' doesn't exist",
+        "unknown database",
     )
     return any(indicator in message for indicator in missing_indicators)
 
@@ -6,7 +6,6 @@ from datetime import datetime, timezone
 
 import click
 
-from sqlitch.config.resolver import resolve_config
 from sqlitch.plan.formatter import write_plan
 from sqlitch.plan.model import Change, PlanEntry, Tag
 from sqlitch.plan.parser import PlanParseError, parse_plan
@@ -117,11 +116,7 @@ def _add_tag(
     quiet = quiet_mode_enabled(ctx)
 
     # Load configuration for planner identity resolution
-    config = resolve_config(
-        root_dir=project_root,
-        config_root=cli_context.config_root,
-        env=environment,
-    )
+    config = cli_context.config_profile()
 
     plan_path = resolve_plan_path(
         project_root=project_root,
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import closing
 from pathlib import Path
 
 import click
 
-from sqlitch.engine import EngineTarget, canonicalize_engine_name
+from sqlitch.engine import EngineTarget, canonicalize_engine_name, create_engine
+from sqlitch.engine.base import EngineError, UnsupportedEngineError
 from sqlitch.engine.scripts import Script
+from sqlitch.engine.server import ServerEngine
 from sqlitch.plan.model import Plan
 from sqlitch.plan.parser import parse_plan
+from sqlitch.utils.logging import StructuredLogger
 
 from ..options import global_output_options, global_sqitch_options
 from . import CommandError, register_command
@@ -145,6 +148,18 @@ def _resolve_engine_target(
         )
         return engine_target, display_name
 
+    if engine_name in {"pg", "mysql"}:
+        workspace_uri = (
+            candidate if candidate.startswith("db:") else f"db:{engine_name}:{workspace_payload}"
+        )
+        engine_target = EngineTarget(
+            name=original_display,
+            engine=engine_name,
+            uri=workspace_uri,
+            registry_uri=registry_override or workspace_uri,
+        )
+        return engine_target, original_display
+
     raise CommandError(f"Engine '{engine_name}' verification is not supported yet.")
 
 
@@ -223,17 +238,13 @@ def verify_command(  # pylint: disable=unused-argument
         engine_override=cli_context.engine,
         plan_path=plan_path,
     )
-    plan = _load_plan(plan_path, default_engine)
+    logger = cli_context.logger
+    with logger.span("verify.plan.parse", plan_path=plan_path.as_posix()):
+        plan = _load_plan(plan_path, default_engine)
 
     # If no target from CLI/env, check if the default engine has a target configured
     if not target_value and default_engine:
-        from sqlitch.config import resolver as config_resolver
-
-        config_profile = config_resolver.resolve_config(
-            root_dir=project_root,
-            config_root=cli_context.config_root,
-            env=environment,
-        )
+        config_profile = cli_context.config_profile()
         engine_section = f'engine "{default_engine}"'
         engine_target_value = config_profile.settings.get(engine_section, {}).get("target")
         if engine_target_value and isinstance(engine_target_value, str):
@@ -241,7 +252,6 @@ def verify_command(  # pylint: disable=unused-argument
 
     if not target_value:
         raise CommandError("A target must be provided via --target or configuration.")
-    plan_change_names = [change.name for change in plan.changes]
 
     # Resolve engine target
     engine_target, display_target = _resolve_engine_target(
@@ -254,6 +264,44 @@ def verify_command(  # pylint: disable=unused-argument
         registry_override=cli_context.registry,
     )
 
+    if engine_target.engine == "sqlite":
+        outcome = _verify_sqlite_target(engine_target, display_target, plan, project_root, logger)
+    else:
+        outcome = _verify_server_target(engine_target, plan, project_root, logger)
+    if outcome is None:
+        return
+    processed_changes, error_count, pending_changes = outcome
+
+    if pending_changes:
+        header = "Undeployed change:" if len(pending_changes) == 1 else "Undeployed changes:"
+        click.echo(header)
+        for change_name in pending_changes:
+            click.echo(f"  * {change_name}")
+
+    if error_count:
+        click.echo()
+        summary_title = "Verify Summary Report"
+        click.echo(summary_title)
+        click.echo("-" * len(summary_title))
+        click.echo(f"Changes: {processed_changes}")
+        click.echo(f"Errors:  {error_count}")
+        raise CommandError("Verify failed")
+
+    click.echo("Verify successful")
+
+
+def _verify_sqlite_target(
+    engine_target: EngineTarget,
+    display_target: str,
+    plan: Plan,
+    project_root: Path,
+    logger: StructuredLogger,
+) -> tuple[int, int, list[str]] | None:
+    """Run verify scripts against a SQLite target.
+
+    Returns ``(processed, errors, undeployed)`` or ``None`` when nothing is deployed.
+    """
+
     # EngineTarget.__post_init__ guarantees registry_uri is never None
     assert engine_target.registry_uri is not None  # nosec B101 - type guard for invariant
 
@@ -274,7 +322,6 @@ def verify_command(  # pylint: disable=unused-argument
 
     processed_changes = 0
     error_count = 0
-    pending_changes: list[str] = []
     with closing(connection):
         try:
             connection.execute("ATTACH DATABASE ? AS sqitch", (registry_path,))
@@ -283,13 +330,16 @@ def verify_command(  # pylint: disable=unused-argument
 
         try:
             # Query registry with change_id to match against plan for rework detection
-            with closing(
-                connection.execute(
-                    "SELECT change, change_id FROM sqitch.changes "
-                    "WHERE project = ? ORDER BY committed_at",
-                    (plan.project_name,),
-                )
-            ) as query_cursor:
+            with (
+                logger.span("verify.registry.load"),
+                closing(
+                    connection.execute(
+                        "SELECT change, change_id FROM sqitch.changes "
+                        "WHERE project = ? ORDER BY committed_at",
+                        (plan.project_name,),
+                    )
+                ) as query_cursor,
+            ):
                 deployed_changes = list(query_cursor.fetchall())
         except sqlite3.Error as exc:
             raise CommandError(f"Failed to query registry: {exc}") from exc
@@ -298,75 +348,157 @@ def verify_command(  # pylint: disable=unused-argument
 
         if not deployed_changes:
             click.echo("No changes to verify.")
-            return
+            return None
 
         deployed_names = [name for name, _ in deployed_changes]
-        pending_changes = [name for name in plan_change_names if name not in deployed_names]
-
-        # Build a map of change occurrences to handle reworked changes
-        # Track which occurrence of each change name we're processing
-        change_occurrence_index: dict[str, int] = {}
 
         with closing(connection.cursor()) as cursor:
-            for change_name, _ in deployed_changes:
+            for change_name, verify_script_path in _verify_script_paths(
+                plan, project_root, deployed_names
+            ):
                 processed_changes += 1
 
-                # Track occurrence count for this change name
-                occurrence = change_occurrence_index.get(change_name, 0)
-                change_occurrence_index[change_name] = occurrence + 1
-
-                # Find the matching Change object in the plan for this occurrence
-                matching_change = None
-                current_occurrence = 0
-                for change_obj in plan.changes:
-                    if change_obj.name == change_name:
-                        if current_occurrence == occurrence:
-                            matching_change = change_obj
-                            break
-                        current_occurrence += 1
-
-                # Determine verify script filename
-                if matching_change and matching_change.is_rework():
-                    rework_tag = matching_change.get_rework_tag()
-                    if rework_tag:
-                        verify_filename = f"{change_name}@{rework_tag}.sql"
-                    else:
-                        verify_filename = f"{change_name}.sql"
-                else:
-                    verify_filename = f"{change_name}.sql"
-
-                verify_script_path = project_root / "verify" / verify_filename
-
                 if not verify_script_path.exists():
                     click.echo(f"  # {change_name} .. SKIP (no verify script)")
+                    _log_verify_result(logger, plan, change_name, "skip")
                     continue
 
                 try:
                     script = Script.load(verify_script_path)
-                    _execute_sqlite_verify_script(cursor, script.content)
+                    with logger.span("verify.apply", change=change_name):
+                        _execute_sqlite_verify_script(cursor, script.content)
                     click.echo(f"  * {change_name} .. ok")
+                    _log_verify_result(logger, plan, change_name, "success")
                 except Exception as exc:  # pylint: disable=broad-exception-caught
                     # User-friendly error reporting for any verify failure
                     click.echo(f"  # {change_name} .. NOT OK")
                     click.echo(f"  Error: {exc}", err=True)
+                    _log_verify_result(logger, plan, change_name, "error", exc)
                     error_count += 1
 
-    if pending_changes:
-        header = "Undeployed change:" if len(pending_changes) == 1 else "Undeployed changes:"
-        click.echo(header)
-        for change_name in pending_changes:
-            click.echo(f"  * {change_name}")
+    return processed_changes, error_count, _undeployed_names(plan, deployed_names)
 
-    if error_count:
-        click.echo()
-        summary_title = "Verify Summary Report"
-        click.echo(summary_title)
-        click.echo("-" * len(summary_title))
-        click.echo(f"Changes: {processed_changes}")
-        click.echo(f"Errors:  {error_count}")
-        raise CommandError("Verify failed")
 
-    click.echo("Verify successful")
+def _verify_server_target(
+    engine_target: EngineTarget,
+    plan: Plan,
+    project_root: Path,
+    logger: StructuredLogger,
+) -> tuple[int, int, list[str]] | None:
+    """Run verify scripts against a target whose registry lives on a database server.
+
+    Each verify script runs in a transaction that is always rolled back.
+    """
+
+    try:
+        engine = create_engine(engine_target)
+    except (UnsupportedEngineError, EngineError) as exc:
+        raise CommandError(f"Unsupported engine '{engine_target.engine}': {exc}") from exc
+    if not isinstance(engine, ServerEngine):  # pragma: no cover - defensive guard
+        raise CommandError(f"Engine '{engine_target.engine}' verification is not supported yet.")
+
+    processed_changes = 0
+    error_count = 0
+    try:
+        with engine.session() as connection:
+            deployed_names: list[str] = []
+            with logger.span("verify.registry.load"):
+                if engine.registry_exists(connection):
+                    deployed_names = [
+                        row.change
+                        for row in engine.load_deployed_changes(connection, plan.project_name)
+                    ]
+
+            click.echo(f"Verifying {engine_target.name}")
+
+            if not deployed_names:
+                click.echo("No changes to verify.")
+                return None
+
+            for change_name, verify_script_path in _verify_script_paths(
+                plan, project_root, deployed_names
+            ):
+                processed_changes += 1
+
+                if not verify_script_path.exists():
+                    click.echo(f"  # {change_name} .. SKIP (no verify script)")
+                    _log_verify_result(logger, plan, change_name, "skip")
+                    continue
+
+                try:
+                    script_body = Script.load(verify_script_path).content
+                    with logger.span("verify.apply", change=change_name):
+                        engine.verify_change(connection, script_body)
+                    click.echo(f"  * {change_name} .. ok")
+                    _log_verify_result(logger, plan, change_name, "success")
+                except EngineError as exc:
+                    click.echo(f"  # {change_name} .. NOT OK")
+                    click.echo(f"  Error: {exc}", err=True)
+                    _log_verify_result(logger, plan, change_name, "error", exc)
+                    error_count += 1
+    except EngineError as exc:
+        raise CommandError(str(exc)) from exc
+
+    return processed_changes, error_count, _undeployed_names(plan, deployed_names)
+
+
+def _verify_script_paths(
+    plan: Plan,
+    project_root: Path,
+    deployed_names: Sequence[str],
+) -> Iterator[tuple[str, Path]]:
+    """Yield each deployed change name with the verify script for that instance."""
+
+    # Build a map of change occurrences to handle reworked changes
+    # Track which occurrence of each change name we're processing
+    change_occurrence_index: dict[str, int] = {}
+
+    for change_name in deployed_names:
+        # Track occurrence count for this change name
+        occurrence = change_occurrence_index.get(change_name, 0)
+        change_occurrence_index[change_name] = occurrence + 1
+
+        # Find the matching Change object in the plan for this occurrence
+        matching_change = None
+        current_occurrence = 0
+        for change_obj in plan.changes:
+            if change_obj.name == change_name:
+                if current_occurrence == occurrence:
+                    matching_change = change_obj
+                    break
+                current_occurrence += 1
+
+        # Determine verify script filename
+        if matching_change and matching_change.is_rework():
+            rework_tag = matching_change.get_rework_tag()
+            if rework_tag:
+                verify_filename = f"{change_name}@{rework_tag}.sql"
+            else:
+                verify_filename = f"{change_name}.sql"
+        else:
+            verify_filename = f"{change_name}.sql"
+
+        yield change_name, project_root / "verify" / verify_filename
+
+
+def _log_verify_result(
+    logger: StructuredLogger,
+    plan: Plan,
+    change_name: str,
+    outcome: str,
+    error: BaseException | None = None,
+) -> None:
+    """Emit ``verify.change.<outcome>`` for ``change_name``."""
+
+    payload = {"change": change_name, "plan": plan.project_name}
+    if error is not None:
+        logger.error(f"verify.change.{outcome}", message=str(error), payload=payload)
+    elif logger.enabled("INFO", f"verify.change.{outcome}"):
+        logger.info(f"verify.change.{outcome}", payload=payload)
+
+
+def _undeployed_names(plan: Plan, deployed_names: Sequence[str]) -> list[str]:
+    return [change.name for change in plan.changes if change.name not in deployed_names]
 
 
 def _load_plan(plan_path: Path, default_engine: str) -> Plan:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import time
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any
@@ -13,7 +13,11 @@ from typing import Any
 import click
 
 from sqlitch.config import resolver as config_resolver
+from sqlitch.config.loader import ConfigProfile
+from sqlitch.utils.identity import IdentityService, activate_identity_service
 from sqlitch.utils.logging import StructuredLogger, create_logger
+from sqlitch.utils.metrics import METRICS_COMMANDS, MetricsCollector
+from sqlitch.utils.profiling import DEFAULT_PROFILE_TOP, PROFILE_MODES, create_profiler
 
 from .commands import (
     CommandError,
@@ -28,6 +32,8 @@ _CLI_CONTEXT_META_KEY = "sqlitch_cli_context"
 _CLI_ARGS_META_KEY = "sqlitch_cli_args"
 _CLI_SUBCOMMAND_META_KEY = "sqlitch_cli_subcommand"
 _CLI_START_TIME_META_KEY = "sqlitch_cli_start_time"
+_JSON_LOG_BUFFER_SIZE = 64
+_DEFAULT_PROFILE_FILES = {"deterministic": "sqlitch.pstats", "sampling": "sqlitch.folded"}
 
 
 @dataclass
@@ -48,6 +54,8 @@ class CLIContext:
         json_mode: Indicates whether structured JSON output has been requested.
         log_config: Default logging configuration for the invocation.
         logger: Structured logger that honors the configured verbosity/quiet settings.
+        config_cache: Configuration profiles parsed during this invocation.
+        identity: System identity lookups shared by planner and committer resolution.
     """
 
     project_root: Path
@@ -63,6 +71,18 @@ class CLIContext:
     json_mode: bool
     log_config: LogConfiguration
     logger: StructuredLogger
+    config_cache: config_resolver.ConfigCache = field(default_factory=config_resolver.ConfigCache)
+    identity: IdentityService = field(default_factory=IdentityService)
+
+    def config_profile(self) -> ConfigProfile:
+        """Return the merged configuration profile for the project and config root."""
+
+        return config_resolver.resolve_config(
+            root_dir=self.project_root,
+            config_root=self.config_root,
+            env=self.env,
+            cache=self.config_cache,
+        )
 
     @property
     def run_identifier(self) -> str:
@@ -103,7 +123,7 @@ def _build_cli_context(
         json_mode=json_mode,
         env=environment,
     )
-    logger = create_logger(log_config)
+    logger = create_logger(log_config, json_buffer_size=_JSON_LOG_BUFFER_SIZE)
 
     resolved_target = (
         target or environment.get("SQLITCH_TARGET") or environment.get("SQITCH_TARGET")
@@ -123,12 +143,23 @@ def _build_cli_context(
         json_mode=json_mode,
         log_config=log_config,
         logger=logger,
+        identity=IdentityService.from_env(environment, resolved_config_root),
     )
 
 
 class SqlitchGroup(click.Group):
     """Custom Click group that emits structured logging events."""
 
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        # ``--profile`` takes its path only as ``--profile=PATH``; a bare flag must not
+        # swallow the command name that follows it.
+        for index, arg in enumerate(args):
+            if arg == "--" or arg in self.commands:
+                break
+            if arg == "--profile":
+                args = [*args[:index], "--profile=", *args[index + 1 :]]
+        return super().parse_args(ctx, args)
+
     def invoke(self, ctx: click.Context) -> Any:
         error: BaseException | None = None
         try:
@@ -211,6 +242,46 @@ class SqlitchGroup(click.Group):
     is_flag=True,
     help="Do not pipe output into a pager.",
 )
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Write timing spans of the command to this file as Chrome trace-event JSON.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help=(
+        "Write OpenMetrics for the deploy, revert, verify, or status run to this "
+        "file, e.g. for the node exporter textfile collector."
+    ),
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    is_flag=False,
+    flag_value="",
+    default=None,
+    metavar="[PATH]",
+    help=(
+        "Profile the command, write the profile to PATH (sqlitch.pstats, or "
+        "sqlitch.folded when sampling), and print the hottest functions. Name "
+        "the file with --profile=PATH."
+    ),
+)
+@click.option(
+    "--profile-mode",
+    type=click.Choice(PROFILE_MODES),
+    default="deterministic",
+    show_default=True,
+    help="Use cProfile (deterministic) or a low-overhead stack sampler.",
+)
+@click.option(
+    "--profile-top",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PROFILE_TOP,
+    show_default=True,
+    help="Number of functions listed in the --profile summary.",
+)
 @global_output_options
 @click.pass_context
 def main(
@@ -226,6 +297,11 @@ def main(
     quiet: bool,
     chdir_path: Path | None,
     no_pager: bool,
+    trace_file: Path | None,
+    metrics_file: Path | None,
+    profile_path: str | None,
+    profile_mode: str,
+    profile_top: int,
 ) -> None:
     """Top-level SQLitch command group.
 
@@ -255,6 +331,26 @@ def main(
     )
     ctx.obj = cli_context
     ctx.meta[_CLI_CONTEXT_META_KEY] = cli_context
+    ctx.with_resource(config_resolver.activate_config_cache(cli_context.config_cache))
+    ctx.with_resource(activate_identity_service(cli_context.identity))
+    # Runs after the group's command.complete record, so the final batch is written.
+    ctx.call_on_close(cli_context.logger.flush)
+    if metrics_file is not None:
+        _start_metrics(ctx, cli_context.logger, metrics_file.resolve())
+    if trace_file is not None:
+        _start_trace(ctx, cli_context.logger, trace_file.resolve())
+    if profile_path is not None:
+        _start_profile(
+            ctx,
+            path=Path(profile_path or _DEFAULT_PROFILE_FILES[profile_mode]).resolve(),
+            mode=profile_mode,
+            top=profile_top,
+            quiet=quiet,
+        )
+    else:
+        for name in ("profile_mode", "profile_top"):
+            if ctx.get_parameter_source(name) is not click.core.ParameterSource.DEFAULT:
+                raise CommandError(f"--{name.replace('_', '-')} requires --profile.")
     ctx.meta["no_pager"] = no_pager  # Store for commands that need it
     leftover_args = tuple(ctx.args)
     ctx.meta[_CLI_ARGS_META_KEY] = leftover_args
@@ -265,6 +361,63 @@ def main(
     _log_command_start(ctx, cli_context)
 
 
+def _start_trace(ctx: click.Context, logger: StructuredLogger, trace_file: Path) -> None:
+    """Trace the invocation in one root span and export it when the context closes."""
+
+    logger.start_trace()
+
+    def _export() -> None:
+        try:
+            logger.export_trace(trace_file)
+        except OSError as exc:
+            raise CommandError(f"Failed to write trace file {trace_file}: {exc}") from exc
+
+    # Close callbacks run last-in first-out: the root span ends before the export.
+    ctx.call_on_close(_export)
+    ctx.with_resource(logger.span(f"sqlitch.{ctx.invoked_subcommand or 'main'}"))
+
+
+def _start_metrics(ctx: click.Context, logger: StructuredLogger, metrics_file: Path) -> None:
+    """Collect run metrics from ``logger`` and write them when the context closes."""
+
+    command = ctx.invoked_subcommand
+    if command not in METRICS_COMMANDS:
+        raise CommandError(
+            f"--metrics-file supports only the {', '.join(METRICS_COMMANDS)} commands."
+        )
+
+    collector = MetricsCollector(command)
+    logger.add_listener(collector, events=collector.events)
+
+    def _write() -> None:
+        try:
+            collector.write(metrics_file)
+        except OSError as exc:
+            raise CommandError(f"Failed to write metrics file {metrics_file}: {exc}") from exc
+
+    ctx.call_on_close(_write)
+
+
+def _start_profile(ctx: click.Context, *, path: Path, mode: str, top: int, quiet: bool) -> None:
+    """Profile the rest of the invocation and report it when the context closes."""
+
+    profiler = create_profiler(mode)
+
+    def _finish() -> None:
+        profiler.stop()
+        try:
+            profiler.write(path)
+        except OSError as exc:
+            raise CommandError(f"Failed to write profile {path}: {exc}") from exc
+        if not quiet:
+            click.echo(profiler.summary(top), err=True)
+            click.echo(f"Profile written to {path}", err=True)
+
+    # Registered last, so it runs first on close and leaves the teardown unprofiled.
+    ctx.call_on_close(_finish)
+    profiler.start()
+
+
 def _resolve_cli_context(ctx: click.Context) -> CLIContext | None:
     obj = ctx.obj
     if isinstance(obj, CLIContext):
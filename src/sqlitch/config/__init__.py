@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from .compiled import CompiledConfigStore  # noqa: F401
 from .loader import ConfigConflictError, ConfigProfile, ConfigScope, load_config  # noqa: F401
 from .resolver import (  # noqa: F401
+    ConfigCache,
     CredentialResolution,
+    activate_config_cache,
     determine_config_root,
     resolve_config,
     resolve_credentials,
@@ -0,0 +1,140 @@
+"""Persistent cache of merged configuration profiles.
+
+Every invocation normally parses the system, user, and local ``sqitch.conf``
+files. Tooling that runs SQLitch hundreds of times in a row pays for that on
+each run, so :class:`CompiledConfigStore` keeps the merged
+:class:`~sqlitch.config.loader.ConfigProfile` as a small JSON document under
+the user configuration root. The cache is opt-in through the
+``SQLITCH_CONFIG_CACHE`` environment variable.
+
+An entry is keyed by the resolved scope directories and the configuration
+environment variables, and it records the path, ``mtime_ns``, size, and inode
+of every candidate config file. It is only used while all of those still
+match, so editing, replacing, creating, or deleting a config file invalidates it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from .loader import ConfigProfile
+
+__all__ = ["COMPILED_CONFIG_ENV", "CompiledConfigStore", "FileFingerprint"]
+
+COMPILED_CONFIG_ENV = "SQLITCH_CONFIG_CACHE"
+"""Environment variable enabling the persistent configuration cache."""
+
+FileFingerprint = tuple[str, int | None, int | None, int | None]
+"""``(path, mtime_ns, size, inode)`` of a candidate config file; ``None`` when missing."""
+
+_FORMAT_VERSION = 1
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+class CompiledConfigStore:
+    """Read and write compiled configuration profiles in ``directory``."""
+
+    __slots__ = ("directory",)
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str], user_root: Path) -> CompiledConfigStore | None:
+        """Return a store under ``user_root`` when ``SQLITCH_CONFIG_CACHE`` is enabled."""
+
+        if env.get(COMPILED_CONFIG_ENV, "").strip().lower() not in _TRUTHY:
+            return None
+        base = user_root.parent if user_root.is_file() else user_root
+        return cls(base / "cache" / "config")
+
+    @staticmethod
+    def entry_key(key_material: Sequence[object]) -> str:
+        """Return the entry name for JSON-serialisable ``key_material``."""
+
+        encoded = json.dumps(list(key_material), default=str, separators=(",", ":"))
+        return hashlib.sha1(encoded.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def load(self, key: str, fingerprint: Sequence[FileFingerprint]) -> ConfigProfile | None:
+        """Return the stored profile for ``key`` if its files still match ``fingerprint``."""
+
+        try:
+            payload = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return _decode_entry(payload, key, fingerprint)
+
+    def store(
+        self, key: str, fingerprint: Sequence[FileFingerprint], profile: ConfigProfile
+    ) -> None:
+        """Persist ``profile`` for ``key``; failures to write are ignored."""
+
+        path = self._entry_path(key)
+        payload = {
+            "version": _FORMAT_VERSION,
+            "key": key,
+            "fingerprint": [list(item) for item in fingerprint],
+            "root_dir": str(profile.root_dir),
+            "files": [str(item) for item in profile.files],
+            "settings": {section: dict(values) for section, values in profile.settings.items()},
+            "active_engine": profile.active_engine,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle)
+                os.replace(temp_name, path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # The cache is an optimisation; an unwritable directory must not fail a command.
+            return
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"v{_FORMAT_VERSION}" / f"{key}.json"
+
+
+def _decode_entry(
+    payload: object, key: str, fingerprint: Sequence[FileFingerprint]
+) -> ConfigProfile | None:
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != _FORMAT_VERSION or payload.get("key") != key:
+        return None
+    if payload.get("fingerprint") != [list(item) for item in fingerprint]:
+        return None
+
+    root_dir = payload.get("root_dir")
+    files = payload.get("files")
+    settings = payload.get("settings")
+    active_engine = payload.get("active_engine")
+    if not (
+        isinstance(root_dir, str)
+        and isinstance(files, list)
+        and all(isinstance(item, str) for item in files)
+        and isinstance(settings, dict)
+        and all(
+            isinstance(values, dict)
+            and all(
+                isinstance(name, str) and isinstance(value, str) for name, value in values.items()
+            )
+            for values in settings.values()
+        )
+        and (active_engine is None or isinstance(active_engine, str))
+    ):
+        return None
+
+    return ConfigProfile(
+        root_dir=Path(root_dir),
+        files=tuple(Path(item) for item in files),
+        settings=settings,
+        active_engine=active_engine,
+    )
@@ -9,6 +9,7 @@ from enum import Enum
 from pathlib import Path
 
 __all__ = [
+    "CONFIG_FILENAMES",
     "ConfigScope",
     "ConfigConflictError",
     "ConfigProfile",
@@ -39,7 +40,8 @@ class ConfigConflictError(RuntimeError):
     """Raised when conflicting config files are discovered within the same scope."""
 
 
-_CONFIG_FILENAMES: Sequence[str] = ("sqitch.conf", "sqlitch.conf")
+CONFIG_FILENAMES: Sequence[str] = ("sqitch.conf", "sqlitch.conf")
+"""File names searched for in each configuration scope directory, in order."""
 
 
 def load_config(
@@ -62,7 +64,7 @@ def load_config(
     Defaults to ``("sqitch.conf", "sqlitch.conf")`` while retaining support for
     legacy SQLitch-specific filenames.
     """
-    search_names: Sequence[str] = config_filenames or _CONFIG_FILENAMES
+    search_names: Sequence[str] = config_filenames or CONFIG_FILENAMES
     root_path = Path(root_dir)
     resolved_scopes = {scope: Path(path) for scope, path in scope_dirs.items()}
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import MappingProxyType
 from typing import TYPE_CHECKING
@@ -12,7 +14,8 @@ from typing import TYPE_CHECKING
 from sqlitch.engine import canonicalize_engine_name
 from sqlitch.engine.sqlite import derive_sqlite_registry_uri
 
-from .loader import ConfigProfile, ConfigScope, load_config
+from .compiled import CompiledConfigStore, FileFingerprint
+from .loader import CONFIG_FILENAMES, ConfigProfile, ConfigScope, load_config
 
 if TYPE_CHECKING:
     from sqlitch.cli.options import CredentialOverrides
@@ -26,6 +29,17 @@ _ENV_SQLITCH_USER_CONFIG = "SQLITCH_USER_CONFIG"
 _ENV_SQITCH_USER_CONFIG = "SQITCH_USER_CONFIG"
 _ENV_SQLITCH_SYSTEM_CONFIG = "SQLITCH_SYSTEM_CONFIG"
 _ENV_SQITCH_SYSTEM_CONFIG = "SQITCH_SYSTEM_CONFIG"
+_CONFIG_ENV_NAMES: tuple[str, ...] = (
+    _ENV_SQLITCH_CONFIG_ROOT,
+    _ENV_SQITCH_CONFIG_ROOT,
+    _ENV_XDG_CONFIG_HOME,
+    _ENV_SQLITCH_CONFIG,
+    _ENV_SQITCH_CONFIG,
+    _ENV_SQLITCH_USER_CONFIG,
+    _ENV_SQITCH_USER_CONFIG,
+    _ENV_SQLITCH_SYSTEM_CONFIG,
+    _ENV_SQITCH_SYSTEM_CONFIG,
+)
 
 _DEFAULT_SYSTEM_PATH = Path("/etc/sqlitch")
 _FALLBACK_SYSTEM_PATH = Path("/etc/sqitch")
@@ -41,6 +55,87 @@ _CONFIG_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
 }
 
 
+_CacheKey = tuple[Path, tuple[tuple[str, Path], ...], tuple[str, ...]]
+
+
+@dataclass
+class ConfigCache:
+    """Memoize merged configuration profiles for the lifetime of one invocation.
+
+    A cached profile is reused while every candidate config file of every
+    scope keeps its modification time, size, and inode, so a file that is
+    written, created, or removed mid-invocation is read again on the next lookup.
+
+    Attributes:
+        loads: Number of profiles read from disk, either parsed or compiled.
+        hits: Number of lookups served from memory.
+    """
+
+    loads: int = 0
+    hits: int = 0
+    _entries: dict[_CacheKey, tuple[tuple[FileFingerprint, ...], ConfigProfile]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def load(
+        self,
+        *,
+        root_dir: Path,
+        scope_dirs: Mapping[ConfigScope, Path],
+        config_filenames: Sequence[str] | None = None,
+        store: CompiledConfigStore | None = None,
+        overlays: Sequence[tuple[str, str]] = (),
+    ) -> ConfigProfile:
+        """Return the profile for ``scope_dirs``, reading the files only when they changed."""
+
+        names = tuple(config_filenames or CONFIG_FILENAMES)
+        key = (root_dir, tuple((scope.value, path) for scope, path in scope_dirs.items()), names)
+        fingerprint = _fingerprint_scope_files(scope_dirs.values(), names)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            self.hits += 1
+            return cached[1]
+
+        profile = _load_profile(
+            root_dir=root_dir,
+            scope_dirs=scope_dirs,
+            config_filenames=config_filenames,
+            store=store,
+            overlays=overlays,
+            fingerprint=fingerprint,
+        )
+        self.loads += 1
+        self._entries[key] = (fingerprint, profile)
+        return profile
+
+    def clear(self) -> None:
+        """Drop every cached profile; the counters are kept."""
+
+        self._entries.clear()
+
+
+_ACTIVE_CONFIG_CACHE: ContextVar[ConfigCache | None] = ContextVar(
+    "sqlitch_config_cache", default=None
+)
+
+
+@contextmanager
+def activate_config_cache(cache: ConfigCache) -> Iterator[ConfigCache]:
+    """Serve :func:`resolve_config` calls from ``cache`` until the block exits."""
+
+    token = _ACTIVE_CONFIG_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_CONFIG_CACHE.reset(token)
+
+
+def active_config_cache() -> ConfigCache | None:
+    """Return the cache activated by :func:`activate_config_cache`, if any."""
+
+    return _ACTIVE_CONFIG_CACHE.get()
+
+
 @dataclass(frozen=True)
 class CredentialResolution:
     """Resolved credential values alongside their originating sources."""
@@ -91,8 +186,16 @@ def resolve_config(
     home: Path | None = None,
     system_path: Path | str | None = None,
     config_filenames: Sequence[str] | None = None,
+    cache: ConfigCache | None = None,
 ) -> ConfigProfile:
-    """Resolve configuration scope directories and load a profile."""
+    """Resolve configuration scope directories and load a profile.
+
+    The profile is served from ``cache``, or else from the cache activated by
+    :func:`activate_config_cache`; without either, the files are read on
+    every call. When ``SQLITCH_CONFIG_CACHE`` is enabled, profiles read from
+    disk come from the compiled cache under the user config root whenever the
+    config files are unchanged.
+    """
     env_map = _normalize_env(env)
     project_root = Path(root_dir)
 
@@ -114,13 +217,77 @@ def resolve_config(
         ConfigScope.LOCAL: local_root,
     }
 
-    return load_config(
+    store = CompiledConfigStore.from_env(env_map, user_root)
+    overlays = tuple((name, env_map[name]) for name in _CONFIG_ENV_NAMES if name in env_map)
+    cache = cache if cache is not None else _ACTIVE_CONFIG_CACHE.get()
+    if cache is not None:
+        return cache.load(
+            root_dir=project_root,
+            scope_dirs=scope_dirs,
+            config_filenames=config_filenames,
+            store=store,
+            overlays=overlays,
+        )
+
+    return _load_profile(
         root_dir=project_root,
         scope_dirs=scope_dirs,
         config_filenames=config_filenames,
+        store=store,
+        overlays=overlays,
     )
 
 
+def _load_profile(
+    *,
+    root_dir: Path,
+    scope_dirs: Mapping[ConfigScope, Path],
+    config_filenames: Sequence[str] | None,
+    store: CompiledConfigStore | None,
+    overlays: Sequence[tuple[str, str]],
+    fingerprint: tuple[FileFingerprint, ...] | None = None,
+) -> ConfigProfile:
+    if store is None:
+        return load_config(
+            root_dir=root_dir, scope_dirs=scope_dirs, config_filenames=config_filenames
+        )
+
+    names = tuple(config_filenames or CONFIG_FILENAMES)
+    if fingerprint is None:
+        fingerprint = _fingerprint_scope_files(scope_dirs.values(), names)
+    key = store.entry_key(
+        (
+            str(root_dir),
+            [(scope.value, str(path)) for scope, path in scope_dirs.items()],
+            names,
+            overlays,
+        )
+    )
+    profile = store.load(key, fingerprint)
+    if profile is None:
+        profile = load_config(
+            root_dir=root_dir, scope_dirs=scope_dirs, config_filenames=config_filenames
+        )
+        store.store(key, fingerprint, profile)
+    return profile
+
+
+def _fingerprint_scope_files(
+    directories: Iterable[Path], names: Sequence[str]
+) -> tuple[FileFingerprint, ...]:
+    fingerprint: list[FileFingerprint] = []
+    for directory in directories:
+        candidates = [directory] if directory.is_file() else [directory / name for name in names]
+        for candidate in candidates:
+            try:
+                stat = candidate.stat()
+            except OSError:
+                fingerprint.append((str(candidate), None, None, None))
+            else:
+                fingerprint.append((str(candidate), stat.st_mtime_ns, stat.st_size, stat.st_ino))
+    return tuple(fingerprint)
+
+
 def _resolve_user_scope_root(
     *, env_map: Mapping[str, str], config_root: Path | str | None, home: Path | None
 ) -> Path:
@@ -239,36 +406,36 @@ def _normalize_env(env: Mapping[str, str] | None) -> Mapping[str, str]:
 
 
 def _resolve_credential_field(
-    field: str,
+    field_name: str,
     cli_overrides: "CredentialOverrides" | None,
     env_map: Mapping[str, str],
     profile: ConfigProfile | None,
     target: str | None,
     sources: dict[str, str],
 ) -> str | None:
-    cli_value = _cli_override_value(cli_overrides, field)
+    cli_value = _cli_override_value(cli_overrides, field_name)
     if cli_value is not None:
-        sources[field] = "cli"
+        sources[field_name] = "cli"
         return cli_value
 
-    env_value = _lookup_env_credential(field, env_map, target)
+    env_value = _lookup_env_credential(field_name, env_map, target)
     if env_value is not None:
-        sources[field] = "env"
+        sources[field_name] = "env"
         return env_value
 
-    config_value = _lookup_config_credential(field, profile, target)
+    config_value = _lookup_config_credential(field_name, profile, target)
     if config_value is not None:
-        sources[field] = "config"
+        sources[field_name] = "config"
         return config_value
 
-    sources[field] = "unset"
+    sources[field_name] = "unset"
     return None
 
 
-def _cli_override_value(overrides: "CredentialOverrides" | None, field: str) -> str | None:
+def _cli_override_value(overrides: "CredentialOverrides" | None, field_name: str) -> str | None:
     if overrides is None:
         return None
-    value = getattr(overrides, field, None)
+    value = getattr(overrides, field_name, None)
     if value is None:
         return None
     if isinstance(value, str):
@@ -277,17 +444,17 @@ def _cli_override_value(overrides: "CredentialOverrides" | None, field: str) ->
 
 
 def _lookup_env_credential(
-    field: str, env_map: Mapping[str, str], target: str | None
+    field_name: str, env_map: Mapping[str, str], target: str | None
 ) -> str | None:
-    for name in _environment_variable_names(field, target):
+    for name in _environment_variable_names(field_name, target):
         value = env_map.get(name)
         if value is not None:
             return value
     return None
 
 
-def _environment_variable_names(field: str, target: str | None) -> tuple[str, ...]:
-    aliases = _ENV_FIELD_ALIASES.get(field, (field.upper(),))
+def _environment_variable_names(field_name: str, target: str | None) -> tuple[str, ...]:
+    aliases = _ENV_FIELD_ALIASES.get(field_name, (field_name.upper(),))
     names: list[str] = []
     target_fragment = _normalize_env_identifier(target) if target else None
 
@@ -304,7 +471,7 @@ def _environment_variable_names(field: str, target: str | None) -> tuple[str, ..
 
 
 def _lookup_config_credential(
-    field: str, profile: ConfigProfile | None, target: str | None
+    field_name: str, profile: ConfigProfile | None, target: str | None
 ) -> str | None:
     if profile is None:
         return None
@@ -316,7 +483,7 @@ def _lookup_config_credential(
         sections.append(f'engine "{profile.active_engine}"')
     sections.append("core")
 
-    aliases = _CONFIG_FIELD_ALIASES.get(field, (field,))
+    aliases = _CONFIG_FIELD_ALIASES.get(field_name, (field_name,))
 
     for section in sections:
         data = profile.settings.get(section)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .aio import AsyncEngine, create_async_engine, gather_bounded
 from .base import (
     ENGINE_REGISTRY,
     Engine,
@@ -15,11 +16,13 @@ from .base import (
     registered_engines,
     unregister_engine,
 )
-from .mysql import MYSQL_STUB_MESSAGE, MySQLEngine
-from .postgres import POSTGRES_STUB_MESSAGE, PostgresEngine
+from .mysql import MySQLEngine
+from .postgres import PostgresEngine
+from .server import ServerEngine
 from .sqlite import SQLiteEngine, SQLiteEngineError
 
 __all__ = [
+    "AsyncEngine",
     "Engine",
     "EngineError",
     "EngineTarget",
@@ -27,14 +30,15 @@ __all__ = [
     "UnsupportedEngineError",
     "canonicalize_engine_name",
     "connection_factory_for_engine",
+    "create_async_engine",
     "create_engine",
+    "gather_bounded",
     "register_engine",
     "unregister_engine",
     "registered_engines",
     "MySQLEngine",
-    "MYSQL_STUB_MESSAGE",
     "PostgresEngine",
-    "POSTGRES_STUB_MESSAGE",
+    "ServerEngine",
     "SQLiteEngine",
     "SQLiteEngineError",
 ]
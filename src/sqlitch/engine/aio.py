@@ -0,0 +1,269 @@
+"""Asynchronous engine API for operating on many targets concurrently.
+
+:class:`AsyncEngine` mirrors the connection helpers of :class:`Engine` with
+coroutine methods so that, for example, ``status`` or ``deploy`` across many
+targets can run in a single event loop. Drivers without native asyncio support
+(``sqlite3``, PyMySQL) are wrapped aiosqlite-style: each connection is opened
+and used on its own worker thread, so thread-bound connections stay valid and
+blocking calls never stall the loop. PostgreSQL targets use psycopg's native
+:class:`psycopg.AsyncConnection`.
+
+:func:`gather_bounded` runs one coroutine per target with a concurrency limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+from typing import Any, TypeVar
+
+from .base import ConnectArguments, Engine, EngineTarget, create_engine
+
+__all__ = [
+    "AsyncConnection",
+    "AsyncEngine",
+    "PsycopgAsyncEngine",
+    "ThreadedAsyncEngine",
+    "create_async_engine",
+    "gather_bounded",
+]
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class AsyncConnection(ABC):
+    """Coroutine interface over a single driver connection.
+
+    Connections are asynchronous context managers that close on exit.
+    Parameters use the owning engine's ``paramstyle``.
+    """
+
+    @abstractmethod
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        """Execute a single statement in autocommit mode."""
+
+    @abstractmethod
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        """Execute a query and return every row."""
+
+    @abstractmethod
+    async def execute_script(self, script_sql: str) -> None:
+        """Execute a multi-statement script."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the underlying driver connection."""
+
+    async def __aenter__(self) -> AsyncConnection:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+class _ThreadedConnection(AsyncConnection):
+    """Run a blocking DB-API connection on a dedicated worker thread."""
+
+    __slots__ = ("_connection", "_executor")
+
+    def __init__(self, executor: ThreadPoolExecutor, connection: Any) -> None:
+        self._executor = executor
+        self._connection = connection
+
+    @classmethod
+    async def open(cls, connect: Callable[[], Any]) -> _ThreadedConnection:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlitch-db")
+        try:
+            connection = await asyncio.get_running_loop().run_in_executor(executor, connect)
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        return cls(executor, connection)
+
+    async def _run(self, func: Callable[..., _R], *args: Any) -> _R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        await self._run(_execute, self._connection, sql, params)
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        return await self._run(_fetchall, self._connection, sql, params)
+
+    async def execute_script(self, script_sql: str) -> None:
+        await self._run(_execute_script, self._connection, script_sql)
+
+    async def close(self) -> None:
+        try:
+            await self._run(self._connection.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+def _execute(connection: Any, sql: str, params: Sequence[Any]) -> None:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, tuple(params))
+    finally:
+        cursor.close()
+    # sqlite3 opens implicit transactions for DML; commit to keep autocommit semantics.
+    if getattr(connection, "in_transaction", False):
+        connection.commit()
+
+
+def _fetchall(connection: Any, sql: str, params: Sequence[Any]) -> list[tuple[Any, ...]]:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, tuple(params))
+        return [tuple(row) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def _execute_script(connection: Any, script_sql: str) -> None:
+    executescript = getattr(connection, "executescript", None)
+    if executescript is not None:
+        executescript(script_sql)
+        return
+    # Drivers without executescript (PyMySQL) accept multi-statement batches.
+    cursor = connection.cursor()
+    try:
+        cursor.execute(script_sql)
+        while cursor.nextset():
+            pass
+    finally:
+        cursor.close()
+
+
+class _PsycopgConnection(AsyncConnection):
+    """Adapter over :class:`psycopg.AsyncConnection`."""
+
+    __slots__ = ("_connection",)
+
+    def __init__(self, connection: Any) -> None:
+        self._connection = connection
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        await self._connection.execute(sql, tuple(params) or None)
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        cursor = await self._connection.execute(sql, tuple(params) or None)
+        return [tuple(row) for row in await cursor.fetchall()]
+
+    async def execute_script(self, script_sql: str) -> None:
+        await self._connection.execute(script_sql)
+
+    async def close(self) -> None:
+        await self._connection.close()
+
+
+class AsyncEngine(ABC):
+    """Asynchronous counterpart of :class:`Engine` wrapping a synchronous engine.
+
+    Args:
+        engine: Synchronous engine supplying target details and connect arguments.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    @property
+    def target(self) -> EngineTarget:
+        """Target served by the wrapped engine."""
+
+        return self.engine.target
+
+    def format_query(self, sql: str) -> str:
+        """Rewrite ``?`` placeholders in ``sql`` for the driver's parameter style."""
+
+        return self.engine.format_query(sql)
+
+    @abstractmethod
+    async def connect_registry(self) -> AsyncConnection:
+        """Open a connection to the engine's registry database."""
+
+    @abstractmethod
+    async def connect_workspace(self) -> AsyncConnection:
+        """Open a connection to the engine's workspace database."""
+
+    async def execute_script(self, connection: AsyncConnection, script_sql: str) -> None:
+        """Execute a change script over ``connection``."""
+
+        await connection.execute_script(script_sql)
+
+
+class ThreadedAsyncEngine(AsyncEngine):
+    """Async engine offloading a blocking driver to per-connection worker threads."""
+
+    async def connect_registry(self) -> AsyncConnection:
+        return await _ThreadedConnection.open(self.engine.connect_registry)
+
+    async def connect_workspace(self) -> AsyncConnection:
+        return await _ThreadedConnection.open(self.engine.connect_workspace)
+
+
+class PsycopgAsyncEngine(AsyncEngine):
+    """Async engine for PostgreSQL targets using psycopg's native asyncio support."""
+
+    async def connect_registry(self) -> AsyncConnection:
+        return await self._connect(self.engine.build_registry_connect_arguments())
+
+    async def connect_workspace(self) -> AsyncConnection:
+        return await self._connect(self.engine.build_workspace_connect_arguments())
+
+    async def _connect(self, arguments: ConnectArguments) -> AsyncConnection:
+        import psycopg
+
+        connection = await psycopg.AsyncConnection.connect(*arguments.args, **arguments.kwargs)
+        return _PsycopgConnection(connection)
+
+
+def create_async_engine(target: EngineTarget, **kwargs: Any) -> AsyncEngine:
+    """Instantiate the async engine for ``target``.
+
+    Keyword arguments are forwarded to the synchronous engine constructor.
+    """
+
+    engine = create_engine(target, **kwargs)
+    if target.engine == "pg":
+        return PsycopgAsyncEngine(engine)
+    return ThreadedAsyncEngine(engine)
+
+
+async def gather_bounded(
+    items: Iterable[_T],
+    operation: Callable[[_T], Awaitable[_R]],
+    *,
+    concurrency: int = 4,
+) -> list[_R]:
+    """Apply ``operation`` to every item with at most ``concurrency`` in flight.
+
+    Results are returned in input order. If any operation fails, the others
+    are cancelled and the first failure propagates.
+    """
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(item: _T) -> _R:
+        async with semaphore:
+            return await operation(item)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_bounded(item)) for item in items]
+    except BaseExceptionGroup as failures:
+        raise failures.exceptions[0]
+    return [task.result() for task in tasks]
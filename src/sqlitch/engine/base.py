@@ -7,7 +7,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from types import MappingProxyType, ModuleType
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 
 class EngineError(RuntimeError):
@@ -144,6 +144,9 @@ class Engine(ABC):
     registry and workspace databases while sharing lazy driver loading logic.
     """
 
+    paramstyle: ClassVar[str] = "qmark"
+    """DB-API parameter style of the engine's driver (``qmark`` or ``format``)."""
+
     def __init__(self, target: EngineTarget, **_: Any) -> None:
         self.target = target
         self._connection_factory = connection_factory_for_engine(target.engine)
@@ -166,6 +169,12 @@ class Engine(ABC):
         arguments = self.build_workspace_connect_arguments()
         return self._connection_factory.connect(arguments)
 
+    def format_query(self, sql: str) -> str:
+        """Rewrite ``?`` placeholders in ``sql`` for the driver's parameter style."""
+        if self.paramstyle == "qmark":
+            return sql
+        return sql.replace("%", "%%").replace("?", "%s")
+
 
 ENGINE_REGISTRY: dict[str, type[Engine]] = {}
 """Global registry mapping canonical engine names to their implementations.
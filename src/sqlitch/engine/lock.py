@@ -0,0 +1,283 @@
+"""Advisory deploy lock for SQLite targets.
+
+SQLite serialises writers with file locks, so two deployers racing for the same
+registry fail with ``database is locked`` as soon as their busy timeout runs
+out. Deploys often run longer than any sensible busy timeout. The deploy lock
+serialises whole commands instead of single transactions.
+
+The lock is a small JSON file created next to the registry database with
+``O_CREAT | O_EXCL``. It records the owner, process ID, host, and a heartbeat
+that the holder refreshes from a background thread. Waiters retry with
+exponential backoff until their timeout expires. A lock whose heartbeat is
+older than ``stale_after`` seconds is treated as abandoned and removed. A holder
+whose lock file was removed or taken over stops its heartbeat rather than
+overwriting the new owner's file.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+
+from .base import EngineError
+
+__all__ = [
+    "DEFAULT_BUSY_TIMEOUT_MS",
+    "DEFAULT_LOCK_TIMEOUT",
+    "DEFAULT_STALE_AFTER",
+    "DeployLock",
+    "DeployLockError",
+    "LockInfo",
+    "lock_path_for_registry",
+    "read_lock_info",
+]
+
+DEFAULT_LOCK_TIMEOUT = 60.0
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_STALE_AFTER = 30.0
+LOCK_SUFFIX = ".lock"
+
+_logger = logging.getLogger(__name__)
+
+
+class DeployLockError(EngineError):
+    """Raised when the deploy lock cannot be acquired before the timeout."""
+
+
+@dataclass(frozen=True, slots=True)
+class LockInfo:
+    """Contents of a deploy lock file.
+
+    Attributes:
+        acquired_at: Wall-clock time (seconds since the epoch) the lock was taken.
+        heartbeat_at: Wall-clock time of the holder's most recent heartbeat.
+    """
+
+    owner: str
+    pid: int
+    host: str
+    acquired_at: float
+    heartbeat_at: float
+
+    def age(self, now: float | None = None) -> float:
+        """Return the seconds elapsed since the last heartbeat."""
+
+        return (time.time() if now is None else now) - self.heartbeat_at
+
+    def describe(self) -> str:
+        """Return a one-line description of the holder."""
+
+        return f"{self.owner} (pid {self.pid} on {self.host})"
+
+
+def lock_path_for_registry(registry_path: Path) -> Path:
+    """Return the lock file guarding the registry database at ``registry_path``."""
+
+    return registry_path.with_name(registry_path.name + LOCK_SUFFIX)
+
+
+def read_lock_info(path: Path) -> LockInfo | None:
+    """Return the lock recorded at ``path``, or ``None`` when it is not held.
+
+    A lock file that cannot be parsed, for example one its creator has not
+    finished writing, is reported as held by an unknown owner whose heartbeat
+    is the file's modification time.
+    """
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return LockInfo(
+            owner=str(payload["owner"]),
+            pid=int(payload["pid"]),
+            host=str(payload["host"]),
+            acquired_at=float(payload["acquired_at"]),
+            heartbeat_at=float(payload["heartbeat_at"]),
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        try:
+            modified = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        return LockInfo(
+            owner="unknown", pid=0, host="unknown", acquired_at=modified, heartbeat_at=modified
+        )
+
+
+class DeployLock:
+    """Exclusive advisory lock held for the duration of a deploy-like command.
+
+    Args:
+        path: Lock file location, usually from :func:`lock_path_for_registry`.
+        owner: Human-readable holder description, such as the committer.
+        timeout: Seconds to wait for a held lock; ``0`` fails immediately.
+        stale_after: Heartbeat age, in seconds, after which a lock is abandoned.
+        heartbeat_interval: Seconds between heartbeat refreshes while held.
+        initial_delay: First backoff delay in seconds; doubles on every retry.
+        max_delay: Upper bound on a single backoff delay.
+        sleep: Sleep function, replaceable in tests.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        owner: str,
+        timeout: float = DEFAULT_LOCK_TIMEOUT,
+        stale_after: float = DEFAULT_STALE_AFTER,
+        heartbeat_interval: float = 5.0,
+        initial_delay: float = 0.05,
+        max_delay: float = 2.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.path = path
+        self.owner = owner
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.heartbeat_interval = heartbeat_interval
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._info: LockInfo | None = None
+        self._stop = threading.Event()
+        self._heartbeat: threading.Thread | None = None
+        self._lost = False
+
+    @property
+    def held(self) -> bool:
+        """``True`` while this instance holds the lock."""
+
+        return self._info is not None
+
+    @property
+    def lost(self) -> bool:
+        """``True`` once the heartbeat found the lock file removed or taken over."""
+
+        return self._lost
+
+    def acquire(self) -> None:
+        """Take the lock, waiting with exponential backoff while another holder has it.
+
+        Raises:
+            DeployLockError: If the lock is still held when the timeout expires.
+        """
+
+        deadline = time.monotonic() + max(self.timeout, 0.0)
+        delay = self.initial_delay
+        while not self._try_create():
+            holder = read_lock_info(self.path)
+            if holder is not None and holder.age() > self.stale_after:
+                self._remove_stale(holder)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                description = holder.describe() if holder else "another process"
+                raise DeployLockError(
+                    f"Timed out after {self.timeout:g}s waiting for the deploy lock "
+                    f"held by {description}"
+                )
+            self._sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_delay)
+
+        self._stop.clear()
+        self._lost = False
+        self._heartbeat = threading.Thread(
+            target=self._beat, name="sqlitch-deploy-lock", daemon=True
+        )
+        self._heartbeat.start()
+
+    def release(self) -> None:
+        """Stop the heartbeat and remove the lock file if this instance holds it."""
+
+        if self._info is None:
+            return
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        current = read_lock_info(self.path)
+        if current is not None and (current.pid, current.acquired_at) == (
+            self._info.pid,
+            self._info.acquired_at,
+        ):
+            self.path.unlink(missing_ok=True)
+        self._info = None
+
+    def __enter__(self) -> DeployLock:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def _try_create(self) -> bool:
+        now = time.time()
+        info = LockInfo(
+            owner=self.owner,
+            pid=os.getpid(),
+            host=socket.gethostname(),
+            acquired_at=now,
+            heartbeat_at=now,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            descriptor = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            json.dump(asdict(info), handle)
+        self._info = info
+        return True
+
+    def _remove_stale(self, holder: LockInfo) -> None:
+        # Only remove the file if it still records the holder that was judged stale.
+        if read_lock_info(self.path) == holder:
+            self.path.unlink(missing_ok=True)
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.heartbeat_interval):
+            info = self._info
+            if info is None:  # pragma: no cover - release clears the event first
+                return
+            current = read_lock_info(self.path)
+            if current is None or (current.pid, current.acquired_at) != (
+                info.pid,
+                info.acquired_at,
+            ):
+                self._report_lost(current)
+                return
+            refreshed = LockInfo(
+                owner=info.owner,
+                pid=info.pid,
+                host=info.host,
+                acquired_at=info.acquired_at,
+                heartbeat_at=time.time(),
+            )
+            temporary = self.path.with_name(self.path.name + f".{info.pid}")
+            try:
+                temporary.write_text(json.dumps(asdict(refreshed)), encoding="utf-8")
+                os.replace(temporary, self.path)
+            except OSError:  # pragma: no cover - a missed heartbeat is retried
+                continue
+            self._info = refreshed
+
+    def _report_lost(self, current: LockInfo | None) -> None:
+        self._lost = True
+        holder = f"taken over by {current.describe()}" if current else "removed"
+        _logger.warning(
+            "Deploy lock %s was %s; stopped refreshing its heartbeat", self.path, holder
+        )
@@ -1,42 +1,391 @@
-"""Stub PostgreSQL engine adapter retained for Sqitch parity messaging."""
+"""PostgreSQL engine adapter.
+
+Targets use the Sqitch URI forms ``db:pg://user:pass@host:port/dbname`` and
+``db:pg:dbname``; an empty payload (``db:pg:``) defers to libpq environment
+defaults such as ``PGHOST`` and ``PGDATABASE``. The registry lives in a schema
+(``sqitch`` by default) inside the workspace database.
+
+Connections are borrowed from a process-wide pool. Registry writes for one
+change are sent in a single psycopg pipeline using server-side prepared
+statements, so recording a change costs one network round-trip instead of one
+per row.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import re
+from collections.abc import Mapping, Sequence
 from typing import Any
 
-from .base import ConnectArguments, Engine, EngineTarget, register_engine
+from sqlitch.registry.migrations import LATEST_REGISTRY_VERSION, get_registry_migrations
+
+from .base import ConnectArguments, EngineError, EngineTarget, register_engine
+from .server import DeployedChangeRow, RegistryChangeRecord, ServerEngine
 
-__all__ = ["PostgresEngine", "POSTGRES_STUB_MESSAGE"]
+__all__ = [
+    "DEFAULT_REGISTRY_SCHEMA",
+    "PostgresEngine",
+    "postgres_conninfo",
+]
 
-POSTGRES_STUB_MESSAGE = (
-    "PostgreSQL engine support is not yet implemented. This placeholder matches Sqitch parity."
+DEFAULT_REGISTRY_SCHEMA = "sqitch"
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_$]*$")
+_TRANSACTION_LINE = re.compile(r"^\s*(BEGIN|COMMIT)\s*;\s*$", re.IGNORECASE | re.MULTILINE)
+# Dollar-quoted bodies (``$$ ... $$``, ``$fn$ ... $fn$``) hold PL/pgSQL whose
+# ``BEGIN``/``END`` keywords are block delimiters, not transaction control.
+_NON_CODE = re.compile(
+    r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\$(?P<tag>[A-Za-z_][A-Za-z0-9_]*|)\$.*?\$(?P=tag)\$",
+    re.DOTALL,
+)
+_TRANSACTION_STATEMENT = re.compile(
+    r"(?:\A|;)\s*(?:(?:BEGIN|START\s+TRANSACTION)\b[^;]*|(?:COMMIT|END|ABORT|ROLLBACK)"
+    r"(?:\s+(?:WORK|TRANSACTION))?(?:\s+AND\s+(?:NO\s+)?CHAIN)?)\s*(?:;|\Z)",
+    re.IGNORECASE,
 )
 
 
-class PostgresEngine(Engine):
-    """Stub engine that advertises PostgreSQL support but raises for all operations."""
+def postgres_conninfo(uri: str) -> str:
+    """Translate a Sqitch ``db:pg:`` target URI into a libpq connection string."""
+
+    payload = uri[3:] if uri.startswith("db:") else uri
+    _, separator, remainder = payload.partition(":")
+    if not separator:
+        raise EngineError(f"Malformed PostgreSQL target URI: {uri}")
+    if remainder.startswith("//"):
+        return f"postgresql:{remainder}"
+    if not remainder:
+        return ""
+
+    from psycopg.conninfo import make_conninfo
+
+    return make_conninfo(dbname=remainder)
+
+
+class PostgresEngine(ServerEngine):
+    """Engine adapter for PostgreSQL targets using :mod:`psycopg`.
+
+    Args:
+        target: Workspace and registry target description. A registry value
+            that is not a ``db:`` URI names the registry schema.
+        connect_kwargs: Extra keyword arguments passed to ``psycopg.connect``.
+        registry_schema: Explicit registry schema, overriding the target.
+    """
+
+    paramstyle = "format"
+    non_code_pattern = _NON_CODE
+    transaction_statement_pattern = _TRANSACTION_STATEMENT
 
     def __init__(
         self,
         target: EngineTarget,
         *,
         connect_kwargs: Mapping[str, Any] | None = None,
+        registry_schema: str | None = None,
     ) -> None:
         super().__init__(target)
         self._connect_kwargs = dict(connect_kwargs or {})
+        schema = registry_schema or _schema_from_target(target)
+        if not _IDENTIFIER_PATTERN.match(schema):
+            raise EngineError(f"Invalid PostgreSQL registry schema name: {schema!r}")
+        self.registry_schema = schema
+
+    @property
+    def conninfo(self) -> str:
+        return postgres_conninfo(self.target.uri)
+
+    def build_workspace_connect_arguments(self) -> ConnectArguments:
+        return ConnectArguments(
+            args=(self.conninfo,),
+            kwargs={"autocommit": True, **self._connect_kwargs},
+        )
+
+    def build_registry_connect_arguments(self) -> ConnectArguments:
+        registry_uri = self.target.registry_uri or self.target.uri
+        conninfo = postgres_conninfo(
+            registry_uri if registry_uri.startswith("db:") else self.target.uri
+        )
+        return ConnectArguments(
+            args=(conninfo,),
+            kwargs={
+                "autocommit": True,
+                "options": f"-c search_path={self.registry_schema}",
+                **self._connect_kwargs,
+            },
+        )
+
+    def open_connection(self) -> Any:
+        import psycopg
+
+        try:
+            return self.connect_workspace()
+        except psycopg.Error as exc:
+            raise EngineError(f"Unable to connect to {self.target.uri}: {exc}") from exc
+
+    def connection_is_usable(self, connection: Any) -> bool:
+        from psycopg.pq import TransactionStatus
+
+        return (
+            not connection.closed and connection.info.transaction_status == TransactionStatus.IDLE
+        )
+
+    def registry_exists(self, connection: Any) -> bool:
+        import psycopg
+
+        try:
+            row = connection.execute(
+                "SELECT count(*) FROM information_schema.tables "
+                "WHERE table_schema = %s AND table_name IN ('changes', 'projects', 'events')",
+                (self.registry_schema,),
+            ).fetchone()
+        except psycopg.Error as exc:
+            raise EngineError(f"Failed to inspect registry schema: {exc}") from exc
+        return bool(row and row[0] == 3)
+
+    def initialise_registry(
+        self, connection: Any, *, installer_name: str, installer_email: str
+    ) -> None:
+        import psycopg
+
+        baseline = next(
+            (migration for migration in get_registry_migrations("pg") if migration.is_baseline),
+            None,
+        )
+        if baseline is None:  # pragma: no cover - defensive guard
+            raise EngineError("PostgreSQL registry baseline migration is unavailable.")
+
+        schema = self._schema
+        script = _TRANSACTION_LINE.sub("", baseline.sql)
+        script = script.replace(':"registry"', schema).replace(":tableopts", "")
+        try:
+            with connection.transaction():
+                connection.execute(script)
+                connection.execute(
+                    f"INSERT INTO {schema}.releases (version, installer_name, installer_email) "
+                    "VALUES (%s, %s, %s) ON CONFLICT (version) DO NOTHING",  # nosec B608
+                    (float(LATEST_REGISTRY_VERSION), installer_name, installer_email),
+                )
+        except psycopg.Error as exc:
+            raise EngineError(f"Failed to initialise registry: {exc}") from exc
+
+    def ensure_project(
+        self,
+        connection: Any,
+        *,
+        project: str,
+        uri: str | None,
+        creator_name: str,
+        creator_email: str,
+    ) -> None:
+        import psycopg
+
+        try:
+            connection.execute(
+                f"INSERT INTO {self._schema}.projects "
+                "(project, uri, creator_name, creator_email) VALUES (%s, %s, %s, %s) "
+                "ON CONFLICT (project) DO NOTHING",  # nosec B608
+                (project, uri, creator_name, creator_email),
+            )
+        except psycopg.Error as exc:
+            raise EngineError(f"Failed to register project '{project}': {exc}") from exc
+
+    def load_deployed_changes(self, connection: Any, project: str) -> Sequence[DeployedChangeRow]:
+        import psycopg
+
+        try:
+            rows = connection.execute(
+                f'SELECT "change", change_id, script_hash FROM {self._schema}.changes '
+                "WHERE project = %s ORDER BY committed_at ASC, change_id ASC",  # nosec B608
+                (project,),
+                prepare=True,
+            ).fetchall()
+        except psycopg.Error as exc:
+            raise EngineError(f"Failed to read registry: {exc}") from exc
+        return [
+            DeployedChangeRow(change=str(name), change_id=str(change_id), script_hash=script_hash)
+            for name, change_id, script_hash in rows
+        ]
+
+    def deploy_change(
+        self,
+        connection: Any,
+        script_sql: str,
+        record: RegistryChangeRecord,
+        *,
+        manages_transactions: bool,
+    ) -> None:
+        import psycopg
+
+        try:
+            if manages_transactions:
+                connection.execute(script_sql)
+                with connection.transaction():
+                    self._write_deploy(connection, record)
+            else:
+                with connection.transaction():
+                    connection.execute(script_sql)
+                    self._write_deploy(connection, record)
+        except psycopg.Error as exc:
+            raise EngineError(f"Deploy failed for change '{record.change}': {exc}") from exc
+
+    def revert_change(
+        self,
+        connection: Any,
+        script_sql: str,
+        record: RegistryChangeRecord,
+        *,
+        manages_transactions: bool,
+    ) -> None:
+        import psycopg
+
+        try:
+            if manages_transactions:
+                connection.execute(script_sql)
+                with connection.transaction():
+                    self._write_revert(connection, record)
+            else:
+                with connection.transaction():
+                    connection.execute(script_sql)
+                    self._write_revert(connection, record)
+        except psycopg.Error as exc:
+            raise EngineError(f"Revert failed for change '{record.change}': {exc}") from exc
+
+    def record_failure(self, connection: Any, record: RegistryChangeRecord) -> None:
+        import psycopg
+
+        try:
+            with connection.transaction(), connection.cursor() as cursor:
+                self._insert_event(cursor, "deploy_fail", record)
+        except psycopg.Error as exc:
+            raise EngineError(
+                f"Failed to record failure event for change '{record.change}': {exc}"
+            ) from exc
+
+    def verify_change(self, connection: Any, script_sql: str) -> None:
+        import psycopg
+
+        try:
+            with connection.transaction(force_rollback=True):
+                connection.execute(script_sql)
+        except psycopg.Error as exc:
+            raise EngineError(str(exc)) from exc
+
+    @property
+    def _schema(self) -> str:
+        return f'"{self.registry_schema}"'
+
+    def _write_deploy(self, connection: Any, record: RegistryChangeRecord) -> None:
+        schema = self._schema
+        with connection.pipeline(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {schema}.changes (
+                    change_id, script_hash, "change", project, note, committed_at,
+                    committer_name, committer_email, planned_at, planner_name, planner_email
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,  # nosec B608
+                (
+                    record.change_id,
+                    record.script_hash,
+                    record.change,
+                    record.project,
+                    record.note,
+                    record.committed_at,
+                    record.committer_name,
+                    record.committer_email,
+                    record.planned_at,
+                    record.planner_name,
+                    record.planner_email,
+                ),
+                prepare=True,
+            )
+            dependency_rows: list[tuple[str, str, str, str | None]] = [
+                (record.change_id, "require", dependency, record.dependency_ids[dependency])
+                for dependency in record.requires
+            ]
+            dependency_rows.extend(
+                (record.change_id, "conflict", dependency, None) for dependency in record.conflicts
+            )
+            if dependency_rows:
+                cursor.executemany(
+                    f"INSERT INTO {schema}.dependencies "
+                    "(change_id, type, dependency, dependency_id) "
+                    "VALUES (%s, %s, %s, %s)",  # nosec B608
+                    dependency_rows,
+                )
+            if record.tags:
+                cursor.executemany(
+                    f"""
+                    INSERT INTO {schema}.tags (
+                        tag_id, tag, project, change_id, note, committed_at,
+                        committer_name, committer_email, planned_at, planner_name, planner_email
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """,  # nosec B608
+                    [
+                        (
+                            tag.tag_id,
+                            tag.tag,
+                            record.project,
+                            record.change_id,
+                            record.note,
+                            record.committed_at,
+                            record.committer_name,
+                            record.committer_email,
+                            record.planned_at,
+                            record.planner_name,
+                            record.planner_email,
+                        )
+                        for tag in record.tags
+                    ],
+                )
+            self._insert_event(cursor, "deploy", record)
 
-    def build_registry_connect_arguments(self) -> ConnectArguments:  # pragma: no cover - stub
-        raise NotImplementedError(POSTGRES_STUB_MESSAGE)
+    def _write_revert(self, connection: Any, record: RegistryChangeRecord) -> None:
+        schema = self._schema
+        with connection.pipeline(), connection.cursor() as cursor:
+            for statement in (
+                f"DELETE FROM {schema}.tags WHERE change_id = %s",  # nosec B608
+                f"DELETE FROM {schema}.dependencies WHERE change_id = %s",  # nosec B608
+                f"DELETE FROM {schema}.dependencies WHERE dependency_id = %s",  # nosec B608
+                f"DELETE FROM {schema}.changes WHERE change_id = %s",  # nosec B608
+            ):
+                cursor.execute(statement, (record.change_id,), prepare=True)
+            self._insert_event(cursor, "revert", record)
 
-    def build_workspace_connect_arguments(self) -> ConnectArguments:  # pragma: no cover - stub
-        raise NotImplementedError(POSTGRES_STUB_MESSAGE)
+    def _insert_event(self, cursor: Any, event: str, record: RegistryChangeRecord) -> None:
+        cursor.execute(
+            f"""
+            INSERT INTO {self._schema}.events (
+                event, change_id, "change", project, note, requires, conflicts, tags,
+                committed_at, committer_name, committer_email,
+                planned_at, planner_name, planner_email
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """,  # nosec B608
+            (
+                event,
+                record.change_id,
+                record.change,
+                record.project,
+                record.note,
+                list(record.requires),
+                list(record.conflicts),
+                [tag.tag for tag in record.tags],
+                record.committed_at,
+                record.committer_name,
+                record.committer_email,
+                record.planned_at,
+                record.planner_name,
+                record.planner_email,
+            ),
+            prepare=True,
+        )
 
-    def connect_registry(self) -> Any:  # pragma: no cover - stub
-        raise NotImplementedError(POSTGRES_STUB_MESSAGE)
 
-    def connect_workspace(self) -> Any:  # pragma: no cover - stub
-        raise NotImplementedError(POSTGRES_STUB_MESSAGE)
+def _schema_from_target(target: EngineTarget) -> str:
+    registry = target.registry_uri
+    if registry and registry != target.uri and not registry.startswith("db:"):
+        return registry
+    return DEFAULT_REGISTRY_SCHEMA
 
 
 register_engine("pg", PostgresEngine, replace=True)
@@ -0,0 +1,216 @@
+"""Content-addressed cache of preprocessed SQLite scripts.
+
+Deploy and revert lex every script before executing it: the body is split into
+statements, each statement is tokenized to find its leading keyword, and the
+result is validated. :class:`ScriptCache` memoises that work by the script's
+SHA-1 so identical content (the same change deployed to many databases, or a
+CI job re-running a plan) is only lexed once.
+
+Recently used entries are kept in memory for the lifetime of the process. A
+persistent directory may be supplied explicitly or through the
+``SQLITCH_SCRIPT_CACHE`` environment variable; entries are stored there as small
+JSON documents.
+
+Persistent entries hold the statement boundaries and leading keywords. On load
+every boundary is checked against the script content so the statements are
+exactly what :func:`~sqlitch.engine.sqlite.extract_sqlite_statements` would
+return, each keyword is checked against the start of its statement, and the
+transaction control and validation result are recomputed from both. An entry
+written by someone else therefore cannot change the SQL that runs or how it is
+run; at worst it is ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+
+from .sqlite import PreparedSQLiteScript, compute_script_hash, prepare_sqlite_script
+
+__all__ = ["SCRIPT_CACHE_ENV", "ScriptCache", "clear_memory_cache"]
+
+SCRIPT_CACHE_ENV = "SQLITCH_SCRIPT_CACHE"
+"""Environment variable naming the persistent script cache directory."""
+
+_FORMAT_VERSION = 3
+
+_MEMORY_CACHE_SIZE = 512
+"""Most prepared scripts kept in memory; long-lived processes evict the oldest."""
+
+_MEMORY_CACHE: OrderedDict[str, PreparedSQLiteScript] = OrderedDict()
+_MEMORY_LOCK = threading.Lock()
+
+
+def clear_memory_cache() -> None:
+    """Drop all in-process cache entries (intended for tests)."""
+
+    with _MEMORY_LOCK:
+        _MEMORY_CACHE.clear()
+
+
+class ScriptCache:
+    """Look up or compute :class:`PreparedSQLiteScript` entries by content hash.
+
+    Args:
+        directory: Optional directory for persistent entries. When omitted only
+            the in-process cache is used.
+    """
+
+    __slots__ = ("directory",)
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = directory
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> ScriptCache:
+        """Build a cache honouring the ``SQLITCH_SCRIPT_CACHE`` directory setting."""
+
+        configured = env.get(SCRIPT_CACHE_ENV)
+        return cls(Path(configured).expanduser() if configured else None)
+
+    def prepare(self, script_sql: str) -> PreparedSQLiteScript:
+        """Return the preprocessed form of ``script_sql``, computing it at most once."""
+
+        script_hash = compute_script_hash(script_sql)
+        with _MEMORY_LOCK:
+            prepared = _MEMORY_CACHE.get(script_hash)
+            if prepared is not None:
+                _MEMORY_CACHE.move_to_end(script_hash)
+                return prepared
+
+        entry = self._load(script_sql, script_hash)
+        if entry is None:
+            prepared = prepare_sqlite_script(script_sql)
+            self._store(script_sql, prepared)
+        else:
+            statements, keywords = entry
+            prepared = prepare_sqlite_script(
+                script_sql, statements=statements, leading_keywords=keywords
+            )
+
+        with _MEMORY_LOCK:
+            _MEMORY_CACHE[script_hash] = prepared
+            if len(_MEMORY_CACHE) > _MEMORY_CACHE_SIZE:
+                _MEMORY_CACHE.popitem(last=False)
+        return prepared
+
+    def _entry_path(self, script_hash: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / f"v{_FORMAT_VERSION}" / script_hash[:2] / f"{script_hash}.json"
+
+    def _load(
+        self, script_sql: str, script_hash: str
+    ) -> tuple[tuple[str, ...], tuple[str, ...] | None] | None:
+        path = self._entry_path(script_hash)
+        if path is None:
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return _decode_entry(payload, script_hash, script_sql)
+
+    def _store(self, script_sql: str, prepared: PreparedSQLiteScript) -> None:
+        path = self._entry_path(prepared.script_hash)
+        if path is None:
+            return
+        spans: list[list[int]] = []
+        position = 0
+        for statement in prepared.statements:
+            start = script_sql.index(statement, position)
+            position = start + len(statement)
+            spans.append([start, position])
+        payload = {
+            "version": _FORMAT_VERSION,
+            "script_hash": prepared.script_hash,
+            "spans": spans,
+            "leading_keywords": list(prepared.leading_keywords),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle)
+                os.replace(temp_name, path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # The cache is an optimisation; an unwritable directory must not fail a deploy.
+            return
+
+
+def _decode_entry(
+    payload: object, script_hash: str, script_sql: str
+) -> tuple[tuple[str, ...], tuple[str, ...] | None] | None:
+    """Return the statements an entry's spans cut from ``script_sql`` and its keywords.
+
+    The spans must tile the content the way
+    :func:`~sqlitch.engine.sqlite.extract_sqlite_statements` does: only
+    whitespace between statements, every statement but a trailing remainder
+    ending at a complete ``;``, and no earlier ``;`` in a statement completing
+    it. Only statements containing several semicolons need more than one
+    completeness check.
+    """
+
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != _FORMAT_VERSION or payload.get("script_hash") != script_hash:
+        return None
+    spans = payload.get("spans")
+    if not isinstance(spans, list):
+        return None
+
+    if not all(
+        isinstance(span, list) and len(span) == 2 and type(span[0]) is int and type(span[1]) is int
+        for span in spans
+    ):
+        return None
+
+    statements: list[str] = []
+    position = 0
+    last = len(spans) - 1
+    for index, (start, end) in enumerate(spans):
+        if not position <= start < end <= len(script_sql):
+            return None
+        statement = script_sql[start:end]
+        if (start > position and not script_sql[position:start].isspace()) or (
+            statement[0].isspace() or statement[-1].isspace()
+        ):
+            return None
+        if statement[-1] == ";":
+            if not sqlite3.complete_statement(statement):
+                if index != last:
+                    return None
+        elif index != last:
+            return None
+        if statement.count(";") > 1 and _completes_early(statement):
+            return None
+        statements.append(statement)
+        position = end
+
+    if position < len(script_sql) and not script_sql[position:].isspace():
+        return None
+    keywords = payload.get("leading_keywords")
+    if not (isinstance(keywords, list) and all(isinstance(item, str) for item in keywords)):
+        return tuple(statements), None
+    return tuple(statements), tuple(keywords)
+
+
+def _completes_early(statement: str) -> bool:
+    """Return whether a ``;`` before the end of ``statement`` already completes it."""
+
+    semicolon = statement.find(";")
+    while -1 < semicolon < len(statement) - 1:
+        if sqlite3.complete_statement(statement[: semicolon + 1]):
+            return True
+        semicolon = statement.find(";", semicolon + 1)
+    return False
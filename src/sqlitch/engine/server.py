@@ -0,0 +1,312 @@
+"""Shared support for engines whose registry lives on a database server.
+
+SQLite targets are files that are opened, used, and closed by each command.
+PostgreSQL and MySQL targets are reached over the network, so connection setup
+and per-statement round-trips dominate the cost of registry bookkeeping. This
+module provides the pieces those engines share:
+
+* :class:`ConnectionPool` keeps idle driver connections for reuse by later
+  commands in the same process (for example the revert and deploy halves of a
+  rebase).
+* :class:`RegistryChangeRecord` carries everything needed to write the registry
+  rows for one change event so engines can batch those writes.
+* :class:`ServerEngine` defines the registry and script execution operations
+  the deploy, revert, and verify commands rely on.
+"""
+
+from __future__ import annotations
+
+import atexit
+import re
+import threading
+from abc import abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, ClassVar
+
+from .base import Engine
+
+__all__ = [
+    "ConnectionPool",
+    "DeployedChangeRow",
+    "RegistryChangeRecord",
+    "RegistryTagRecord",
+    "ServerEngine",
+    "close_connection_pools",
+    "connection_pool",
+]
+
+_SQL_NON_CODE = re.compile(r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'", re.DOTALL)
+_TRANSACTION_STATEMENT = re.compile(
+    r"(?:\A|;)\s*(?:BEGIN(?:\s+(?:WORK|TRANSACTION))?|START\s+TRANSACTION\b[^;]*"
+    r"|COMMIT\b[^;]*|ROLLBACK(?:\s+(?:WORK|TRANSACTION))?)\s*(?:;|\Z)",
+    re.IGNORECASE,
+)
+
+
+class ConnectionPool:
+    """Thread-safe pool of idle driver connections for one connection string.
+
+    Connections are created on demand through ``connect`` and returned to the
+    pool when a :meth:`connection` block exits. At most ``max_idle``
+    connections are retained; surplus and unusable connections are closed.
+
+    Args:
+        connect: Zero-argument callable opening a new driver connection.
+        is_usable: Predicate deciding whether a returned connection may be reused.
+        max_idle: Maximum number of idle connections kept for reuse.
+    """
+
+    __slots__ = ("_connect", "_is_usable", "_max_idle", "_idle", "_lock", "opened")
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        is_usable: Callable[[Any], bool],
+        max_idle: int = 4,
+    ) -> None:
+        self._connect = connect
+        self._is_usable = is_usable
+        self._max_idle = max_idle
+        self._idle: list[Any] = []
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def acquire(self) -> Any:
+        """Return an idle connection, opening a new one when none is available."""
+
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if self._is_usable(candidate):
+                    return candidate
+                _close_quietly(candidate)
+            self.opened += 1
+        return self._connect()
+
+    def release(self, connection: Any) -> None:
+        """Return ``connection`` to the pool, closing it if it cannot be reused."""
+
+        with self._lock:
+            if self._is_usable(connection) and len(self._idle) < self._max_idle:
+                self._idle.append(connection)
+                return
+        _close_quietly(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the duration of the ``with`` block."""
+
+        connection = self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            _close_quietly(connection)
+            raise
+        else:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            _close_quietly(connection)
+
+
+_POOLS: dict[tuple[str, str], ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def connection_pool(
+    engine: str,
+    conninfo: str,
+    factory: Callable[[], ConnectionPool],
+) -> ConnectionPool:
+    """Return the process-wide pool for ``(engine, conninfo)``, creating it once."""
+
+    key = (engine, conninfo)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = factory()
+            _POOLS[key] = pool
+        return pool
+
+
+def close_connection_pools() -> None:
+    """Close and forget every process-wide connection pool."""
+
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_connection_pools)
+
+
+def _close_quietly(connection: Any) -> None:
+    try:
+        connection.close()
+    except Exception:  # pylint: disable=broad-exception-caught # nosec B110
+        # Closing a broken connection must never mask the original outcome.
+        pass
+
+
+@dataclass(frozen=True, slots=True)
+class RegistryTagRecord:
+    """Registry row for a tag applied alongside a change."""
+
+    tag_id: str
+    tag: str
+
+
+@dataclass(frozen=True, slots=True)
+class RegistryChangeRecord:
+    """Registry rows describing one deploy, revert, or failure event for a change.
+
+    Attributes:
+        dependency_ids: Maps each entry of ``requires`` to the change ID it
+            resolved to when the change was deployed.
+    """
+
+    project: str
+    change_id: str
+    change: str
+    script_hash: str | None
+    note: str
+    committed_at: datetime
+    committer_name: str
+    committer_email: str
+    planned_at: datetime
+    planner_name: str
+    planner_email: str
+    requires: tuple[str, ...] = ()
+    conflicts: tuple[str, ...] = ()
+    tags: tuple[RegistryTagRecord, ...] = ()
+    dependency_ids: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class DeployedChangeRow:
+    """A change currently recorded as deployed, in deployment order."""
+
+    change: str
+    change_id: str
+    script_hash: str | None
+
+
+class ServerEngine(Engine):
+    """Engine whose registry and workspace live on a database server.
+
+    Registry and script operations take a connection obtained from
+    :meth:`session` so that one command performs all of its work over a single
+    pooled connection. Driver exceptions are reported as :class:`EngineError`.
+    """
+
+    pool_max_idle = 4
+    #: Comments, literals, and bodies whose contents are not top-level statements.
+    non_code_pattern: ClassVar[re.Pattern[str]] = _SQL_NON_CODE
+    #: Top-level statements that open or close a transaction.
+    transaction_statement_pattern: ClassVar[re.Pattern[str]] = _TRANSACTION_STATEMENT
+
+    @property
+    @abstractmethod
+    def conninfo(self) -> str:
+        """Return the driver connection string for the workspace database."""
+
+    @abstractmethod
+    def open_connection(self) -> Any:
+        """Open a new workspace connection configured for registry bookkeeping."""
+
+    @abstractmethod
+    def connection_is_usable(self, connection: Any) -> bool:
+        """Return ``True`` when ``connection`` is open and idle."""
+
+    def session(self) -> Any:
+        """Return a context manager borrowing a pooled workspace connection."""
+
+        pool = connection_pool(
+            self.target.engine,
+            self.conninfo,
+            lambda: ConnectionPool(
+                self.open_connection,
+                is_usable=self.connection_is_usable,
+                max_idle=self.pool_max_idle,
+            ),
+        )
+        return pool.connection()
+
+    @abstractmethod
+    def registry_exists(self, connection: Any) -> bool:
+        """Return ``True`` when the registry tables are present."""
+
+    @abstractmethod
+    def initialise_registry(
+        self, connection: Any, *, installer_name: str, installer_email: str
+    ) -> None:
+        """Create the registry tables and record the installed registry release."""
+
+    @abstractmethod
+    def ensure_project(
+        self,
+        connection: Any,
+        *,
+        project: str,
+        uri: str | None,
+        creator_name: str,
+        creator_email: str,
+    ) -> None:
+        """Register ``project`` unless it is already known to the registry."""
+
+    @abstractmethod
+    def load_deployed_changes(self, connection: Any, project: str) -> Sequence[DeployedChangeRow]:
+        """Return the deployed changes of ``project`` in deployment order."""
+
+    def script_manages_transactions(self, script_sql: str) -> bool:
+        """Return ``True`` when ``script_sql`` issues its own transaction control.
+
+        Scripts are not parsed; comments, string literals, and any engine
+        specific bodies matched by :attr:`non_code_pattern` are blanked before
+        looking for top-level transaction statements, leaving everything else
+        for the server to interpret.
+        """
+
+        code = self.non_code_pattern.sub(" ", script_sql)
+        return self.transaction_statement_pattern.search(code) is not None
+
+    @abstractmethod
+    def deploy_change(
+        self,
+        connection: Any,
+        script_sql: str,
+        record: RegistryChangeRecord,
+        *,
+        manages_transactions: bool,
+    ) -> None:
+        """Run a deploy script and record the change, atomically where possible."""
+
+    @abstractmethod
+    def revert_change(
+        self,
+        connection: Any,
+        script_sql: str,
+        record: RegistryChangeRecord,
+        *,
+        manages_transactions: bool,
+    ) -> None:
+        """Run a revert script and remove the change from the registry."""
+
+    @abstractmethod
+    def record_failure(self, connection: Any, record: RegistryChangeRecord) -> None:
+        """Record a ``deploy_fail`` event for a change whose script failed."""
+
+    @abstractmethod
+    def verify_change(self, connection: Any, script_sql: str) -> None:
+        """Run a verify script without persisting any of its effects."""
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import sqlite3
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import SplitResult, unquote, urlsplit, urlunsplit
@@ -28,13 +30,25 @@ class SQLiteEngineError(EngineError):
 
 
 class SQLiteEngine(Engine):
-    """Engine adapter for sqlite3 targets."""
+    """Engine adapter for sqlite3 targets.
+
+    Args:
+        target: Workspace and registry target description.
+        connect_kwargs: Extra keyword arguments passed to ``sqlite3.connect``.
+        busy_timeout: Milliseconds a connection waits on a locked database
+            before failing, applied with ``PRAGMA busy_timeout``.
+    """
 
     def __init__(
-        self, target: EngineTarget, *, connect_kwargs: Mapping[str, Any] | None = None
+        self,
+        target: EngineTarget,
+        *,
+        connect_kwargs: Mapping[str, Any] | None = None,
+        busy_timeout: int | None = None,
     ) -> None:
         super().__init__(target)
         self._connect_kwargs = dict(connect_kwargs or {})
+        self.busy_timeout = busy_timeout
         self._workspace_path, self._workspace_is_uri = _parse_sqlite_uri(target.uri)
         registry_uri = target.registry_uri or target.uri
         self._registry_path, self._registry_is_uri = _parse_sqlite_uri(registry_uri)
@@ -48,8 +62,14 @@ class SQLiteEngine(Engine):
         """Return connection arguments pointing to the workspace database."""
         return self._build_connect_arguments(self.target.uri)
 
+    def connect_registry(self) -> sqlite3.Connection:
+        connection = cast(sqlite3.Connection, super().connect_registry())
+        self._apply_busy_timeout(connection)
+        return connection
+
     def connect_workspace(self) -> sqlite3.Connection:
         connection = cast(sqlite3.Connection, super().connect_workspace())
+        self._apply_busy_timeout(connection)
         self._attach_registry(connection)
         # Enable foreign keys for proper cascading deletes (sqitch parity)
         connection.execute("PRAGMA foreign_keys = ON")
@@ -73,6 +93,10 @@ class SQLiteEngine(Engine):
         kwargs["uri"] = is_uri
         return ConnectArguments(args=(database,), kwargs=kwargs)
 
+    def _apply_busy_timeout(self, connection: sqlite3.Connection) -> None:
+        if self.busy_timeout is not None:
+            connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+
     def _attach_registry(self, connection: sqlite3.Connection) -> None:
         registry_argument = self._registry_path
         # When the registry path is a filesystem location, normalise to POSIX.
@@ -224,14 +248,19 @@ __all__ = [
     "SQLiteEngineError",
     "REGISTRY_ATTACHMENT_ALIAS",
     "REGISTRY_FILENAME",
+    "PreparedSQLiteScript",
+    "compute_script_hash",
     "derive_sqlite_registry_uri",
     "extract_sqlite_statements",
+    "prepare_sqlite_script",
     "script_manages_transactions",
     "validate_sqlite_script",
     "resolve_sqlite_filesystem_path",
 ]
 
 
+_KEYWORD_BOUNDARIES = frozenset(" \t\r\n,();")
+
 _TRANSACTION_KEYWORDS: tuple[str, ...] = (
     "BEGIN",
     "END",
@@ -250,27 +279,93 @@ def extract_sqlite_statements(script_sql: str) -> tuple[str, ...]:
     whitespace-only chunks are discarded.
     """
     statements: list[str] = []
-    buffer: list[str] = []
-
-    def flush_buffer() -> None:
-        nonlocal buffer
-        statement = "".join(buffer).strip()
-        if statement:
-            statements.append(statement)
-        buffer = []
-
-    for char in script_sql:
-        buffer.append(char)
-        if sqlite3.complete_statement("".join(buffer)):
-            flush_buffer()
-
-    remainder = "".join(buffer).strip()
+    start = 0
+    # A chunk can only become complete as its terminating semicolon is added.
+    end = script_sql.find(";")
+    while end != -1:
+        if sqlite3.complete_statement(script_sql[start : end + 1]):
+            statement = script_sql[start : end + 1].strip()
+            if statement:
+                statements.append(statement)
+            start = end + 1
+        end = script_sql.find(";", end + 1)
+
+    remainder = script_sql[start:].strip()
     if remainder:
         statements.append(remainder)
 
     return tuple(statements)
 
 
+@dataclass(frozen=True, slots=True)
+class PreparedSQLiteScript:
+    """Lexed form of a SQLite script, reusable wherever identical content is executed.
+
+    Attributes:
+        script_hash: SHA-1 hex digest of the script body (the registry ``script_hash``).
+        statements: Statements as returned by :func:`extract_sqlite_statements`.
+        leading_keywords: Upper-cased leading keyword of each statement.
+        manages_transactions: Whether the script contains explicit transaction control.
+        validation_error: Message raised by :func:`validate_sqlite_script`, if any.
+    """
+
+    script_hash: str
+    statements: tuple[str, ...]
+    leading_keywords: tuple[str, ...]
+    manages_transactions: bool
+    validation_error: str | None = None
+
+    def validate(self) -> None:
+        """Raise :class:`SQLiteEngineError` when the script failed validation."""
+
+        if self.validation_error is not None:
+            raise SQLiteEngineError(self.validation_error)
+
+
+def compute_script_hash(script_sql: str) -> str:
+    """Return the SHA-1 hex digest Sqitch records for ``script_sql``."""
+
+    return hashlib.sha1(script_sql.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def prepare_sqlite_script(
+    script_sql: str,
+    *,
+    statements: tuple[str, ...] | None = None,
+    leading_keywords: Sequence[str] | None = None,
+) -> PreparedSQLiteScript:
+    """Split, tokenize and validate ``script_sql`` in a single pass.
+
+    ``statements`` may supply the result of :func:`extract_sqlite_statements`
+    for ``script_sql`` when it is already known, and ``leading_keywords`` the
+    keywords previously found for them. A supplied keyword is only kept when
+    its statement visibly starts with it; otherwise the statement is tokenized.
+    """
+
+    if statements is None:
+        statements = extract_sqlite_statements(script_sql)
+    if leading_keywords is None or len(leading_keywords) != len(statements):
+        leading_keywords = ("",) * len(statements)
+    keywords = tuple(
+        hint if _starts_with_keyword(statement, hint) else _leading_keyword(statement)
+        for statement, hint in zip(statements, leading_keywords)
+    )
+    try:
+        _validate_statements(statements, keywords)
+    except SQLiteEngineError as exc:
+        validation_error: str | None = str(exc)
+    else:
+        validation_error = None
+
+    return PreparedSQLiteScript(
+        script_hash=compute_script_hash(script_sql),
+        statements=statements,
+        leading_keywords=keywords,
+        manages_transactions=any(keyword in _TRANSACTION_KEYWORDS for keyword in keywords),
+        validation_error=validation_error,
+    )
+
+
 def script_manages_transactions(script_sql: str) -> bool:
     """Return ``True`` when ``script_sql`` contains explicit transaction control."""
 
@@ -285,11 +380,13 @@ def validate_sqlite_script(script_sql: str) -> None:
     """Validate ``script_sql`` for disallowed pragmas and unbalanced transactions."""
 
     statements = extract_sqlite_statements(script_sql)
-    transaction_depth = 0
+    _validate_statements(statements, tuple(_leading_keyword(statement) for statement in statements))
 
-    for statement in statements:
-        keyword = _leading_keyword(statement)
 
+def _validate_statements(statements: Sequence[str], keywords: Sequence[str]) -> None:
+    transaction_depth = 0
+
+    for statement, keyword in zip(statements, keywords):
         if keyword == "PRAGMA":
             _validate_sqlite_pragma(statement)
 
@@ -325,12 +422,25 @@ def _validate_sqlite_pragma(statement: str) -> None:
         raise SQLiteEngineError("SQLite foreign_keys pragma must remain enabled during deploy.")
 
 
+def _starts_with_keyword(statement: str, keyword: str) -> bool:
+    """Return ``True`` when ``keyword`` is certainly the leading token of ``statement``."""
+
+    size = len(keyword)
+    return (
+        keyword.isalpha()
+        and statement[:size].upper() == keyword
+        and (len(statement) == size or statement[size] in _KEYWORD_BOUNDARIES)
+    )
+
+
 def _leading_keyword(statement: str) -> str:
-    tokens = _tokenize_statement(statement)
+    tokens = _tokenize_statement(statement, limit=1)
     return tokens[0] if tokens else ""
 
 
-def _tokenize_statement(statement: str) -> list[str]:
+def _tokenize_statement(statement: str, *, limit: int | None = None) -> list[str]:
+    """Split ``statement`` into upper-cased tokens, stopping after ``limit`` tokens."""
+
     normalized = _strip_leading_sql_comments(statement.strip())
     if not normalized:
         return []
@@ -361,6 +471,8 @@ def _tokenize_statement(statement: str) -> list[str]:
             if token:
                 pieces.append("".join(token).upper())
                 token.clear()
+                if len(pieces) == limit:
+                    return pieces
             continue
 
         token.append(char)
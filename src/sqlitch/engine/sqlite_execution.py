@@ -0,0 +1,201 @@
+"""Strategies for executing the statements of a SQLite deploy script.
+
+``statement``
+    Run each statement with its own ``cursor.execute`` call. This is the
+    default and the reference behaviour.
+
+``script``
+    Hand the whole script to :meth:`sqlite3.Cursor.executescript`, which
+    parses and runs it in C without a Python round-trip per statement.
+    ``executescript`` commits any open transaction before it starts, so the
+    transaction-control statements that would normally precede the script
+    (``BEGIN IMMEDIATE`` and the change savepoint) are passed as a
+    ``preamble`` and run as part of the same call. The transaction is still
+    open afterwards, so registry rows are written and committed with the
+    script exactly as for the other strategies.
+
+``batch``
+    Run statements one by one, but collapse runs of consecutive
+    parameterless ``INSERT INTO ... VALUES (...)`` statements with the same
+    table and column list into one prepared statement executed with
+    ``executemany``. Only literal values (numbers, strings, blobs and
+    ``NULL``) are rewritten as parameters; any other statement runs as is.
+    Parsing the literals in Python costs more than ``executemany`` saves, so
+    on ``scripts/benchmarks/deploy_strategies.py`` this strategy runs at about
+    half the speed of ``statement``. It is kept for comparison and is never
+    the default.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterator, Sequence
+from typing import TypeAlias
+
+from .sqlite import SQLiteEngineError
+
+__all__ = [
+    "DEFAULT_EXECUTION_STRATEGY",
+    "EXECUTION_STRATEGIES",
+    "execute_sqlite_statements",
+    "parse_literal_insert",
+]
+
+EXECUTION_STRATEGIES: tuple[str, ...] = ("statement", "script", "batch")
+DEFAULT_EXECUTION_STRATEGY = "statement"
+
+SQLValue: TypeAlias = str | int | float | bytes | None
+
+_LEADING_COMMENTS = re.compile(r"\A(?:\s+|--[^\n]*(?:\n|\Z)|/\*.*?\*/)*", re.DOTALL)
+_IDENTIFIER = r'(?:"(?:[^"]|"")+"|\[[^\]]+\]|`[^`]+`|[A-Za-z_][A-Za-z0-9_$]*)'
+_INSERT_HEADER = re.compile(
+    rf"INSERT\s+INTO\s+(?P<table>{_IDENTIFIER}(?:\s*\.\s*{_IDENTIFIER})?)\s*"
+    rf"(?P<columns>\(\s*{_IDENTIFIER}(?:\s*,\s*{_IDENTIFIER})*\s*\))?\s*VALUES\s*",
+    re.IGNORECASE,
+)
+_LITERAL = (
+    r"(?:'(?:[^']|'')*'"
+    r"|[xX]'(?:[0-9A-Fa-f]{2})*'"
+    r"|[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?"
+    r"|NULL)"
+)
+_ROW = rf"\(\s*{_LITERAL}(?:\s*,\s*{_LITERAL})*\s*\)"
+_VALUES_SHAPE = re.compile(rf"\s*{_ROW}(?:\s*,\s*{_ROW})*\s*;?\s*", re.IGNORECASE)
+_VALUE_TOKEN = re.compile(rf"{_LITERAL}|\)", re.IGNORECASE)
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def execute_sqlite_statements(
+    cursor: sqlite3.Cursor,
+    statements: Sequence[str],
+    *,
+    strategy: str = DEFAULT_EXECUTION_STRATEGY,
+    preamble: Sequence[str] = (),
+) -> None:
+    """Run ``preamble`` and then ``statements`` against ``cursor`` using ``strategy``.
+
+    Raises:
+        SQLiteEngineError: If ``strategy`` is not one of :data:`EXECUTION_STRATEGIES`.
+    """
+
+    if strategy == "statement":
+        for statement in (*preamble, *statements):
+            cursor.execute(statement)
+    elif strategy == "script":
+        # Terminate every statement explicitly; a trailing comment may hide its semicolon.
+        cursor.executescript("\n;\n".join((*preamble, *statements)) + "\n;")
+    elif strategy == "batch":
+        for statement in preamble:
+            cursor.execute(statement)
+        _execute_batched(cursor, statements)
+    else:
+        raise SQLiteEngineError(
+            f"Unknown SQLite execution strategy '{strategy}'; expected one of "
+            f"{', '.join(EXECUTION_STRATEGIES)}."
+        )
+
+
+def parse_literal_insert(statement: str) -> tuple[str, list[tuple[SQLValue, ...]]] | None:
+    """Split a literal-only ``INSERT`` into a parameterised statement and its rows.
+
+    Returns ``None`` when ``statement`` is not an ``INSERT INTO ... VALUES``
+    whose values are all literals of one arity.
+    """
+
+    body = _LEADING_COMMENTS.sub("", statement, count=1)
+    header = _INSERT_HEADER.match(body)
+    if header is None:
+        return None
+    values = body[header.end() :]
+    if _VALUES_SHAPE.fullmatch(values) is None:
+        return None
+
+    rows: list[tuple[SQLValue, ...]] = []
+    row: list[SQLValue] = []
+    try:
+        for token in _VALUE_TOKEN.findall(values):
+            if token == ")":  # nosec B105 - a row delimiter token, not a password
+                if rows and len(row) != len(rows[0]):
+                    return None
+                rows.append(tuple(row))
+                row = []
+            else:
+                row.append(_literal_value(token))
+    except ValueError:
+        return None
+
+    target = header.group("table")
+    if header.group("columns"):
+        target = f"{target} {header.group('columns')}"
+    # The table and columns are the script's own identifiers; only literals become parameters.
+    sql = f"INSERT INTO {target} VALUES ({', '.join('?' * len(rows[0]))})"  # nosec B608
+    return sql, rows
+
+
+def _literal_value(token: str) -> SQLValue:
+    """Return the Python value of a literal token, or raise :class:`ValueError`."""
+
+    lead = token[0]
+    if lead == "'":
+        return token[1:-1].replace("''", "'")
+    if lead in "xX":
+        return bytes.fromhex(token[2:-1])
+    if lead in "nN":
+        return None
+    try:
+        integer = int(token)
+    except ValueError:
+        return float(token)
+    if not _INT64_MIN <= integer <= _INT64_MAX:
+        # SQLite reads out-of-range integer literals as REAL; leave those to SQLite.
+        raise ValueError(token)
+    return integer
+
+
+def _execute_batched(cursor: sqlite3.Cursor, statements: Sequence[str]) -> None:
+    for statement, sql, rows in _group_inserts(statements):
+        if sql is None:
+            cursor.execute(statement)
+        else:
+            cursor.executemany(sql, rows)
+
+
+def _group_inserts(
+    statements: Sequence[str],
+) -> Iterator[tuple[str, str | None, list[tuple[SQLValue, ...]]]]:
+    """Yield ``(statement, None, [])`` for plain statements and ``(first, sql, rows)`` runs."""
+
+    pending_statement = ""
+    pending_sql: str | None = None
+    pending_rows: list[tuple[SQLValue, ...]] = []
+    pending_count = 0
+
+    def _drain() -> Iterator[tuple[str, str | None, list[tuple[SQLValue, ...]]]]:
+        if pending_sql is None:
+            return
+        if pending_count == 1:
+            # A lone INSERT gains nothing from executemany; run it verbatim.
+            yield pending_statement, None, []
+        else:
+            yield pending_statement, pending_sql, pending_rows
+
+    for statement in statements:
+        parsed = parse_literal_insert(statement)
+        if parsed is not None and parsed[0] == pending_sql:
+            pending_rows.extend(parsed[1])
+            pending_count += 1
+            continue
+        yield from _drain()
+        if parsed is None:
+            pending_statement, pending_sql, pending_rows, pending_count = "", None, [], 0
+            yield statement, None, []
+        else:
+            pending_statement, pending_sql, pending_rows, pending_count = (
+                statement,
+                parsed[0],
+                list(parsed[1]),
+                1,
+            )
+    yield from _drain()
@@ -0,0 +1,77 @@
+"""Minimal revert and deploy sets between a deployed history and a plan.
+
+Rebase and checkout move a database from the changes recorded in its registry
+to the changes of some plan. Both sequences are compared by change key,
+usually the change ID, optionally paired with the deploy script hash so that
+an edited script counts as divergent.
+
+A change ID hashes the ID of its parent change. Two histories therefore can
+only share a change when they also share every change before it, so their
+longest common subsequence is exactly their longest common prefix. Reverts
+also have to run newest first. Only the tail after that prefix needs to be
+reverted and redeployed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+
+__all__ = ["PlanDiff", "common_prefix_length", "diff_change_sequences"]
+
+
+@dataclass(frozen=True, slots=True)
+class PlanDiff:
+    """Changes to revert and deploy to move from one change sequence to another.
+
+    Attributes:
+        common: Number of leading changes shared by both sequences.
+        revert: Positions in the deployed sequence to revert, newest first.
+        deploy: Positions in the target sequence to deploy, in plan order.
+    """
+
+    common: int
+    revert: tuple[int, ...]
+    deploy: tuple[int, ...]
+
+    @property
+    def is_noop(self) -> bool:
+        """``True`` when the deployed sequence already matches the target."""
+
+        return not self.revert and not self.deploy
+
+
+def common_prefix_length(left: Sequence[Hashable], right: Sequence[Hashable]) -> int:
+    """Return the number of leading items ``left`` and ``right`` have in common."""
+
+    length = 0
+    for left_item, right_item in zip(left, right):
+        if left_item != right_item:
+            break
+        length += 1
+    return length
+
+
+def diff_change_sequences(
+    deployed: Sequence[Hashable],
+    target: Sequence[Hashable],
+    *,
+    keep: int | None = None,
+) -> PlanDiff:
+    """Compare deployed change keys with target change keys.
+
+    Args:
+        deployed: Keys of the deployed changes, in deployment order.
+        target: Keys of the target plan's changes, in plan order.
+        keep: Upper bound on the shared prefix. Use it to force a revert from
+            a given position even where the histories agree.
+    """
+
+    common = common_prefix_length(deployed, target)
+    if keep is not None:
+        common = min(common, max(keep, 0))
+    return PlanDiff(
+        common=common,
+        revert=tuple(range(len(deployed) - 1, common - 1, -1)),
+        deploy=tuple(range(common, len(target))),
+    )
@@ -0,0 +1,253 @@
+"""Dependency graph over plan changes.
+
+The graph is built once per :class:`~sqlitch.plan.model.Plan` and stores the
+dependency DAG as tuples of integer change indexes (positions within
+``Plan.changes``). Forward (``requires``) and reverse (``required_by``)
+adjacency are both materialised so that dependency and reverse-dependency
+queries are O(degree) instead of linear scans over the plan.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+from .model import Change, Plan, Tag
+
+__all__ = ["DependencyCycleError", "DependencyGraph", "build_dependency_graph"]
+
+
+class DependencyCycleError(ValueError):
+    """Raised when plan dependencies form a cycle."""
+
+    def __init__(self, cycle: Sequence[str]) -> None:
+        self.cycle = tuple(cycle)
+        rendered = " -> ".join((*self.cycle, self.cycle[0])) if self.cycle else ""
+        super().__init__(f"Dependency cycle detected: {rendered}")
+
+
+class DependencyGraph:
+    """Immutable dependency DAG keyed by change index.
+
+    Attributes:
+        changes: Plan changes in plan order; indexes refer to this tuple.
+        requires: For each change, the indexes of the changes it depends on.
+        required_by: For each change, the indexes of the changes depending on it.
+        unresolved: For each change, dependency strings not found in the plan.
+    """
+
+    __slots__ = (
+        "changes",
+        "requires",
+        "required_by",
+        "unresolved",
+        "_positions",
+        "_dependencies_memo",
+        "_dependents_memo",
+    )
+
+    def __init__(
+        self,
+        changes: Sequence[Change],
+        requires: Sequence[Sequence[int]],
+        unresolved: Sequence[Sequence[str]],
+    ) -> None:
+        self.changes: tuple[Change, ...] = tuple(changes)
+        self.requires: tuple[tuple[int, ...], ...] = tuple(tuple(edges) for edges in requires)
+        self.unresolved: tuple[tuple[str, ...], ...] = tuple(tuple(deps) for deps in unresolved)
+
+        reverse: list[list[int]] = [[] for _ in self.changes]
+        for index, edges in enumerate(self.requires):
+            for dependency in edges:
+                reverse[dependency].append(index)
+        self.required_by: tuple[tuple[int, ...], ...] = tuple(tuple(edges) for edges in reverse)
+
+        self._positions = {id(change): index for index, change in enumerate(self.changes)}
+        self._dependencies_memo: dict[int, frozenset[int]] = {}
+        self._dependents_memo: dict[int, frozenset[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def index_of(self, change: Change) -> int:
+        """Return the index of ``change``, which must be an entry of this graph's plan."""
+
+        try:
+            return self._positions[id(change)]
+        except KeyError:
+            raise KeyError(change.name) from None
+
+    @property
+    def missing_dependencies(self) -> tuple[str, ...]:
+        """Return unique dependency strings that no plan change satisfies, in plan order."""
+
+        seen: dict[str, None] = {}
+        for dependencies in self.unresolved:
+            for dependency in dependencies:
+                seen.setdefault(dependency, None)
+        return tuple(seen)
+
+    def dependencies_of(self, index: int) -> tuple[int, ...]:
+        """Return the indexes of changes directly required by ``index``."""
+
+        return self.requires[index]
+
+    def dependents_of(self, index: int) -> tuple[int, ...]:
+        """Return the indexes of changes that directly require ``index``."""
+
+        return self.required_by[index]
+
+    def transitive_dependencies(self, index: int) -> frozenset[int]:
+        """Return every change reachable through ``requires`` from ``index``."""
+
+        return _closure(index, self.requires, self._dependencies_memo)
+
+    def transitive_dependents(self, index: int) -> frozenset[int]:
+        """Return every change that requires ``index`` directly or indirectly."""
+
+        return _closure(index, self.required_by, self._dependents_memo)
+
+    def find_cycle(self) -> tuple[int, ...] | None:
+        """Return the indexes forming a dependency cycle, or ``None`` for a DAG."""
+
+        visiting, done = 1, 2
+        state = [0] * len(self.changes)
+        for root in range(len(self.changes)):
+            if state[root]:
+                continue
+            path: list[int] = [root]
+            cursors: list[int] = [0]
+            state[root] = visiting
+            while path:
+                node = path[-1]
+                edges = self.requires[node]
+                cursor = cursors[-1]
+                if cursor == len(edges):
+                    state[node] = done
+                    path.pop()
+                    cursors.pop()
+                    continue
+                cursors[-1] = cursor + 1
+                target = edges[cursor]
+                if state[target] == visiting:
+                    return tuple(path[path.index(target) :])
+                if not state[target]:
+                    state[target] = visiting
+                    path.append(target)
+                    cursors.append(0)
+        return None
+
+    def assert_acyclic(self) -> None:
+        """Raise :class:`DependencyCycleError` when the plan contains a cycle."""
+
+        cycle = self.find_cycle()
+        if cycle is not None:
+            raise DependencyCycleError([self.changes[index].name for index in cycle])
+
+    def topological_layers(self) -> tuple[tuple[int, ...], ...]:
+        """Group change indexes into layers whose members only require earlier layers.
+
+        Raises:
+            DependencyCycleError: If the graph is not acyclic.
+        """
+
+        remaining = [len(edges) for edges in self.requires]
+        layer = [index for index, count in enumerate(remaining) if count == 0]
+        layers: list[tuple[int, ...]] = []
+        placed = 0
+        while layer:
+            layers.append(tuple(layer))
+            placed += len(layer)
+            following: list[int] = []
+            for index in layer:
+                for dependent in self.required_by[index]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        following.append(dependent)
+            layer = sorted(following)
+        if placed != len(self.changes):
+            self.assert_acyclic()
+        return tuple(layers)
+
+
+def build_dependency_graph(plan: Plan) -> DependencyGraph:
+    """Build the dependency graph for ``plan``.
+
+    A bare ``name`` dependency resolves to the latest instance of ``name``
+    planned before the dependent change (falling back to the first instance
+    for forward references). ``name@tag`` resolves to the instance of
+    ``name`` that was current when ``tag`` was applied.
+    """
+
+    changes: list[Change] = []
+    instances: dict[str, list[int]] = {}
+    tag_positions: dict[str, int] = {}
+    for entry in plan.entries:
+        if isinstance(entry, Change):
+            instances.setdefault(entry.name, []).append(len(changes))
+            changes.append(entry)
+        elif isinstance(entry, Tag) and entry.change_ref in instances:
+            tag_positions.setdefault(entry.name, instances[entry.change_ref][-1])
+
+    requires: list[list[int]] = []
+    unresolved: list[list[str]] = []
+    for index, change in enumerate(changes):
+        edges: list[int] = []
+        missing: list[str] = []
+        for dependency in change.dependencies:
+            target = _resolve_dependency(dependency, index, instances, tag_positions)
+            if target is None:
+                missing.append(dependency)
+            elif target != index and target not in edges:
+                edges.append(target)
+        requires.append(edges)
+        unresolved.append(missing)
+
+    return DependencyGraph(changes, requires, unresolved)
+
+
+def _resolve_dependency(
+    dependency: str,
+    index: int,
+    instances: dict[str, list[int]],
+    tag_positions: dict[str, int],
+) -> int | None:
+    name, _, tag = dependency.partition("@")
+    candidates = instances.get(name)
+    if not candidates:
+        return None
+
+    if tag and tag in tag_positions:
+        position = bisect_right(candidates, tag_positions[tag])
+        if position:
+            return candidates[position - 1]
+
+    position = bisect_left(candidates, index)
+    return candidates[position - 1] if position else candidates[0]
+
+
+def _closure(
+    index: int,
+    adjacency: tuple[tuple[int, ...], ...],
+    memo: dict[int, frozenset[int]],
+) -> frozenset[int]:
+    cached = memo.get(index)
+    if cached is not None:
+        return cached
+
+    reached: set[int] = set()
+    stack = list(adjacency[index])
+    while stack:
+        node = stack.pop()
+        if node in reached:
+            continue
+        reached.add(node)
+        known = memo.get(node)
+        if known is not None:
+            reached.update(known)
+            continue
+        stack.extend(adjacency[node])
+
+    result = frozenset(reached)
+    memo[index] = result
+    return result
@@ -1,15 +1,22 @@
-"""Domain models representing plan entities."""
+"""Domain models representing plan entities.
+
+Plans for long-lived projects can hold tens of thousands of entries, so the
+entry types are slotted and share interned strings. Script paths are not stored
+per change; :class:`ScriptPaths` derives them on access from the plan root, the
+change slug, and the rework suffix.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from types import MappingProxyType
 from typing import TypeAlias
 from uuid import UUID
 
+from sqlitch.plan.utils import slugify_change_name
 from sqlitch.utils.time import ensure_timezone
 
 __all__ = [
@@ -17,8 +24,23 @@ __all__ = [
     "Tag",
     "Plan",
     "PlanEntry",
+    "ScriptPaths",
+    "intern_path",
 ]
 
+_SCRIPT_KINDS: tuple[str, ...] = ("deploy", "revert", "verify")
+_SCRIPT_EXTENSION = ".sql"
+_KIND_INDEX: dict[str, int] = {kind: index for index, kind in enumerate(_SCRIPT_KINDS)}
+_HAS_VERIFY = 1
+_REWORKED_FLAGS: dict[str, int] = {kind: 2 << index for index, kind in enumerate(_SCRIPT_KINDS)}
+
+_INTERNED_PATHS: dict[Path, Path] = {}
+"""Canonical instances of plan root directories shared by every change.
+
+Only directory roots are interned (one per plan location), so the table stays
+small for the lifetime of the process.
+"""
+
 
 def _ensure_path(value: Path | str) -> Path:
     if isinstance(value, Path):
@@ -26,7 +48,161 @@ def _ensure_path(value: Path | str) -> Path:
     return Path(value)
 
 
-@dataclass(frozen=True)
+def intern_path(value: Path | str) -> Path:
+    """Return a canonical shared :class:`Path` instance equal to ``value``."""
+
+    path = _ensure_path(value)
+    return _INTERNED_PATHS.setdefault(path, path)
+
+
+def _intern_optional(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
+def _intern_all(values: tuple[str, ...]) -> tuple[str, ...]:
+    if not values:
+        return ()
+    return tuple(sys.intern(value) for value in values)
+
+
+class ScriptPaths(Mapping[str, "Path | None"]):
+    """Read-only mapping of script kinds to the script paths of one change.
+
+    Conventional layouts (``<root>/<kind>/<slug>[@tag].sql``) are stored as the
+    shared plan root, the change slug, an optional rework suffix, and a bit
+    field recording which kinds exist and which use the suffix. Paths are
+    built on access. Layouts that do not follow the convention keep their
+    explicit paths.
+
+    The mapping always exposes the ``deploy``, ``revert`` and ``verify`` keys;
+    ``verify`` maps to ``None`` when the change has no verify script.
+    """
+
+    __slots__ = ("_root", "_slug", "_suffix", "_layout", "_explicit")
+
+    def __init__(
+        self,
+        *,
+        root: Path | None = None,
+        slug: str = "",
+        suffix: str = "",
+        layout: int = 0,
+        explicit: tuple[Path | None, ...] | None = None,
+    ) -> None:
+        self._root = root
+        self._slug = slug
+        self._suffix = suffix
+        self._layout = layout
+        self._explicit = explicit
+
+    @classmethod
+    def conventional(
+        cls,
+        root: Path,
+        slug: str,
+        *,
+        has_verify: bool = True,
+        suffix: str = "",
+        reworked_kinds: Iterable[str] = (),
+    ) -> ScriptPaths:
+        """Return script paths following the ``<root>/<kind>/<slug>.sql`` layout.
+
+        Args:
+            root: Directory containing the ``deploy``/``revert``/``verify`` folders.
+            slug: Filesystem-friendly change name.
+            has_verify: Whether the change has a verify script.
+            suffix: Rework suffix (for example ``"@v1.0"``) used by ``reworked_kinds``.
+            reworked_kinds: Script kinds whose file names carry ``suffix``.
+        """
+
+        layout = _HAS_VERIFY if has_verify else 0
+        for kind in reworked_kinds:
+            layout |= _REWORKED_FLAGS[kind]
+        return cls(
+            root=intern_path(root),
+            slug=sys.intern(slug),
+            suffix=sys.intern(suffix) if suffix else "",
+            layout=layout,
+        )
+
+    @classmethod
+    def from_mapping(cls, paths: Mapping[str, Path | str | None], slug: str) -> ScriptPaths:
+        """Return the compact form of ``paths`` when it follows the convention.
+
+        Missing kinds and ``None`` values are recorded as absent scripts.
+        """
+
+        if isinstance(paths, ScriptPaths):
+            return paths
+
+        normalized = {
+            kind: _ensure_path(value)
+            for kind in _SCRIPT_KINDS
+            if (value := paths.get(kind)) is not None
+        }
+        deploy = normalized.get("deploy")
+        if deploy is not None and deploy.suffix == _SCRIPT_EXTENSION:
+            compact = cls._compact_layout(normalized, deploy.parent.parent, slug)
+            if compact is not None:
+                return compact
+        return cls(explicit=tuple(normalized.get(kind) for kind in _SCRIPT_KINDS))
+
+    @classmethod
+    def _compact_layout(
+        cls, paths: Mapping[str, Path | None], root: Path, slug: str
+    ) -> ScriptPaths | None:
+        suffix = ""
+        reworked: list[str] = []
+        for kind in _SCRIPT_KINDS:
+            path = paths.get(kind)
+            if path is None:
+                continue
+            name = path.name
+            if path.parent != root / kind or not name.endswith(_SCRIPT_EXTENSION):
+                return None
+            stem = name[: -len(_SCRIPT_EXTENSION)]
+            if stem == slug:
+                continue
+            candidate = stem[len(slug) :]
+            if not stem.startswith(slug) or not candidate.startswith("@"):
+                return None
+            if suffix and candidate != suffix:
+                return None
+            suffix = candidate
+            reworked.append(kind)
+
+        compact = cls.conventional(
+            root,
+            slug,
+            has_verify=paths.get("verify") is not None,
+            suffix=suffix,
+            reworked_kinds=reworked,
+        )
+        if any(compact[kind] != paths.get(kind) for kind in _SCRIPT_KINDS):
+            return None
+        return compact
+
+    def __getitem__(self, kind: str) -> Path | None:
+        index = _KIND_INDEX[kind]
+        if self._explicit is not None:
+            return self._explicit[index]
+        if kind == "verify" and not self._layout & _HAS_VERIFY:
+            return None
+        suffix = self._suffix if self._layout & _REWORKED_FLAGS[kind] else ""
+        assert self._root is not None  # nosec B101 - set for every conventional layout
+        return self._root / kind / f"{self._slug}{suffix}{_SCRIPT_EXTENSION}"
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_SCRIPT_KINDS)
+
+    def __len__(self) -> int:
+        return len(_SCRIPT_KINDS)
+
+    def __repr__(self) -> str:
+        return f"ScriptPaths({dict(self)!r})"
+
+
+@dataclass(frozen=True, slots=True)
 class Tag:
     """Represents a tag entry within a plan.
 
@@ -75,15 +251,15 @@ class Tag:
         normalized_tagged_at = ensure_timezone(tagged_at, "Tag tagged_at")
 
         return cls(
-            name=name,
-            change_ref=change_ref,
-            planner=planner,
+            name=sys.intern(name),
+            change_ref=sys.intern(change_ref),
+            planner=sys.intern(planner),
             tagged_at=normalized_tagged_at,
             note=note,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Change:
     """Represents a deployable change entry within a plan."""
 
@@ -154,7 +330,12 @@ class Change:
         tags: Sequence[str] | None = None,
         rework_of: str | None = None,
     ) -> "Change":
-        """Factory method that applies validation prior to instantiation."""
+        """Factory method that applies validation prior to instantiation.
+
+        ``script_paths`` may be a plain mapping or a prepared :class:`ScriptPaths`.
+        Names, planners, and dependency references are interned so repeated
+        values share storage across the plan.
+        """
 
         normalized = _normalize_change_fields(
             name=name,
@@ -168,16 +349,16 @@ class Change:
         )
 
         return cls(
-            name=name,
-            script_paths=MappingProxyType(normalized.script_paths),
-            planner=planner,
+            name=sys.intern(name),
+            script_paths=normalized.script_paths,
+            planner=sys.intern(planner),
             planned_at=normalized.planned_at,
             notes=notes,
             change_id=normalized.change_id,
-            dependencies=normalized.dependencies,
-            conflicts=normalized.conflicts,
-            tags=normalized.tags,
-            rework_of=rework_of,
+            dependencies=_intern_all(normalized.dependencies),
+            conflicts=_intern_all(normalized.conflicts),
+            tags=_intern_all(normalized.tags),
+            rework_of=_intern_optional(rework_of),
         )
 
 
@@ -337,7 +518,7 @@ class Plan:
 class _NormalizedChange:
     planned_at: datetime
     change_id: UUID | None
-    script_paths: dict[str, Path | None]
+    script_paths: ScriptPaths
     dependencies: tuple[str, ...]
     conflicts: tuple[str, ...]
     tags: tuple[str, ...]
@@ -361,7 +542,7 @@ def _normalize_change_fields(
 
     normalized_planned_at = ensure_timezone(planned_at, "Change.planned_at")
     normalized_change_id = _normalize_change_id(change_id)
-    normalized_scripts = _normalize_script_paths(script_paths)
+    normalized_scripts = _normalize_script_paths(script_paths, name)
     normalized_dependencies = _normalize_unique_sequence(dependencies, "Change.dependencies")
     normalized_conflicts = _normalize_unique_sequence(conflicts, "Change.conflicts")
     normalized_tags = _normalize_unique_sequence(tags, "Change.tags")
@@ -386,7 +567,15 @@ def _normalize_change_id(value: UUID | None) -> UUID | None:
 
 def _normalize_script_paths(
     script_paths: Mapping[str, Path | str | None] | None,
-) -> dict[str, Path | None]:
+    name: str,
+) -> ScriptPaths:
+    if isinstance(script_paths, ScriptPaths):
+        if script_paths["deploy"] is None:
+            raise ValueError("Change.script_paths['deploy'] is required")
+        if script_paths["revert"] is None:
+            raise ValueError("Change.script_paths['revert'] is required")
+        return script_paths
+
     provided = dict(script_paths or {})
 
     deploy_path = provided.get("deploy")
@@ -403,7 +592,7 @@ def _normalize_script_paths(
 
     verify_path = provided.get("verify")
     normalized["verify"] = _ensure_path(verify_path) if verify_path is not None else None
-    return normalized
+    return ScriptPaths.from_mapping(normalized, slugify_change_name(name))
 
 
 def _normalize_unique_sequence(values: Sequence[str] | None, label: str) -> tuple[str, ...]:
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 import shlex
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
@@ -13,13 +15,48 @@ from uuid import UUID
 from sqlitch.plan.utils import slugify_change_name
 from sqlitch.utils.time import parse_iso_datetime
 
-from .model import Change, Plan, PlanEntry, Tag
+from .model import Change, Plan, PlanEntry, ScriptPaths, Tag
 
 
 class PlanParseError(ValueError):
     """Raised when the plan file contains invalid data."""
 
 
+class _ScriptDirectoryIndex:
+    """Per-parse cache of script directory listings.
+
+    Rework resolution needs to know which ``@tag`` suffixed scripts exist. Each
+    directory is listed at most once per parse so that lookups become set
+    membership checks instead of one filesystem probe per candidate.
+    ``list_directory`` replaces :func:`os.scandir` for scripts stored elsewhere.
+    """
+
+    __slots__ = ("_listings", "_list_directory")
+
+    def __init__(self, list_directory: Callable[[Path], Iterable[str]] | None = None) -> None:
+        self._listings: dict[Path, frozenset[str]] = {}
+        self._list_directory = list_directory
+
+    def contains(self, path: Path) -> bool:
+        """Return ``True`` when ``path`` names an existing directory entry."""
+
+        return path.name in self._listing(path.parent)
+
+    def _listing(self, directory: Path) -> frozenset[str]:
+        listing = self._listings.get(directory)
+        if listing is None:
+            if self._list_directory is not None:
+                listing = frozenset(self._list_directory(directory))
+            else:
+                try:
+                    with os.scandir(directory) as entries:
+                        listing = frozenset(entry.name for entry in entries)
+                except OSError:
+                    listing = frozenset()
+            self._listings[directory] = listing
+        return listing
+
+
 _CHANGE_PATTERN = re.compile(
     r"""
     ^
@@ -45,9 +82,24 @@ _TAG_PATTERN = re.compile(
 )
 
 
-def parse_plan(path: Path | str, *, default_engine: str | None = None) -> Plan:
+def parse_plan(
+    path: Path | str,
+    *,
+    default_engine: str | None = None,
+    content: str | None = None,
+    list_directory: Callable[[Path], Iterable[str]] | None = None,
+) -> Plan:
+    """Parse the plan at ``path``.
+
+    ``content`` supplies the plan text instead of reading ``path``, for example
+    a plan read from another VCS revision; ``path`` still anchors script paths.
+    ``list_directory`` returns the entry names of a script directory when the
+    scripts do not live on the filesystem, such as in a bundle archive.
+    """
+
     plan_path = Path(path)
-    content = plan_path.read_text(encoding="utf-8")
+    if content is None:
+        content = plan_path.read_text(encoding="utf-8")
     checksum = hashlib.sha256(content.encode("utf-8")).hexdigest()
 
     headers: dict[str, str] = {}
@@ -116,6 +168,7 @@ def parse_plan(path: Path | str, *, default_engine: str | None = None) -> Plan:
         entries=tuple(entries),
         change_tags_by_index=change_tags_by_index,
         base_dir=plan_path.parent,
+        script_index=_ScriptDirectoryIndex(list_directory),
     )
 
     return Plan(
@@ -239,11 +292,7 @@ def _parse_compact_change(line: str, note: str | None, line_no: int, base_dir: P
     planner = match.group("planner").strip()
 
     slug = slugify_change_name(name)
-    script_paths = {
-        "deploy": base_dir / "deploy" / f"{slug}.sql",
-        "revert": base_dir / "revert" / f"{slug}.sql",
-        "verify": base_dir / "verify" / f"{slug}.sql",
-    }
+    script_paths = ScriptPaths.conventional(base_dir, slug)
 
     return Change.create(
         name=name,
@@ -261,6 +310,7 @@ def _apply_rework_metadata(
     entries: Sequence[PlanEntry],
     change_tags_by_index: dict[int, list[str]],
     base_dir: Path,
+    script_index: _ScriptDirectoryIndex | None = None,
 ) -> tuple[PlanEntry, ...]:
     """Attach tag metadata and reworked script paths to change entries.
 
@@ -272,6 +322,9 @@ def _apply_rework_metadata(
     script paths are resolved to use the @tag suffix.
     """
 
+    if script_index is None:
+        script_index = _ScriptDirectoryIndex()
+
     # First pass: identify which changes are being reworked and at which tag
     # Maps (change_name, instance_index) -> rework_tag
     # A reworked change has a dependency on its previous version like "users@v1.0.0"
@@ -316,10 +369,11 @@ def _apply_rework_metadata(
         # Check if this specific instance was reworked
         rework_tag = rework_tags.get((entry.name, instance_index))
 
-        # At this point in parsing, script_paths are already resolved to Path | None
-        script_paths: dict[str, Path | None] = {
-            k: v if not isinstance(v, str) else Path(v) for k, v in entry.script_paths.items()
-        }
+        if not rework_tag and not tags:
+            adjusted.append(entry)
+            continue
+
+        script_paths = entry.script_paths
         # If this change was reworked (has a later instance that references it with @tag),
         # use the @tag suffixed scripts
         if rework_tag:
@@ -328,17 +382,13 @@ def _apply_rework_metadata(
                 script_paths=script_paths,
                 tags=(rework_tag,),  # Use the rework tag, not the change's own tags
                 base_dir=base_dir,
+                script_index=script_index,
             )
 
         adjusted.append(
-            Change.create(
-                name=entry.name,
+            replace(
+                entry,
                 script_paths=script_paths,
-                planner=entry.planner,
-                planned_at=entry.planned_at,
-                notes=entry.notes,
-                change_id=entry.change_id,
-                dependencies=entry.dependencies,
                 tags=tags or entry.tags,
                 rework_of=(
                     f"{entry.name}@{rework_tag}" if rework_tag and instance_index > 0 else None
@@ -353,20 +403,26 @@ def _resolve_reworked_script_paths(  # pylint: disable=unused-argument
     # base_dir reserved for future script path resolution
     *,
     change_name: str,
-    script_paths: dict[str, Path | None],
+    script_paths: Mapping[str, Path | str | None],
     tags: Sequence[str],
     base_dir: Path,
-) -> dict[str, Path | None]:
+    script_index: _ScriptDirectoryIndex | None = None,
+) -> ScriptPaths:
     """Compute script paths for reworked changes preferring ``@tag`` suffixes.
 
     Note: script_paths values are already constructed relative to base_dir,
-    so we use them as-is to find the @tag suffixed versions.
+    so we use them as-is to find the @tag suffixed versions. Candidate
+    existence is answered by ``script_index`` so each script directory is
+    listed once per parse rather than probed per candidate.
     """
 
-    if not tags:
-        return script_paths
+    if script_index is None:
+        script_index = _ScriptDirectoryIndex()
 
     slug = slugify_change_name(change_name)
+    if not tags:
+        return ScriptPaths.from_mapping(script_paths, slug)
+
     suffixes = [f"@{tag}" for tag in tags]
 
     resolved: dict[str, Path | None] = {}
@@ -384,13 +440,13 @@ def _resolve_reworked_script_paths(  # pylint: disable=unused-argument
         selected: Path | None = None
         for suffix in reversed(suffixes):
             candidate = parent / f"{slug}{suffix}{extension}"
-            if candidate.exists():
+            if script_index.contains(candidate):
                 selected = candidate
                 break
 
         resolved[kind] = selected or original_path
 
-    return resolved
+    return ScriptPaths.from_mapping(resolved, slug)
 
 
 def _parse_compact_tag(
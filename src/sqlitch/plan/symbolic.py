@@ -7,14 +7,23 @@ Implements the extended SHA1 syntax documented in sqitchchanges.pod:
 - <change>^<n> - n changes prior (e.g., @HEAD^3 means 3 before HEAD)
 - <change>~ - next change (e.g., @ROOT~ means one after ROOT)
 - <change>~<n> - n changes after (e.g., @ROOT~4 means 4 after ROOT)
+
+:class:`ReferenceResolver` indexes a plan once so that change names, tags,
+change IDs and ``change@tag`` references (with offsets) resolve without
+scanning the plan.
 """
 
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
+from .model import Change, Plan, Tag
+
 __all__ = [
+    "ReferenceResolver",
     "SymbolicReference",
     "parse_symbolic_reference",
     "resolve_symbolic_reference",
@@ -143,3 +152,192 @@ def resolve_symbolic_reference(ref: str, change_names: list[str]) -> str:
         )
 
     return change_names[target_index]
+
+
+class ReferenceResolver:
+    """Resolve change references against a plan using precomputed indexes.
+
+    The resolver is built once per plan. Indexes refer to positions within
+    ``Plan.changes``. A bare change name resolves to its latest instance,
+    ``name@tag`` to the instance that was current when ``tag`` was applied,
+    and ``@tag`` (or a bare tag name that is not also a change name) to the
+    change the tag is attached to.
+    """
+
+    __slots__ = ("changes", "_instances", "_tags", "_change_ids", "_tagged")
+
+    def __init__(
+        self,
+        changes: Sequence[Change],
+        *,
+        tags: dict[str, int],
+        change_ids: dict[str, int],
+    ) -> None:
+        self.changes: tuple[Change, ...] = tuple(changes)
+        instances: dict[str, list[int]] = {}
+        for index, change in enumerate(self.changes):
+            instances.setdefault(change.name, []).append(index)
+        self._instances = {name: tuple(indexes) for name, indexes in instances.items()}
+        self._tags = tags
+        self._change_ids = change_ids
+        self._tagged: dict[tuple[str, str], int] = {}
+
+    @classmethod
+    def from_plan(cls, plan: Plan, *, change_ids: Sequence[str] = ()) -> ReferenceResolver:
+        """Index ``plan``; ``change_ids`` optionally lists computed IDs in plan order."""
+
+        changes: list[Change] = []
+        latest: dict[str, int] = {}
+        tags: dict[str, int] = {}
+        for entry in plan.entries:
+            if isinstance(entry, Change):
+                latest[entry.name] = len(changes)
+                changes.append(entry)
+            elif isinstance(entry, Tag) and entry.change_ref in latest:
+                tags.setdefault(entry.name, latest[entry.change_ref])
+
+        ids: dict[str, int] = {}
+        for index, change in enumerate(changes):
+            if change.change_id is not None:
+                ids.setdefault(str(change.change_id), index)
+                ids.setdefault(change.change_id.hex, index)
+        for index, change_id in enumerate(change_ids):
+            ids.setdefault(change_id, index)
+
+        return cls(changes, tags=tags, change_ids=ids)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def has_change(self, name: str) -> bool:
+        return name in self._instances
+
+    def has_tag(self, name: str) -> bool:
+        return name.removeprefix("@") in self._tags
+
+    def first_index(self, name: str) -> int | None:
+        """Return the plan index of the first instance of change ``name``, if any."""
+
+        instances = self._instances.get(name)
+        return instances[0] if instances else None
+
+    def resolve_target_index(self, ref: str) -> int:
+        """Return the plan index ``ref`` names as a deploy or revert stopping point.
+
+        Unlike :meth:`resolve_index`, a bare name of a reworked change stops at
+        its first instance; ``name@tag`` or a symbolic reference such as
+        ``@HEAD`` reaches a later one.
+
+        Raises:
+            ValueError: If the reference cannot be resolved.
+        """
+
+        first = self.first_index(ref)
+        return first if first is not None else self.resolve_index(ref)
+
+    def target_reference(self, index: int, ref: str) -> str:
+        """Return how to name the stopping point ``ref`` resolved to at ``index``.
+
+        This is the change name when :meth:`resolve_target_index` maps that name
+        back to ``index``, and ``ref`` itself for a later reworked instance.
+        """
+
+        name = self.changes[index].name
+        return name if self.first_index(name) == index else ref
+
+    def resolve_index(self, ref: str) -> int:
+        """Return the plan index of the change identified by ``ref``.
+
+        Raises:
+            ValueError: If the reference cannot be resolved.
+        """
+
+        if not self.changes:
+            raise ValueError("Cannot resolve symbolic reference in empty plan")
+
+        parsed = parse_symbolic_reference(ref)
+        base_index = self._resolve_base(parsed.base)
+
+        if parsed.offset_type == "^":
+            target_index = base_index - parsed.offset_count
+        elif parsed.offset_type == "~":
+            target_index = base_index + parsed.offset_count
+        else:
+            target_index = base_index
+
+        if target_index < 0:
+            raise ValueError(
+                f"Symbolic reference '{ref}' resolves to position {target_index} "
+                f"(before first change)"
+            )
+        if target_index >= len(self.changes):
+            raise ValueError(
+                f"Symbolic reference '{ref}' resolves to position {target_index} "
+                f"(after last change at position {len(self.changes) - 1})"
+            )
+        return target_index
+
+    def resolve(self, ref: str) -> Change:
+        """Return the change identified by ``ref``."""
+
+        return self.changes[self.resolve_index(ref)]
+
+    def resolve_many(self, refs: Iterable[str]) -> tuple[int, ...]:
+        """Resolve several references, returning their plan indexes in input order."""
+
+        return tuple(self.resolve_index(ref) for ref in refs)
+
+    def _resolve_base(self, base: str) -> int:
+        if base in ("HEAD", "@HEAD"):
+            return len(self.changes) - 1
+        if base in ("ROOT", "@ROOT"):
+            return 0
+
+        if base.startswith("@"):
+            tag = base[1:]
+            if tag not in self._tags:
+                raise ValueError(f"Unknown tag '{base}'")
+            return self._tags[tag]
+
+        instances = self._instances.get(base)
+        if instances is not None:
+            return instances[-1]
+
+        if "@" in base:
+            name, tag = base.split("@", 1)
+            return self._resolve_tagged(name, tag)
+
+        change_index = self._change_ids.get(base)
+        if change_index is not None:
+            return change_index
+
+        tag_index = self._tags.get(base)
+        if tag_index is not None:
+            return tag_index
+
+        raise ValueError(f"Change '{base}' not found in plan")
+
+    def _resolve_tagged(self, name: str, tag: str) -> int:
+        key = (name, tag)
+        cached = self._tagged.get(key)
+        if cached is not None:
+            return cached
+
+        instances = self._instances.get(name)
+        if instances is None:
+            raise ValueError(f"Change '{name}' not found in plan")
+
+        if tag == "HEAD":
+            index = instances[-1]
+        elif tag == "ROOT":
+            index = instances[0]
+        else:
+            if tag not in self._tags:
+                raise ValueError(f"Unknown tag '@{tag}'")
+            position = bisect_right(instances, self._tags[tag])
+            if not position:
+                raise ValueError(f"Change '{name}' is not planned as of tag '@{tag}'")
+            index = instances[position - 1]
+
+        self._tagged[key] = index
+        return index
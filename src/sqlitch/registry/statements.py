@@ -0,0 +1,96 @@
+"""Precompiled SQLite registry statements.
+
+Recording a change writes one ``changes`` row, one ``events`` row, and a row per
+dependency and tag. Building that SQL with f-strings for every change costs
+more than executing it for small deploy scripts. :func:`registry_statements`
+builds the statements once per registry schema alias. Reusing the exact same
+SQL text also lets :mod:`sqlite3` serve each statement from its per-connection
+prepared statement cache instead of recompiling it.
+
+Schema aliases are never user input: callers pass the constant attachment
+alias of the registry database.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+__all__ = [
+    "CLEANUP_CHUNK_SIZE",
+    "RegistryStatements",
+    "registry_cleanup_statements",
+    "registry_statements",
+]
+
+CLEANUP_CHUNK_SIZE = 400
+"""Most change IDs per set-based cleanup statement.
+
+The dependency cleanup binds every ID twice, which keeps a full chunk below
+SQLite's historical limit of 999 bound parameters.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RegistryStatements:
+    """Parameterised (qmark style) registry statements for one schema alias.
+
+    Attributes:
+        insert_change: Insert a ``changes`` row; 11 parameters.
+        insert_event: Insert an ``events`` row; 14 parameters, event name first.
+        insert_dependency: Insert a ``require`` dependency; use with ``executemany``.
+        insert_tag: Insert a ``tags`` row; use with ``executemany``.
+    """
+
+    insert_change: str
+    insert_event: str
+    insert_dependency: str
+    insert_tag: str
+
+
+@lru_cache(maxsize=None)
+def registry_statements(schema: str) -> RegistryStatements:
+    """Return the registry statements for tables in the ``schema`` alias."""
+
+    return RegistryStatements(
+        insert_change=(
+            f'INSERT INTO {schema}.changes (change_id, script_hash, "change", project, '
+            "note, committed_at, committer_name, committer_email, planned_at, planner_name, "
+            "planner_email) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"  # nosec B608
+        ),
+        insert_event=(
+            f"INSERT INTO {schema}.events (event, change_id, change, project, note, "
+            "requires, conflicts, tags, committed_at, committer_name, committer_email, "
+            "planned_at, planner_name, planner_email) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"  # nosec B608
+        ),
+        insert_dependency=(
+            f"INSERT INTO {schema}.dependencies (change_id, type, dependency, dependency_id) "
+            "VALUES (?, 'require', ?, ?)"  # nosec B608
+        ),
+        insert_tag=(
+            f"INSERT INTO {schema}.tags (tag_id, tag, project, change_id, note, committed_at, "
+            "committer_name, committer_email, planned_at, planner_name, planner_email) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"  # nosec B608
+        ),
+    )
+
+
+@lru_cache(maxsize=64)
+def registry_cleanup_statements(schema: str, count: int) -> tuple[str, str, str]:
+    """Return set-based DELETEs that remove ``count`` reverted changes.
+
+    The statements delete, in order, the tags of the changes, the dependencies
+    from or to them, and the ``changes`` rows. Each binds the change IDs once,
+    except the dependency statement, which binds them twice. Keep ``count`` at
+    or below :data:`CLEANUP_CHUNK_SIZE`.
+    """
+
+    placeholders = ", ".join("?" * count)
+    return (
+        f"DELETE FROM {schema}.tags WHERE change_id IN ({placeholders})",  # nosec B608
+        # dependency_id has no ON DELETE CASCADE, so rows pointing at the changes go too.
+        f"DELETE FROM {schema}.dependencies WHERE change_id IN ({placeholders}) "
+        f"OR dependency_id IN ({placeholders})",  # nosec B608
+        f"DELETE FROM {schema}.changes WHERE change_id IN ({placeholders})",  # nosec B608
+    )
@@ -0,0 +1,457 @@
+"""Content manifests of project bundles.
+
+``sqlitch bundle`` writes a :class:`BundleManifest` next to the bundled plan
+and scripts. It lists the bundle-relative path, SHA-1 digest, and size of
+every bundled file. For UTF-8 files the digest equals the ``script_hash`` the
+registry records for a script, so a deployed change can be checked against
+the bundle it came from.
+
+Re-bundling compares a fresh manifest of the project with the one already in
+the destination and only copies files whose digest or size changed.
+
+A bundle can also be a single ``.tar.gz`` or ``.zip`` archive written by
+:func:`write_archive`. :class:`BundleArchive` memory-maps such an archive and
+serves its plan and scripts without extracting them to disk. Zip members are
+decompressed on demand; gzip streams cannot be read out of order, so a tar
+archive is decompressed into memory once when it is opened.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import mmap
+import os
+import tarfile
+import tempfile
+import threading
+import zipfile
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from types import TracebackType
+from typing import Any
+
+from sqlitch.engine.sqlite import compute_script_hash
+
+__all__ = [
+    "ARCHIVE_FORMATS",
+    "MANIFEST_NAME",
+    "BundleArchive",
+    "BundleArchiveError",
+    "BundleManifest",
+    "ManifestEntry",
+    "archive_format",
+    "build_manifest",
+    "file_digest",
+    "write_archive",
+]
+
+MANIFEST_NAME = "sqlitch-manifest.json"
+"""File name of the manifest inside a bundle directory."""
+
+ARCHIVE_FORMATS: dict[str, str] = {".tar.gz": "tar", ".tgz": "tar", ".zip": "zip"}
+"""Archive file suffixes and the format each selects."""
+
+_FORMAT_VERSION = 1
+_PLAN_NAMES = ("sqitch.plan", "sqlitch.plan")
+
+
+class BundleArchiveError(ValueError):
+    """Raised when a bundle archive cannot be read or fails its integrity check."""
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """One bundled file.
+
+    Attributes:
+        path: POSIX path relative to the bundle root.
+        sha1: Hex SHA-1 digest, matching ``script_hash`` for UTF-8 files.
+        size: Size of the file in bytes.
+    """
+
+    path: str
+    sha1: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True)
+class BundleManifest:
+    """The files of a bundle, sorted by path."""
+
+    entries: tuple[ManifestEntry, ...]
+
+    def by_path(self) -> dict[str, ManifestEntry]:
+        """Return the entries keyed by their bundle-relative path."""
+
+        return {entry.path: entry for entry in self.entries}
+
+    def changed_since(
+        self, previous: BundleManifest | None, root: Path
+    ) -> tuple[tuple[ManifestEntry, ...], tuple[ManifestEntry, ...]]:
+        """Return ``(changed, stale)`` relative to the ``previous`` manifest of ``root``.
+
+        ``changed`` holds the entries whose digest or size differ from
+        ``previous`` or whose file is missing under ``root``; ``stale`` holds
+        the entries of ``previous`` that are no longer part of the bundle.
+        """
+
+        known = previous.by_path() if previous is not None else {}
+        changed = tuple(
+            entry
+            for entry in self.entries
+            if known.get(entry.path) != entry or not _has_size(root / entry.path, entry.size)
+        )
+        current = {entry.path for entry in self.entries}
+        stale = tuple(entry for path, entry in known.items() if path not in current)
+        return changed, stale
+
+    def verify(self, root: Path) -> tuple[str, ...]:
+        """Return the paths under ``root`` that are missing or differ from the manifest."""
+
+        mismatched: list[str] = []
+        for entry in self.entries:
+            path = root / entry.path
+            if not _has_size(path, entry.size) or file_digest(path) != entry.sha1:
+                mismatched.append(entry.path)
+        return tuple(mismatched)
+
+    def to_json(self) -> str:
+        """Serialise the manifest."""
+
+        document = {
+            "version": _FORMAT_VERSION,
+            "files": [
+                {"path": entry.path, "sha1": entry.sha1, "size": entry.size}
+                for entry in self.entries
+            ],
+        }
+        return json.dumps(document, indent=2) + "\n"
+
+    @classmethod
+    def from_json(cls, text: str) -> BundleManifest:
+        """Parse a manifest written by :meth:`to_json`.
+
+        Raises:
+            ValueError: If ``text`` is not a manifest of a supported version, or
+                an entry's path is absolute or leaves the bundle root.
+        """
+
+        document = json.loads(text)
+        if not isinstance(document, dict) or document.get("version") != _FORMAT_VERSION:
+            raise ValueError("Unsupported bundle manifest version")
+        files = document.get("files")
+        if not isinstance(files, list):
+            raise ValueError("Bundle manifest has no file list")
+        entries: list[ManifestEntry] = []
+        for item in files:
+            if not (
+                isinstance(item, dict)
+                and isinstance(item.get("path"), str)
+                and isinstance(item.get("sha1"), str)
+                and isinstance(item.get("size"), int)
+            ):
+                raise ValueError(f"Invalid bundle manifest entry: {item!r}")
+            if not _is_bundle_relative(item["path"]):
+                raise ValueError(f"Bundle manifest path escapes the bundle: {item['path']!r}")
+            entries.append(ManifestEntry(item["path"], item["sha1"], item["size"]))
+        return cls(tuple(sorted(entries, key=lambda entry: entry.path)))
+
+    @classmethod
+    def load(cls, root: Path) -> BundleManifest | None:
+        """Return the manifest of the bundle at ``root``, or ``None`` if it has no valid one."""
+
+        try:
+            return cls.from_json((root / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def write(self, root: Path) -> None:
+        """Atomically write the manifest into the bundle at ``root``."""
+
+        fd, temp_name = tempfile.mkstemp(dir=root, prefix=f".{MANIFEST_NAME}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self.to_json())
+            os.replace(temp_name, root / MANIFEST_NAME)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-1 of ``path`` as recorded in manifests.
+
+    UTF-8 files are hashed like :func:`~sqlitch.engine.sqlite.compute_script_hash`
+    hashes the script text deploy reads; other files are hashed byte for byte.
+    """
+
+    try:
+        return compute_script_hash(path.read_text(encoding="utf-8"))
+    except UnicodeDecodeError:
+        return hashlib.sha1(path.read_bytes(), usedforsecurity=False).hexdigest()
+
+
+def build_manifest(files: Mapping[str, Path], executor: Executor | None = None) -> BundleManifest:
+    """Hash ``files``, keyed by bundle-relative path, into a manifest.
+
+    Files are hashed on ``executor`` when one is given.
+    """
+
+    def _entry(item: tuple[str, Path]) -> ManifestEntry:
+        relative, source = item
+        return ManifestEntry(relative, file_digest(source), source.stat().st_size)
+
+    items: Iterable[tuple[str, Path]] = sorted(files.items())
+    mapped = executor.map(_entry, items) if executor is not None else map(_entry, items)
+    return BundleManifest(tuple(mapped))
+
+
+def _is_bundle_relative(path: str) -> bool:
+    """Return whether ``path`` is a relative POSIX path that stays inside the bundle root."""
+
+    posix = PurePosixPath(path)
+    windows = PureWindowsPath(path)
+    return (
+        bool(posix.parts)
+        and not posix.is_absolute()
+        and not windows.drive
+        and not windows.root
+        and ".." not in windows.parts
+    )
+
+
+def _has_size(path: Path, size: int) -> bool:
+    try:
+        return path.stat().st_size == size
+    except OSError:
+        return False
+
+
+def archive_format(path: Path) -> str | None:
+    """Return ``"tar"`` or ``"zip"`` for a supported archive name, else ``None``."""
+
+    name = path.name.lower()
+    for suffix, kind in ARCHIVE_FORMATS.items():
+        if name.endswith(suffix):
+            return kind
+    return None
+
+
+def write_archive(path: Path, files: Mapping[str, Path], manifest: BundleManifest) -> None:
+    """Atomically write ``files`` and ``manifest`` into the archive at ``path``.
+
+    The manifest is the first member so streaming readers see it first.
+
+    Raises:
+        ValueError: If the suffix of ``path`` names no supported format.
+    """
+
+    kind = archive_format(path)
+    if kind is None:
+        raise ValueError(f"Unsupported archive type {path.name}")
+    manifest_bytes = manifest.to_json().encode("utf-8")
+
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            if kind == "zip":
+                with zipfile.ZipFile(handle, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                    archive.writestr(MANIFEST_NAME, manifest_bytes)
+                    for entry in manifest.entries:
+                        archive.write(files[entry.path], entry.path)
+            else:
+                with tarfile.open(fileobj=handle, mode="w:gz") as archive:
+                    info = tarfile.TarInfo(MANIFEST_NAME)
+                    info.size = len(manifest_bytes)
+                    archive.addfile(info, io.BytesIO(manifest_bytes))
+                    for entry in manifest.entries:
+                        archive.add(files[entry.path], entry.path, filter=_anonymise)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _anonymise(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info
+
+
+class BundleArchive:
+    """Read-only view of a bundle archive, mounted at a project directory.
+
+    Paths passed to :meth:`read_text` and :meth:`list_directory` are resolved
+    relative to ``root``, so a plan parsed from :attr:`plan_path` finds its
+    scripts in the archive exactly as it would in an extracted bundle. Every
+    member read is checked against the manifest.
+
+    Raises:
+        BundleArchiveError: If ``path`` is not a readable bundle archive.
+    """
+
+    def __init__(self, path: Path, root: Path) -> None:
+        self.path = path
+        self.root = root
+        self._lock = threading.Lock()
+        self._members: dict[str, bytes] = {}
+        self._zip: zipfile.ZipFile | None = None
+        try:
+            self._handle = path.open("rb")
+        except OSError as exc:
+            raise BundleArchiveError(f"Cannot open bundle archive {path}: {exc}") from exc
+        try:
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._names = self._index()
+            manifest_text = self._read(MANIFEST_NAME)
+            if manifest_text is None:
+                raise BundleArchiveError(f"{path} has no {MANIFEST_NAME}; it is not a bundle")
+            self.manifest = BundleManifest.from_json(manifest_text.decode("utf-8"))
+        except BundleArchiveError:
+            self.close()
+            raise
+        except (OSError, ValueError, tarfile.TarError, zipfile.BadZipFile) as exc:
+            self.close()
+            raise BundleArchiveError(f"Cannot read bundle archive {path}: {exc}") from exc
+        self._entries = self.manifest.by_path()
+        missing = sorted(set(self._entries) - self._names)
+        if missing:
+            self.close()
+            raise BundleArchiveError(f"Bundle archive {path} is missing {', '.join(missing)}")
+
+    def __enter__(self) -> BundleArchive:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the archive and its memory map."""
+
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if getattr(self, "_map", None) is not None and not self._map.closed:
+            self._map.close()
+        self._handle.close()
+
+    @property
+    def plan_path(self) -> Path:
+        """Path of the bundled plan below :attr:`root`."""
+
+        for name in _PLAN_NAMES:
+            if name in self._entries:
+                return self.root / name
+        raise BundleArchiveError(f"Bundle archive {self.path} contains no plan file")
+
+    def read_text(self, path: Path) -> str:
+        """Return the UTF-8 text of the member at ``path``.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such member.
+            BundleArchiveError: If the member does not match the manifest.
+        """
+
+        name = self._member_name(path)
+        entry = self._entries.get(name) if name is not None else None
+        data = self._read(name) if entry is not None and name is not None else None
+        if entry is None or data is None:
+            raise FileNotFoundError(f"{path} is not in bundle archive {self.path}")
+        try:
+            # Translate newlines like Path.read_text, which the manifest digest was taken from.
+            text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError as exc:
+            raise BundleArchiveError(f"{entry.path} in {self.path} is not UTF-8: {exc}") from exc
+        if len(data) != entry.size or compute_script_hash(text) != entry.sha1:
+            raise BundleArchiveError(f"{entry.path} in {self.path} does not match its manifest")
+        return text
+
+    def list_directory(self, directory: Path) -> frozenset[str]:
+        """Return the names of the bundled files directly inside ``directory``."""
+
+        prefix = self._member_name(directory)
+        if prefix is None:
+            return frozenset()
+        return frozenset(
+            PurePosixPath(name).name
+            for name in self._entries
+            if str(PurePosixPath(name).parent) == (prefix or ".")
+        )
+
+    def _member_name(self, path: Path) -> str | None:
+        try:
+            relative = path.relative_to(self.root)
+        except ValueError:
+            return None
+        name = relative.as_posix()
+        return "" if name == "." else name
+
+    def _index(self) -> set[str]:
+        if self._map[:4] == b"PK\x03\x04" or self._map[:4] == b"PK\x05\x06":
+            # Members are decompressed straight out of the mapping.
+            self._zip = zipfile.ZipFile(_MappedFile(self._map))
+            return {info.filename for info in self._zip.infolist() if not info.is_dir()}
+        if self._map[:2] == b"\x1f\x8b":
+            with tarfile.open(fileobj=self._map, mode="r:gz") as archive:
+                for member in archive:
+                    extracted = archive.extractfile(member) if member.isfile() else None
+                    if extracted is not None:
+                        self._members[_normalise(member.name)] = extracted.read()
+            return set(self._members)
+        raise BundleArchiveError(f"{self.path} is not a .tar.gz or .zip bundle archive")
+
+    def _read(self, name: str) -> bytes | None:
+        if self._zip is None:
+            return self._members.get(name)
+        with self._lock:
+            try:
+                return self._zip.read(name)
+            except KeyError:
+                return None
+
+
+class _MappedFile(io.RawIOBase):
+    """Seekable read-only file over a memory map.
+
+    :class:`mmap.mmap` only reports itself seekable from Python 3.13, which
+    :class:`zipfile.ZipFile` checks before reading members in place.
+    """
+
+    def __init__(self, mapping: mmap.mmap) -> None:
+        super().__init__()
+        self._mapping = mapping
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._mapping.tell()
+        elif whence == os.SEEK_END:
+            offset += len(self._mapping)
+        self._mapping.seek(offset)
+        return offset
+
+    def tell(self) -> int:
+        return self._mapping.tell()
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._mapping.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _normalise(name: str) -> str:
+    return name[2:] if name.startswith("./") else name
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import os
 import socket
 import sys
-from collections.abc import Mapping
+import tempfile
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -31,7 +37,10 @@ else:
         win32net = None  # type: ignore[assignment]
 
 __all__ = [
+    "IDENTITY_CACHE_TTL_ENV",
+    "IdentityService",
     "UserIdentity",
+    "activate_identity_service",
     "generate_change_id",
     "resolve_planner_identity",
     "resolve_username",
@@ -43,6 +52,11 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+IDENTITY_CACHE_TTL_ENV = "SQLITCH_IDENTITY_CACHE_TTL"
+"""Environment variable holding the lifetime, in seconds, of persisted identity lookups."""
+
+_IDENTITY_CACHE_VERSION = 3
+
 
 @dataclass(frozen=True)
 class UserIdentity:
@@ -55,6 +69,174 @@ class UserIdentity:
     email: str
 
 
+class IdentityService:
+    """Memoize the system lookups behind planner and committer identities.
+
+    Login names and GECOS full names come from ``getlogin`` and the passwd
+    database, which can each take hundreds of milliseconds on hosts backed by
+    LDAP or NSS. A service performs every lookup, and ``gethostname``, at most
+    once. With ``store_path`` and a positive ``ttl`` the login name and full
+    names are also persisted as JSON and reused by later processes of the same
+    user until they are ``ttl`` seconds old. Each result keeps the time it was
+    looked up, so persisting a new lookup does not extend older ones.
+
+    Only system lookups are persisted: usernames taken from the environment
+    are resolved afresh, and the hostname is not stored because a config
+    directory may be shared by several hosts.
+
+    Attributes:
+        lookups: Number of system lookups performed (not served from a cache).
+    """
+
+    __slots__ = (
+        "store_path",
+        "ttl",
+        "lookups",
+        "_system_username",
+        "_system_username_known",
+        "_fullnames",
+        "_hostname",
+        "_resolved_at",
+        "_loaded",
+    )
+
+    def __init__(self, *, store_path: Path | None = None, ttl: float = 0.0) -> None:
+        self.store_path = store_path
+        self.ttl = ttl
+        self.lookups = 0
+        self._system_username: str | None = None
+        self._system_username_known = False
+        self._fullnames: dict[str, str | None] = {}
+        self._hostname: str | None = None
+        self._resolved_at: dict[tuple[str, str], float] = {}
+        self._loaded = False
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str], config_root: Path) -> IdentityService:
+        """Build a service persisting under ``config_root`` when a TTL is configured."""
+
+        try:
+            ttl = float(env.get(IDENTITY_CACHE_TTL_ENV, "") or 0)
+        except ValueError:
+            ttl = 0.0
+        if ttl <= 0:
+            return cls()
+        user_key = str(os.getuid()) if hasattr(os, "getuid") else env.get("USERNAME", "user")
+        return cls(store_path=config_root / "cache" / f"identity-{user_key}.json", ttl=ttl)
+
+    def username(self, env: Mapping[str, str]) -> str:
+        """Return :func:`resolve_username` for ``env``, looking up the login name at most once."""
+
+        if env.get("SQITCH_ORIG_SYSUSER"):
+            return env["SQITCH_ORIG_SYSUSER"]
+        self._load()
+        if not self._system_username_known:
+            self._system_username = _system_username()
+            self._system_username_known = True
+            self._record_lookup("username", "")
+        return self._system_username or _fallback_username(env)
+
+    def system_fullname(self, username: str) -> str | None:
+        """Return :func:`get_system_fullname` for ``username``, looking it up at most once."""
+
+        self._load()
+        if username not in self._fullnames:
+            self._fullnames[username] = get_system_fullname(username)
+            self._record_lookup("fullnames", username)
+        return self._fullnames[username]
+
+    def hostname(self) -> str:
+        """Return :func:`get_hostname`, looking it up at most once."""
+
+        if self._hostname is None:
+            self._hostname = get_hostname()
+            self.lookups += 1
+        return self._hostname
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.store_path is None:
+            return
+        try:
+            payload = json.loads(self.store_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _IDENTITY_CACHE_VERSION:
+            return
+        now = time.time()
+        for _, value in self._fresh_entries({"": payload.get("username")}, "username", now):
+            if isinstance(value, str):
+                self._system_username = value
+                self._system_username_known = True
+        for key, value in self._fresh_entries(payload.get("fullnames"), "fullnames", now):
+            self._fullnames[key] = value
+
+    def _fresh_entries(
+        self, entries: object, section: str, now: float
+    ) -> Iterator[tuple[str, str | None]]:
+        """Yield the ``[value, resolved_at]`` entries of ``section`` younger than the TTL."""
+
+        if not isinstance(entries, dict):
+            return
+        for key, entry in entries.items():
+            if not (isinstance(entry, list) and len(entry) == 2):
+                continue
+            value, resolved_at = entry
+            if value is not None and not isinstance(value, str):
+                continue
+            if not isinstance(resolved_at, (int, float)) or now - resolved_at > self.ttl:
+                continue
+            self._resolved_at[(section, key)] = float(resolved_at)
+            yield key, value
+
+    def _record_lookup(self, section: str, key: str) -> None:
+        self.lookups += 1
+        if self.store_path is None:
+            return
+        resolved_at = self._resolved_at
+        resolved_at[(section, key)] = time.time()
+        username = self._system_username
+        payload = {
+            "version": _IDENTITY_CACHE_VERSION,
+            "username": (None if username is None else [username, resolved_at[("username", "")]]),
+            "fullnames": {
+                name: [value, resolved_at[("fullnames", name)]]
+                for name, value in self._fullnames.items()
+            },
+        }
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.store_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle)
+                os.replace(temp_name, self.store_path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # Persisting is an optimisation; an unwritable directory must not fail a command.
+            return
+
+
+_ACTIVE_IDENTITY_SERVICE: ContextVar[IdentityService | None] = ContextVar(
+    "sqlitch_identity_service", default=None
+)
+
+
+@contextmanager
+def activate_identity_service(service: IdentityService) -> Iterator[IdentityService]:
+    """Serve the identity helpers' system lookups from ``service`` until the block exits."""
+
+    token = _ACTIVE_IDENTITY_SERVICE.set(service)
+    try:
+        yield service
+    finally:
+        _ACTIVE_IDENTITY_SERVICE.reset(token)
+
+
 def generate_change_id(
     project: str,
     change: str,
@@ -209,9 +391,21 @@ def resolve_username(env: Mapping[str, str]) -> str:
     Returns:
         Username string (never None).
     """
+    service = _ACTIVE_IDENTITY_SERVICE.get()
+    if service is not None:
+        return service.username(env)
+    return _lookup_username(env)
+
+
+def _lookup_username(env: Mapping[str, str]) -> str:
     # Check SQITCH_ORIG_SYSUSER (internal)
     if env.get("SQITCH_ORIG_SYSUSER"):
         return env["SQITCH_ORIG_SYSUSER"]
+    return _system_username() or _fallback_username(env)
+
+
+def _system_username() -> str | None:
+    """Return the login name from ``getlogin()`` or the passwd database, if any."""
 
     # Try getlogin()
     try:
@@ -227,6 +421,11 @@ def resolve_username(env: Mapping[str, str]) -> str:
             return pwd.getpwuid(os.getuid()).pw_name
         except (KeyError, AttributeError):  # pragma: no cover
             pass
+    return None
+
+
+def _fallback_username(env: Mapping[str, str]) -> str:
+    """Return the username from the environment or Windows when no login name exists."""
 
     # Check environment variables in order
     for var in ("LOGNAME", "USER", "USERNAME"):
@@ -307,7 +506,11 @@ def resolve_fullname(
             return value
 
     # Try system full name
-    system_name = get_system_fullname(username_fallback)
+    service = _ACTIVE_IDENTITY_SERVICE.get()
+    if service is not None:
+        system_name = service.system_fullname(username_fallback)
+    else:
+        system_name = get_system_fullname(username_fallback)
     if system_name:
         return system_name
 
@@ -374,7 +577,8 @@ def resolve_email(
         return value
 
     # Synthesize email
-    hostname = get_hostname()
+    service = _ACTIVE_IDENTITY_SERVICE.get()
+    hostname = service.hostname() if service is not None else get_hostname()
     return f"{username}@{hostname}"
 
 
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
 import re
-from collections.abc import Callable, Mapping
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from types import MappingProxyType
-from typing import Any, TextIO
+from pathlib import Path
+from types import MappingProxyType, TracebackType
+from typing import Any, TextIO, TypeAlias
 
 from rich.console import Console
 from rich.text import Text
@@ -35,6 +39,12 @@ _LEVEL_STYLES: dict[str, str] = {
 
 _JSON_SEPARATORS = (",", ":")
 
+PayloadSource: TypeAlias = Mapping[str, Any] | Callable[[], Mapping[str, Any]]
+"""A payload mapping, or a callable building it only when the record is emitted."""
+
+RecordListener: TypeAlias = Callable[["StructuredLogRecord"], None]
+"""A callback receiving every record emitted by a logger, whatever its level."""
+
 REDACTED_PLACEHOLDER = "***REDACTED***"
 
 _SENSITIVE_KEYWORDS: tuple[str, ...] = (
@@ -127,8 +137,83 @@ class StructuredLogRecord:
         return data
 
 
+class Span:
+    """A timed, nestable section of work opened with :meth:`StructuredLogger.span`.
+
+    Attributes:
+        name: Span name, also used as the event name of its log record.
+        attributes: Extra key/value data attached to the span.
+        span_id: Identifier unique within the logger.
+        parent_id: Identifier of the enclosing span, if any.
+        duration_ms: Monotonic duration, available once the span has closed.
+    """
+
+    __slots__ = (
+        "_logger",
+        "name",
+        "attributes",
+        "span_id",
+        "parent_id",
+        "duration_ms",
+        "_started_ns",
+    )
+
+    def __init__(self, logger: StructuredLogger, name: str, attributes: dict[str, Any]) -> None:
+        self._logger = logger
+        self.name = name
+        self.attributes = attributes
+        self.span_id = 0
+        self.parent_id: int | None = None
+        self.duration_ms: float | None = None
+        self._started_ns = 0
+
+    def __enter__(self) -> Span:
+        self._logger._open_span(self)  # pylint: disable=protected-access
+        self._started_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        ended_ns = time.perf_counter_ns()
+        self.duration_ms = (ended_ns - self._started_ns) / 1_000_000
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._logger._close_span(  # pylint: disable=protected-access
+            self, self._started_ns, ended_ns
+        )
+
+
+class _NullSpan:
+    """Stand-in returned by :meth:`StructuredLogger.span` when nothing would record it."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
 class StructuredLogger:
-    """Emit structured log records to Rich or JSON sinks."""
+    """Emit structured log records to Rich or JSON sinks.
+
+    Args:
+        config: Logging configuration of the invocation.
+        console: Rich console for human-readable records (stderr by default).
+        json_stream: Stream for JSON records (the console's file by default).
+        clock: Timestamp source, overridable for tests.
+        json_dumps: JSON encoder for records.
+        json_buffer_size: Number of JSON records written per batch. Records at
+            ``ERROR`` and above, and :meth:`flush`, write the batch immediately.
+    """
 
     def __init__(
         self,
@@ -138,6 +223,7 @@ class StructuredLogger:
         json_stream: TextIO | None = None,
         clock: Callable[[], datetime] | None = None,
         json_dumps: Callable[[Mapping[str, Any]], str] | None = None,
+        json_buffer_size: int = 1,
     ) -> None:
         self._config = config
         self._console = console or Console(
@@ -155,13 +241,146 @@ class StructuredLogger:
         level_name = config.level.upper()
         self._threshold = _LEVEL_ORDER.get(level_name, _LEVEL_ORDER["INFO"])
         self._structured_logging_enabled = config.structured_logging_enabled
+        self._json_buffer_size = max(json_buffer_size, 1)
+        self._json_buffer: list[str] = []
+        self._span_stack: list[Span] = []
+        self._next_span_id = 1
+        self._trace_events: list[dict[str, Any]] | None = None
+        self._trace_origin_ns = 0
+        self._listeners: list[tuple[RecordListener, frozenset[str] | None, tuple[str, ...]]] = []
+        self._listen_to_all = False
+        self._listened_events: frozenset[str] = frozenset()
+        self._listened_prefixes: tuple[str, ...] = ()
+
+    def add_listener(
+        self, listener: RecordListener, *, events: Iterable[str] | None = None
+    ) -> None:
+        """Pass the records emitted from now on to ``listener``.
+
+        Listeners see records below the verbosity threshold and records that
+        reach no sink, so they can aggregate data (for example metrics) that
+        does not depend on how verbose the console output is.
+
+        ``events`` limits the listener to those event (and span) names; a name
+        ending in ``.`` matches every event it prefixes. Records no sink or
+        listener wants are still not built, so subscribe to as few events as
+        possible.
+        """
+
+        if events is None:
+            self._listeners.append((listener, None, ()))
+            self._listen_to_all = True
+            return
+        names = tuple(events)
+        exact = frozenset(name for name in names if not name.endswith("."))
+        prefixes = tuple(name for name in names if name.endswith("."))
+        self._listeners.append((listener, exact, prefixes))
+        self._listened_events |= exact
+        self._listened_prefixes += prefixes
+
+    def _listened(self, event: str) -> bool:
+        return (
+            self._listen_to_all
+            or event in self._listened_events
+            or event.startswith(self._listened_prefixes)
+        )
+
+    def span(self, name: str, **attributes: Any) -> Span | _NullSpan:
+        """Return a context manager timing ``name`` as a child of the enclosing span.
+
+        A closed span is emitted as a ``TRACE`` record named ``name`` carrying
+        its duration, identifiers, and ``attributes``, and is added to the
+        trace started by :meth:`start_trace`. When neither would record it, a
+        shared no-op context manager is returned instead.
+        """
+
+        if self._trace_events is None and not self.enabled("TRACE", name):
+            return _NULL_SPAN
+        return Span(self, name, attributes)
+
+    def start_trace(self) -> None:
+        """Start collecting closed spans for :meth:`export_trace`."""
+
+        self._trace_events = []
+        self._trace_origin_ns = time.perf_counter_ns()
+
+    def export_trace(self, path: Path) -> None:
+        """Write the collected spans to ``path`` as Chrome trace-event JSON.
+
+        The file loads in ``chrome://tracing``, Perfetto, and Speedscope.
+        """
+
+        document = {"traceEvents": self._trace_events or [], "displayTimeUnit": "ms"}
+        path.write_text(json.dumps(document, separators=_JSON_SEPARATORS), encoding="utf-8")
+
+    def _open_span(self, span: Span) -> None:
+        span.span_id = self._next_span_id
+        self._next_span_id += 1
+        span.parent_id = self._span_stack[-1].span_id if self._span_stack else None
+        self._span_stack.append(span)
+
+    def _close_span(self, span: Span, started_ns: int, ended_ns: int) -> None:
+        if span in self._span_stack:
+            del self._span_stack[self._span_stack.index(span) :]
+        if self._trace_events is not None:
+            self._trace_events.append(
+                {
+                    "name": span.name,
+                    "cat": "sqlitch",
+                    "ph": "X",
+                    "ts": (started_ns - self._trace_origin_ns) / 1000,
+                    "dur": (ended_ns - started_ns) / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        **_redact_payload(span.attributes),
+                    },
+                }
+            )
+        self.emit(
+            "TRACE",
+            span.name,
+            payload=lambda: {
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "duration_ms": round(span.duration_ms or 0.0, 3),
+                **span.attributes,
+            },
+        )
+
+    def enabled(self, level: str, event: str | None = None) -> bool:
+        """Return whether a record at ``level`` would reach a log sink.
+
+        Guard expensive payload construction in hot paths with this check, or
+        pass the payload as a callable, which is only invoked for such records.
+        When ``event`` is given, a listener subscribed to it also enables it.
+        """
+
+        severity = _LEVEL_ORDER.get(level.upper())
+        if severity is None:
+            raise ValueError(f"Unknown log level '{level}'")
+        if severity >= self._threshold and self._structured_logging_enabled:
+            return True
+        return event is not None and bool(self._listeners) and self._listened(event)
+
+    def flush(self) -> None:
+        """Write any buffered JSON records."""
+
+        if not self._json_buffer:
+            return
+        stream = self._json_stream if self._json_stream is not None else self._console.file
+        lines, self._json_buffer = self._json_buffer, []
+        stream.write("".join(lines))
+        stream.flush()
 
     def trace(
         self,
         event: str,
         message: str | None = None,
         *,
-        payload: Mapping[str, Any] | None = None,
+        payload: PayloadSource | None = None,
         **extra: Any,
     ) -> StructuredLogRecord | None:
         return self.emit("TRACE", event, message, payload=payload, **extra)
@@ -171,7 +390,7 @@ class StructuredLogger:
         event: str,
         message: str | None = None,
         *,
-        payload: Mapping[str, Any] | None = None,
+        payload: PayloadSource | None = None,
         **extra: Any,
     ) -> StructuredLogRecord | None:
         return self.emit("DEBUG", event, message, payload=payload, **extra)
@@ -181,7 +400,7 @@ class StructuredLogger:
         event: str,
         message: str | None = None,
         *,
-        payload: Mapping[str, Any] | None = None,
+        payload: PayloadSource | None = None,
         **extra: Any,
     ) -> StructuredLogRecord | None:
         return self.emit("INFO", event, message, payload=payload, **extra)
@@ -191,7 +410,7 @@ class StructuredLogger:
         event: str,
         message: str | None = None,
         *,
-        payload: Mapping[str, Any] | None = None,
+        payload: PayloadSource | None = None,
         **extra: Any,
     ) -> StructuredLogRecord | None:
         return self.emit("WARNING", event, message, payload=payload, **extra)
@@ -201,7 +420,7 @@ class StructuredLogger:
         event: str,
         message: str | None = None,
         *,
-        payload: Mapping[str, Any] | None = None,
+        payload: PayloadSource | None = None,
         **extra: Any,
     ) -> StructuredLogRecord | None:
         return self.emit("ERROR", event, message, payload=payload, **extra)
@@ -211,7 +430,7 @@ class StructuredLogger:
         event: str,
         message: str | None = None,
         *,
-        payload: Mapping[str, Any] | None = None,
+        payload: PayloadSource | None = None,
         **extra: Any,
     ) -> StructuredLogRecord | None:
         return self.emit("CRITICAL", event, message, payload=payload, **extra)
@@ -222,17 +441,28 @@ class StructuredLogger:
         event: str,
         message: str | None = None,
         *,
-        payload: Mapping[str, Any] | None = None,
+        payload: PayloadSource | None = None,
         **extra: Any,
     ) -> StructuredLogRecord | None:
-        """Emit a structured log record when severity meets configured threshold."""
+        """Emit a structured log record when severity meets configured threshold.
+
+        A callable ``payload`` is only invoked when the record reaches a sink
+        or a listener subscribed to ``event``; otherwise nothing is built and
+        ``None`` is returned.
+        """
 
         level_name = level.upper()
         severity = _LEVEL_ORDER.get(level_name)
         if severity is None:
             raise ValueError(f"Unknown log level '{level}'")
-        if severity < self._threshold:
+        below_threshold = severity < self._threshold
+        listened = bool(self._listeners) and self._listened(event)
+        if below_threshold and not listened:
             return None
+        if callable(payload):
+            if not self._structured_logging_enabled and not listened:
+                return None
+            payload = payload()
 
         combined_payload: dict[str, Any] = {}
         if payload:
@@ -252,6 +482,12 @@ class StructuredLogger:
             payload=MappingProxyType(combined_payload),
         )
 
+        if listened:
+            for listener, exact, prefixes in self._listeners:
+                if exact is None or event in exact or event.startswith(prefixes):
+                    listener(record)
+        if below_threshold:
+            return None
         if not self._structured_logging_enabled:
             return record
 
@@ -267,10 +503,12 @@ class StructuredLogger:
         self._console.print(text)
 
     def _emit_json(self, record: StructuredLogRecord) -> None:
-        stream = self._json_stream if self._json_stream is not None else self._console.file
-        payload = self._json_dumps(record.to_dict())
-        stream.write(f"{payload}\n")
-        stream.flush()
+        self._json_buffer.append(f"{self._json_dumps(record.to_dict())}\n")
+        if (
+            len(self._json_buffer) >= self._json_buffer_size
+            or _LEVEL_ORDER[record.level] >= _LEVEL_ORDER["ERROR"]
+        ):
+            self.flush()
 
     @staticmethod
     def _format_text(record: StructuredLogRecord) -> Text:
@@ -300,13 +538,23 @@ def create_logger(
     console: Console | None = None,
     json_stream: TextIO | None = None,
     clock: Callable[[], datetime] | None = None,
+    json_buffer_size: int = 1,
 ) -> StructuredLogger:
     """Convenience helper that instantiates :class:`StructuredLogger`."""
 
-    return StructuredLogger(config, console=console, json_stream=json_stream, clock=clock)
+    return StructuredLogger(
+        config,
+        console=console,
+        json_stream=json_stream,
+        clock=clock,
+        json_buffer_size=json_buffer_size,
+    )
 
 
 __all__ = [
+    "PayloadSource",
+    "RecordListener",
+    "Span",
     "StructuredLogRecord",
     "StructuredLogger",
     "create_logger",
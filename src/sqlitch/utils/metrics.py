@@ -0,0 +1,232 @@
+"""OpenMetrics export behind the global ``--metrics-file`` option.
+
+:class:`MetricsCollector` listens to the records of a
+:class:`~sqlitch.utils.logging.StructuredLogger` and aggregates them into the
+metrics of one run. It reads the same records the log sinks receive, so the
+numbers do not depend on the verbosity and no log output is parsed:
+
+* ``<command>.change.success``, ``.change.error``, and ``.change.skip``
+  records count processed changes.
+* ``<command>.apply`` spans time individual changes.
+* Spans named ``<command>.registry.*``, ``<command>.plan.parse``, and
+  ``<command>.lock.wait`` time registry bookkeeping, plan parsing, and waiting
+  for the deploy lock.
+* ``command.complete`` reports whether the run succeeded.
+
+The file is written in the OpenMetrics text format, which the node exporter
+textfile collector reads, and it is replaced atomically so a scrape never
+sees a partial file.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from .logging import StructuredLogRecord
+
+__all__ = [
+    "CHANGE_DURATION_BUCKETS",
+    "METRICS_COMMANDS",
+    "MetricsCollector",
+]
+
+METRICS_COMMANDS: tuple[str, ...] = ("deploy", "revert", "verify", "status")
+"""Commands whose runs ``--metrics-file`` can export."""
+
+CHANGE_DURATION_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+"""Upper bounds, in seconds, of the per-change duration histogram buckets."""
+
+_CHANGE_RESULTS = {"success": "success", "error": "failure", "skip": "skipped"}
+
+
+class MetricsCollector:
+    """Aggregate the metrics of one ``command`` run from structured log records.
+
+    Register an instance with
+    :meth:`~sqlitch.utils.logging.StructuredLogger.add_listener`, passing
+    :attr:`events` so no other record is built for it, before the command runs
+    and call :meth:`write` once it has finished.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        *,
+        buckets: Sequence[float] = CHANGE_DURATION_BUCKETS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.command = command
+        self.buckets = tuple(sorted(buckets))
+        self.changes = {result: 0 for result in _CHANGE_RESULTS.values()}
+        self.change_durations: list[float] = []
+        self.registry_seconds = 0.0
+        self.plan_parse_seconds = 0.0
+        self.lock_wait_seconds = 0.0
+        self.plan_changes: dict[str, int] = {}
+        self.succeeded = False
+        self._clock = clock
+        self._started = time.perf_counter()
+        self._prefix = f"{command}."
+        self.events: tuple[str, ...] = (
+            "command.complete",
+            f"{command}.complete",
+            f"{command}.change.",
+            f"{command}.apply",
+            f"{command}.registry.",
+            f"{command}.plan.parse",
+            f"{command}.lock.wait",
+        )
+        """Event and span names the collector reads; names ending in ``.`` are prefixes."""
+
+    def __call__(self, record: StructuredLogRecord) -> None:
+        event = record.event
+        if event == "command.complete":
+            self.succeeded = record.payload.get("exit_code") == 0
+            return
+        if not event.startswith(self._prefix):
+            return
+
+        payload = record.payload
+        if "span_id" in payload and "duration_ms" in payload:
+            self._observe_span(event, payload)
+            return
+
+        _, _, outcome = event.rpartition(".change.")
+        if outcome in _CHANGE_RESULTS:
+            self.changes[_CHANGE_RESULTS[outcome]] += 1
+        elif event == f"{self.command}.complete":
+            for state in ("deployed", "pending"):
+                count = payload.get(state)
+                if isinstance(count, int):
+                    self.plan_changes[state] = count
+
+    def _observe_span(self, event: str, payload: Mapping[str, Any]) -> None:
+        seconds = float(payload["duration_ms"]) / 1000
+        if "change" in payload:
+            self.change_durations.append(seconds)
+        elif ".registry." in event:
+            self.registry_seconds += seconds
+        elif event.endswith(".plan.parse"):
+            self.plan_parse_seconds += seconds
+        elif event.endswith(".lock.wait"):
+            self.lock_wait_seconds += seconds
+
+    def render(self) -> str:
+        """Return the collected metrics in the OpenMetrics text format."""
+
+        command = _labels(command=self.command)
+        lines: list[str] = []
+
+        def _gauge(name: str, help_text: str, samples: Sequence[tuple[str, float]]) -> None:
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"# HELP {name} {help_text}")
+            lines.extend(f"{name}{labels} {_number(value)}" for labels, value in samples)
+
+        _gauge(
+            "sqlitch_run_success",
+            "Whether the last run succeeded (1) or failed (0).",
+            [(command, int(self.succeeded))],
+        )
+        _gauge(
+            "sqlitch_run_timestamp_seconds",
+            "Unix time at which the last run finished.",
+            [(command, self._clock())],
+        )
+        _gauge(
+            "sqlitch_run_duration_seconds",
+            "Wall time of the last run.",
+            [(command, time.perf_counter() - self._started)],
+        )
+        _gauge(
+            "sqlitch_changes",
+            "Changes processed by the last run, by result.",
+            [
+                (_labels(command=self.command, result=result), count)
+                for result, count in self.changes.items()
+            ],
+        )
+        _gauge(
+            "sqlitch_registry_duration_seconds",
+            "Time the last run spent reading and writing the registry.",
+            [(command, self.registry_seconds)],
+        )
+        _gauge(
+            "sqlitch_plan_parse_duration_seconds",
+            "Time the last run spent parsing the plan.",
+            [(command, self.plan_parse_seconds)],
+        )
+        _gauge(
+            "sqlitch_lock_wait_duration_seconds",
+            "Time the last run spent waiting for the deploy lock.",
+            [(command, self.lock_wait_seconds)],
+        )
+        if self.plan_changes:
+            _gauge(
+                "sqlitch_plan_changes",
+                "Plan changes by deployment state, as reported by the last run.",
+                [
+                    (_labels(command=self.command, state=state), count)
+                    for state, count in sorted(self.plan_changes.items())
+                ],
+            )
+
+        name = "sqlitch_change_duration_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        lines.append(f"# HELP {name} Time taken by each change of the last run.")
+        for bound in (*self.buckets, float("inf")):
+            count = sum(1 for value in self.change_durations if value <= bound)
+            le = "+Inf" if bound == float("inf") else repr(float(bound))
+            lines.append(f"{name}_bucket{_labels(command=self.command, le=le)} {count}")
+        lines.append(f"{name}_count{command} {len(self.change_durations)}")
+        lines.append(f"{name}_sum{command} {_number(sum(self.change_durations))}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Atomically replace ``path`` with the rendered metrics."""
+
+        content = self.render()
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(content)
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+
+def _labels(**labels: str) -> str:
+    rendered = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f"{{{rendered}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(round(value, 6))
@@ -0,0 +1,157 @@
+"""Profilers behind the global ``--profile`` option.
+
+:class:`DeterministicProfiler` wraps :mod:`cProfile` and writes a ``.pstats``
+file that loads in ``pstats``, SnakeViz, or ``gprof2dot``. Every call is
+instrumented, so it can slow a long deploy down noticeably.
+
+:class:`SamplingProfiler` instead captures the stack of the profiled thread
+every ``interval`` seconds from a background thread. The overhead is
+independent of how many calls the command makes. Samples are written as
+collapsed stacks (``frame;frame;frame count`` per line), the input format of
+flame graph tools such as ``flamegraph.pl`` and Speedscope.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Protocol
+
+__all__ = [
+    "DEFAULT_PROFILE_TOP",
+    "DEFAULT_SAMPLING_INTERVAL",
+    "PROFILE_MODES",
+    "DeterministicProfiler",
+    "Profiler",
+    "SamplingProfiler",
+    "create_profiler",
+]
+
+PROFILE_MODES: tuple[str, ...] = ("deterministic", "sampling")
+DEFAULT_PROFILE_TOP = 25
+DEFAULT_SAMPLING_INTERVAL = 0.005
+
+
+class Profiler(Protocol):
+    """Common interface of the ``--profile`` profilers."""
+
+    def start(self) -> None:
+        """Start profiling the calling thread."""
+
+    def stop(self) -> None:
+        """Stop profiling; calling it again is a no-op."""
+
+    def write(self, path: Path) -> None:
+        """Write the collected profile to ``path``."""
+
+    def summary(self, top: int) -> str:
+        """Return a text table of the ``top`` functions by cumulative cost."""
+
+
+class DeterministicProfiler:
+    """Profile every call with :mod:`cProfile`."""
+
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+        self._running = False
+
+    def start(self) -> None:
+        self._profile.enable()
+        self._running = True
+
+    def stop(self) -> None:
+        if self._running:
+            self._profile.disable()
+            self._running = False
+
+    def write(self, path: Path) -> None:
+        self._profile.dump_stats(path)
+
+    def summary(self, top: int) -> str:
+        buffer = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=buffer)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        return buffer.getvalue().rstrip()
+
+
+class SamplingProfiler:
+    """Sample the stack of the starting thread at a fixed interval."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL) -> None:
+        self.interval = interval
+        self._stacks: Counter[tuple[str, ...]] = Counter()
+        self._samples = 0
+        self._target: int | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._target = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sqlitch-sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def write(self, path: Path) -> None:
+        lines = [f"{';'.join(stack)} {count}" for stack, count in self._stacks.most_common()]
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+    def summary(self, top: int) -> str:
+        inclusive: Counter[str] = Counter()
+        for stack, count in self._stacks.items():
+            # Count each function once per sample, however deep its recursion.
+            for frame in set(stack):
+                inclusive[frame] += count
+
+        total = max(self._samples, 1)
+        lines = [
+            f"{self._samples} samples every {self.interval * 1000:g} ms",
+            f"{'samples':>8} {'cumul%':>7}  function",
+        ]
+        for frame, count in inclusive.most_common(top):
+            lines.append(f"{count:>8} {count / total:>7.1%}  {frame}")
+        return "\n".join(lines)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._target or 0)  # pylint: disable=protected-access
+            if frame is None:
+                continue
+            self._stacks[_collapse(frame)] += 1
+            self._samples += 1
+
+
+def _collapse(frame: FrameType | None) -> tuple[str, ...]:
+    names: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    names.reverse()
+    return tuple(names)
+
+
+def create_profiler(
+    mode: str, *, interval: float = DEFAULT_SAMPLING_INTERVAL
+) -> DeterministicProfiler | SamplingProfiler:
+    """Return a profiler for ``mode``, one of :data:`PROFILE_MODES`."""
+
+    if mode == "deterministic":
+        return DeterministicProfiler()
+    if mode == "sampling":
+        return SamplingProfiler(interval)
+    raise ValueError(f"Unknown profile mode '{mode}'; expected one of {', '.join(PROFILE_MODES)}")
@@ -0,0 +1,134 @@
+"""Functional tests for incremental ``sqlitch bundle`` runs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.commands import CommandError
+from sqlitch.cli.commands import bundle as bundle_module
+from sqlitch.cli.main import main
+from sqlitch.engine.sqlite import compute_script_hash
+from sqlitch.utils.bundle import MANIFEST_NAME, ManifestEntry
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    project_dir = tmp_path / "widgets"
+    project_dir.mkdir()
+    (project_dir / "sqitch.plan").write_text("%project=widgets\n", encoding="utf-8")
+    for directory in ("deploy", "revert", "verify"):
+        (project_dir / directory / "nested").mkdir(parents=True)
+        (project_dir / directory / "widgets.sql").write_text(
+            f"-- {directory} widgets\n", encoding="utf-8"
+        )
+        (project_dir / directory / "nested" / "parts.sql").write_text(
+            f"-- {directory} parts\n", encoding="utf-8"
+        )
+    monkeypatch.chdir(project_dir)
+    return project_dir
+
+
+def _bundle(*args: str) -> str:
+    result = CliRunner().invoke(main, ["bundle", *args])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_bundle_writes_manifest_with_script_hashes(project: Path) -> None:
+    _bundle()
+
+    document = json.loads((project / "bundle" / MANIFEST_NAME).read_text(encoding="utf-8"))
+    files = {entry["path"]: entry for entry in document["files"]}
+    assert sorted(files) == [
+        "deploy/nested/parts.sql",
+        "deploy/widgets.sql",
+        "revert/nested/parts.sql",
+        "revert/widgets.sql",
+        "sqitch.plan",
+        "verify/nested/parts.sql",
+        "verify/widgets.sql",
+    ]
+    assert files["deploy/widgets.sql"]["sha1"] == compute_script_hash("-- deploy widgets\n")
+    assert files["deploy/widgets.sql"]["size"] == len("-- deploy widgets\n")
+
+
+def test_rebundle_copies_only_changed_files_and_removes_stale_ones(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _bundle()
+    (project / "deploy" / "widgets.sql").write_text("-- deploy widgets v2\n", encoding="utf-8")
+    (project / "revert" / "nested" / "parts.sql").unlink()
+    (project / "revert" / "nested").rmdir()
+    (project / "verify" / "gadgets.sql").write_text("-- verify gadgets\n", encoding="utf-8")
+
+    copied: list[Path] = []
+    original_copy_file = bundle_module._copy_file
+
+    def _recording_copy_file(source: Path, destination: Path) -> None:
+        copied.append(destination)
+        original_copy_file(source, destination)
+
+    monkeypatch.setattr(bundle_module, "_copy_file", _recording_copy_file)
+
+    output = _bundle("-v")
+
+    bundle_root = project / "bundle"
+    assert sorted(path.relative_to(bundle_root).as_posix() for path in copied) == [
+        "deploy/widgets.sql",
+        "verify/gadgets.sql",
+    ]
+    assert "2 copied, 5 unchanged, 1 removed" in output
+    assert (bundle_root / "deploy" / "widgets.sql").read_text() == "-- deploy widgets v2\n"
+    assert not (bundle_root / "revert" / "nested").exists()
+    assert (bundle_root / "revert" / "widgets.sql").exists()
+
+
+def test_rebundle_restores_files_deleted_from_the_bundle(project: Path) -> None:
+    _bundle()
+    (project / "bundle" / "deploy" / "widgets.sql").unlink()
+
+    _bundle()
+
+    assert (project / "bundle" / "deploy" / "widgets.sql").read_text() == "-- deploy widgets\n"
+
+
+def test_rebundle_keeps_files_the_manifest_does_not_track(project: Path) -> None:
+    (project / "bundle").mkdir()
+    (project / "bundle" / "README").write_text("keep me\n", encoding="utf-8")
+
+    _bundle()
+    _bundle()
+
+    assert (project / "bundle" / "README").read_text() == "keep me\n"
+
+
+def test_rebundle_ignores_manifest_entries_outside_the_bundle(project: Path) -> None:
+    _bundle()
+    outside = project / "outside.sql"
+    outside.write_text("-- keep\n", encoding="utf-8")
+    manifest_path = project / "bundle" / MANIFEST_NAME
+    document = json.loads(manifest_path.read_text(encoding="utf-8"))
+    document["files"].append({"path": "../outside.sql", "sha1": "0" * 40, "size": 8})
+    manifest_path.write_text(json.dumps(document), encoding="utf-8")
+
+    _bundle()
+
+    assert outside.read_text(encoding="utf-8") == "-- keep\n"
+
+
+def test_remove_stale_refuses_paths_resolving_outside_the_bundle(tmp_path: Path) -> None:
+    destination = tmp_path / "bundle"
+    destination.mkdir()
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "users.sql").write_text("-- keep\n", encoding="utf-8")
+    (destination / "deploy").symlink_to(elsewhere, target_is_directory=True)
+
+    with pytest.raises(CommandError, match="resolves outside"):
+        bundle_module._remove_stale((ManifestEntry("deploy/users.sql", "0" * 40, 8),), destination)
+
+    assert (elsewhere / "users.sql").exists()
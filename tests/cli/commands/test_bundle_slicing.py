@@ -0,0 +1,158 @@
+"""Functional tests for ``sqlitch bundle --from/--to``."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+from sqlitch.utils.bundle import MANIFEST_NAME
+
+_HEADER = """%syntax-version=1.0.0
+%project=slices
+
+"""
+
+_ENTRIES = (
+    "schema 2025-01-01T00:00:00Z Alice <alice@example.com> # Schema",
+    "items [schema] 2025-01-02T00:00:00Z Alice <alice@example.com> # Items",
+    "@v1 2025-01-03T00:00:00Z Alice <alice@example.com> # Tag v1",
+    "users [schema] 2025-01-04T00:00:00Z Alice <alice@example.com> # Users",
+    "items [items@v1] 2025-01-05T00:00:00Z Alice <alice@example.com> # Rework items",
+    "@v2 2025-01-06T00:00:00Z Alice <alice@example.com> # Tag v2",
+    "audit 2025-01-07T00:00:00Z Alice <alice@example.com> # Audit",
+)
+
+_CONFIG = """[core]
+\tengine = sqlite
+
+[user]
+\tname = Alice
+\temail = alice@example.com
+"""
+
+_SCRIPTS = ("schema", "items", "items@v1", "users", "audit")
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    scripts = {
+        f"{directory}/{name}.sql": (
+            f"CREATE TABLE {name.replace('@', '_')} (id INTEGER);\n"
+            if directory == "deploy"
+            else "-- noop\n"
+        )
+        for directory in ("deploy", "revert", "verify")
+        for name in _SCRIPTS
+    }
+    return make_project("slices", _HEADER + "\n".join(_ENTRIES) + "\n", scripts, config=_CONFIG)
+
+
+def _bundle(*args: str) -> str:
+    result = CliRunner().invoke(main, ["bundle", *args])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def _manifest_paths(bundle_root: Path) -> list[str]:
+    document = json.loads((bundle_root / MANIFEST_NAME).read_text(encoding="utf-8"))
+    return sorted(entry["path"] for entry in document["files"])
+
+
+def test_range_bundles_truncated_plan_and_reworked_scripts(project: Path) -> None:
+    _bundle("--from", "users", "--to", "@v2")
+
+    bundle_root = project / "bundle"
+    assert (bundle_root / "sqitch.plan").read_text() == _HEADER + "\n".join(_ENTRIES[:6]) + "\n"
+    assert _manifest_paths(bundle_root) == [
+        "deploy/items@v1.sql",
+        "deploy/users.sql",
+        "revert/items@v1.sql",
+        "revert/users.sql",
+        "sqitch.plan",
+        "verify/items@v1.sql",
+        "verify/users.sql",
+    ]
+    assert not (bundle_root / "deploy" / "items.sql").exists()
+    assert (project / "sqitch.plan").read_text() == _HEADER + "\n".join(_ENTRIES) + "\n"
+
+
+def test_rebundling_a_narrower_range_removes_scripts_outside_it(project: Path) -> None:
+    _bundle()
+    _bundle("--from", "@HEAD")
+
+    bundle_root = project / "bundle"
+    assert _manifest_paths(bundle_root) == [
+        "deploy/audit.sql",
+        "revert/audit.sql",
+        "sqitch.plan",
+        "verify/audit.sql",
+    ]
+    assert not (bundle_root / "deploy" / "schema.sql").exists()
+    assert (bundle_root / "sqitch.plan").read_text() == _HEADER + "\n".join(_ENTRIES) + "\n"
+
+
+def test_sliced_archive_deploys(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _bundle("--to", "@v1", "--archive", "release.zip")
+
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    (target_dir / "sqitch.conf").write_text(_CONFIG)
+    monkeypatch.chdir(target_dir)
+    result = CliRunner().invoke(
+        main, ["deploy", "--bundle", str(project / "release.zip"), "db:sqlite:test.db"]
+    )
+    assert result.exit_code == 0, result.output
+
+    connection = sqlite3.connect(target_dir / "test.db")
+    try:
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    finally:
+        connection.close()
+    assert tables == {"schema", "items"}
+
+
+def test_consecutive_slices_deploy_like_the_full_plan(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _bundle("--to", "@v1", "--archive", "first.zip")
+    _bundle("--from", "users", "--archive", "second.zip")
+    _bundle("--archive", "full.zip")
+
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    (target_dir / "sqitch.conf").write_text(_CONFIG)
+    monkeypatch.chdir(target_dir)
+    outputs = []
+    for name in ("first.zip", "second.zip", "full.zip"):
+        result = CliRunner().invoke(
+            main, ["deploy", "--bundle", str(project / name), "db:sqlite:test.db"]
+        )
+        assert result.exit_code == 0, result.output
+        outputs.append(result.output)
+
+    assert "+ users" in outputs[1]
+    assert "+ schema" not in outputs[1]
+    assert "Nothing to deploy (up-to-date)." in outputs[2]
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (("--from", "audit", "--to", "schema"), "Change 'audit' comes after 'schema'"),
+        (("--to", "missing"), "Plan does not contain change 'missing'."),
+    ],
+)
+def test_invalid_range_is_rejected(project: Path, args: tuple[str, ...], message: str) -> None:
+    result = CliRunner().invoke(main, ["bundle", *args])
+
+    assert result.exit_code != 0
+    assert message in result.output
+    assert not (project / "bundle").exists()
@@ -0,0 +1,171 @@
+"""Functional tests for ``sqlitch checkout BRANCH`` against a local git repository."""
+
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import subprocess  # nosec B404
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+_HEADER = """%syntax-version=1.0.0
+%project=checkout_test
+
+users 2025-01-01T12:00:00Z Alice <alice@example.com> # Users
+"""
+
+_CONFIG = """[core]
+\tengine = sqlite
+
+[user]
+\tname = Alice
+\temail = alice@example.com
+"""
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)  # nosec
+
+
+def _write_change(repo: Path, name: str) -> None:
+    (repo / "deploy" / f"{name}.sql").write_text(f"CREATE TABLE {name} (id INTEGER);\n")
+    (repo / "revert" / f"{name}.sql").write_text(f"DROP TABLE {name};\n")
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a repo whose ``main`` and ``feature`` branches diverge after ``users``."""
+
+    for variable, value in {
+        "GIT_AUTHOR_NAME": "Alice",
+        "GIT_AUTHOR_EMAIL": "alice@example.com",
+        "GIT_COMMITTER_NAME": "Alice",
+        "GIT_COMMITTER_EMAIL": "alice@example.com",
+    }.items():
+        monkeypatch.setenv(variable, value)
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    (repo / "sqitch.conf").write_text(_CONFIG)
+    (repo / "deploy").mkdir()
+    (repo / "revert").mkdir()
+    _write_change(repo, "users")
+    _write_change(repo, "posts")
+    (repo / "sqitch.plan").write_text(
+        _HEADER + "posts [users] 2025-01-02T12:00:00Z Alice <alice@example.com> # Posts\n"
+    )
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "main")
+
+    _git(repo, "checkout", "-q", "-b", "feature")
+    _write_change(repo, "articles")
+    (repo / "sqitch.plan").write_text(
+        _HEADER + "articles [users] 2025-01-03T12:00:00Z Alice <alice@example.com> # Articles\n"
+    )
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "feature")
+    _git(repo, "checkout", "-q", "main")
+
+    monkeypatch.chdir(repo)
+    return repo
+
+
+def _deploy(target: str) -> None:
+    result = CliRunner().invoke(main, ["deploy", target])
+    assert result.exit_code == 0, result.output
+
+
+def test_checkout_only_touches_divergent_changes(repo: Path, tmp_path: Path) -> None:
+    target = f"db:sqlite:{tmp_path / 'test.db'}"
+    _deploy(target)
+
+    result = CliRunner().invoke(main, ["checkout", "--target", target, "feature"])
+
+    assert result.exit_code == 0, result.output
+    assert "Last change before the branches diverged: users" in result.output
+    assert "  - posts .. ok" in result.output
+    assert "  + articles" in result.output
+    assert "users .. ok" not in result.output
+    assert (repo / "deploy" / "articles.sql").exists()
+
+    connection = sqlite3.connect(tmp_path / "sqitch.db")
+    try:
+        events = connection.execute('SELECT event, "change" FROM events ORDER BY rowid').fetchall()
+    finally:
+        connection.close()
+    assert events == [
+        ("deploy", "users"),
+        ("deploy", "posts"),
+        ("revert", "posts"),
+        ("deploy", "articles"),
+    ]
+
+
+def test_checkout_log_only_describes_the_diff(repo: Path, tmp_path: Path) -> None:
+    target = f"db:sqlite:{tmp_path / 'test.db'}"
+    _deploy(target)
+
+    result = CliRunner().invoke(main, ["checkout", "--log-only", "--target", target, "feature"])
+
+    assert result.exit_code == 0, result.output
+    assert "Would revert change posts" in result.output
+    assert "Would run VCS command: git checkout feature" in result.output
+    assert "Would deploy change articles" in result.output
+    assert "Would revert change users" not in result.output
+    assert not (repo / "deploy" / "articles.sql").exists()
+
+
+def test_checkout_reports_unknown_branch(repo: Path, tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        main, ["checkout", "--target", f"db:sqlite:{tmp_path / 'test.db'}", "missing"]
+    )
+
+    assert result.exit_code != 0
+    assert "git show missing:./sqitch.plan failed" in result.output
+
+
+def test_checkout_resolves_to_change_against_the_branch_plan(repo: Path, tmp_path: Path) -> None:
+    target = f"db:sqlite:{tmp_path / 'test.db'}"
+    _deploy(target)
+    args = ["checkout", "--target", target, "--to-change"]
+
+    preview = CliRunner().invoke(main, [*args, "users", "--log-only", "feature"])
+    missing = CliRunner().invoke(main, [*args, "posts", "feature"])
+
+    assert preview.exit_code == 0, preview.output
+    assert "Would revert change posts" in preview.output
+    assert "Would deploy change articles" not in preview.output
+    assert missing.exit_code != 0
+    assert "Plan on branch 'feature' does not contain change 'posts'." in missing.output
+    # The reference is checked before anything is reverted or checked out.
+    assert not (repo / "deploy" / "articles.sql").exists()
+    connection = sqlite3.connect(tmp_path / "sqitch.db")
+    try:
+        events = connection.execute('SELECT event, "change" FROM events ORDER BY rowid').fetchall()
+    finally:
+        connection.close()
+    assert events == [("deploy", "users"), ("deploy", "posts")]
+
+
+def test_checkout_rejects_mode_with_branch(repo: Path, tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        main,
+        [
+            "checkout",
+            "--target",
+            f"db:sqlite:{tmp_path / 'test.db'}",
+            "--mode",
+            "tag:v1",
+            "feature",
+        ],
+    )
+
+    assert result.exit_code != 0
+    assert "--mode cannot be combined with BRANCH" in result.output
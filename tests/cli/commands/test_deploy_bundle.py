@@ -0,0 +1,161 @@
+"""Functional tests for ``sqlitch bundle --archive`` and ``deploy --bundle``."""
+
+from __future__ import annotations
+
+import sqlite3
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+from sqlitch.utils.bundle import BundleArchive, build_manifest, write_archive
+
+_PLAN = """%syntax-version=1.0.0
+%project=archive_test
+
+items 2025-01-01T12:00:00Z Alice <alice@example.com> # Items
+@v1 2025-01-02T12:00:00Z Alice <alice@example.com> # Tag v1
+items [items@v1] 2025-01-03T12:00:00Z Alice <alice@example.com> # Add names
+"""
+
+_CONFIG = """[core]
+\tengine = sqlite
+
+[user]
+\tname = Alice
+\temail = alice@example.com
+"""
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    return make_project(
+        "archive_test",
+        _PLAN,
+        {
+            "deploy/items.sql": "CREATE TABLE items (id INTEGER);\n",
+            "deploy/items@v1.sql": "ALTER TABLE items ADD COLUMN name TEXT;\n",
+        },
+        config=_CONFIG,
+    )
+
+
+def _invoke(*args: str) -> str:
+    result = CliRunner().invoke(main, list(args))
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def _deploy_target(tmp_path: Path, archive: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Return a directory holding only the configuration, next to ``archive``."""
+
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    (target_dir / "sqitch.conf").write_text(_CONFIG)
+    monkeypatch.chdir(target_dir)
+    return target_dir
+
+
+@pytest.mark.parametrize("name", ["release.tar.gz", "release.zip"])
+def test_deploy_reads_reworked_scripts_from_archive(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str
+) -> None:
+    output = _invoke("bundle", "--archive", name)
+    archive = project / name
+    assert f"Bundled project to {name}" in output
+    assert not (project / "bundle").exists()
+
+    target_dir = _deploy_target(tmp_path, archive, monkeypatch)
+    _invoke("deploy", "--bundle", str(archive), "db:sqlite:test.db")
+
+    connection = sqlite3.connect(target_dir / "test.db")
+    try:
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(items)")]
+    finally:
+        connection.close()
+    assert columns == ["id", "name"]
+    assert sorted(path.name for path in target_dir.iterdir()) == [
+        "sqitch.conf",
+        "sqitch.db",
+        "test.db",
+    ]
+
+
+def test_deploy_rejects_tampered_archive_member(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _invoke("bundle", "--archive", "release.zip")
+    original = project / "release.zip"
+    tampered = tmp_path / "tampered.zip"
+    with zipfile.ZipFile(original) as source, zipfile.ZipFile(tampered, "w") as target:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == "deploy/items@v1.sql":
+                data = b"DROP TABLE items;\n"
+            target.writestr(info, data)
+
+    _deploy_target(tmp_path, tampered, monkeypatch)
+    result = CliRunner().invoke(main, ["deploy", "--bundle", str(tampered), "db:sqlite:test.db"])
+
+    assert result.exit_code != 0
+    assert "deploy/items@v1.sql" in result.output
+    assert "does not match its manifest" in result.output
+
+
+def test_bundle_archive_rejects_destination_and_unknown_suffix(project: Path) -> None:
+    runner = CliRunner()
+
+    combined = runner.invoke(main, ["bundle", "--archive", "out.zip", "--dest", "out"])
+    assert combined.exit_code != 0
+    assert "--archive cannot be combined with a destination directory." in combined.output
+
+    unknown = runner.invoke(main, ["bundle", "--archive", "out.rar"])
+    assert unknown.exit_code != 0
+    assert "out.rar" in unknown.output
+
+
+def test_deploy_bundle_rejects_plan_file(project: Path) -> None:
+    _invoke("bundle", "--archive", "release.zip")
+
+    result = CliRunner().invoke(
+        main, ["--plan-file", "sqitch.plan", "deploy", "--bundle", "release.zip"]
+    )
+
+    assert result.exit_code != 0
+    assert "--bundle cannot be combined with --plan-file." in result.output
+
+
+def test_deploy_reads_the_bundled_plan_once(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _invoke("bundle", "--archive", "release.zip")
+    archive = project / "release.zip"
+    reads: list[str] = []
+    original_read_text = BundleArchive.read_text
+
+    def _recording_read_text(self: BundleArchive, path: Path) -> str:
+        reads.append(path.name)
+        return original_read_text(self, path)
+
+    monkeypatch.setattr(BundleArchive, "read_text", _recording_read_text)
+    _deploy_target(tmp_path, archive, monkeypatch)
+    _invoke("deploy", "--bundle", str(archive), "db:sqlite:test.db")
+
+    assert reads.count("sqitch.plan") == 1
+
+
+def test_deploy_rejects_archive_without_plan(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest = build_manifest({"deploy/items.sql": project / "deploy" / "items.sql"})
+    archive = tmp_path / "noplan.zip"
+    write_archive(archive, {"deploy/items.sql": project / "deploy" / "items.sql"}, manifest)
+
+    _deploy_target(tmp_path, archive, monkeypatch)
+    result = CliRunner().invoke(main, ["deploy", "--bundle", str(archive), "db:sqlite:test.db"])
+
+    assert result.exit_code != 0
+    assert "contains no plan file" in result.output
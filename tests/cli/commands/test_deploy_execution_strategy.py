@@ -0,0 +1,91 @@
+"""Functional tests for ``sqlitch deploy --execution-strategy``."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+
+_PLAN = """%syntax-version=1.0.0
+%project=strategy_test
+
+items 2025-01-01T12:00:00Z Alice <alice@example.com> # Items
+broken [items] 2025-01-02T12:00:00Z Alice <alice@example.com> # Broken
+"""
+
+_CONFIG = """[core]
+\tengine = sqlite
+
+[user]
+\tname = Alice
+\temail = alice@example.com
+"""
+
+_ITEMS = "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT);\n" + "".join(
+    f"INSERT INTO items (id, name) VALUES ({index}, 'item {index}');\n" for index in range(50)
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    project_dir = tmp_path / "strategy_test"
+    project_dir.mkdir()
+    (project_dir / "sqitch.plan").write_text(_PLAN)
+    (project_dir / "sqitch.conf").write_text(_CONFIG)
+    (project_dir / "deploy").mkdir()
+    (project_dir / "deploy" / "items.sql").write_text(_ITEMS)
+    (project_dir / "deploy" / "broken.sql").write_text(
+        "CREATE TABLE partial (id INTEGER);\nINSERT INTO missing VALUES (1);\n"
+    )
+    monkeypatch.chdir(project_dir)
+    return project_dir
+
+
+def _query(path: Path, sql: str) -> list[tuple[object, ...]]:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(sql).fetchall()
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("strategy", ["statement", "script", "batch"])
+def test_strategies_deploy_atomically(project: Path, strategy: str) -> None:
+    result = CliRunner().invoke(
+        main, ["deploy", "--execution-strategy", strategy, "db:sqlite:test.db"]
+    )
+
+    assert result.exit_code != 0
+    assert "Deploy failed for change 'broken'" in result.output
+    assert _query(project / "test.db", "SELECT COUNT(*) FROM items") == [(50,)]
+    tables = _query(project / "test.db", "SELECT name FROM sqlite_master WHERE type = 'table'")
+    assert ("partial",) not in tables
+    assert _query(project / "sqitch.db", 'SELECT "change" FROM changes') == [("items",)]
+
+
+def test_strategy_is_read_from_target_configuration(project: Path) -> None:
+    (project / "deploy" / "broken.sql").write_text("SELECT 1;\n")
+    (project / "sqitch.conf").write_text(
+        _CONFIG + '[target "local"]\n\turi = db:sqlite:test.db\n\texecution_strategy = bogus\n'
+    )
+
+    result = CliRunner().invoke(main, ["deploy", "local"])
+
+    assert result.exit_code != 0
+    assert "Invalid execution_strategy 'bogus' in [target \"local\"]" in result.output
+
+
+def test_engine_configuration_supplies_the_default(project: Path) -> None:
+    (project / "deploy" / "broken.sql").write_text("SELECT 1;\n")
+    (project / "sqitch.conf").write_text(
+        _CONFIG + '[engine "sqlite"]\n\texecution_strategy = script\n'
+    )
+
+    result = CliRunner().invoke(main, ["deploy", "db:sqlite:test.db"])
+
+    assert result.exit_code == 0, result.output
+    assert _query(project / "test.db", "SELECT COUNT(*) FROM items") == [(50,)]
@@ -1604,6 +1604,90 @@ class TestDeployFailureHandling:
         conn.close()
 
 
+class TestDeployPreflight:
+    """Pending scripts are loaded and validated before the first change is applied."""
+
+    @staticmethod
+    def _project(tmp_path: Path, posts_sql: str) -> tuple[Path, Path]:
+        from tests.support.sqlite_fixtures import ChangeScript, create_sqlite_project
+
+        project = create_sqlite_project(
+            tmp_path,
+            changes=[
+                ChangeScript(name="users", deploy_sql="CREATE TABLE users (id INTEGER);"),
+                ChangeScript(name="posts", deploy_sql=posts_sql),
+            ],
+        )
+        return project.project_root, tmp_path / "app.db"
+
+    @staticmethod
+    def _tables(target_db: Path) -> list[str]:
+        if not target_db.exists():
+            return []
+        with sqlite3.connect(target_db) as conn:
+            rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        conn.close()
+        return [row[0] for row in rows]
+
+    def test_missing_later_script_fails_before_any_change(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        project_root, target_db = self._project(tmp_path, "CREATE TABLE posts (id INTEGER);")
+        (project_root / "deploy" / "posts.sql").unlink()
+
+        result = runner.invoke(
+            main, ["--chdir", str(project_root), "deploy", f"db:sqlite:{target_db}"]
+        )
+
+        assert result.exit_code != 0, result.output
+        assert "Deploy script" in result.output
+        assert "is missing for change 'posts'" in result.output
+        assert "users" not in self._tables(target_db)
+
+    def test_invalid_later_script_fails_before_any_change(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        project_root, target_db = self._project(
+            tmp_path, "BEGIN;\nCREATE TABLE posts (id INTEGER);\n"
+        )
+
+        result = runner.invoke(
+            main, ["--chdir", str(project_root), "deploy", f"db:sqlite:{target_db}"]
+        )
+
+        assert result.exit_code != 0, result.output
+        assert "Invalid deploy script" in result.output
+        assert "must end with COMMIT or ROLLBACK" in result.output
+        assert "users" not in self._tables(target_db)
+
+    def test_preflight_all_checks_revert_scripts(self, runner: CliRunner, tmp_path: Path) -> None:
+        project_root, target_db = self._project(tmp_path, "CREATE TABLE posts (id INTEGER);")
+        (project_root / "revert" / "posts.sql").unlink()
+
+        result = runner.invoke(
+            main,
+            [
+                "--chdir",
+                str(project_root),
+                "deploy",
+                f"db:sqlite:{target_db}",
+                "--preflight",
+                "all",
+            ],
+        )
+
+        assert result.exit_code != 0, result.output
+        assert "Revert script" in result.output
+        assert "users" not in self._tables(target_db)
+
+        result = runner.invoke(
+            main, ["--chdir", str(project_root), "deploy", f"db:sqlite:{target_db}"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert {"users", "posts"} <= set(self._tables(target_db))
+
+
 class TestDeployErrorMessages:
     """Tests for deploy error message formatting and Sqitch parity.
 
@@ -1693,6 +1777,40 @@ class TestDeployErrorMessages:
         expected_output = (golden_root / "missing_dependency.txt").read_text(encoding="utf-8")
         assert result.output == expected_output
 
+    def test_dependency_cycle_is_rejected_before_deploy(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Plans whose dependencies form a cycle should fail before touching the target."""
+        from tests.support.sqlite_fixtures import ChangeScript, create_sqlite_project
+
+        project = create_sqlite_project(
+            tmp_path,
+            changes=[
+                ChangeScript(
+                    name="alpha",
+                    deploy_sql="SELECT 1;",
+                    revert_sql="SELECT 1;",
+                    dependencies=("beta",),
+                ),
+                ChangeScript(
+                    name="beta",
+                    deploy_sql="SELECT 1;",
+                    revert_sql="SELECT 1;",
+                    dependencies=("alpha",),
+                ),
+            ],
+        )
+
+        target = f"db:sqlite:{project.registry_path}"
+        result = runner.invoke(
+            main,
+            ["--chdir", str(project.project_root), "deploy", target],
+        )
+
+        assert result.exit_code != 0, result.output
+        assert "Dependency cycle detected: alpha -> beta -> alpha" in result.output
+        assert not project.registry_path.exists()
+
 
 class TestDeployHelpers:
     """Unit coverage for helper functions in sqlitch.cli.commands.deploy.
@@ -1843,6 +1961,42 @@ class TestDeployHelpers:
 
         assert selected == (first, second)
 
+    def test_select_changes_bare_name_stops_at_first_reworked_instance(self) -> None:
+        """A bare --to-change name selects the first instance of a reworked change."""
+        from datetime import datetime, timezone
+
+        from sqlitch.cli.commands import deploy as deploy_module
+
+        first = self._make_change("one")
+        second = self._make_change("two")
+        reworked = Change.create(
+            name="one",
+            script_paths={"deploy": Path("deploy.sql"), "revert": Path("revert.sql")},
+            planner="Tester",
+            planned_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+            dependencies=("one@v1.0",),
+        )
+        tag = Tag(
+            name="v1.0",
+            change_ref=second.name,
+            planner="Tester",
+            tagged_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+        plan = Plan(
+            project_name="demo",
+            file_path=Path("sqlitch.plan"),
+            entries=(first, second, tag, reworked),
+            checksum="checksum",
+            default_engine="sqlite",
+        )
+
+        assert deploy_module._select_changes(plan=plan, to_change="one", to_tag=None) == (first,)
+        assert deploy_module._select_changes(plan=plan, to_change="@HEAD", to_tag=None) == (
+            first,
+            second,
+            reworked,
+        )
+
     def test_select_changes_by_tag_filters(self) -> None:
         """Test change selection by tag filter."""
         from datetime import datetime, timezone
@@ -0,0 +1,76 @@
+"""Functional tests for ``sqlitch --profile deploy``."""
+
+from __future__ import annotations
+
+import pstats
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+
+_PLAN = """%syntax-version=1.0.0
+%project=profile_test
+
+users 2025-01-01T12:00:00Z Alice <alice@example.com> # Users
+"""
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    return make_project(
+        "profile_test", _PLAN, {"deploy/users.sql": "CREATE TABLE users (id INTEGER);\n"}
+    )
+
+
+def test_profile_writes_pstats_and_prints_summary(project: Path) -> None:
+    profile_path = project / "deploy.pstats"
+
+    result = CliRunner().invoke(
+        main, [f"--profile={profile_path}", "--profile-top", "5", "deploy", "db:sqlite:test.db"]
+    )
+
+    assert result.exit_code == 0, result.output
+    stats = pstats.Stats(str(profile_path))
+    assert any(name == "deploy_command" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+    assert "cumulative" in result.stderr
+    assert f"Profile written to {profile_path}" in result.stderr
+    assert "cumulative" not in result.stdout
+
+
+def test_profile_without_path_uses_mode_default(project: Path) -> None:
+    result = CliRunner().invoke(
+        main, ["--profile-mode", "sampling", "--profile", "deploy", "db:sqlite:test.db"]
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert (project / "sqlitch.folded").exists()
+    assert not (project / "sqlitch.pstats").exists()
+
+
+def test_profile_quiet_writes_file_without_summary(project: Path) -> None:
+    result = CliRunner().invoke(main, ["-q", "--profile", "deploy", "db:sqlite:test.db"])
+
+    assert result.exit_code == 0, result.stderr
+    assert (project / "sqlitch.pstats").exists()
+    assert "Profile written" not in result.stderr
+
+
+def test_profile_options_require_profile(project: Path) -> None:
+    result = CliRunner().invoke(main, ["--profile-mode", "sampling", "deploy", "db:sqlite:test.db"])
+
+    assert result.exit_code != 0
+    assert "--profile-mode requires --profile" in result.stderr
+    assert not (project / "test.db").exists()
+
+
+def test_unwritable_profile_path_is_reported(project: Path) -> None:
+    profile_path = project / "missing" / "deploy.pstats"
+
+    result = CliRunner().invoke(main, [f"--profile={profile_path}", "deploy", "db:sqlite:test.db"])
+
+    assert result.exit_code != 0
+    assert f"Failed to write profile {profile_path}" in result.stderr
+    assert "Profile written" not in result.stderr
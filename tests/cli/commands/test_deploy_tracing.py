@@ -0,0 +1,80 @@
+"""Functional tests for ``sqlitch --trace-file deploy``."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+
+_PLAN = """%syntax-version=1.0.0
+%project=trace_test
+
+users 2025-01-01T12:00:00Z Alice <alice@example.com> # Users
+posts [users] 2025-01-02T12:00:00Z Alice <alice@example.com> # Posts
+"""
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    return make_project(
+        "trace_test",
+        _PLAN,
+        {
+            "deploy/users.sql": "CREATE TABLE users (id INTEGER);\n",
+            "deploy/posts.sql": "CREATE TABLE posts (id INTEGER);\n",
+        },
+    )
+
+
+def test_trace_file_records_deploy_phases(project: Path) -> None:
+    trace_path = project / "deploy-trace.json"
+
+    result = CliRunner().invoke(
+        main, ["--trace-file", str(trace_path), "deploy", "db:sqlite:test.db"]
+    )
+
+    assert result.exit_code == 0, result.output
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    by_name: dict[str, list[dict[str, Any]]] = {}
+    for event in events:
+        by_name.setdefault(event["name"], []).append(event)
+
+    for phase in (
+        "sqlitch.deploy",
+        "deploy.config",
+        "deploy.plan.parse",
+        "deploy.target.resolve",
+        "deploy.registry.load",
+        "deploy.change_ids",
+        "deploy.preflight",
+    ):
+        assert phase in by_name, phase
+    applies = by_name["deploy.apply"]
+    assert [event["args"]["change"] for event in applies] == ["users", "posts"]
+    root_id = by_name["sqlitch.deploy"][0]["args"]["span_id"]
+    assert by_name["deploy.config"][0]["args"]["parent_id"] == root_id
+    record_parents = {event["args"]["parent_id"] for event in by_name["deploy.registry.record"]}
+    assert record_parents == {event["args"]["span_id"] for event in applies}
+
+
+def test_deploy_without_trace_file_writes_no_trace(project: Path) -> None:
+    result = CliRunner().invoke(main, ["deploy", "db:sqlite:test.db"])
+
+    assert result.exit_code == 0, result.output
+    assert not list(project.glob("*.json"))
+
+
+def test_unwritable_trace_file_is_reported(project: Path) -> None:
+    trace_path = project / "missing" / "trace.json"
+
+    result = CliRunner().invoke(main, ["--trace-file", str(trace_path), "status"])
+
+    assert result.exit_code != 0
+    assert f"Failed to write trace file {trace_path}" in result.output
+    assert "Traceback" not in result.output
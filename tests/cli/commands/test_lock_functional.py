@@ -0,0 +1,128 @@
+"""Functional tests for deploy locking and ``sqlitch lock``."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+
+_PLAN = """%syntax-version=1.0.0
+%project=lock_test
+
+users 2025-01-01T12:00:00Z Alice <alice@example.com> # Users
+"""
+
+_CONFIG = """[core]
+\tengine = sqlite
+
+[user]
+\tname = Alice
+\temail = alice@example.com
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    project_dir = tmp_path / "lock_test"
+    project_dir.mkdir()
+    (project_dir / "sqitch.plan").write_text(_PLAN)
+    (project_dir / "sqitch.conf").write_text(_CONFIG)
+    for kind in ("deploy", "revert"):
+        (project_dir / kind).mkdir()
+    (project_dir / "deploy" / "users.sql").write_text("CREATE TABLE users (id INTEGER);\n")
+    (project_dir / "revert" / "users.sql").write_text("DROP TABLE users;\n")
+    monkeypatch.chdir(project_dir)
+    return project_dir
+
+
+def _hold_lock(project_dir: Path, *, heartbeat_at: float) -> Path:
+    path = project_dir / "sqitch.db.lock"
+    path.write_text(
+        json.dumps(
+            {
+                "owner": "Bob <bob@example.com>",
+                "pid": 4242,
+                "host": "build-1",
+                "acquired_at": heartbeat_at,
+                "heartbeat_at": heartbeat_at,
+            }
+        )
+    )
+    return path
+
+
+def test_deploy_releases_the_lock(project: Path) -> None:
+    result = CliRunner().invoke(main, ["deploy", "db:sqlite:test.db"])
+
+    assert result.exit_code == 0, result.output
+    assert not (project / "sqitch.db.lock").exists()
+
+
+def test_deploy_fails_when_lock_is_held_past_timeout(project: Path) -> None:
+    _hold_lock(project, heartbeat_at=time.time())
+
+    result = CliRunner().invoke(main, ["deploy", "--lock-timeout", "0", "db:sqlite:test.db"])
+
+    assert result.exit_code != 0
+    assert "waiting for the deploy lock held by Bob <bob@example.com>" in result.output
+
+
+def test_revert_takes_over_a_stale_lock(project: Path) -> None:
+    runner = CliRunner()
+    assert runner.invoke(main, ["deploy", "db:sqlite:test.db"]).exit_code == 0
+    lock_path = _hold_lock(project, heartbeat_at=time.time() - 3600)
+
+    result = runner.invoke(main, ["revert", "--lock-timeout", "0", "-y", "db:sqlite:test.db"])
+
+    assert result.exit_code == 0, result.output
+    assert not lock_path.exists()
+
+
+def test_lock_status_reports_holder(project: Path) -> None:
+    runner = CliRunner()
+    result = runner.invoke(main, ["lock", "--status", "--target", "db:sqlite:test.db"])
+    assert result.exit_code == 0, result.output
+    assert "No deploy lock held on db:sqlite:test.db." in result.output
+
+    _hold_lock(project, heartbeat_at=time.time())
+    result = runner.invoke(main, ["lock", "--target", "db:sqlite:test.db"])
+
+    assert result.exit_code == 0, result.output
+    assert "held by Bob <bob@example.com> (pid 4242 on build-1)" in result.output
+    assert "(stale)" not in result.output
+
+
+def test_lock_release_requires_force_for_active_lock(project: Path) -> None:
+    runner = CliRunner()
+    lock_path = _hold_lock(project, heartbeat_at=time.time())
+
+    result = runner.invoke(main, ["lock", "--release", "--target", "db:sqlite:test.db"])
+    assert result.exit_code != 0
+    assert "use --force" in result.output
+    assert lock_path.exists()
+
+    result = runner.invoke(main, ["lock", "--release", "--force", "--target", "db:sqlite:test.db"])
+    assert result.exit_code == 0, result.output
+    assert not lock_path.exists()
+
+
+def test_lock_release_removes_stale_lock(project: Path) -> None:
+    lock_path = _hold_lock(project, heartbeat_at=time.time() - 3600)
+
+    result = CliRunner().invoke(main, ["lock", "--release", "--target", "db:sqlite:test.db"])
+
+    assert result.exit_code == 0, result.output
+    assert "Released deploy lock" in result.output
+    assert not lock_path.exists()
+
+
+def test_lock_rejects_conflicting_flags(project: Path) -> None:
+    result = CliRunner().invoke(main, ["lock", "--status", "--release"])
+
+    assert result.exit_code != 0
+    assert "mutually exclusive" in result.output
@@ -0,0 +1,88 @@
+"""Functional tests for ``sqlitch --metrics-file``."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+
+_PLAN = """%syntax-version=1.0.0
+%project=metrics_test
+
+users 2025-01-01T12:00:00Z Alice <alice@example.com> # Users
+posts [users] 2025-01-02T12:00:00Z Alice <alice@example.com> # Posts
+"""
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    scripts = {"verify/users.sql": "SELECT id FROM users WHERE 0;\n"}
+    for name in ("users", "posts"):
+        scripts[f"deploy/{name}.sql"] = f"CREATE TABLE {name} (id INTEGER);\n"
+        scripts[f"revert/{name}.sql"] = f"DROP TABLE {name};\n"
+    return make_project("metrics_test", _PLAN, scripts)
+
+
+def _run(project: Path, *args: str) -> dict[str, str]:
+    metrics_path = project / "sqlitch.prom"
+    result = CliRunner().invoke(main, ["--metrics-file", str(metrics_path), *args])
+    assert result.exit_code == 0, result.output
+    text = metrics_path.read_text(encoding="utf-8")
+    assert text.endswith("# EOF\n")
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if line and not line.startswith("#")
+    )
+
+
+def test_metrics_file_reports_deploy_run(project: Path) -> None:
+    samples = _run(project, "deploy", "db:sqlite:test.db")
+
+    assert samples['sqlitch_run_success{command="deploy"}'] == "1"
+    assert samples['sqlitch_changes{command="deploy",result="success"}'] == "2"
+    assert samples['sqlitch_changes{command="deploy",result="failure"}'] == "0"
+    assert samples['sqlitch_change_duration_seconds_count{command="deploy"}'] == "2"
+    assert float(samples['sqlitch_plan_parse_duration_seconds{command="deploy"}']) > 0
+    assert float(samples['sqlitch_registry_duration_seconds{command="deploy"}']) > 0
+    assert 'sqlitch_lock_wait_duration_seconds{command="deploy"}' in samples
+
+
+def test_metrics_file_reports_verify_status_and_revert(project: Path) -> None:
+    _run(project, "deploy", "db:sqlite:test.db")
+
+    verify = _run(project, "verify", "db:sqlite:test.db")
+    assert verify['sqlitch_changes{command="verify",result="success"}'] == "1"
+    assert verify['sqlitch_changes{command="verify",result="skipped"}'] == "1"
+
+    status = _run(project, "status", "db:sqlite:test.db")
+    assert status['sqlitch_plan_changes{command="status",state="deployed"}'] == "2"
+    assert status['sqlitch_plan_changes{command="status",state="pending"}'] == "0"
+
+    revert = _run(project, "revert", "-y", "db:sqlite:test.db")
+    assert revert['sqlitch_changes{command="revert",result="success"}'] == "2"
+    assert revert['sqlitch_change_duration_seconds_count{command="revert"}'] == "2"
+
+
+def test_metrics_file_records_failed_deploy(project: Path) -> None:
+    (project / "deploy" / "posts.sql").write_text("CREATE TABLE broken (;\n")
+    metrics_path = project / "sqlitch.prom"
+
+    result = CliRunner().invoke(
+        main, ["--metrics-file", str(metrics_path), "deploy", "db:sqlite:test.db"]
+    )
+
+    assert result.exit_code != 0
+    text = metrics_path.read_text(encoding="utf-8")
+    assert 'sqlitch_run_success{command="deploy"} 0' in text
+    assert 'sqlitch_changes{command="deploy",result="failure"} 1' in text
+
+
+def test_metrics_file_rejects_other_commands(project: Path) -> None:
+    result = CliRunner().invoke(main, ["--metrics-file", str(project / "x.prom"), "plan"])
+
+    assert result.exit_code != 0
+    assert "--metrics-file supports only" in result.output
+    assert not (project / "x.prom").exists()
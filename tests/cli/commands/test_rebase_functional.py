@@ -0,0 +1,176 @@
+"""Functional tests for the ``sqlitch rebase`` command against SQLite targets."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+from sqlitch.engine.sqlite import SQLiteEngine
+
+_PLAN = """%syntax-version=1.0.0
+%project=rebase_test
+
+users 2025-01-01T12:00:00Z Alice <alice@example.com> # Users
+posts [users] 2025-01-02T12:00:00Z Alice <alice@example.com> # Posts
+"""
+
+_CONFIG = """[core]
+\tengine = sqlite
+
+[user]
+\tname = Alice
+\temail = alice@example.com
+"""
+
+
+@pytest.fixture
+def deployed_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a project whose two changes are deployed to ``test.db``."""
+
+    project_dir = tmp_path / "rebase_test"
+    project_dir.mkdir()
+    (project_dir / "sqitch.plan").write_text(_PLAN)
+    (project_dir / "sqitch.conf").write_text(_CONFIG)
+    for kind in ("deploy", "revert", "verify"):
+        (project_dir / kind).mkdir()
+    for name in ("users", "posts"):
+        (project_dir / "deploy" / f"{name}.sql").write_text(
+            f"CREATE TABLE {name} (id INTEGER PRIMARY KEY);\n"
+        )
+        (project_dir / "revert" / f"{name}.sql").write_text(f"DROP TABLE {name};\n")
+        (project_dir / "verify" / f"{name}.sql").write_text(f"SELECT id FROM {name};\n")
+
+    monkeypatch.chdir(project_dir)
+    result = CliRunner().invoke(main, ["deploy", "db:sqlite:test.db"])
+    assert result.exit_code == 0, result.output
+    return project_dir
+
+
+def _events(project_dir: Path) -> list[tuple[str, str]]:
+    connection = sqlite3.connect(project_dir / "sqitch.db")
+    try:
+        rows = connection.execute('SELECT event, "change" FROM events ORDER BY rowid').fetchall()
+    finally:
+        connection.close()
+    return [(str(event), str(change)) for event, change in rows]
+
+
+def _count_connections(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = SQLiteEngine.connect_workspace
+
+    def _counting(self: SQLiteEngine) -> sqlite3.Connection:
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(SQLiteEngine, "connect_workspace", _counting)
+    return calls
+
+
+def test_rebase_with_unchanged_scripts_is_noop(
+    deployed_project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events_before = _events(deployed_project)
+    calls = _count_connections(monkeypatch)
+
+    result = CliRunner().invoke(main, ["rebase", "--target", "db:sqlite:test.db", "-y"])
+
+    assert result.exit_code == 0, result.output
+    assert "Nothing to rebase" in result.output
+    assert _events(deployed_project) == events_before
+    assert len(calls) == 1
+
+
+def test_rebase_reverts_only_changes_after_edited_script(
+    deployed_project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (deployed_project / "deploy" / "posts.sql").write_text(
+        "CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT);\n"
+    )
+    calls = _count_connections(monkeypatch)
+
+    result = CliRunner().invoke(main, ["rebase", "--target", "db:sqlite:test.db", "-y"])
+
+    assert result.exit_code == 0, result.output
+    assert "Reverting changes to users" in result.output
+    assert "  - posts .. ok" in result.output
+    assert "  + posts" in result.output
+    assert "users .. ok" not in result.output
+    assert len(calls) == 1
+    assert _events(deployed_project)[-2:] == [("revert", "posts"), ("deploy", "posts")]
+
+    connection = sqlite3.connect(deployed_project / "test.db")
+    try:
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(posts)")]
+    finally:
+        connection.close()
+    assert columns == ["id", "title"]
+
+
+def test_rebase_redeploys_changes_missing_from_registry(deployed_project: Path) -> None:
+    plan_path = deployed_project / "sqitch.plan"
+    plan_path.write_text(
+        plan_path.read_text()
+        + "comments [posts] 2025-01-03T12:00:00Z Alice <alice@example.com> # Comments\n"
+    )
+    (deployed_project / "deploy" / "comments.sql").write_text(
+        "CREATE TABLE comments (id INTEGER PRIMARY KEY);\n"
+    )
+    (deployed_project / "revert" / "comments.sql").write_text("DROP TABLE comments;\n")
+
+    result = CliRunner().invoke(main, ["rebase", "--target", "db:sqlite:test.db", "-y"])
+
+    assert result.exit_code == 0, result.output
+    assert "Nothing to rebase" not in result.output
+    assert "  + comments" in result.output
+
+
+def test_rebase_onto_reverts_from_the_given_change(deployed_project: Path) -> None:
+    result = CliRunner().invoke(
+        main, ["rebase", "--target", "db:sqlite:test.db", "--onto", "users", "-y"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert _events(deployed_project)[-4:] == [
+        ("revert", "posts"),
+        ("revert", "users"),
+        ("deploy", "users"),
+        ("deploy", "posts"),
+    ]
+
+
+def test_rebase_from_reverts_and_redeploys_only_later_changes(deployed_project: Path) -> None:
+    result = CliRunner().invoke(
+        main, ["rebase", "--target", "db:sqlite:test.db", "--from", "posts", "-y"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert _events(deployed_project)[-2:] == [("revert", "posts"), ("deploy", "posts")]
+    assert ("revert", "users") not in _events(deployed_project)
+
+
+def test_rebase_log_only_previews_the_real_run(deployed_project: Path) -> None:
+    (deployed_project / "deploy" / "posts.sql").write_text(
+        "CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT);\n"
+    )
+    events_before = _events(deployed_project)
+
+    preview = CliRunner().invoke(main, ["rebase", "--target", "db:sqlite:test.db", "--log-only"])
+
+    assert preview.exit_code == 0, preview.output
+    assert "Would revert change posts" in preview.output
+    assert "Would deploy change posts" in preview.output
+    assert "users" not in preview.output
+    assert _events(deployed_project) == events_before
+
+    result = CliRunner().invoke(main, ["rebase", "--target", "db:sqlite:test.db", "-y"])
+
+    assert result.exit_code == 0, result.output
+    assert _events(deployed_project)[len(events_before) :] == [
+        ("revert", "posts"),
+        ("deploy", "posts"),
+    ]
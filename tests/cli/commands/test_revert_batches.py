@@ -0,0 +1,135 @@
+"""Functional tests for batched ``sqlitch revert --mode=all`` / ``--batch-size``."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.commands import revert as revert_module
+from sqlitch.cli.main import main
+
+_PLAN = """%syntax-version=1.0.0
+%project=batch_test
+
+users 2025-01-01T12:00:00Z Alice <alice@example.com> # Users
+posts [users] 2025-01-02T12:00:00Z Alice <alice@example.com> # Posts
+comments [posts] 2025-01-03T12:00:00Z Alice <alice@example.com> # Comments
+"""
+
+_CONFIG = """[core]
+\tengine = sqlite
+
+[user]
+\tname = Alice
+\temail = alice@example.com
+"""
+
+_TARGET = "db:sqlite:test.db"
+
+
+@pytest.fixture
+def deployed_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a project whose three changes are deployed to ``test.db``."""
+
+    project_dir = tmp_path / "batch_test"
+    project_dir.mkdir()
+    (project_dir / "sqitch.plan").write_text(_PLAN)
+    (project_dir / "sqitch.conf").write_text(_CONFIG)
+    for kind in ("deploy", "revert"):
+        (project_dir / kind).mkdir()
+    for name in ("users", "posts", "comments"):
+        (project_dir / "deploy" / f"{name}.sql").write_text(f"CREATE TABLE {name} (id INTEGER);\n")
+        (project_dir / "revert" / f"{name}.sql").write_text(f"DROP TABLE {name};\n")
+
+    monkeypatch.chdir(project_dir)
+    result = CliRunner().invoke(main, ["deploy", _TARGET])
+    assert result.exit_code == 0, result.output
+    return project_dir
+
+
+def _query(path: Path, sql: str) -> list[tuple[object, ...]]:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(sql).fetchall()
+    finally:
+        connection.close()
+
+
+def _deployed(project_dir: Path) -> list[str]:
+    rows = _query(project_dir / "sqitch.db", 'SELECT "change" FROM changes ORDER BY committed_at')
+    return [str(name) for (name,) in rows]
+
+
+def _tables(project_dir: Path) -> set[str]:
+    rows = _query(project_dir / "test.db", "SELECT name FROM sqlite_master WHERE type = 'table'")
+    return {str(name) for (name,) in rows}
+
+
+@pytest.mark.parametrize("options", [["--mode=all"], ["--batch-size", "2"]])
+def test_batched_revert_removes_every_change(deployed_project: Path, options: list[str]) -> None:
+    result = CliRunner().invoke(main, ["revert", *options, "-y", _TARGET])
+
+    assert result.exit_code == 0, result.output
+    assert "  - comments .. ok\n  - posts .. ok\n  - users .. ok" in result.output
+    assert _deployed(deployed_project) == []
+    assert _tables(deployed_project) == set()
+    events = _query(
+        deployed_project / "sqitch.db",
+        "SELECT \"change\" FROM events WHERE event = 'revert' ORDER BY rowid",
+    )
+    assert events == [("comments",), ("posts",), ("users",)]
+    assert _query(deployed_project / "sqitch.db", "SELECT COUNT(*) FROM dependencies") == [(0,)]
+
+
+def test_failure_rolls_back_the_whole_batch(deployed_project: Path) -> None:
+    (deployed_project / "revert" / "posts.sql").write_text("DROP TABLE missing;\n")
+
+    result = CliRunner().invoke(main, ["revert", "--mode=all", "-y", _TARGET])
+
+    assert result.exit_code != 0
+    assert "  - posts .. not ok" in result.output
+    assert "1 earlier change(s) in the transaction were rolled back" in result.output
+    assert "comments .. ok" not in result.output
+    assert _deployed(deployed_project) == ["users", "posts", "comments"]
+    assert "comments" in _tables(deployed_project)
+
+
+def test_registry_failure_is_not_blamed_on_a_script(
+    deployed_project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _fail(*_args: object) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(revert_module, "_record_reverts", _fail)
+
+    result = CliRunner().invoke(main, ["revert", "--mode=all", "-y", _TARGET])
+
+    assert result.exit_code != 0
+    assert "Failed to record reverts of comments, posts, users in the registry" in result.output
+    assert "disk I/O error" in result.output
+    assert "Revert failed for change" not in result.output
+    assert _deployed(deployed_project) == ["users", "posts", "comments"]
+    assert _tables(deployed_project) == {"users", "posts", "comments"}
+
+
+def test_per_change_mode_keeps_earlier_reverts(deployed_project: Path) -> None:
+    (deployed_project / "revert" / "posts.sql").write_text("DROP TABLE missing;\n")
+
+    result = CliRunner().invoke(main, ["revert", "-y", _TARGET])
+
+    assert result.exit_code != 0
+    assert "  - comments .. ok" in result.output
+    assert _deployed(deployed_project) == ["users", "posts"]
+
+
+def test_transaction_managing_script_runs_outside_the_batch(deployed_project: Path) -> None:
+    (deployed_project / "revert" / "posts.sql").write_text("BEGIN;\nDROP TABLE posts;\nCOMMIT;\n")
+
+    result = CliRunner().invoke(main, ["revert", "--mode=all", "-y", _TARGET])
+
+    assert result.exit_code == 0, result.output
+    assert _deployed(deployed_project) == []
+    assert _tables(deployed_project) == set()
@@ -13,7 +13,11 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
+from sqlitch.cli.commands import CommandError
+from sqlitch.cli.commands.revert import _assert_no_deployed_dependents
 from sqlitch.cli.main import main
+from sqlitch.plan.model import Plan
+from sqlitch.plan.parser import parse_plan
 
 
 @pytest.fixture
@@ -710,3 +714,37 @@ class TestRevertConfirmation:
 
         # Should abort without making changes
         assert result.exit_code != 0 or "aborted" in result.output.lower()
+
+
+class TestRevertDependencyGuard:
+    """Reverse-dependency checks backed by the plan dependency graph."""
+
+    @staticmethod
+    def _plan(tmp_path: Path) -> Plan:
+        plan_path = tmp_path / "sqlitch.plan"
+        plan_path.write_text(
+            "%syntax-version=1.0.0\n%project=guard\n\n"
+            "users [posts] 2025-01-01T12:00:00Z Alice <alice@example.com>\n"
+            "posts 2025-01-02T12:00:00Z Alice <alice@example.com>\n",
+            encoding="utf-8",
+        )
+        return parse_plan(plan_path, default_engine="sqlite")
+
+    def test_rejects_revert_of_change_required_by_deployed_change(self, tmp_path: Path) -> None:
+        with pytest.raises(CommandError) as excinfo:
+            _assert_no_deployed_dependents(
+                plan=self._plan(tmp_path),
+                reverted_indices=[1],
+                deployed_indices=[0, 1],
+            )
+
+        assert str(excinfo.value.message) == (
+            'Change "posts" required by currently deployed change: "users"'
+        )
+
+    def test_allows_revert_when_dependents_are_also_reverted(self, tmp_path: Path) -> None:
+        _assert_no_deployed_dependents(
+            plan=self._plan(tmp_path),
+            reverted_indices=[1, 0],
+            deployed_indices=[0, 1],
+        )
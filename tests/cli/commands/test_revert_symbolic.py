@@ -158,3 +158,39 @@ def test_revert_to_change_with_caret(tmp_path: Path, monkeypatch):
     tables = [row[0] for row in cursor.fetchall()]
     conn.close()
     assert tables == ["change1", "change2", "change3"]
+
+
+def test_revert_to_reworked_instance_keeps_that_instance(tmp_path: Path, monkeypatch):
+    """``--to name@tag`` stops at that instance; a bare name stops at the first one."""
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+
+    assert runner.invoke(main, ["init", "test", "--engine", "sqlite"]).exit_code == 0
+    runner.invoke(main, ["config", "user.name", "Test User"])
+    runner.invoke(main, ["config", "user.email", "test@example.com"])
+    assert runner.invoke(main, ["add", "users", "-n", "Add users"]).exit_code == 0
+    assert runner.invoke(main, ["tag", "v1", "-n", "Tag v1"]).exit_code == 0
+    assert runner.invoke(main, ["add", "other", "-n", "Add other"]).exit_code == 0
+    (tmp_path / "deploy" / "users.sql").write_text("CREATE TABLE users (id INTEGER);")
+    (tmp_path / "revert" / "users.sql").write_text("DROP TABLE users;")
+    result = runner.invoke(main, ["rework", "users", "-n", "Rework users"])
+    assert result.exit_code == 0, result.output
+
+    scripts = {
+        "users": ("CREATE TABLE users_v2 (id INTEGER);", "DROP TABLE users_v2;"),
+        "other": ("CREATE TABLE other (id INTEGER);", "DROP TABLE other;"),
+    }
+    for change, (deploy, revert) in scripts.items():
+        (tmp_path / "deploy" / f"{change}.sql").write_text(deploy)
+        (tmp_path / "revert" / f"{change}.sql").write_text(revert)
+
+    target = f"db:sqlite:{tmp_path / 'test.db'}"
+    for reference in ("users@v1", "users"):
+        result = runner.invoke(main, ["deploy", target])
+        assert result.exit_code == 0, f"Deploy failed: {result.output}"
+
+        result = runner.invoke(main, ["revert", target, "--to", reference, "-y"])
+
+        assert result.exit_code == 0, f"Revert failed: {result.output}"
+        reverted = [line for line in result.output.splitlines() if line.startswith("  - ")]
+        assert reverted == ["  - users .. ok", "  - other .. ok"]
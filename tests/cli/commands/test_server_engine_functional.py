@@ -0,0 +1,350 @@
+"""Functional tests for deploy, revert, and verify against server engines.
+
+A recording in-memory :class:`ServerEngine` is registered in place of the
+PostgreSQL and MySQL engines so the command wiring can be exercised without a
+database server.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, ClassVar
+
+import pytest
+from click.testing import CliRunner, Result
+
+from sqlitch.cli.main import main
+from sqlitch.engine import EngineError, register_engine
+from sqlitch.engine.base import ENGINE_REGISTRY, ConnectArguments
+from sqlitch.engine.server import (
+    DeployedChangeRow,
+    RegistryChangeRecord,
+    ServerEngine,
+    close_connection_pools,
+)
+
+
+class _InMemoryServerEngine(ServerEngine):
+    """Server engine keeping its registry in class-level state."""
+
+    registry_installed: ClassVar[bool] = False
+    deployed: ClassVar[list[RegistryChangeRecord]] = []
+    events: ClassVar[list[tuple[str, str]]] = []
+    executed: ClassVar[list[str]] = []
+    scopes: ClassVar[list[tuple[str, bool]]] = []
+    connections_opened: ClassVar[int] = 0
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.registry_installed = False
+        cls.deployed = []
+        cls.events = []
+        cls.executed = []
+        cls.scopes = []
+        cls.connections_opened = 0
+
+    @property
+    def conninfo(self) -> str:
+        return self.target.uri
+
+    def build_registry_connect_arguments(self) -> ConnectArguments:
+        return ConnectArguments()
+
+    def build_workspace_connect_arguments(self) -> ConnectArguments:
+        return ConnectArguments()
+
+    def open_connection(self) -> Any:
+        type(self).connections_opened += 1
+        return _FakeConnection()
+
+    def connection_is_usable(self, connection: Any) -> bool:
+        return not connection.closed
+
+    def registry_exists(self, connection: Any) -> bool:
+        return self.registry_installed
+
+    def initialise_registry(
+        self, connection: Any, *, installer_name: str, installer_email: str
+    ) -> None:
+        type(self).registry_installed = True
+
+    def ensure_project(self, connection: Any, **_: Any) -> None:
+        return None
+
+    def load_deployed_changes(self, connection: Any, project: str) -> list[DeployedChangeRow]:
+        return [
+            DeployedChangeRow(record.change, record.change_id, record.script_hash)
+            for record in self.deployed
+            if record.project == project
+        ]
+
+    def deploy_change(
+        self,
+        connection: Any,
+        script_sql: str,
+        record: RegistryChangeRecord,
+        *,
+        manages_transactions: bool,
+    ) -> None:
+        self._run(script_sql)
+        self.scopes.append((record.change, manages_transactions))
+        self.deployed.append(record)
+        self.events.append(("deploy", record.change))
+
+    def revert_change(
+        self,
+        connection: Any,
+        script_sql: str,
+        record: RegistryChangeRecord,
+        *,
+        manages_transactions: bool,
+    ) -> None:
+        self._run(script_sql)
+        self.scopes.append((record.change, manages_transactions))
+        type(self).deployed = [row for row in self.deployed if row.change_id != record.change_id]
+        self.events.append(("revert", record.change))
+
+    def record_failure(self, connection: Any, record: RegistryChangeRecord) -> None:
+        self.events.append(("deploy_fail", record.change))
+
+    def verify_change(self, connection: Any, script_sql: str) -> None:
+        self._run(script_sql)
+
+    def _run(self, script_sql: str) -> None:
+        if "FAIL" in script_sql:
+            raise EngineError("relation does not exist")
+        self.executed.append(script_sql.strip())
+
+
+class _FakeConnection:
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+_TARGETS = {"pg": "db:pg:flipr", "mysql": "db:mysql://localhost/flipr"}
+
+
+@pytest.fixture(params=sorted(_TARGETS))
+def target(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    engine_name = str(request.param)
+    original = ENGINE_REGISTRY[engine_name]
+    # Detect script-managed transactions the way the real dialect does.
+    for attribute in ("non_code_pattern", "transaction_statement_pattern"):
+        monkeypatch.setattr(_InMemoryServerEngine, attribute, getattr(original, attribute))
+    register_engine(engine_name, _InMemoryServerEngine, replace=True)
+    _InMemoryServerEngine.reset()
+    close_connection_pools()
+    try:
+        yield _TARGETS[engine_name]
+    finally:
+        close_connection_pools()
+        register_engine(engine_name, original, replace=True)
+
+
+@pytest.fixture()
+def fake_engine(target: str) -> type[_InMemoryServerEngine]:
+    return _InMemoryServerEngine
+
+
+@pytest.fixture()
+def runner(tmp_path: Path) -> CliRunner:
+    """Provide a Click CLI test runner with configuration isolated to ``tmp_path``."""
+    return CliRunner(
+        env={
+            "SQLITCH_SYSTEM_CONFIG": str(tmp_path / "etc" / "sqitch.conf"),
+            "SQLITCH_USER_CONFIG": str(tmp_path / "home" / "sqitch.conf"),
+        }
+    )
+
+
+@pytest.fixture()
+def project_dir(tmp_path: Path) -> Path:
+    project = tmp_path / "flipr"
+    project.mkdir()
+    (project / "sqitch.conf").write_text("[core]\n    engine = pg\n", encoding="utf-8")
+    (project / "sqitch.plan").write_text(
+        "%syntax-version=1.0.0\n"
+        "%project=flipr\n"
+        "\n"
+        "users 2025-01-01T00:00:00Z Test User <test@example.com> # Add users\n"
+        "posts [users] 2025-01-02T00:00:00Z Test User <test@example.com> # Add posts\n"
+        "@v1 2025-01-03T00:00:00Z Test User <test@example.com> # Tag v1\n",
+        encoding="utf-8",
+    )
+    for kind in ("deploy", "revert", "verify"):
+        (project / kind).mkdir()
+        for change in ("users", "posts"):
+            (project / kind / f"{change}.sql").write_text(f"-- {kind} {change}\n", encoding="utf-8")
+    return project
+
+
+def _invoke(runner: CliRunner, project_dir: Path, *args: str) -> Result:
+    original_cwd = os.getcwd()
+    try:
+        os.chdir(project_dir)
+        return runner.invoke(main, list(args))
+    finally:
+        os.chdir(original_cwd)
+
+
+def test_deploy_initialises_registry_and_records_changes(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+) -> None:
+    result = _invoke(runner, project_dir, "deploy", target)
+
+    assert result.exit_code == 0, result.output
+    assert f"Adding registry tables to {target}" in result.output
+    assert "  + users" in result.output
+    assert "  + posts" in result.output
+    assert [record.change for record in fake_engine.deployed] == ["users", "posts"]
+    posts = fake_engine.deployed[1]
+    assert posts.requires == ("users",)
+    assert posts.dependency_ids == {"users": fake_engine.deployed[0].change_id}
+    assert [tag.tag for tag in posts.tags] == ["v1"]
+    assert fake_engine.connections_opened == 1
+
+
+def test_deploy_runs_the_script_body_checked_during_preflight(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from sqlitch.cli.commands import deploy as deploy_module
+
+    original_preflight = deploy_module._preflight_scripts
+
+    def _preflight_then_edit(**kwargs: Any) -> Any:
+        scripts = original_preflight(**kwargs)
+        (project_dir / "deploy" / "posts.sql").write_text("-- edited\n", encoding="utf-8")
+        return scripts
+
+    monkeypatch.setattr(deploy_module, "_preflight_scripts", _preflight_then_edit)
+
+    result = _invoke(runner, project_dir, "deploy", target)
+
+    assert result.exit_code == 0, result.output
+    assert fake_engine.executed == ["-- deploy users", "-- deploy posts"]
+
+
+def test_redeploy_reports_nothing_to_deploy(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+) -> None:
+    assert _invoke(runner, project_dir, "deploy", target).exit_code == 0
+
+    result = _invoke(runner, project_dir, "deploy", target)
+
+    assert result.exit_code == 0, result.output
+    assert "Nothing to deploy (up-to-date)." in result.output
+    assert len(fake_engine.deployed) == 2
+
+
+def test_failed_deploy_records_failure_event(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+) -> None:
+    (project_dir / "deploy" / "posts.sql").write_text("-- FAIL\n", encoding="utf-8")
+
+    result = _invoke(runner, project_dir, "deploy", target)
+
+    assert result.exit_code != 0
+    assert "relation does not exist" in result.output
+    assert fake_engine.events == [("deploy", "users"), ("deploy_fail", "posts")]
+
+
+_ROUTINE_SCRIPTS = {
+    _TARGETS["pg"]: (
+        "CREATE FUNCTION touch_users() RETURNS trigger AS $$\n"
+        "BEGIN\n"
+        "    NEW.updated_at := now();\n"
+        "    RETURN NEW;\n"
+        "END;\n"
+        "$$ LANGUAGE plpgsql;\n"
+    ),
+    _TARGETS["mysql"]: (
+        "CREATE TRIGGER touch_users BEFORE UPDATE ON users FOR EACH ROW\n"
+        "BEGIN\n"
+        "    SET NEW.updated_at = NOW();\n"
+        "END;\n"
+    ),
+}
+
+
+def test_routine_bodies_are_left_to_the_server(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+) -> None:
+    routine = _ROUTINE_SCRIPTS[target]
+    (project_dir / "deploy" / "users.sql").write_text(routine, encoding="utf-8")
+    (project_dir / "revert" / "users.sql").write_text(routine, encoding="utf-8")
+    (project_dir / "deploy" / "posts.sql").write_text(
+        "BEGIN;\nCREATE TABLE posts (id integer);\nCOMMIT;\n", encoding="utf-8"
+    )
+
+    deploy = _invoke(runner, project_dir, "deploy", target)
+    revert = _invoke(runner, project_dir, "revert", target, "-y", "--to", "users")
+
+    assert deploy.exit_code == 0, deploy.output
+    assert revert.exit_code == 0, revert.output
+    assert fake_engine.executed[0] == routine.strip()
+    assert fake_engine.scopes == [("users", False), ("posts", True), ("posts", False)]
+
+
+def test_revert_removes_changes_in_reverse_order(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+) -> None:
+    assert _invoke(runner, project_dir, "deploy", target).exit_code == 0
+
+    result = _invoke(runner, project_dir, "revert", target, "-y")
+
+    assert result.exit_code == 0, result.output
+    assert "  - posts .. ok" in result.output
+    assert "  - users .. ok" in result.output
+    assert fake_engine.deployed == []
+    assert fake_engine.events[-2:] == [("revert", "posts"), ("revert", "users")]
+
+
+def test_revert_without_registry_reports_nothing(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+) -> None:
+    result = _invoke(runner, project_dir, "revert", target, "-y")
+
+    assert result.exit_code == 0, result.output
+    assert "Nothing to revert" in result.output
+
+
+def test_verify_runs_verify_scripts_for_deployed_changes(
+    runner: CliRunner,
+    project_dir: Path,
+    target: str,
+    fake_engine: type[_InMemoryServerEngine],
+) -> None:
+    assert _invoke(runner, project_dir, "deploy", target).exit_code == 0
+    (project_dir / "verify" / "posts.sql").write_text("-- FAIL\n", encoding="utf-8")
+
+    result = _invoke(runner, project_dir, "verify", target)
+
+    assert result.exit_code != 0
+    assert "  * users .. ok" in result.output
+    assert "  # posts .. NOT OK" in result.output
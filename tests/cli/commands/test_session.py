@@ -0,0 +1,35 @@
+"""Tests for the registry snapshot shared across command phases."""
+
+from __future__ import annotations
+
+from sqlitch.cli.commands._session import RegistrySnapshot
+from sqlitch.engine.server import DeployedChangeRow
+
+
+def _snapshot(*names: str) -> RegistrySnapshot:
+    return RegistrySnapshot(
+        rows=[DeployedChangeRow(name, f"id-{name}", None) for name in names],
+        tags={f"id-{name}": {f"@{name}"} for name in names},
+    )
+
+
+def test_discard_removes_rows_newest_first() -> None:
+    snapshot = _snapshot("a", "b", "c")
+
+    snapshot.discard("id-c")
+    snapshot.discard("id-b")
+
+    assert [row.change for row in snapshot.rows] == ["a"]
+    assert snapshot.change_ids == {"id-a"}
+    assert snapshot.tags == {"id-a": {"@a"}}
+
+
+def test_discard_from_the_middle_keeps_later_rows_addressable() -> None:
+    snapshot = _snapshot("a", "b", "c")
+
+    snapshot.discard("id-a")
+    snapshot.discard("id-c")
+    snapshot.discard("id-missing")
+
+    assert [row.change for row in snapshot.rows] == ["b"]
+    assert snapshot.change_ids == {"id-b"}
@@ -675,10 +675,10 @@ class TestVerifyAdditionalScenarios:
         project_dir, _ = setup_project(tmp_path, changes=())
 
         with pushd(project_dir):
-            result = runner.invoke(main, ["verify", "db:pg:flipr"])
+            result = runner.invoke(main, ["verify", "db:oracle://localhost/flipr"])
 
         assert result.exit_code == 1
-        assert "verification is not supported" in result.output
+        assert "Unsupported engine 'oracle'" in result.output
 
     def test_execute_sqlite_verify_script_handles_multiple_statements(self) -> None:
         connection = sqlite3.connect(":memory:")
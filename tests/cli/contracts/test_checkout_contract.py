@@ -98,6 +98,26 @@ def test_checkout_log_only_reports_pipeline(runner: CliRunner) -> None:
         assert "Log-only run; no database changes were applied." in result.output
 
 
+def test_checkout_resolves_symbolic_to_change(runner: CliRunner) -> None:
+    """``--to-change`` accepts symbolic references resolved against the plan."""
+
+    with isolated_test_context(runner) as (runner, temp_dir):
+        plan_path = Path("sqlitch.plan")
+        _seed_plan(plan_path)
+        Path("sqitch.conf").write_text("[core]\n\tengine = sqlite\n", encoding="utf-8")
+
+        args = ["checkout", "--log-only", "--target", "db:sqlite:deploy.db", "--to-change"]
+        env = {"SQLITCH_VCS_COMMAND": "git checkout main"}
+
+        result = runner.invoke(main, [*args, "@HEAD"], env=env)
+        assert result.exit_code == 0, result.output
+        assert "using mode 'latest' to change 'widgets:init'" in result.output
+
+        missing = runner.invoke(main, [*args, "gadgets"], env=env)
+        assert missing.exit_code != 0
+        assert "Plan does not contain change 'gadgets'." in missing.output
+
+
 # =============================================================================
 # CLI Contract Tests (merged from tests/cli/commands/test_checkout_contract.py)
 # =============================================================================
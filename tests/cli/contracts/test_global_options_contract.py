@@ -95,6 +95,7 @@ COMMANDS = [
     "engine",
     "help",
     "init",
+    "lock",
     "log",
     "plan",
     "rebase",
@@ -69,9 +69,27 @@ def _seed_plan(plan_path: Path) -> tuple[Change, Change, Tag]:
     config_path = plan_path.parent / "sqitch.conf"
     config_path.write_text("[core]\n\tengine = sqlite\n", encoding="utf-8")
 
+    for change, table in ((change_one, "core"), (change_two, "widgets")):
+        scripts = {
+            "deploy": f"CREATE TABLE {table} (id INTEGER);\n",
+            "revert": f"DROP TABLE {table};\n",
+            "verify": f"SELECT id FROM {table} WHERE 0;\n",
+        }
+        for kind, body in scripts.items():
+            script_path = plan_path.parent / change.script_paths[kind]
+            script_path.parent.mkdir(parents=True, exist_ok=True)
+            script_path.write_text(body, encoding="utf-8")
+
     return change_one, change_two, tag
 
 
+def _deploy(runner: CliRunner) -> None:
+    """Deploy the seeded plan so log-only rebases have a registry to diff."""
+
+    result = runner.invoke(main, ["deploy", "db:sqlite:rebase.db"])
+    assert result.exit_code == 0, result.output
+
+
 def test_rebase_requires_target(runner: CliRunner) -> None:
     """Rebase should require a target to be provided explicitly or via config."""
 
@@ -91,6 +109,10 @@ def test_rebase_log_only_shows_revert_and_deploy_sequences(runner: CliRunner) ->
     with isolated_test_context(runner) as (runner, temp_dir):
         plan_path = Path("sqlitch.plan")
         change_one, change_two, _ = _seed_plan(plan_path)
+        _deploy(runner)
+        Path("deploy/core_init.sql").write_text(
+            "CREATE TABLE core (id INTEGER, name TEXT);\n", encoding="utf-8"
+        )
 
         result = runner.invoke(
             main,
@@ -121,6 +143,7 @@ def test_rebase_from_option_limits_redeploy_scope(runner: CliRunner) -> None:
     with isolated_test_context(runner) as (runner, temp_dir):
         plan_path = Path("sqlitch.plan")
         change_one, change_two, _ = _seed_plan(plan_path)
+        _deploy(runner)
 
         result = runner.invoke(
             main,
@@ -145,6 +168,7 @@ def test_rebase_onto_option_limits_revert_scope(runner: CliRunner) -> None:
     with isolated_test_context(runner) as (runner, temp_dir):
         plan_path = Path("sqlitch.plan")
         change_one, change_two, tag = _seed_plan(plan_path)
+        _deploy(runner)
 
         result = runner.invoke(
             main,
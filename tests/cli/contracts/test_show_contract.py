@@ -185,6 +185,22 @@ def test_show_json_format_returns_structured_payload(runner: CliRunner) -> None:
         }
 
 
+def test_show_lists_changes_that_require_the_change(runner: CliRunner) -> None:
+    """Reverse dependencies come from the plan dependency graph."""
+
+    with isolated_test_context(runner) as (runner, temp_dir):
+        project_root = Path.cwd()
+        _seed_project(project_root)
+
+        human = runner.invoke(main, ["show", "core:init"])
+        assert human.exit_code == 0, human.stderr
+        assert "Required By: widgets:add" in human.stdout
+
+        json_result = runner.invoke(main, ["show", "widgets:add", "--format", "json"])
+        assert json_result.exit_code == 0, json_result.stderr
+        assert json.loads(json_result.stdout)["required_by"] == []
+
+
 def test_show_script_option_outputs_script_contents(runner: CliRunner) -> None:
     """Requesting a script should stream the script contents verbatim."""
 
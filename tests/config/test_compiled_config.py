@@ -0,0 +1,94 @@
+"""Tests for the persistent compiled configuration cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sqlitch.config import resolver
+from sqlitch.config.compiled import COMPILED_CONFIG_ENV
+from sqlitch.config.loader import ConfigProfile
+
+
+@pytest.fixture
+def dirs(tmp_path: Path) -> tuple[Path, Path]:
+    project_dir = tmp_path / "project"
+    user_dir = tmp_path / "user"
+    project_dir.mkdir()
+    user_dir.mkdir()
+    (project_dir / "sqitch.conf").write_text("[core]\n\tengine = sqlite\n", encoding="utf-8")
+    (user_dir / "sqitch.conf").write_text("[user]\n\tname = Alice\n", encoding="utf-8")
+    return project_dir, user_dir
+
+
+def _resolve(project_dir: Path, user_dir: Path, **env: str) -> ConfigProfile:
+    return resolver.resolve_config(
+        root_dir=project_dir,
+        config_root=user_dir,
+        env={COMPILED_CONFIG_ENV: "1", **env},
+        system_path=project_dir.parent / "system",
+    )
+
+
+def _forbid_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(**_: object) -> ConfigProfile:
+        raise AssertionError("configuration files were parsed")
+
+    monkeypatch.setattr(resolver, "load_config", _fail)
+
+
+def test_compiled_profile_skips_parsing(
+    dirs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project_dir, user_dir = dirs
+    parsed = _resolve(project_dir, user_dir)
+    assert list((user_dir / "cache" / "config" / "v1").glob("*.json"))
+
+    _forbid_parsing(monkeypatch)
+    compiled = _resolve(project_dir, user_dir)
+
+    assert compiled == parsed
+    assert compiled.settings["user"] == {"name": "Alice"}
+
+
+def test_changed_source_file_invalidates_entry(dirs: tuple[Path, Path]) -> None:
+    project_dir, user_dir = dirs
+    _resolve(project_dir, user_dir)
+
+    config_file = user_dir / "sqitch.conf"
+    config_file.write_text("[user]\n\tname = Bob\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _resolve(project_dir, user_dir).settings["user"] == {"name": "Bob"}
+
+
+def test_environment_overlays_select_separate_entries(
+    dirs: tuple[Path, Path], tmp_path: Path
+) -> None:
+    project_dir, user_dir = dirs
+    override = tmp_path / "override.conf"
+    override.write_text("[core]\n\tengine = pg\n", encoding="utf-8")
+
+    assert _resolve(project_dir, user_dir).active_engine == "sqlite"
+    assert _resolve(project_dir, user_dir, SQLITCH_CONFIG=str(override)).active_engine == "pg"
+    assert len(list((user_dir / "cache" / "config" / "v1").glob("*.json"))) == 2
+
+
+def test_corrupt_entry_is_ignored(dirs: tuple[Path, Path]) -> None:
+    project_dir, user_dir = dirs
+    _resolve(project_dir, user_dir)
+    for entry in (user_dir / "cache" / "config" / "v1").glob("*.json"):
+        entry.write_text("{not json", encoding="utf-8")
+
+    assert _resolve(project_dir, user_dir).active_engine == "sqlite"
+
+
+def test_cache_is_disabled_by_default(dirs: tuple[Path, Path]) -> None:
+    project_dir, user_dir = dirs
+
+    resolver.resolve_config(root_dir=project_dir, config_root=user_dir, env={})
+
+    assert not (user_dir / "cache").exists()
@@ -0,0 +1,105 @@
+"""Tests for the invocation-scoped configuration cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from sqlitch.cli.main import main
+from sqlitch.config import resolver
+from sqlitch.config.loader import ConfigProfile
+
+
+def _resolve(project_dir: Path, user_dir: Path, cache: resolver.ConfigCache) -> ConfigProfile:
+    return resolver.resolve_config(
+        root_dir=project_dir,
+        config_root=user_dir,
+        env={},
+        system_path=project_dir.parent / "system",
+        cache=cache,
+    )
+
+
+@pytest.fixture
+def dirs(tmp_path: Path) -> tuple[Path, Path]:
+    project_dir = tmp_path / "project"
+    user_dir = tmp_path / "user"
+    project_dir.mkdir()
+    user_dir.mkdir()
+    (project_dir / "sqitch.conf").write_text("[core]\n\tengine = sqlite\n", encoding="utf-8")
+    return project_dir, user_dir
+
+
+def test_cache_reuses_profile_until_a_file_changes(dirs: tuple[Path, Path]) -> None:
+    project_dir, user_dir = dirs
+    cache = resolver.ConfigCache()
+
+    first = _resolve(project_dir, user_dir, cache)
+    assert _resolve(project_dir, user_dir, cache) is first
+    assert (cache.loads, cache.hits) == (1, 1)
+
+    config_file = project_dir / "sqitch.conf"
+    config_file.write_text("[core]\n\tengine = pg\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _resolve(project_dir, user_dir, cache).active_engine == "pg"
+    assert cache.loads == 2
+
+
+def test_cache_notices_new_scope_files(dirs: tuple[Path, Path]) -> None:
+    project_dir, user_dir = dirs
+    cache = resolver.ConfigCache()
+
+    assert "user" not in _resolve(project_dir, user_dir, cache).settings
+    (user_dir / "sqitch.conf").write_text("[user]\n\tname = Alice\n", encoding="utf-8")
+
+    assert _resolve(project_dir, user_dir, cache).settings["user"] == {"name": "Alice"}
+    assert cache.loads == 2
+
+
+def test_activated_cache_serves_calls_without_explicit_cache(dirs: tuple[Path, Path]) -> None:
+    project_dir, user_dir = dirs
+    cache = resolver.ConfigCache()
+
+    with resolver.activate_config_cache(cache):
+        for _ in range(3):
+            resolver.resolve_config(root_dir=project_dir, config_root=user_dir, env={})
+    resolver.resolve_config(root_dir=project_dir, config_root=user_dir, env={})
+
+    assert resolver.active_config_cache() is None
+    assert (cache.loads, cache.hits) == (1, 2)
+
+
+def test_deploy_parses_configuration_once(
+    dirs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project_dir, user_dir = dirs
+    (project_dir / "sqitch.plan").write_text(
+        "%syntax-version=1.0.0\n%project=cache_test\n\n"
+        "items 2025-01-01T12:00:00Z Alice <alice@example.com> # Items\n",
+        encoding="utf-8",
+    )
+    (project_dir / "deploy").mkdir()
+    (project_dir / "deploy" / "items.sql").write_text("CREATE TABLE items (id INTEGER);\n")
+    monkeypatch.chdir(project_dir)
+
+    loads: list[Path] = []
+    original_load_config = resolver.load_config
+
+    def _counting_load_config(**kwargs: object) -> ConfigProfile:
+        profile = original_load_config(**kwargs)  # type: ignore[arg-type]
+        loads.append(profile.root_dir)
+        return profile
+
+    monkeypatch.setattr(resolver, "load_config", _counting_load_config)
+
+    result = CliRunner().invoke(
+        main, ["--config-root", str(user_dir), "deploy", "db:sqlite:test.db"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert loads == [project_dir]
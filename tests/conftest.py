@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Final
 
 import pytest
 
-_UNSUPPORTED_ENGINES: Final[dict[str, str]] = {
-    "mysql": "MySQL engine suite skipped: SQLitch ships a parity stub only.",
-    "pg": "PostgreSQL engine suite skipped: SQLitch ships a parity stub only.",
-    "postgres": "PostgreSQL engine suite skipped: SQLitch ships a parity stub only.",
-    "postgresql": "PostgreSQL engine suite skipped: SQLitch ships a parity stub only.",
+from tests.support.sqlite_fixtures import SQLITE_CONFIG, write_project_files
+
+PG_TEST_URI_ENV: Final[str] = "SQLITCH_TEST_PG_URI"
+"""Environment variable naming a throwaway PostgreSQL database for engine tests."""
+
+MYSQL_TEST_URI_ENV: Final[str] = "SQLITCH_TEST_MYSQL_URI"
+"""Environment variable naming a throwaway MySQL/MariaDB database for engine tests."""
+
+_SERVER_ENGINE_URI_ENVS: Final[dict[str, tuple[str, str]]] = {
+    **{
+        name: (
+            PG_TEST_URI_ENV,
+            f"PostgreSQL engine suite skipped: set {PG_TEST_URI_ENV} to a throwaway database URI.",
+        )
+        for name in ("pg", "postgres", "postgresql")
+    },
+    **{
+        name: (
+            MYSQL_TEST_URI_ENV,
+            f"MySQL engine suite skipped: set {MYSQL_TEST_URI_ENV} to a throwaway database URI.",
+        )
+        for name in ("mysql", "mariadb")
+    },
 }
 
 
@@ -148,8 +168,29 @@ def pytest_collection_modifyitems(  # pylint: disable=unused-argument
             continue
 
         engine_name = str(marker.args[0]).strip().lower()
-        reason = _UNSUPPORTED_ENGINES.get(engine_name)
-        if reason is None:
+        if engine_name not in _SERVER_ENGINE_URI_ENVS:
             continue
 
-        item.add_marker(pytest.mark.skip(reason=reason))
+        env_name, reason = _SERVER_ENGINE_URI_ENVS[engine_name]
+        if not os.environ.get(env_name):
+            item.add_marker(pytest.mark.skip(reason=reason))
+
+
+@pytest.fixture
+def make_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[..., Path]:
+    """Return a factory that writes a project under ``tmp_path`` and changes into it.
+
+    The factory takes the project directory name, the plan text, and the
+    scripts keyed by project-relative path, plus an optional ``config``.
+    """
+
+    def _make(
+        name: str, plan: str, scripts: Mapping[str, str], *, config: str = SQLITE_CONFIG
+    ) -> Path:
+        project_dir = write_project_files(
+            tmp_path / name, plan=plan, scripts=scripts, config=config
+        )
+        monkeypatch.chdir(project_dir)
+        return project_dir
+
+    return _make
@@ -0,0 +1,170 @@
+"""Tests for the asynchronous engine API."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from sqlitch.engine import EngineTarget, create_async_engine, gather_bounded
+from sqlitch.engine.aio import PsycopgAsyncEngine, ThreadedAsyncEngine
+
+
+def _sqlite_target(tmp_path: Path, name: str = "flipr") -> EngineTarget:
+    uri = f"db:sqlite:{tmp_path / f'{name}.db'}"
+    return EngineTarget(
+        name=uri, engine="sqlite", uri=uri, registry_uri=f"db:sqlite:{tmp_path / 'sqitch.db'}"
+    )
+
+
+class TestCreateAsyncEngine:
+    def test_sqlite_targets_are_thread_offloaded(self, tmp_path: Path) -> None:
+        engine = create_async_engine(_sqlite_target(tmp_path))
+
+        assert isinstance(engine, ThreadedAsyncEngine)
+        assert engine.target.engine == "sqlite"
+        assert engine.format_query("SELECT ?") == "SELECT ?"
+
+    def test_postgres_targets_use_native_asyncio(self) -> None:
+        target = EngineTarget(name="pg", engine="pg", uri="db:pg:flipr")
+
+        engine = create_async_engine(target)
+
+        assert isinstance(engine, PsycopgAsyncEngine)
+        assert engine.format_query("SELECT ?") == "SELECT %s"
+
+
+class TestThreadedSQLiteConnections:
+    def test_script_and_queries_round_trip(self, tmp_path: Path) -> None:
+        engine = create_async_engine(_sqlite_target(tmp_path))
+
+        async def scenario() -> list[tuple[object, ...]]:
+            async with await engine.connect_workspace() as connection:
+                await engine.execute_script(
+                    connection, "CREATE TABLE users (name TEXT); CREATE TABLE roles (id INT);"
+                )
+                await connection.execute("INSERT INTO users (name) VALUES (?)", ("alice",))
+                return await connection.fetchall("SELECT name FROM users")
+
+        assert asyncio.run(scenario()) == [("alice",)]
+
+    def test_execute_commits_each_statement(self, tmp_path: Path) -> None:
+        engine = create_async_engine(_sqlite_target(tmp_path))
+
+        async def scenario() -> list[tuple[object, ...]]:
+            async with await engine.connect_workspace() as connection:
+                await connection.execute("CREATE TABLE users (name TEXT)")
+                await connection.execute("INSERT INTO users (name) VALUES (?)", ("bob",))
+            async with await engine.connect_workspace() as connection:
+                return await connection.fetchall("SELECT name FROM users")
+
+        assert asyncio.run(scenario()) == [("bob",)]
+
+    def test_registry_connection_opens_registry_database(self, tmp_path: Path) -> None:
+        engine = create_async_engine(_sqlite_target(tmp_path))
+
+        async def scenario() -> None:
+            async with await engine.connect_registry() as connection:
+                await connection.execute("CREATE TABLE marker (id INT)")
+
+        asyncio.run(scenario())
+
+        assert (tmp_path / "sqitch.db").exists()
+
+    def test_connection_stays_on_one_worker_thread(self, tmp_path: Path) -> None:
+        engine = create_async_engine(_sqlite_target(tmp_path))
+
+        async def scenario() -> None:
+            connection = await engine.connect_workspace()
+            try:
+                for _ in range(3):
+                    await connection.fetchall("SELECT 1")
+            finally:
+                await connection.close()
+
+        # sqlite3 rejects use from any thread other than the creating one.
+        asyncio.run(scenario())
+
+    def test_connect_failure_propagates(self, tmp_path: Path) -> None:
+        target = _sqlite_target(tmp_path / "missing" / "dir")
+        engine = create_async_engine(target)
+
+        async def scenario() -> None:
+            await engine.connect_workspace()
+
+        with pytest.raises(Exception, match="unable to open database"):
+            asyncio.run(scenario())
+
+
+class TestGatherBounded:
+    def test_limits_concurrency_and_preserves_order(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def operation(item: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (5 - item))
+            in_flight -= 1
+            return item * 10
+
+        results = asyncio.run(gather_bounded(range(5), operation, concurrency=2))
+
+        assert results == [0, 10, 20, 30, 40]
+        assert peak == 2
+
+    def test_first_failure_propagates_and_cancels_others(self) -> None:
+        cancelled = threading.Event()
+
+        async def operation(item: int) -> int:
+            if item == 0:
+                raise RuntimeError("target unreachable")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return item
+
+        with pytest.raises(RuntimeError, match="target unreachable"):
+            asyncio.run(gather_bounded(range(3), operation, concurrency=3))
+
+        assert cancelled.is_set()
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        async def operation(item: int) -> int:
+            return item
+
+        with pytest.raises(ValueError, match="concurrency"):
+            asyncio.run(gather_bounded([1], operation, concurrency=0))
+
+    def test_runs_status_queries_across_many_targets(self, tmp_path: Path) -> None:
+        targets = [_sqlite_target(tmp_path, f"db{index}") for index in range(4)]
+
+        async def count_tables(target: EngineTarget) -> int:
+            engine = create_async_engine(target)
+            async with await engine.connect_workspace() as connection:
+                await connection.execute_script("CREATE TABLE t (id INT);")
+                rows = await connection.fetchall(
+                    "SELECT count(*) FROM sqlite_master WHERE type = 'table'"
+                )
+            return int(rows[0][0])
+
+        assert asyncio.run(gather_bounded(targets, count_tables, concurrency=2)) == [1, 1, 1, 1]
+
+
+@pytest.mark.requires_engine("pg")
+def test_live_postgres_connection_runs_natively() -> None:
+    uri = os.environ["SQLITCH_TEST_PG_URI"]
+    engine = create_async_engine(EngineTarget(name=uri, engine="pg", uri=uri))
+
+    async def scenario() -> list[tuple[object, ...]]:
+        async with await engine.connect_workspace() as connection:
+            await engine.execute_script(connection, "SELECT 1; SELECT 2;")
+            return await connection.fetchall("SELECT %s::int", (7,))
+
+    assert asyncio.run(scenario()) == [(7,)]
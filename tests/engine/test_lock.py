@@ -0,0 +1,184 @@
+"""Tests for the advisory deploy lock."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from sqlitch.engine.lock import (
+    DeployLock,
+    DeployLockError,
+    LockInfo,
+    lock_path_for_registry,
+    read_lock_info,
+)
+
+
+def _write_lock(path: Path, *, heartbeat_at: float, owner: str = "Bob <bob@example.com>") -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "owner": owner,
+                "pid": 4242,
+                "host": "build-1",
+                "acquired_at": heartbeat_at,
+                "heartbeat_at": heartbeat_at,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_lock_path_sits_next_to_registry(tmp_path: Path) -> None:
+    assert lock_path_for_registry(tmp_path / "sqitch.db") == tmp_path / "sqitch.db.lock"
+
+
+def test_acquire_records_holder_and_release_removes_file(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+
+    with DeployLock(path, owner="Alice <alice@example.com>", timeout=0) as lock:
+        assert lock.held
+        info = read_lock_info(path)
+        assert info is not None
+        assert info.owner == "Alice <alice@example.com>"
+        assert info.pid == os.getpid()
+
+    assert not lock.held
+    assert not path.exists()
+
+
+def test_zero_timeout_fails_without_waiting(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    _write_lock(path, heartbeat_at=time.time())
+    delays: list[float] = []
+
+    lock = DeployLock(path, owner="Alice", timeout=0, sleep=delays.append)
+
+    with pytest.raises(DeployLockError, match=r"held by Bob <bob@example.com> \(pid 4242"):
+        lock.acquire()
+    assert delays == []
+    assert not lock.held
+
+
+def test_waits_with_exponential_backoff_until_released(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    _write_lock(path, heartbeat_at=time.time())
+    delays: list[float] = []
+
+    def sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) == 4:
+            path.unlink()
+
+    lock = DeployLock(
+        path, owner="Alice", timeout=3600, initial_delay=0.1, max_delay=0.5, sleep=sleep
+    )
+    lock.acquire()
+    lock.release()
+
+    assert delays == [0.1, 0.2, 0.4, 0.5]
+
+
+def test_stale_lock_is_taken_over(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    _write_lock(path, heartbeat_at=time.time() - 120)
+
+    lock = DeployLock(path, owner="Alice", timeout=0, stale_after=30)
+    lock.acquire()
+    try:
+        info = read_lock_info(path)
+        assert info is not None and info.owner == "Alice"
+    finally:
+        lock.release()
+
+
+def test_release_leaves_a_lock_taken_over_by_another_holder(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    lock = DeployLock(path, owner="Alice", timeout=0)
+    lock.acquire()
+    _write_lock(path, heartbeat_at=time.time())
+
+    lock.release()
+
+    info = read_lock_info(path)
+    assert info is not None and info.pid == 4242
+
+
+def test_heartbeat_refreshes_the_lock_file(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    lock = DeployLock(path, owner="Alice", timeout=0, heartbeat_interval=0.01)
+    lock.acquire()
+    try:
+        first = read_lock_info(path)
+        assert first is not None
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            current = read_lock_info(path)
+            if current is not None and current.heartbeat_at > first.heartbeat_at:
+                break
+            time.sleep(0.01)
+        else:  # pragma: no cover - only reached when the heartbeat thread stalls
+            pytest.fail("heartbeat was not refreshed")
+    finally:
+        lock.release()
+
+
+def test_read_lock_info_handles_missing_and_corrupt_files(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    assert read_lock_info(path) is None
+
+    path.write_text("{not json", encoding="utf-8")
+    info = read_lock_info(path)
+
+    assert info is not None
+    assert info.owner == "unknown"
+    assert info.heartbeat_at == pytest.approx(path.stat().st_mtime)
+
+
+def test_lock_info_describes_holder() -> None:
+    info = LockInfo(owner="Alice", pid=7, host="ci", acquired_at=10.0, heartbeat_at=10.0)
+
+    assert info.describe() == "Alice (pid 7 on ci)"
+    assert info.age(now=25.0) == 15.0
+
+
+def test_heartbeat_stops_when_the_lock_is_taken_over(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    lock = DeployLock(path, owner="Alice", timeout=0, heartbeat_interval=0.01)
+    lock.acquire()
+    try:
+        _write_lock(path, heartbeat_at=time.time())
+        deadline = time.monotonic() + 5
+        while not lock.lost and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert lock.lost
+        taken_over = read_lock_info(path)
+        time.sleep(0.05)
+        assert read_lock_info(path) == taken_over
+        assert "taken over by Bob <bob@example.com> (pid 4242 on build-1)" in caplog.text
+    finally:
+        lock.release()
+
+    assert path.exists()
+
+
+def test_heartbeat_does_not_recreate_a_removed_lock(tmp_path: Path) -> None:
+    path = tmp_path / "sqitch.db.lock"
+    lock = DeployLock(path, owner="Alice", timeout=0, heartbeat_interval=0.01)
+    lock.acquire()
+    try:
+        path.unlink()
+        deadline = time.monotonic() + 5
+        while not lock.lost and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert lock.lost
+        time.sleep(0.05)
+        assert not path.exists()
+    finally:
+        lock.release()
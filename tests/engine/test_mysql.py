@@ -0,0 +1,350 @@
+"""Tests for the MySQL engine adapter."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from pymysql.constants import SERVER_STATUS
+
+from sqlitch.engine import EngineError, EngineTarget, canonicalize_engine_name, create_engine
+from sqlitch.engine.mysql import MySQLEngine, _split_mysql_script, mysql_connect_kwargs
+from sqlitch.engine.server import RegistryChangeRecord, RegistryTagRecord, close_connection_pools
+from sqlitch.registry.migrations import get_registry_migrations
+
+_NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _target(
+    uri: str = "db:mysql://bob@db.example/app", registry: str | None = None
+) -> EngineTarget:
+    return EngineTarget(name=uri, engine="mysql", uri=uri, registry_uri=registry or uri)
+
+
+def _record(**overrides: Any) -> RegistryChangeRecord:
+    values: dict[str, Any] = {
+        "project": "flipr",
+        "change_id": "c" * 40,
+        "change": "users",
+        "script_hash": "h" * 40,
+        "note": "Adds users",
+        "committed_at": _NOW,
+        "committer_name": "Alice",
+        "committer_email": "alice@example.com",
+        "planned_at": _NOW,
+        "planner_name": "Bob",
+        "planner_email": "bob@example.com",
+    }
+    values.update(overrides)
+    return RegistryChangeRecord(**values)
+
+
+class TestMySQLConnectKwargs:
+    def test_network_uri(self) -> None:
+        assert mysql_connect_kwargs("db:mysql://bob:s%40cret@db:3307/app") == {
+            "host": "db",
+            "port": 3307,
+            "user": "bob",
+            "password": "s@cret",
+            "database": "app",
+        }
+
+    def test_database_name_form(self) -> None:
+        assert mysql_connect_kwargs("db:mysql:flipr") == {"database": "flipr"}
+
+    def test_empty_payload_uses_driver_defaults(self) -> None:
+        assert mysql_connect_kwargs("db:mysql:") == {}
+
+    def test_rejects_malformed_uri(self) -> None:
+        with pytest.raises(EngineError, match="Malformed MySQL target URI"):
+            mysql_connect_kwargs("db:mysql")
+
+
+class TestMySQLEngineConfiguration:
+    def test_registered_under_canonical_name(self) -> None:
+        assert canonicalize_engine_name("mariadb") == "mysql"
+        assert isinstance(create_engine(_target()), MySQLEngine)
+
+    def test_defaults_registry_database_to_sqitch(self) -> None:
+        assert MySQLEngine(_target()).registry_database == "sqitch"
+
+    def test_registry_uri_names_database(self) -> None:
+        engine = MySQLEngine(_target(registry="db:mysql://bob@db.example/meta"))
+
+        assert engine.registry_database == "meta"
+
+    def test_rejects_unsafe_registry_database(self) -> None:
+        with pytest.raises(EngineError, match="Invalid MySQL registry database"):
+            MySQLEngine(_target(registry="sqitch`; DROP"))
+
+    def test_connections_enable_multi_statements_and_autocommit(self) -> None:
+        from pymysql.constants import CLIENT
+
+        engine = MySQLEngine(_target(registry="meta"), connect_kwargs={"connect_timeout": 3})
+
+        workspace = engine.build_workspace_connect_arguments().kwargs
+        registry = engine.build_registry_connect_arguments().kwargs
+
+        assert workspace["autocommit"] is True
+        assert workspace["client_flag"] & CLIENT.MULTI_STATEMENTS
+        assert workspace["database"] == "app"
+        assert workspace["connect_timeout"] == 3
+        assert registry["database"] == "meta"
+        assert "ANSI_QUOTES" in registry["init_command"]
+
+    def test_connection_failure_is_reported_as_engine_error(self) -> None:
+        engine = MySQLEngine(
+            _target("db:mysql://root@127.0.0.1:1/app"), connect_kwargs={"connect_timeout": 1}
+        )
+
+        with pytest.raises(EngineError, match="Unable to connect to db:mysql://root@127.0.0.1:1"):
+            engine.open_connection()
+
+
+@pytest.mark.parametrize(
+    ("script", "expected"),
+    [
+        ("CREATE TABLE users (id integer);\n", False),
+        ("START TRANSACTION;\nCREATE TABLE users (id integer);\nCOMMIT;\n", True),
+        (
+            "CREATE TRIGGER t BEFORE INSERT ON users FOR EACH ROW\nBEGIN\n  SET NEW.a = 1;\nEND;\n",
+            False,
+        ),
+        ("SELECT 'it\\'s; COMMIT;'; # COMMIT;\n", False),
+    ],
+)
+def test_script_manages_transactions_ignores_compound_statements(
+    script: str, expected: bool
+) -> None:
+    assert MySQLEngine(_target()).script_manages_transactions(script) is expected
+
+
+def test_split_script_separates_delimiter_blocks() -> None:
+    baseline = next(m for m in get_registry_migrations("mysql") if m.is_baseline)
+
+    batches = _split_mysql_script(baseline.sql)
+
+    assert batches[0].startswith("SET SESSION sql_mode = ansi;")
+    assert "CREATE TABLE events" in batches[0]
+    assert [batch.split()[2] for batch in batches[1:]] == [
+        "ck_insert_dependency",
+        "ck_update_dependency",
+    ]
+    assert not any("DELIMITER" in batch or "COMMIT;" in batch for batch in batches)
+
+
+class _RecordingCursor:
+    def __init__(self, connection: _RecordingConnection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> _RecordingCursor:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def mogrify(self, sql: str, params: Any = None) -> str:
+        return sql % tuple(repr(value) for value in params) if params else sql
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self._connection.calls.append(self.mogrify(sql, params))
+        if self._connection.fail_on and self._connection.fail_on in sql:
+            raise self._connection.error
+        for statement in sql.split(";"):
+            keyword = statement.split()[0].upper() if statement.split() else ""
+            if keyword in {"START", "BEGIN"}:
+                self._connection.server_status = SERVER_STATUS.SERVER_STATUS_IN_TRANS
+            elif keyword in {"COMMIT", "ROLLBACK", "CREATE", "DROP", "ALTER"}:
+                # DDL commits implicitly, as on a real server.
+                self._connection.server_status = 0
+
+    def nextset(self) -> None:
+        return None
+
+
+class _RecordingConnection:
+    def __init__(self, fail_on: str | None = None) -> None:
+        import pymysql
+
+        self.calls: list[str] = []
+        self.rollbacks = 0
+        self.server_status = 0
+        self.fail_on = fail_on
+        self.error = pymysql.err.ProgrammingError(1146, "Table 'app.missing' doesn't exist")
+
+    def cursor(self) -> _RecordingCursor:
+        return _RecordingCursor(self)
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+class TestMySQLRegistryWrites:
+    def test_deploy_sends_script_then_one_registry_batch(self) -> None:
+        connection = _RecordingConnection()
+        record = _record(
+            requires=("roles", "groups"),
+            tags=(RegistryTagRecord("t" * 40, "v1"), RegistryTagRecord("u" * 40, "v2")),
+            dependency_ids={"roles": "r" * 40, "groups": "g" * 40},
+        )
+
+        MySQLEngine(_target()).deploy_change(
+            connection, "CREATE TABLE users (id INT);", record, manages_transactions=False
+        )
+
+        assert len(connection.calls) == 2
+        script, registry = connection.calls
+        assert script == "START TRANSACTION;\nCREATE TABLE users (id INT);"
+        statements = registry.split(";\n")[1:]
+        # The DDL committed the script's transaction, so the registry opens its own.
+        assert registry.startswith("START TRANSACTION;\n")
+        assert [statement.split()[0] for statement in statements] == [
+            "INSERT",
+            "INSERT",
+            "INSERT",
+            "INSERT",
+            "COMMIT",
+        ]
+        assert statements[1].startswith("INSERT INTO `sqitch`.dependencies")
+        assert statements[1].count("), (") == 1
+        assert statements[2].startswith("INSERT INTO `sqitch`.tags")
+        assert statements[2].count("), (") == 1
+        assert "'roles,groups'" in statements[3]
+        # DATETIME columns carry no zone, so timestamps are sent as naive UTC.
+        assert "datetime.datetime(2026, 1, 2, 3, 4, 5)" in statements[0]
+
+    def test_registry_writes_join_an_open_script_transaction(self) -> None:
+        connection = _RecordingConnection()
+
+        MySQLEngine(_target()).deploy_change(
+            connection, "INSERT INTO flags VALUES (1);", _record(), manages_transactions=False
+        )
+
+        assert connection.calls[0] == "START TRANSACTION;\nINSERT INTO flags VALUES (1);"
+        assert connection.calls[1].startswith("INSERT INTO `sqitch`.changes")
+        assert connection.calls[1].endswith(";\nCOMMIT")
+
+    def test_delimiter_blocks_in_scripts_are_sent_separately(self) -> None:
+        connection = _RecordingConnection()
+        script = (
+            "CREATE TABLE users (id INT);\n"
+            "DELIMITER //\n"
+            "CREATE TRIGGER users_bi BEFORE INSERT ON users FOR EACH ROW\n"
+            "BEGIN\n  SET NEW.id = NEW.id + 1;\nEND//\n"
+            "DELIMITER ;\n"
+        )
+
+        MySQLEngine(_target()).deploy_change(
+            connection, script, _record(), manages_transactions=False
+        )
+
+        assert connection.calls[:2] == [
+            "START TRANSACTION;\nCREATE TABLE users (id INT);",
+            "CREATE TRIGGER users_bi BEFORE INSERT ON users FOR EACH ROW\n"
+            "BEGIN\n  SET NEW.id = NEW.id + 1;\nEND",
+        ]
+        assert not any("DELIMITER" in call for call in connection.calls)
+        assert connection.calls[2].startswith("START TRANSACTION;\nINSERT")
+
+    def test_script_managing_transactions_is_sent_unchanged(self) -> None:
+        connection = _RecordingConnection()
+
+        MySQLEngine(_target()).deploy_change(
+            connection, "BEGIN; SELECT 1; COMMIT;", _record(), manages_transactions=True
+        )
+
+        assert connection.calls[0] == "BEGIN; SELECT 1; COMMIT;"
+        assert connection.calls[1].startswith("START TRANSACTION;\nINSERT INTO `sqitch`.changes")
+
+    def test_failed_script_rolls_back_and_skips_registry(self) -> None:
+        connection = _RecordingConnection(fail_on="missing")
+
+        with pytest.raises(EngineError, match="Deploy failed for change 'users'"):
+            MySQLEngine(_target()).deploy_change(
+                connection, "SELECT * FROM missing;", _record(), manages_transactions=False
+            )
+
+        assert len(connection.calls) == 1
+        assert connection.rollbacks == 1
+
+    def test_revert_batches_deletes_and_event(self) -> None:
+        connection = _RecordingConnection()
+
+        MySQLEngine(_target()).revert_change(
+            connection, "DROP TABLE users;", _record(), manages_transactions=False
+        )
+
+        statements = connection.calls[1].split(";\n")
+        assert sum(statement.startswith("DELETE") for statement in statements) == 4
+        assert "'revert'" in statements[-2]
+
+    def test_failure_event_uses_sqitch_event_name(self) -> None:
+        connection = _RecordingConnection()
+
+        MySQLEngine(_target()).record_failure(connection, _record())
+
+        assert connection.calls[0].startswith("INSERT INTO `sqitch`.events")
+        assert "('fail', " in connection.calls[0]
+
+    def test_verify_always_rolls_back(self) -> None:
+        connection = _RecordingConnection()
+
+        MySQLEngine(_target()).verify_change(connection, "SELECT 1;")
+
+        assert connection.calls == ["START TRANSACTION;\nSELECT 1;"]
+        assert connection.rollbacks == 1
+
+
+_LIVE_URI = os.environ.get("SQLITCH_TEST_MYSQL_URI", "")
+
+
+@pytest.fixture()
+def live_engine() -> Iterator[MySQLEngine]:
+    database = f"sqitch_test_{uuid.uuid4().hex[:12]}"
+    engine = MySQLEngine(_target(_LIVE_URI), registry_database=database)
+    try:
+        yield engine
+    finally:
+        with engine.session() as connection, connection.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+            cursor.execute("DROP TABLE IF EXISTS sqlitch_live_users")
+        close_connection_pools()
+
+
+@pytest.mark.requires_engine("mysql")
+def test_live_deploy_and_revert_round_trip(live_engine: MySQLEngine) -> None:
+    with live_engine.session() as connection:
+        assert not live_engine.registry_exists(connection)
+        live_engine.initialise_registry(
+            connection, installer_name="Alice", installer_email="alice@example.com"
+        )
+        live_engine.ensure_project(
+            connection,
+            project="flipr",
+            uri=None,
+            creator_name="Alice",
+            creator_email="alice@example.com",
+        )
+        record = _record(tags=(RegistryTagRecord(tag_id="t" * 40, tag="v1"),))
+        live_engine.deploy_change(
+            connection,
+            "CREATE TABLE sqlitch_live_users (id INT);",
+            record,
+            manages_transactions=False,
+        )
+        live_engine.verify_change(connection, "SELECT id FROM sqlitch_live_users;")
+
+        deployed = live_engine.load_deployed_changes(connection, "flipr")
+        assert [row.change for row in deployed] == ["users"]
+
+        live_engine.revert_change(
+            connection,
+            "DROP TABLE sqlitch_live_users;",
+            record,
+            manages_transactions=False,
+        )
+        assert live_engine.load_deployed_changes(connection, "flipr") == []
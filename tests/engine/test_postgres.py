@@ -0,0 +1,280 @@
+"""Tests for the PostgreSQL engine adapter."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from sqlitch.engine import EngineError, EngineTarget, canonicalize_engine_name, create_engine
+from sqlitch.engine.postgres import PostgresEngine, postgres_conninfo
+from sqlitch.engine.server import RegistryChangeRecord, RegistryTagRecord, close_connection_pools
+
+_NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _target(uri: str = "db:pg://alice@db.example/app", registry: str | None = None) -> EngineTarget:
+    return EngineTarget(name=uri, engine="pg", uri=uri, registry_uri=registry or uri)
+
+
+def _record(**overrides: Any) -> RegistryChangeRecord:
+    values: dict[str, Any] = {
+        "project": "flipr",
+        "change_id": "c" * 40,
+        "change": "users",
+        "script_hash": "h" * 40,
+        "note": "Adds users",
+        "committed_at": _NOW,
+        "committer_name": "Alice",
+        "committer_email": "alice@example.com",
+        "planned_at": _NOW,
+        "planner_name": "Bob",
+        "planner_email": "bob@example.com",
+    }
+    values.update(overrides)
+    return RegistryChangeRecord(**values)
+
+
+class TestPostgresConninfo:
+    def test_network_uri_maps_to_postgresql_url(self) -> None:
+        assert postgres_conninfo("db:pg://alice@db:5433/app") == "postgresql://alice@db:5433/app"
+
+    def test_database_name_form(self) -> None:
+        assert postgres_conninfo("db:pg:flipr") == "dbname=flipr"
+
+    def test_empty_payload_defers_to_libpq_defaults(self) -> None:
+        assert postgres_conninfo("db:pg:") == ""
+
+    def test_rejects_malformed_uri(self) -> None:
+        with pytest.raises(EngineError, match="Malformed PostgreSQL target URI"):
+            postgres_conninfo("db:pg")
+
+
+class TestPostgresEngineConfiguration:
+    def test_registered_under_canonical_name(self) -> None:
+        assert canonicalize_engine_name("postgres") == "pg"
+        assert isinstance(create_engine(_target()), PostgresEngine)
+
+    def test_defaults_registry_schema_to_sqitch(self) -> None:
+        assert PostgresEngine(_target()).registry_schema == "sqitch"
+
+    def test_non_uri_registry_names_schema(self) -> None:
+        engine = PostgresEngine(_target(registry="meta"))
+
+        assert engine.registry_schema == "meta"
+        arguments = engine.build_registry_connect_arguments()
+        assert arguments.args == ("postgresql://alice@db.example/app",)
+        assert arguments.kwargs["options"] == "-c search_path=meta"
+        assert arguments.kwargs["autocommit"] is True
+
+    def test_rejects_unsafe_schema_name(self) -> None:
+        with pytest.raises(EngineError, match="Invalid PostgreSQL registry schema"):
+            PostgresEngine(_target(), registry_schema='sqitch"; DROP')
+
+    def test_workspace_connections_use_autocommit_and_extra_kwargs(self) -> None:
+        engine = PostgresEngine(_target(), connect_kwargs={"connect_timeout": 3})
+
+        arguments = engine.build_workspace_connect_arguments()
+
+        assert arguments.kwargs == {"autocommit": True, "connect_timeout": 3}
+
+    def test_format_query_converts_placeholders(self) -> None:
+        engine = PostgresEngine(_target())
+
+        assert engine.format_query("SELECT 1 WHERE a = ? AND b LIKE '5%'") == (
+            "SELECT 1 WHERE a = %s AND b LIKE '5%%'"
+        )
+
+    def test_connection_failure_is_reported_as_engine_error(self) -> None:
+        engine = PostgresEngine(
+            _target("db:pg://127.0.0.1:1/app"), connect_kwargs={"connect_timeout": 1}
+        )
+
+        with pytest.raises(EngineError, match="Unable to connect to db:pg://127.0.0.1:1/app"):
+            engine.open_connection()
+
+
+@pytest.mark.parametrize(
+    ("script", "expected"),
+    [
+        ("CREATE TABLE users (id integer);\n", False),
+        ("BEGIN;\nCREATE TABLE users (id integer);\nCOMMIT;\n", True),
+        ("CREATE TABLE users (id integer);\nEND;\n", True),
+        (
+            "CREATE FUNCTION f() RETURNS trigger AS $$\n"
+            "BEGIN\n  RETURN NEW;\nEND;\n$$ LANGUAGE plpgsql;",
+            False,
+        ),
+        ("DO $body$ BEGIN PERFORM 1; COMMIT; END $body$;", False),
+        ("SELECT 'BEGIN; COMMIT;'; -- COMMIT;\n", False),
+    ],
+)
+def test_script_manages_transactions_ignores_routine_bodies(script: str, expected: bool) -> None:
+    assert PostgresEngine(_target()).script_manages_transactions(script) is expected
+
+
+class _RecordingCursor:
+    def __init__(self, log: list[tuple[Any, ...]]) -> None:
+        self._log = log
+
+    def __enter__(self) -> _RecordingCursor:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None, *, prepare: bool | None = None) -> None:
+        self._log.append(("execute", " ".join(sql.split()), params, prepare))
+
+    def executemany(self, sql: str, rows: Any) -> None:
+        self._log.append(("executemany", " ".join(sql.split()), list(rows)))
+
+
+class _RecordingConnection:
+    def __init__(self) -> None:
+        self.log: list[tuple[Any, ...]] = []
+
+    @contextmanager
+    def pipeline(self) -> Iterator[None]:
+        self.log.append(("pipeline-start",))
+        yield
+        self.log.append(("pipeline-end",))
+
+    @contextmanager
+    def transaction(self, force_rollback: bool = False) -> Iterator[None]:
+        self.log.append(("begin", force_rollback))
+        yield
+        self.log.append(("commit",))
+
+    def cursor(self) -> _RecordingCursor:
+        return _RecordingCursor(self.log)
+
+    def execute(self, sql: str, params: Any = None, *, prepare: bool | None = None) -> None:
+        self.log.append(("execute", " ".join(sql.split()), params, prepare))
+
+
+class TestPostgresRegistryWrites:
+    def test_deploy_batches_registry_rows_in_one_pipeline(self) -> None:
+        connection = _RecordingConnection()
+        record = _record(
+            requires=("roles",),
+            conflicts=("legacy",),
+            tags=(RegistryTagRecord(tag_id="t" * 40, tag="@v1"),),
+            dependency_ids={"roles": "r" * 40},
+        )
+
+        PostgresEngine(_target()).deploy_change(
+            connection, "CREATE TABLE users ();", record, manages_transactions=False
+        )
+
+        kinds = [entry[0] for entry in connection.log]
+        assert kinds == [
+            "begin",
+            "execute",
+            "pipeline-start",
+            "execute",
+            "executemany",
+            "executemany",
+            "execute",
+            "pipeline-end",
+            "commit",
+        ]
+        changes_insert = connection.log[3]
+        assert 'INSERT INTO "sqitch".changes' in changes_insert[1]
+        assert changes_insert[3] is True
+        assert connection.log[4][2] == [
+            ("c" * 40, "require", "roles", "r" * 40),
+            ("c" * 40, "conflict", "legacy", None),
+        ]
+        assert connection.log[5][2][0][:2] == ("t" * 40, "@v1")
+        event = connection.log[6]
+        assert event[2][0] == "deploy"
+        assert event[2][5:8] == (["roles"], ["legacy"], ["@v1"])
+
+    def test_script_managing_transactions_runs_outside_registry_transaction(self) -> None:
+        connection = _RecordingConnection()
+
+        PostgresEngine(_target()).deploy_change(
+            connection, "BEGIN; SELECT 1; COMMIT;", _record(), manages_transactions=True
+        )
+
+        kinds = [entry[0] for entry in connection.log]
+        assert kinds[:2] == ["execute", "begin"]
+        assert "executemany" not in kinds
+
+    def test_revert_deletes_rows_with_prepared_statements(self) -> None:
+        connection = _RecordingConnection()
+
+        PostgresEngine(_target()).revert_change(
+            connection, "DROP TABLE users;", _record(), manages_transactions=False
+        )
+
+        deletes = [
+            entry for entry in connection.log if entry[0] == "execute" and "DELETE" in entry[1]
+        ]
+        assert len(deletes) == 4
+        assert all(entry[2] == ("c" * 40,) and entry[3] is True for entry in deletes)
+        assert connection.log[-3][2][0] == "revert"
+
+    def test_verify_always_rolls_back(self) -> None:
+        connection = _RecordingConnection()
+
+        PostgresEngine(_target()).verify_change(connection, "SELECT 1;")
+
+        assert connection.log[0] == ("begin", True)
+
+
+_LIVE_URI = os.environ.get("SQLITCH_TEST_PG_URI", "")
+
+
+@pytest.fixture()
+def live_engine() -> Iterator[PostgresEngine]:
+    schema = f"sqitch_test_{uuid.uuid4().hex[:12]}"
+    engine = PostgresEngine(_target(_LIVE_URI), registry_schema=schema)
+    try:
+        yield engine
+    finally:
+        with engine.session() as connection:
+            connection.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+            connection.execute("DROP TABLE IF EXISTS sqlitch_live_users")
+        close_connection_pools()
+
+
+@pytest.mark.requires_engine("pg")
+def test_live_deploy_and_revert_round_trip(live_engine: PostgresEngine) -> None:
+    with live_engine.session() as connection:
+        assert not live_engine.registry_exists(connection)
+        live_engine.initialise_registry(
+            connection, installer_name="Alice", installer_email="alice@example.com"
+        )
+        live_engine.ensure_project(
+            connection,
+            project="flipr",
+            uri=None,
+            creator_name="Alice",
+            creator_email="alice@example.com",
+        )
+        record = _record(tags=(RegistryTagRecord(tag_id="t" * 40, tag="@v1"),))
+        live_engine.deploy_change(
+            connection,
+            "CREATE TABLE sqlitch_live_users (id integer);",
+            record,
+            manages_transactions=False,
+        )
+        live_engine.verify_change(connection, "SELECT id FROM sqlitch_live_users;")
+
+        deployed = live_engine.load_deployed_changes(connection, "flipr")
+        assert [row.change for row in deployed] == ["users"]
+
+        live_engine.revert_change(
+            connection,
+            "DROP TABLE sqlitch_live_users;",
+            record,
+            manages_transactions=False,
+        )
+        assert live_engine.load_deployed_changes(connection, "flipr") == []
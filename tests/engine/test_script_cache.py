@@ -0,0 +1,215 @@
+"""Tests for the content-addressed SQLite script cache."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sqlitch.engine import script_cache
+from sqlitch.engine.script_cache import ScriptCache, clear_memory_cache
+from sqlitch.engine.sqlite import (
+    SQLiteEngineError,
+    compute_script_hash,
+    extract_sqlite_statements,
+    prepare_sqlite_script,
+    script_manages_transactions,
+)
+
+SCRIPT = "-- Deploy widgets\nBEGIN;\nCREATE TABLE widgets (id INTEGER);\nCOMMIT;\n"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_memory_cache() -> Iterator[None]:
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
+def _count_preparations(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def counting_prepare(  # type: ignore[no-untyped-def]
+        script_sql: str, *, statements=None, leading_keywords=None
+    ):
+        if statements is None:
+            calls.append(script_sql)
+        return prepare_sqlite_script(
+            script_sql, statements=statements, leading_keywords=leading_keywords
+        )
+
+    monkeypatch.setattr(script_cache, "prepare_sqlite_script", counting_prepare)
+    return calls
+
+
+def test_prepare_sqlite_script_matches_individual_helpers() -> None:
+    prepared = prepare_sqlite_script(SCRIPT)
+
+    assert prepared.script_hash == compute_script_hash(SCRIPT)
+    assert prepared.statements == extract_sqlite_statements(SCRIPT)
+    assert prepared.leading_keywords == ("BEGIN", "CREATE", "COMMIT")
+    assert prepared.manages_transactions is script_manages_transactions(SCRIPT)
+    assert prepared.validation_error is None
+    prepared.validate()
+
+
+def test_prepare_sqlite_script_records_validation_error() -> None:
+    prepared = prepare_sqlite_script("PRAGMA foreign_keys = OFF;")
+
+    assert prepared.validation_error is not None
+    with pytest.raises(SQLiteEngineError, match="foreign_keys"):
+        prepared.validate()
+
+
+def test_memory_cache_lexes_identical_content_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_preparations(monkeypatch)
+
+    first = ScriptCache().prepare(SCRIPT)
+    second = ScriptCache().prepare(SCRIPT)
+
+    assert first is second
+    assert calls == [SCRIPT]
+
+
+def test_persistent_cache_survives_new_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _count_preparations(monkeypatch)
+    cache = ScriptCache.from_env({"SQLITCH_SCRIPT_CACHE": str(tmp_path)})
+
+    stored = cache.prepare(SCRIPT)
+    clear_memory_cache()
+    loaded = cache.prepare(SCRIPT)
+
+    assert loaded == stored
+    assert calls == [SCRIPT]
+    entry = tmp_path / "v3" / stored.script_hash[:2] / f"{stored.script_hash}.json"
+    spans = json.loads(entry.read_text(encoding="utf-8"))["spans"]
+    assert tuple(SCRIPT[start:end] for start, end in spans) == stored.statements
+
+
+def test_corrupt_persistent_entry_is_recomputed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    script_hash = compute_script_hash(SCRIPT)
+    entry = tmp_path / "v3" / script_hash[:2] / f"{script_hash}.json"
+    entry.parent.mkdir(parents=True)
+    entry.write_text('{"version": 3, "script_hash": "other"}', encoding="utf-8")
+    calls = _count_preparations(monkeypatch)
+
+    prepared = ScriptCache(tmp_path).prepare(SCRIPT)
+
+    assert calls == [SCRIPT]
+    assert prepared.statements == extract_sqlite_statements(SCRIPT)
+    assert json.loads(entry.read_text(encoding="utf-8"))["script_hash"] == script_hash
+
+
+def test_unwritable_cache_directory_is_ignored(tmp_path: Path) -> None:
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory", encoding="utf-8")
+
+    prepared = ScriptCache(blocker).prepare(SCRIPT)
+
+    assert prepared.manages_transactions is True
+
+
+def _write_entry(directory: Path, script_sql: str, **payload: object) -> None:
+    script_hash = compute_script_hash(script_sql)
+    entry = directory / "v3" / script_hash[:2] / f"{script_hash}.json"
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    entry.write_text(
+        json.dumps({"version": 3, "script_hash": script_hash, **payload}), encoding="utf-8"
+    )
+
+
+def test_persistent_entry_flags_are_recomputed(tmp_path: Path) -> None:
+    statements = extract_sqlite_statements(SCRIPT)
+    spans = []
+    position = 0
+    for statement in statements:
+        start = SCRIPT.index(statement, position)
+        position = start + len(statement)
+        spans.append([start, position])
+    _write_entry(
+        tmp_path,
+        SCRIPT,
+        spans=spans,
+        leading_keywords=["SELECT", "SELECT", "SELECT"],
+        manages_transactions=False,
+        validation_error="forged",
+    )
+
+    prepared = ScriptCache(tmp_path).prepare(SCRIPT)
+
+    assert prepared == prepare_sqlite_script(SCRIPT)
+
+
+@pytest.mark.parametrize(
+    "spans",
+    [
+        # One span swallowing every statement.
+        [[0, len(SCRIPT.rstrip())]],
+        # A statement dropped from the middle of the script.
+        [[SCRIPT.index("BEGIN"), SCRIPT.index("BEGIN") + 6]],
+        # Statements split inside the comment.
+        [[0, 5], [5, len(SCRIPT.rstrip())]],
+    ],
+)
+def test_persistent_spans_must_match_the_content(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, spans: list[list[int]]
+) -> None:
+    _write_entry(tmp_path, SCRIPT, spans=spans)
+    calls = _count_preparations(monkeypatch)
+
+    prepared = ScriptCache(tmp_path).prepare(SCRIPT)
+
+    assert calls == [SCRIPT]
+    assert prepared.statements == extract_sqlite_statements(SCRIPT)
+
+
+def test_memory_cache_keeps_recent_entries_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(script_cache, "_MEMORY_CACHE_SIZE", 2)
+    calls = _count_preparations(monkeypatch)
+    cache = ScriptCache()
+
+    for script in ("SELECT 1;", "SELECT 2;", "SELECT 1;", "SELECT 3;", "SELECT 1;", "SELECT 2;"):
+        cache.prepare(script)
+
+    assert calls == ["SELECT 1;", "SELECT 2;", "SELECT 3;", "SELECT 2;"]
+
+
+def test_persistent_entry_cannot_replace_statements(tmp_path: Path) -> None:
+    _write_entry(
+        tmp_path,
+        SCRIPT,
+        statements=["DROP TABLE users;", "SELECT 1;", "SELECT 2;"],
+        spans=[],
+    )
+
+    prepared = ScriptCache(tmp_path).prepare(SCRIPT)
+
+    assert prepared.statements == extract_sqlite_statements(SCRIPT)
+
+
+def test_persistent_spans_cover_statements_with_inner_semicolons(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    script = (
+        "CREATE TABLE log (note TEXT DEFAULT 'a;b');\n"
+        "CREATE TRIGGER audit AFTER INSERT ON log BEGIN\n"
+        "    INSERT INTO log (note) VALUES ('x');\n"
+        "END;\n"
+        "SELECT 1"
+    )
+    cache = ScriptCache(tmp_path)
+    stored = cache.prepare(script)
+    clear_memory_cache()
+    calls = _count_preparations(monkeypatch)
+
+    loaded = cache.prepare(script)
+
+    assert calls == []
+    assert loaded == stored
+    assert len(loaded.statements) == 3
@@ -0,0 +1,121 @@
+"""Tests for shared server engine support."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from sqlitch.engine import server
+from sqlitch.engine.server import ConnectionPool
+
+
+class _FakeConnection:
+    def __init__(self, ident: int) -> None:
+        self.ident = ident
+        self.closed = False
+        self.broken = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _make_pool(max_idle: int = 4) -> tuple[ConnectionPool, list[_FakeConnection]]:
+    opened: list[_FakeConnection] = []
+
+    def connect() -> _FakeConnection:
+        connection = _FakeConnection(len(opened))
+        opened.append(connection)
+        return connection
+
+    pool = ConnectionPool(
+        connect,
+        is_usable=lambda connection: not connection.closed and not connection.broken,
+        max_idle=max_idle,
+    )
+    return pool, opened
+
+
+@pytest.fixture(autouse=True)
+def _isolated_pools() -> Iterator[None]:
+    server.close_connection_pools()
+    yield
+    server.close_connection_pools()
+
+
+class TestConnectionPool:
+    def test_reuses_released_connection(self) -> None:
+        pool, opened = _make_pool()
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert len(opened) == 1
+        assert pool.opened == 1
+
+    def test_opens_new_connection_while_one_is_borrowed(self) -> None:
+        pool, opened = _make_pool()
+
+        with pool.connection() as outer, pool.connection() as inner:
+            assert outer is not inner
+
+        assert len(opened) == 2
+
+    def test_discards_connection_when_block_raises(self) -> None:
+        pool, opened = _make_pool()
+
+        with pytest.raises(RuntimeError):
+            with pool.connection():
+                raise RuntimeError("boom")
+
+        assert opened[0].closed
+        with pool.connection() as connection:
+            assert connection is not opened[0]
+
+    def test_skips_unusable_idle_connections(self) -> None:
+        pool, opened = _make_pool()
+        with pool.connection():
+            pass
+        opened[0].broken = True
+
+        with pool.connection() as connection:
+            assert connection is opened[1]
+
+        assert opened[0].closed
+
+    def test_closes_connections_beyond_max_idle(self) -> None:
+        pool, opened = _make_pool(max_idle=1)
+
+        with pool.connection(), pool.connection():
+            pass
+
+        assert [connection.closed for connection in opened] == [True, False]
+
+    def test_close_releases_idle_connections(self) -> None:
+        pool, opened = _make_pool()
+        with pool.connection():
+            pass
+
+        pool.close()
+
+        assert opened[0].closed
+
+
+def test_connection_pool_is_shared_per_engine_and_conninfo() -> None:
+    created: list[ConnectionPool] = []
+
+    def factory() -> ConnectionPool:
+        pool, _ = _make_pool()
+        created.append(pool)
+        return pool
+
+    first = server.connection_pool("pg", "dbname=app", factory)
+    second = server.connection_pool("pg", "dbname=app", factory)
+    other = server.connection_pool("pg", "dbname=other", factory)
+
+    assert first is second
+    assert other is not first
+    assert len(created) == 2
@@ -858,3 +858,15 @@ def test_validate_sqlite_script_ignores_leading_comments() -> None:
     """
 
     validate_sqlite_script(script)
+
+
+def test_sqlite_engine_applies_busy_timeout(tmp_path: Path) -> None:
+    from sqlitch.engine.sqlite import SQLiteEngine
+
+    engine = SQLiteEngine(_make_target(f"db:sqlite:{tmp_path / 'workspace.db'}"), busy_timeout=1234)
+
+    connection = engine.connect_workspace()
+    try:
+        assert connection.execute("PRAGMA busy_timeout").fetchone() == (1234,)
+    finally:
+        connection.close()
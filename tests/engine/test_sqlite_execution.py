@@ -0,0 +1,114 @@
+"""Tests for the SQLite deploy script execution strategies."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from sqlitch.engine.sqlite import SQLiteEngineError, extract_sqlite_statements
+from sqlitch.engine.sqlite_execution import (
+    EXECUTION_STRATEGIES,
+    _group_inserts,
+    execute_sqlite_statements,
+    parse_literal_insert,
+)
+
+_SCRIPT = """-- Deploy demo:items
+CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, price REAL, data BLOB);
+INSERT INTO items (id, name, price, data) VALUES (1, 'it''s', 1.5, X'00ff');
+INSERT INTO items (id, name, price, data) VALUES (2, 'b', -2, NULL);
+insert into items (id, name, price, data) values (3, 'c', 3e2, NULL), (4, 'd', .5, NULL);
+INSERT INTO items (id, name) VALUES (5, upper('e'));
+INSERT INTO items (id, name, price, data) VALUES (6, 'f', 0, NULL); -- trailing comment
+"""
+
+
+def _run(strategy: str) -> list[tuple[object, ...]]:
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    try:
+        cursor = connection.cursor()
+        execute_sqlite_statements(
+            cursor,
+            extract_sqlite_statements(_SCRIPT),
+            strategy=strategy,
+            preamble=("BEGIN IMMEDIATE", "SAVEPOINT sqlitch_change"),
+        )
+        assert connection.in_transaction
+        connection.execute("RELEASE SAVEPOINT sqlitch_change")
+        connection.execute("COMMIT")
+        return connection.execute(
+            "SELECT id, name, price, typeof(price), data FROM items ORDER BY id"
+        ).fetchall()
+    finally:
+        connection.close()
+
+
+def test_strategies_produce_identical_rows() -> None:
+    expected = _run("statement")
+
+    assert len(expected) == 6
+    for strategy in EXECUTION_STRATEGIES:
+        assert _run(strategy) == expected
+
+
+def test_script_strategy_rolls_back_with_the_transaction() -> None:
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            execute_sqlite_statements(
+                connection.cursor(),
+                ("CREATE TABLE t (id INTEGER);", "INSERT INTO missing VALUES (1);"),
+                strategy="script",
+                preamble=("BEGIN IMMEDIATE",),
+            )
+        connection.execute("ROLLBACK")
+        assert connection.execute("SELECT name FROM sqlite_master").fetchall() == []
+    finally:
+        connection.close()
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    with pytest.raises(SQLiteEngineError, match="Unknown SQLite execution strategy 'bulk'"):
+        execute_sqlite_statements(sqlite3.connect(":memory:").cursor(), (), strategy="bulk")
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        (
+            "-- note\nINSERT INTO t (a, b) VALUES (1, 'x''y');",
+            ("INSERT INTO t (a, b) VALUES (?, ?)", [(1, "x'y")]),
+        ),
+        (
+            "INSERT INTO main.\"my t\" VALUES (NULL, x'0A'), (2.5, -3);",
+            ('INSERT INTO main."my t" VALUES (?, ?)', [(None, b"\n"), (2.5, -3)]),
+        ),
+        ("INSERT INTO t VALUES (1 + 2);", None),
+        ("INSERT INTO t VALUES (1), (2, 3);", None),
+        ("INSERT INTO t SELECT 1;", None),
+        ("INSERT INTO t VALUES (99999999999999999999);", None),
+        ("UPDATE t SET a = 1;", None),
+    ],
+)
+def test_parse_literal_insert(statement: str, expected: object) -> None:
+    assert parse_literal_insert(statement) == expected
+
+
+def test_group_inserts_batches_consecutive_runs_only() -> None:
+    statements = (
+        "INSERT INTO t VALUES (1);",
+        "INSERT INTO t VALUES (2);",
+        "INSERT INTO u VALUES (3);",
+        "DELETE FROM t;",
+        "INSERT INTO t VALUES (4);",
+    )
+
+    grouped = [(sql, rows) for _, sql, rows in _group_inserts(statements)]
+
+    assert grouped == [
+        ("INSERT INTO t VALUES (?)", [(1,), (2,)]),
+        (None, []),
+        (None, []),
+        (None, []),
+    ]
@@ -0,0 +1,51 @@
+"""Tests for plan diffing between deployed history and a target plan."""
+
+from __future__ import annotations
+
+from sqlitch.plan.diff import common_prefix_length, diff_change_sequences
+
+
+def test_common_prefix_length_stops_at_first_difference() -> None:
+    assert common_prefix_length(["a", "b", "c"], ["a", "b", "x", "c"]) == 2
+    assert common_prefix_length([], ["a"]) == 0
+    assert common_prefix_length(["a", "b"], ["a", "b"]) == 2
+
+
+def test_identical_sequences_are_noop() -> None:
+    diff = diff_change_sequences(["a", "b"], ["a", "b"])
+
+    assert diff.is_noop
+    assert diff.common == 2
+
+
+def test_only_divergent_tail_is_reverted_and_deployed() -> None:
+    deployed = [f"id{index}" for index in range(100)]
+    target = [*deployed[:99], "other"]
+
+    diff = diff_change_sequences(deployed, target)
+
+    assert diff.common == 99
+    assert diff.revert == (99,)
+    assert diff.deploy == (99,)
+
+
+def test_reverts_newest_first_and_deploys_pending_additions() -> None:
+    diff = diff_change_sequences(["a", "b", "c"], ["a", "x", "y", "z"])
+
+    assert diff.revert == (2, 1)
+    assert diff.deploy == (1, 2, 3)
+
+
+def test_keep_bounds_the_shared_prefix() -> None:
+    diff = diff_change_sequences(["a", "b", "c"], ["a", "b", "c"], keep=1)
+
+    assert diff.common == 1
+    assert diff.revert == (2, 1)
+    assert diff.deploy == (1, 2)
+
+
+def test_keys_may_include_script_hashes() -> None:
+    deployed = [("a", "h1"), ("b", "h2")]
+    target = [("a", "h1"), ("b", "changed")]
+
+    assert diff_change_sequences(deployed, target).revert == (1,)
@@ -0,0 +1,97 @@
+"""Tests for the plan dependency graph."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from sqlitch.plan import parser
+from sqlitch.plan.graph import DependencyCycleError, build_dependency_graph
+from sqlitch.plan.model import Plan
+
+
+def _parse(tmp_path: Path, body: str) -> Plan:
+    plan_path = tmp_path / "sqitch.plan"
+    plan_path.write_text(f"%syntax-version=1.0.0\n%project=widgets\n\n{body}", encoding="utf-8")
+    return parser.parse_plan(plan_path, default_engine="sqlite")
+
+
+DIAMOND = """users 2025-01-01T00:00:00Z Ada <ada@example.com>
+posts [users] 2025-01-02T00:00:00Z Ada <ada@example.com>
+tags [users] 2025-01-03T00:00:00Z Ada <ada@example.com>
+feed [posts tags] 2025-01-04T00:00:00Z Ada <ada@example.com>
+audit 2025-01-05T00:00:00Z Ada <ada@example.com>
+"""
+
+
+def test_graph_builds_forward_and_reverse_adjacency(tmp_path: Path) -> None:
+    graph = build_dependency_graph(_parse(tmp_path, DIAMOND))
+
+    assert len(graph) == 5
+    assert graph.requires == ((), (0,), (0,), (1, 2), ())
+    assert graph.required_by == ((1, 2), (3,), (3,), (), ())
+    assert graph.missing_dependencies == ()
+
+
+def test_graph_transitive_queries_are_memoized(tmp_path: Path) -> None:
+    graph = build_dependency_graph(_parse(tmp_path, DIAMOND))
+
+    assert graph.transitive_dependencies(3) == frozenset({0, 1, 2})
+    assert graph.transitive_dependents(0) == frozenset({1, 2, 3})
+    assert graph.transitive_dependencies(3) is graph.transitive_dependencies(3)
+    assert graph.transitive_dependents(4) == frozenset()
+
+
+def test_graph_topological_layers(tmp_path: Path) -> None:
+    graph = build_dependency_graph(_parse(tmp_path, DIAMOND))
+
+    assert graph.topological_layers() == ((0, 4), (1, 2), (3,))
+    assert graph.find_cycle() is None
+
+
+def test_graph_index_of_uses_plan_identity(tmp_path: Path) -> None:
+    plan = _parse(tmp_path, DIAMOND)
+    graph = build_dependency_graph(plan)
+
+    assert graph.index_of(plan.get_change("feed")) == 3
+    with pytest.raises(KeyError):
+        graph.index_of(build_dependency_graph(_parse(tmp_path, DIAMOND)).changes[0])
+
+
+def test_graph_resolves_reworked_tag_dependencies(tmp_path: Path) -> None:
+    body = """users 2025-01-01T00:00:00Z Ada <ada@example.com>
+@v1 2025-01-02T00:00:00Z Ada <ada@example.com>
+posts [users] 2025-01-03T00:00:00Z Ada <ada@example.com>
+users [users@v1] 2025-01-04T00:00:00Z Ada <ada@example.com>
+feed [users] 2025-01-05T00:00:00Z Ada <ada@example.com>
+"""
+    graph = build_dependency_graph(_parse(tmp_path, body))
+
+    assert graph.requires == ((), (0,), (0,), (2,))
+    assert graph.dependents_of(0) == (1, 2)
+
+
+def test_graph_reports_missing_dependencies_once(tmp_path: Path) -> None:
+    body = """posts [users] 2025-01-01T00:00:00Z Ada <ada@example.com>
+feed [users@v1 posts] 2025-01-02T00:00:00Z Ada <ada@example.com>
+"""
+    graph = build_dependency_graph(_parse(tmp_path, body))
+
+    assert graph.unresolved == (("users",), ("users@v1",))
+    assert graph.missing_dependencies == ("users", "users@v1")
+    assert graph.requires == ((), (0,))
+
+
+def test_graph_detects_cycles(tmp_path: Path) -> None:
+    body = """users [feed] 2025-01-01T00:00:00Z Ada <ada@example.com>
+posts [users] 2025-01-02T00:00:00Z Ada <ada@example.com>
+feed [posts] 2025-01-03T00:00:00Z Ada <ada@example.com>
+"""
+    graph = build_dependency_graph(_parse(tmp_path, body))
+
+    assert graph.find_cycle() == (0, 2, 1)
+    with pytest.raises(DependencyCycleError) as excinfo:
+        graph.topological_layers()
+    assert excinfo.value.cycle == ("users", "feed", "posts")
+    assert str(excinfo.value) == "Dependency cycle detected: users -> feed -> posts -> users"
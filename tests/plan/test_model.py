@@ -430,3 +430,78 @@ def test_plan_rejects_self_dependent_change():
             entries=(change,),
             file_path=Path("sqitch.plan"),
         )
+
+
+def test_change_and_tag_are_slotted():
+    change = _make_change()
+    tag = _make_tag()
+
+    assert not hasattr(change, "__dict__")
+    assert not hasattr(tag, "__dict__")
+
+
+def test_change_stores_conventional_script_paths_compactly(tmp_path: Path):
+    change = _make_change(
+        name="users",
+        script_paths={
+            "deploy": tmp_path / "deploy" / "users.sql",
+            "revert": tmp_path / "revert" / "users.sql",
+            "verify": tmp_path / "verify" / "users.sql",
+        },
+    )
+
+    assert isinstance(change.script_paths, model.ScriptPaths)
+    assert change.script_paths._explicit is None
+    assert dict(change.script_paths) == {
+        "deploy": tmp_path / "deploy" / "users.sql",
+        "revert": tmp_path / "revert" / "users.sql",
+        "verify": tmp_path / "verify" / "users.sql",
+    }
+
+
+def test_change_derives_reworked_script_paths_from_suffix(tmp_path: Path):
+    change = _make_change(
+        name="users",
+        script_paths={
+            "deploy": tmp_path / "deploy" / "users@v1.0.sql",
+            "revert": tmp_path / "revert" / "users@v1.0.sql",
+            "verify": tmp_path / "verify" / "users.sql",
+        },
+    )
+
+    assert change.script_paths._explicit is None
+    assert change.script_paths["deploy"] == tmp_path / "deploy" / "users@v1.0.sql"
+    assert change.script_paths["revert"] == tmp_path / "revert" / "users@v1.0.sql"
+    assert change.script_paths["verify"] == tmp_path / "verify" / "users.sql"
+
+
+def test_change_keeps_unconventional_script_paths_explicit():
+    paths = {
+        "deploy": Path("sql/up/widgets.sql"),
+        "revert": Path("sql/down/widgets.sql"),
+        "verify": None,
+    }
+    change = _make_change(script_paths=paths)
+
+    assert change.script_paths._explicit is not None
+    assert dict(change.script_paths) == paths
+
+
+def test_script_paths_share_interned_plan_root(tmp_path: Path):
+    first = model.ScriptPaths.conventional(tmp_path / "project", "users")
+    second = model.ScriptPaths.conventional(tmp_path / "project", "flips")
+
+    assert first._root is second._root
+    assert model.intern_path(tmp_path / "project") is first._root
+
+
+def test_change_interns_planner_and_dependencies():
+    first = _make_change(planner="".join(["alice", "@example.com"]))
+    second = _make_change(
+        name="widgets:drop",
+        planner="".join(["alice@", "example.com"]),
+        dependencies=["".join(["core", ":init"])],
+    )
+
+    assert first.planner is second.planner
+    assert first.dependencies[0] is second.dependencies[0]
@@ -207,3 +207,75 @@ def test_parse_plan_accepts_compact_sqitch_style(tmp_path: Path) -> None:
     assert tag.change_ref == "widgets:add"
     assert tag.planner == "ada@example.com"
     assert plan.missing_dependencies == ("widgets:add->core:init",)
+
+
+REWORK_PLAN_TEXT = """%syntax-version=1.0.0
+%project=widgets
+
+users 2025-10-03T12:30:00Z ada@example.com
+@v1 2025-10-03T12:31:00Z ada@example.com
+users [users@v1] 2025-10-03T12:32:00Z ada@example.com
+@v2 2025-10-03T12:33:00Z ada@example.com
+users [users@v2] 2025-10-03T12:34:00Z ada@example.com
+widgets [users] 2025-10-03T12:35:00Z ada@example.com
+"""
+
+
+def _write_rework_scripts(tmp_path: Path) -> None:
+    for kind in ("deploy", "revert", "verify"):
+        (tmp_path / kind).mkdir()
+        (tmp_path / kind / "users.sql").write_text("-- current\n", encoding="utf-8")
+        (tmp_path / kind / "users@v1.sql").write_text("-- v1\n", encoding="utf-8")
+    # Only deploy keeps a v2 copy so that fallbacks to the unsuffixed script are exercised.
+    (tmp_path / "deploy" / "users@v2.sql").write_text("-- v2\n", encoding="utf-8")
+
+
+def test_parse_plan_rework_resolution_matches_filesystem_probe(tmp_path: Path) -> None:
+    _write_rework_scripts(tmp_path)
+    plan_path = _write_plan(tmp_path, REWORK_PLAN_TEXT)
+
+    plan = parser.parse_plan(plan_path, default_engine="sqlite")
+
+    for change in plan.changes:
+        rework_tag = next(
+            (dep.split("@", 1)[1] for dep in change.dependencies if dep.startswith("users@")),
+            None,
+        )
+        for kind in ("deploy", "revert", "verify"):
+            expected = tmp_path / kind / f"{change.name}.sql"
+            if rework_tag is not None:
+                candidate = tmp_path / kind / f"{change.name}@{rework_tag}.sql"
+                if candidate.exists():
+                    expected = candidate
+            assert change.script_paths[kind] == expected
+
+    reworked = [change for change in plan.changes if change.rework_of]
+    assert [change.script_paths["deploy"].name for change in reworked] == [
+        "users@v1.sql",
+        "users@v2.sql",
+    ]
+    assert reworked[1].script_paths["revert"].name == "users.sql"
+
+
+def test_parse_plan_lists_script_directories_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_rework_scripts(tmp_path)
+    plan_path = _write_plan(tmp_path, REWORK_PLAN_TEXT)
+
+    scanned: list[str] = []
+    real_scandir = parser.os.scandir
+
+    def counting_scandir(path: Path):  # type: ignore[no-untyped-def]
+        scanned.append(Path(path).name)
+        return real_scandir(path)
+
+    def forbidden_exists(self: Path, *args: object, **kwargs: object) -> bool:
+        raise AssertionError(f"unexpected filesystem probe for {self}")
+
+    monkeypatch.setattr(parser.os, "scandir", counting_scandir)
+    monkeypatch.setattr(Path, "exists", forbidden_exists)
+
+    parser.parse_plan(plan_path, default_engine="sqlite")
+
+    assert sorted(scanned) == ["deploy", "revert", "verify"]
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
+from sqlitch.plan.model import Plan
+from sqlitch.plan.parser import parse_plan
 from sqlitch.plan.symbolic import (
+    ReferenceResolver,
     SymbolicReference,
     parse_symbolic_reference,
     resolve_symbolic_reference,
@@ -193,3 +198,91 @@ class TestSymbolicReferenceIsSymbolic:
     def test_tag_not_symbolic(self):
         """Tag references are not considered symbolic."""
         assert not SymbolicReference(base="@beta1", offset_type=None, offset_count=0).is_symbolic()
+
+
+REWORKED_PLAN = """%syntax-version=1.0.0
+%project=widgets
+
+users 2025-01-01T00:00:00Z Ada <ada@example.com>
+posts [users] 2025-01-02T00:00:00Z Ada <ada@example.com>
+@v1 2025-01-03T00:00:00Z Ada <ada@example.com>
+users [users@v1] 2025-01-04T00:00:00Z Ada <ada@example.com>
+@v2 2025-01-05T00:00:00Z Ada <ada@example.com>
+feed [posts] 2025-01-06T00:00:00Z Ada <ada@example.com>
+"""
+
+
+class TestReferenceResolver:
+    """Test plan-indexed reference resolution."""
+
+    @pytest.fixture
+    def plan(self, tmp_path: Path) -> Plan:
+        plan_path = tmp_path / "sqitch.plan"
+        plan_path.write_text(REWORKED_PLAN, encoding="utf-8")
+        return parse_plan(plan_path, default_engine="sqlite")
+
+    def test_symbolic_heads_and_offsets(self, plan: Plan):
+        resolver = ReferenceResolver.from_plan(plan)
+
+        assert resolver.resolve_index("@HEAD") == 3
+        assert resolver.resolve_index("@ROOT") == 0
+        assert resolver.resolve_index("@HEAD^2") == 1
+        assert resolver.resolve_index("@ROOT~~") == 2
+
+    def test_change_names_resolve_to_latest_instance(self, plan: Plan):
+        resolver = ReferenceResolver.from_plan(plan)
+
+        assert resolver.resolve_index("users") == 2
+        assert resolver.resolve("users") is plan.changes[2]
+        assert resolver.resolve_index("posts~") == 2
+
+    def test_tags_resolve_with_and_without_at_prefix(self, plan: Plan):
+        resolver = ReferenceResolver.from_plan(plan)
+
+        assert resolver.resolve_index("@v1") == 1
+        assert resolver.resolve_index("v2") == 2
+        assert resolver.resolve_index("@v2^") == 1
+        assert resolver.has_tag("@v1")
+        assert not resolver.has_tag("v3")
+
+    def test_change_at_tag_selects_reworked_instance(self, plan: Plan):
+        resolver = ReferenceResolver.from_plan(plan)
+
+        assert resolver.resolve_index("users@v1") == 0
+        assert resolver.resolve_index("users@v2") == 2
+        assert resolver.resolve_index("users@ROOT") == 0
+        assert resolver.resolve_index("users@v1~") == 1
+        with pytest.raises(ValueError, match="not planned as of tag"):
+            resolver.resolve_index("feed@v1")
+
+    def test_target_index_stops_bare_names_at_first_instance(self, plan: Plan):
+        resolver = ReferenceResolver.from_plan(plan)
+
+        assert resolver.resolve_target_index("users") == 0
+        assert resolver.resolve_target_index("users@v2") == 2
+        assert resolver.resolve_target_index("@HEAD^") == 2
+        assert resolver.target_reference(0, "users@v1") == "users"
+        assert resolver.target_reference(2, "users@v2") == "users@v2"
+        assert resolver.target_reference(3, "@HEAD") == "feed"
+
+    def test_change_ids_resolve_when_supplied(self, plan: Plan):
+        ids = [f"{index:040x}" for index in range(len(plan.changes))]
+        resolver = ReferenceResolver.from_plan(plan, change_ids=ids)
+
+        assert resolver.resolve_index(ids[2]) == 2
+        assert resolver.resolve_index(f"{ids[3]}^3") == 0
+
+    def test_resolve_many_preserves_input_order(self, plan: Plan):
+        resolver = ReferenceResolver.from_plan(plan)
+
+        assert resolver.resolve_many(["feed", "@ROOT", "users@v1", "@v2"]) == (3, 0, 0, 2)
+
+    def test_unknown_references_raise_value_error(self, plan: Plan):
+        resolver = ReferenceResolver.from_plan(plan)
+
+        with pytest.raises(ValueError, match="not found in plan"):
+            resolver.resolve_index("missing")
+        with pytest.raises(ValueError, match="Unknown tag"):
+            resolver.resolve_index("@v9")
+        with pytest.raises(ValueError, match="after last change"):
+            resolver.resolve_index("@HEAD~")
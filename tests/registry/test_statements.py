@@ -0,0 +1,63 @@
+"""Tests for the precompiled SQLite registry statements."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from sqlitch.cli.commands.deploy import _apply_registry_baseline
+from sqlitch.registry.statements import registry_cleanup_statements, registry_statements
+
+
+def _registry() -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("ATTACH DATABASE ':memory:' AS sqitch")
+    _apply_registry_baseline(connection, "sqitch")
+    connection.execute(
+        "INSERT INTO sqitch.projects (project, uri, creator_name, creator_email) "
+        "VALUES ('demo', NULL, 'Alice', 'alice@example.com')"
+    )
+    return connection
+
+
+def _change_row(change_id: str, name: str) -> tuple[str, ...]:
+    timestamp = "2025-01-01 00:00:00"
+    return (
+        change_id,
+        f"hash-{change_id}",
+        name,
+        "demo",
+        "",
+        timestamp,
+        "Alice",
+        "alice@example.com",
+        timestamp,
+        "Alice",
+        "alice@example.com",
+    )
+
+
+def test_statements_are_built_once_per_schema() -> None:
+    assert registry_statements("sqitch") is registry_statements("sqitch")
+    assert registry_statements("other").insert_change.startswith("INSERT INTO other.changes")
+
+
+def test_cleanup_statements_remove_changes_and_dependencies_in_one_pass() -> None:
+    statements = registry_statements("sqitch")
+    connection = _registry()
+    for change_id, name in (("a", "users"), ("b", "posts"), ("c", "comments"), ("d", "likes")):
+        connection.execute(statements.insert_change, _change_row(change_id, name))
+    connection.executemany(
+        statements.insert_dependency,
+        [("b", "users", "a"), ("c", "posts", "b"), ("d", "users", "a")],
+    )
+    delete_tags, delete_dependencies, delete_changes = registry_cleanup_statements("sqitch", 2)
+
+    connection.execute(delete_tags, ("b", "c"))
+    connection.execute(delete_dependencies, ("b", "c", "b", "c"))
+    connection.execute(delete_changes, ("b", "c"))
+
+    assert connection.execute("SELECT change_id FROM sqitch.changes ORDER BY 1").fetchall() == [
+        ("a",),
+        ("d",),
+    ]
+    assert connection.execute("SELECT change_id FROM sqitch.dependencies").fetchall() == [("d",)]
@@ -12,12 +12,17 @@ from sqlitch.plan.model import Change
 
 __all__ = [
     "ChangeScript",
+    "SQLITE_CONFIG",
     "SQLiteProject",
     "create_sqlite_project",
     "create_failing_change_project",
     "registry_path_for",
+    "write_project_files",
 ]
 
+SQLITE_CONFIG = "[core]\n\tengine = sqlite\n"
+"""Minimal ``sqitch.conf`` selecting the SQLite engine."""
+
 
 @dataclass(frozen=True, slots=True)
 class ChangeScript:
@@ -104,7 +109,7 @@ def create_sqlite_project(tmp_path: Path, *, changes: Iterable[ChangeScript]) ->
 
     # Create minimal config so commands can find engine (Sqitch stores engine in config, not plan)
     config_path = project_root / "sqitch.conf"
-    config_path.write_text("[core]\n\tengine = sqlite\n", encoding="utf-8")
+    config_path.write_text(SQLITE_CONFIG, encoding="utf-8")
 
     registry_path = registry_path_for(project_root)
 
@@ -130,3 +135,26 @@ def registry_path_for(project_root: Path) -> Path:
     """Return the canonical registry path used for SQLite targets."""
 
     return Path(project_root) / "sqitch.db"
+
+
+def write_project_files(
+    project_root: Path,
+    *,
+    plan: str,
+    scripts: Mapping[str, str],
+    config: str = SQLITE_CONFIG,
+) -> Path:
+    """Write ``plan``, ``config`` and ``scripts`` (keyed by project-relative path) verbatim.
+
+    Unlike :func:`create_sqlite_project` the plan text is used as given, so
+    tests can pin change IDs with fixed timestamps or plan tags and reworks.
+    """
+
+    project_root.mkdir(parents=True, exist_ok=True)
+    (project_root / "sqitch.plan").write_text(plan, encoding="utf-8")
+    (project_root / "sqitch.conf").write_text(config, encoding="utf-8")
+    for relative, body in scripts.items():
+        path = project_root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body, encoding="utf-8")
+    return project_root
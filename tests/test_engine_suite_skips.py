@@ -1,4 +1,4 @@
-"""Regression scaffold for engine stub skip messaging."""
+"""Regression scaffold for engine suite skip messaging."""
 
 from __future__ import annotations
 
@@ -9,7 +9,11 @@ import pytest
 pytest_plugins = ("pytester",)
 
 
-def test_engine_stub_suites_report_skips(pytester: pytest.Pytester) -> None:
+def test_engine_stub_suites_report_skips(
+    pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("SQLITCH_TEST_PG_URI", raising=False)
+    monkeypatch.delenv("SQLITCH_TEST_MYSQL_URI", raising=False)
     pytester.makeconftest(
         dedent(
             """
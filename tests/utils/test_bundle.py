@@ -0,0 +1,162 @@
+"""Tests for bundle manifests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from sqlitch.engine.sqlite import compute_script_hash
+from sqlitch.utils.bundle import (
+    MANIFEST_NAME,
+    BundleArchive,
+    BundleArchiveError,
+    BundleManifest,
+    ManifestEntry,
+    build_manifest,
+    write_archive,
+)
+
+
+def test_manifest_digest_matches_script_hash(tmp_path: Path) -> None:
+    script = tmp_path / "users.sql"
+    script.write_bytes("CREATE TABLE users (id INTEGER);\r\n-- café\r\n".encode("utf-8"))
+    binary = tmp_path / "blob.bin"
+    binary.write_bytes(b"\xff\xfe\x00")
+
+    manifest = build_manifest({"deploy/users.sql": script, "deploy/blob.bin": binary})
+
+    entries = manifest.by_path()
+    assert list(entries) == ["deploy/blob.bin", "deploy/users.sql"]
+    assert entries["deploy/users.sql"].sha1 == compute_script_hash(
+        script.read_text(encoding="utf-8")
+    )
+    assert entries["deploy/users.sql"].size == script.stat().st_size
+    assert entries["deploy/blob.bin"].size == 3
+
+
+def test_manifest_round_trips_through_the_bundle(tmp_path: Path) -> None:
+    manifest = BundleManifest((ManifestEntry("deploy/a.sql", "0" * 40, 12),))
+
+    manifest.write(tmp_path)
+
+    assert BundleManifest.load(tmp_path) == manifest
+    assert [path.name for path in tmp_path.iterdir()] == [MANIFEST_NAME]
+
+
+@pytest.mark.parametrize("content", ["{not json", '{"version": 99, "files": []}', '{"version": 1}'])
+def test_invalid_manifest_loads_as_none(tmp_path: Path, content: str) -> None:
+    (tmp_path / MANIFEST_NAME).write_text(content, encoding="utf-8")
+
+    assert BundleManifest.load(tmp_path) is None
+
+
+@pytest.mark.parametrize(
+    "path", ["/etc/passwd", "../outside.sql", "deploy/../../outside.sql", "C:/x.sql", "", "\\x"]
+)
+def test_manifest_rejects_paths_outside_the_bundle(path: str) -> None:
+    text = BundleManifest((ManifestEntry(path, "0" * 40, 1),)).to_json()
+
+    with pytest.raises(ValueError, match="escapes the bundle"):
+        BundleManifest.from_json(text)
+
+
+def test_changed_since_reports_changed_missing_and_stale_files(tmp_path: Path) -> None:
+    (tmp_path / "same.sql").write_text("same", encoding="utf-8")
+    (tmp_path / "edited.sql").write_text("old", encoding="utf-8")
+    previous = BundleManifest(
+        (
+            ManifestEntry("edited.sql", "1" * 40, 3),
+            ManifestEntry("gone.sql", "2" * 40, 4),
+            ManifestEntry("missing.sql", "3" * 40, 4),
+            ManifestEntry("same.sql", "4" * 40, 4),
+        )
+    )
+    current = BundleManifest(
+        (
+            ManifestEntry("edited.sql", "5" * 40, 3),
+            ManifestEntry("missing.sql", "3" * 40, 4),
+            ManifestEntry("new.sql", "6" * 40, 1),
+            ManifestEntry("same.sql", "4" * 40, 4),
+        )
+    )
+
+    changed, stale = current.changed_since(previous, tmp_path)
+
+    assert [entry.path for entry in changed] == ["edited.sql", "missing.sql", "new.sql"]
+    assert [entry.path for entry in stale] == ["gone.sql"]
+    assert current.changed_since(None, tmp_path)[0] == current.entries
+
+
+def test_verify_reports_tampered_and_missing_files(tmp_path: Path) -> None:
+    (tmp_path / "deploy").mkdir()
+    (tmp_path / "deploy" / "a.sql").write_text("SELECT 1;\n", encoding="utf-8")
+    (tmp_path / "deploy" / "b.sql").write_text("SELECT 2;\n", encoding="utf-8")
+    manifest = build_manifest(
+        {
+            "deploy/a.sql": tmp_path / "deploy" / "a.sql",
+            "deploy/b.sql": tmp_path / "deploy" / "b.sql",
+        }
+    )
+    assert manifest.verify(tmp_path) == ()
+
+    (tmp_path / "deploy" / "a.sql").write_text("SELECT 3;\n", encoding="utf-8")
+    (tmp_path / "deploy" / "b.sql").unlink()
+
+    assert manifest.verify(tmp_path) == ("deploy/a.sql", "deploy/b.sql")
+
+
+def _write_sources(root: Path) -> dict[str, Path]:
+    files = {
+        "sqitch.plan": "%project=widgets\n",
+        "deploy/widgets.sql": "CREATE TABLE widgets (id INTEGER);\r\n",
+        "deploy/widgets@v1.sql": "CREATE TABLE widgets (id TEXT);\n",
+        "deploy/nested/parts.sql": "-- parts\n",
+    }
+    sources = {}
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(text.encode("utf-8"))
+        sources[name] = path
+    return sources
+
+
+@pytest.mark.parametrize("suffix", [".tar.gz", ".zip"])
+def test_archive_serves_members_without_extracting(tmp_path: Path, suffix: str) -> None:
+    sources = _write_sources(tmp_path / "src")
+    archive_path = tmp_path / f"bundle{suffix}"
+    write_archive(archive_path, sources, build_manifest(sources))
+    mount = tmp_path / "mount"
+
+    with BundleArchive(archive_path, mount) as archive:
+        assert archive.plan_path == mount / "sqitch.plan"
+        assert archive.read_text(mount / "deploy" / "widgets.sql") == (
+            "CREATE TABLE widgets (id INTEGER);\n"
+        )
+        assert archive.list_directory(mount / "deploy") == {"widgets.sql", "widgets@v1.sql"}
+        assert archive.list_directory(mount) == {"sqitch.plan"}
+        with pytest.raises(FileNotFoundError):
+            archive.read_text(mount / "deploy" / "missing.sql")
+
+    assert not mount.exists()
+
+
+def test_archive_rejects_member_that_does_not_match_manifest(tmp_path: Path) -> None:
+    sources = _write_sources(tmp_path / "src")
+    manifest = build_manifest(sources)
+    sources["deploy/widgets.sql"].write_text("DROP TABLE widgets;\n", encoding="utf-8")
+    archive_path = tmp_path / "bundle.zip"
+    write_archive(archive_path, sources, manifest)
+
+    with BundleArchive(archive_path, tmp_path) as archive:
+        with pytest.raises(BundleArchiveError, match="does not match its manifest"):
+            archive.read_text(tmp_path / "deploy" / "widgets.sql")
+
+
+def test_archive_without_manifest_is_rejected(tmp_path: Path) -> None:
+    archive_path = tmp_path / "bundle.zip"
+    archive_path.write_bytes(b"not an archive")
+
+    with pytest.raises(BundleArchiveError, match="not a .tar.gz or .zip"):
+        BundleArchive(archive_path, tmp_path)
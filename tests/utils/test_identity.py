@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import sys
 from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 from sqlitch.utils.identity import (
+    IDENTITY_CACHE_TTL_ENV,
+    IdentityService,
     UserIdentity,
+    activate_identity_service,
     generate_change_id,
     get_hostname,
     get_system_fullname,
@@ -863,3 +868,121 @@ def test_resolve_username_uses_win32_api_when_available(monkeypatch: pytest.Monk
     result = resolve_username({})
 
     assert result == "win32user"
+
+
+class TestIdentityService:
+    """Test memoized and persisted system identity lookups."""
+
+    @pytest.fixture
+    def system_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        calls: list[str] = []
+
+        def _getlogin() -> str:
+            calls.append("login")
+            return "ada"
+
+        def _fullname(username: str) -> str:
+            calls.append("fullname")
+            return "Ada Lovelace"
+
+        def _hostname() -> str:
+            calls.append("hostname")
+            return "engine"
+
+        monkeypatch.setattr("sqlitch.utils.identity.os.getlogin", _getlogin)
+        monkeypatch.setattr("sqlitch.utils.identity.get_system_fullname", _fullname)
+        monkeypatch.setattr("sqlitch.utils.identity.get_hostname", _hostname)
+        return calls
+
+    def test_activated_service_resolves_each_lookup_once(self, system_calls: list[str]) -> None:
+        service = IdentityService()
+
+        with activate_identity_service(service):
+            identities = {resolve_planner_identity({}, None) for _ in range(3)}
+
+        assert identities == {"Ada Lovelace <ada@engine>"}
+        assert system_calls == ["login", "fullname", "hostname"]
+        assert service.lookups == 3
+
+    def test_helpers_do_not_cache_without_an_active_service(self, system_calls: list[str]) -> None:
+        resolve_planner_identity({}, None)
+        resolve_planner_identity({}, None)
+
+        assert system_calls.count("login") == 2
+
+    def test_persisted_lookups_are_reused_until_ttl_expires(
+        self, system_calls: list[str], tmp_path: Path
+    ) -> None:
+        store = tmp_path / "identity.json"
+        IdentityService(store_path=store, ttl=60).username({})
+
+        fresh = IdentityService(store_path=store, ttl=60)
+        assert fresh.username({}) == "ada"
+        assert fresh.lookups == 0
+
+        payload = json.loads(store.read_text(encoding="utf-8"))
+        payload["username"][1] -= 120
+        store.write_text(json.dumps(payload), encoding="utf-8")
+        expired = IdentityService(store_path=store, ttl=60)
+        expired.username({})
+
+        assert expired.lookups == 1
+        assert system_calls == ["login", "login"]
+
+    def test_new_lookups_do_not_refresh_older_entries(
+        self, system_calls: list[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = tmp_path / "identity.json"
+        monkeypatch.setattr("sqlitch.utils.identity.time.time", lambda: 1000.0)
+        IdentityService(store_path=store, ttl=60).username({})
+
+        monkeypatch.setattr("sqlitch.utils.identity.time.time", lambda: 1050.0)
+        IdentityService(store_path=store, ttl=60).system_fullname("ada")
+        payload = json.loads(store.read_text(encoding="utf-8"))
+        assert payload["username"] == ["ada", 1000.0]
+        assert payload["fullnames"] == {"ada": ["Ada Lovelace", 1050.0]}
+
+        monkeypatch.setattr("sqlitch.utils.identity.time.time", lambda: 1100.0)
+        later = IdentityService(store_path=store, ttl=60)
+        assert later.system_fullname("ada") == "Ada Lovelace"
+        assert later.username({}) == "ada"
+        assert later.lookups == 1
+        assert system_calls == ["login", "fullname", "login"]
+
+    def test_hostname_is_not_persisted(self, system_calls: list[str], tmp_path: Path) -> None:
+        store = tmp_path / "identity.json"
+        first = IdentityService(store_path=store, ttl=60)
+        assert first.hostname() == "engine"
+        first.system_fullname("ada")
+
+        second = IdentityService(store_path=store, ttl=60)
+        assert second.hostname() == "engine"
+
+        assert "hostname" not in json.loads(store.read_text(encoding="utf-8"))
+        assert system_calls == ["hostname", "fullname", "hostname"]
+
+    def test_environment_usernames_are_not_persisted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def _no_login() -> str:
+            raise OSError("no controlling terminal")
+
+        monkeypatch.setattr("sqlitch.utils.identity.os.getlogin", _no_login)
+        monkeypatch.setattr("sqlitch.utils.identity.pwd", None)
+        store = tmp_path / "identity.json"
+
+        assert IdentityService(store_path=store, ttl=60).username({"LOGNAME": "ada"}) == "ada"
+        assert json.loads(store.read_text(encoding="utf-8"))["username"] is None
+        fresh = IdentityService(store_path=store, ttl=60)
+        assert fresh.username({"LOGNAME": "grace"}) == "grace"
+        assert fresh.username({"SQITCH_ORIG_SYSUSER": "alan"}) == "alan"
+
+    def test_from_env_persists_only_with_positive_ttl(self, tmp_path: Path) -> None:
+        assert IdentityService.from_env({}, tmp_path).store_path is None
+        assert IdentityService.from_env({IDENTITY_CACHE_TTL_ENV: "soon"}, tmp_path).ttl == 0
+
+        service = IdentityService.from_env({IDENTITY_CACHE_TTL_ENV: "300"}, tmp_path)
+
+        assert service.ttl == 300
+        assert service.store_path is not None
+        assert service.store_path.parent == tmp_path / "cache"
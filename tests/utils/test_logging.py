@@ -5,11 +5,12 @@ from __future__ import annotations
 import io
 import json
 from datetime import datetime, timezone
+from pathlib import Path
 
 from rich.console import Console
 
 from sqlitch.cli.options import LogConfiguration
-from sqlitch.utils.logging import StructuredLogger
+from sqlitch.utils.logging import Span, StructuredLogger
 
 
 def _clock() -> datetime:
@@ -200,3 +201,189 @@ def test_structured_logging_emits_run_identifier_when_opted_in() -> None:
 
     assert events["command.start"]["run_id"] == "json-run"
     assert events["command.complete"]["run_id"] == "json-run"
+
+
+def test_enabled_reports_whether_records_reach_a_sink() -> None:
+    quiet = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=True, json_mode=False)
+    )
+    default = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=False, json_mode=False)
+    )
+    verbose = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=2, quiet=False, json_mode=False)
+    )
+
+    assert not quiet.enabled("info")
+    assert not default.enabled("INFO")
+    assert verbose.enabled("TRACE")
+
+
+def test_callable_payload_is_only_built_for_emitted_records() -> None:
+    calls: list[str] = []
+
+    def _payload() -> dict[str, object]:
+        calls.append("built")
+        return {"changes": ["a", "b"]}
+
+    silent = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=False, json_mode=False)
+    )
+    assert silent.info("deploy.start", payload=_payload) is None
+    assert calls == []
+
+    stream = io.StringIO()
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=False, json_mode=True),
+        json_stream=stream,
+        clock=_clock,
+    )
+    record = logger.info("deploy.start", payload=_payload)
+
+    assert calls == ["built"]
+    assert record is not None
+    assert json.loads(stream.getvalue())["data"] == {"changes": ["a", "b"]}
+
+
+def test_buffered_json_sink_writes_in_batches() -> None:
+    stream = io.StringIO()
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=False, json_mode=True),
+        json_stream=stream,
+        clock=_clock,
+        json_buffer_size=3,
+    )
+
+    logger.info("one")
+    logger.info("two")
+    assert stream.getvalue() == ""
+
+    logger.info("three")
+    assert len(stream.getvalue().splitlines()) == 3
+
+    logger.info("four")
+    logger.error("five")
+    assert [json.loads(line)["event"] for line in stream.getvalue().splitlines()][-2:] == [
+        "four",
+        "five",
+    ]
+
+    logger.info("six")
+    logger.flush()
+    assert json.loads(stream.getvalue().splitlines()[-1])["event"] == "six"
+
+
+def test_spans_nest_and_emit_trace_records() -> None:
+    stream = io.StringIO()
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=2, quiet=False, json_mode=True),
+        json_stream=stream,
+        clock=_clock,
+    )
+
+    with logger.span("deploy.run") as outer:
+        with logger.span("deploy.apply", change="users") as inner:
+            pass
+
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert inner.duration_ms is not None and outer.duration_ms is not None
+    assert inner.duration_ms <= outer.duration_ms
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["event"] for record in records] == ["deploy.apply", "deploy.run"]
+    assert records[0]["level"] == "TRACE"
+    assert records[0]["data"]["change"] == "users"
+    assert records[0]["data"]["parent_id"] == outer.span_id
+
+
+def test_spans_are_no_ops_without_tracing_or_trace_level() -> None:
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=1, quiet=False, json_mode=False)
+    )
+
+    with logger.span("deploy.apply") as span:
+        pass
+
+    assert not hasattr(span, "span_id")
+
+
+def test_export_trace_writes_chrome_trace_events(tmp_path: Path) -> None:
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=True, json_mode=False)
+    )
+    logger.start_trace()
+
+    with logger.span("deploy.run"):
+        try:
+            with logger.span("deploy.apply", change="users", password="hunter2"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+    trace_path = tmp_path / "trace.json"
+    logger.export_trace(trace_path)
+
+    document = json.loads(trace_path.read_text(encoding="utf-8"))
+    apply_event, run_event = document["traceEvents"]
+    assert apply_event["name"] == "deploy.apply"
+    assert apply_event["ph"] == "X"
+    assert apply_event["args"]["change"] == "users"
+    assert apply_event["args"]["error"] == "RuntimeError"
+    assert apply_event["args"]["password"] == "***REDACTED***"
+    assert apply_event["args"]["parent_id"] == run_event["args"]["span_id"]
+    assert run_event["ts"] <= apply_event["ts"]
+    assert apply_event["ts"] + apply_event["dur"] <= run_event["ts"] + run_event["dur"]
+
+
+def test_listeners_receive_records_below_the_threshold() -> None:
+    stream = io.StringIO()
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=True, json_mode=True),
+        json_stream=stream,
+        clock=_clock,
+    )
+    received: list[tuple[str, str, dict[str, object]]] = []
+    logger.add_listener(
+        lambda record: received.append((record.level, record.event, dict(record.payload)))
+    )
+
+    assert not logger.enabled("TRACE")
+    assert logger.enabled("TRACE", "deploy.apply")
+    assert logger.info("deploy.start", payload=lambda: {"password": "hunter2"}) is None
+    with logger.span("deploy.apply", change="users"):
+        pass
+
+    assert stream.getvalue() == ""
+    assert received[0] == ("INFO", "deploy.start", {"password": "***REDACTED***"})
+    level, event, payload = received[1]
+    assert (level, event, payload["change"]) == ("TRACE", "deploy.apply", "users")
+    assert isinstance(payload["duration_ms"], float)
+
+
+def test_filtered_listeners_only_enable_their_events() -> None:
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=True, json_mode=True),
+        json_stream=io.StringIO(),
+        clock=_clock,
+    )
+    received: list[str] = []
+    built: list[str] = []
+    logger.add_listener(
+        lambda record: received.append(record.event), events=("deploy.apply", "deploy.change.")
+    )
+
+    assert not logger.enabled("INFO")
+    assert not logger.enabled("INFO", "deploy.start")
+    assert logger.enabled("INFO", "deploy.change.success")
+    assert not logger.enabled("TRACE", "deploy.applying")
+    assert logger.info("deploy.start", payload=lambda: built.append("start") or {}) is None
+    logger.info("deploy.change.success", payload=lambda: built.append("success") or {})
+    with logger.span("deploy.registry.load") as skipped:
+        pass
+    with logger.span("deploy.apply", change="users"):
+        pass
+
+    assert not isinstance(skipped, Span)
+    assert built == ["success"]
+    assert received == ["deploy.change.success", "deploy.apply"]
@@ -0,0 +1,86 @@
+"""Tests for the OpenMetrics run metrics collector."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlitch.cli.options import LogConfiguration
+from sqlitch.utils.logging import StructuredLogger
+from sqlitch.utils.metrics import MetricsCollector
+
+
+def _collect(command: str = "deploy") -> tuple[StructuredLogger, MetricsCollector]:
+    logger = StructuredLogger(
+        LogConfiguration(run_identifier="run", verbosity=0, quiet=True, json_mode=False)
+    )
+    collector = MetricsCollector(command, buckets=(0.5, 1.0), clock=lambda: 1_700_000_000.0)
+    logger.add_listener(collector, events=collector.events)
+    return logger, collector
+
+
+def _samples(text: str) -> dict[str, str]:
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if line and not line.startswith("#")
+    )
+
+
+def test_collector_aggregates_records_of_its_command() -> None:
+    logger, collector = _collect()
+
+    logger.emit("TRACE", "deploy.plan.parse", payload={"span_id": 1, "duration_ms": 20.0})
+    logger.emit("TRACE", "deploy.lock.wait", payload={"span_id": 2, "duration_ms": 1500.0})
+    logger.emit("TRACE", "deploy.registry.load", payload={"span_id": 3, "duration_ms": 5.0})
+    logger.emit("TRACE", "deploy.registry.record", payload={"span_id": 4, "duration_ms": 7.0})
+    for duration in (200.0, 700.0, 3000.0):
+        logger.emit(
+            "TRACE", "deploy.apply", payload={"span_id": 5, "duration_ms": duration, "change": "c"}
+        )
+    logger.info("deploy.change.success")
+    logger.info("deploy.change.success")
+    logger.error("deploy.change.error")
+    logger.info("revert.change.success")
+    logger.info("command.complete", payload={"status": "error", "exit_code": 1})
+
+    samples = _samples(collector.render())
+
+    assert samples['sqlitch_changes{command="deploy",result="success"}'] == "2"
+    assert samples['sqlitch_changes{command="deploy",result="failure"}'] == "1"
+    assert samples['sqlitch_changes{command="deploy",result="skipped"}'] == "0"
+    assert samples['sqlitch_run_success{command="deploy"}'] == "0"
+    assert samples['sqlitch_run_timestamp_seconds{command="deploy"}'] == "1700000000.0"
+    assert samples['sqlitch_plan_parse_duration_seconds{command="deploy"}'] == "0.02"
+    assert samples['sqlitch_lock_wait_duration_seconds{command="deploy"}'] == "1.5"
+    assert samples['sqlitch_registry_duration_seconds{command="deploy"}'] == "0.012"
+    assert samples['sqlitch_change_duration_seconds_bucket{command="deploy",le="0.5"}'] == "1"
+    assert samples['sqlitch_change_duration_seconds_bucket{command="deploy",le="1.0"}'] == "2"
+    assert samples['sqlitch_change_duration_seconds_bucket{command="deploy",le="+Inf"}'] == "3"
+    assert samples['sqlitch_change_duration_seconds_count{command="deploy"}'] == "3"
+    assert samples['sqlitch_change_duration_seconds_sum{command="deploy"}'] == "3.9"
+
+
+def test_render_is_openmetrics_text() -> None:
+    logger, collector = _collect("status")
+    logger.info("status.complete", payload={"deployed": 2, "pending": 1})
+    logger.info("command.complete", payload={"status": "success", "exit_code": 0})
+
+    text = collector.render()
+
+    assert text.endswith("# EOF\n")
+    assert "# TYPE sqlitch_change_duration_seconds histogram" in text
+    samples = _samples(text)
+    assert samples['sqlitch_run_success{command="status"}'] == "1"
+    assert samples['sqlitch_plan_changes{command="status",state="pending"}'] == "1"
+    assert samples['sqlitch_plan_changes{command="status",state="deployed"}'] == "2"
+
+
+def test_write_replaces_the_file_atomically(tmp_path: Path) -> None:
+    _, collector = _collect()
+    path = tmp_path / "sqlitch.prom"
+    path.write_text("stale\n", encoding="utf-8")
+
+    collector.write(path)
+
+    content = path.read_text(encoding="utf-8")
+    assert content.startswith("# TYPE sqlitch_run_success gauge\n")
+    assert content.endswith("# EOF\n")
+    assert [entry.name for entry in tmp_path.iterdir()] == ["sqlitch.prom"]
@@ -0,0 +1,61 @@
+"""Tests for the ``--profile`` profilers."""
+
+from __future__ import annotations
+
+import pstats
+import time
+from pathlib import Path
+
+import pytest
+
+from sqlitch.utils.profiling import DeterministicProfiler, SamplingProfiler, create_profiler
+
+
+def _busy_work(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+def test_deterministic_profiler_writes_loadable_stats(tmp_path: Path) -> None:
+    profiler = DeterministicProfiler()
+    profiler.start()
+    _busy_work(0.01)
+    profiler.stop()
+    profiler.stop()
+
+    path = tmp_path / "run.pstats"
+    profiler.write(path)
+    stats = pstats.Stats(str(path))
+
+    assert any(name == "_busy_work" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+    summary = profiler.summary(5)
+    assert "cumulative" in summary
+    assert "_busy_work" in summary
+
+
+def test_sampling_profiler_collects_collapsed_stacks(tmp_path: Path) -> None:
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    _busy_work(0.1)
+    profiler.stop()
+
+    path = tmp_path / "run.folded"
+    profiler.write(path)
+    lines = path.read_text(encoding="utf-8").splitlines()
+
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any("_busy_work (test_profiling.py:" in line for line in lines)
+    assert ";" in stack
+    assert "_busy_work" in profiler.summary(100)
+
+
+def test_create_profiler_rejects_unknown_mode() -> None:
+    assert isinstance(create_profiler("deterministic"), DeterministicProfiler)
+    assert isinstance(create_profiler("sampling", interval=0.01), SamplingProfiler)
+    with pytest.raises(ValueError, match="Unknown profile mode"):
+        create_profiler("statistical")